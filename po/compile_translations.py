@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Compile .po files into the .mo catalogs loaded at runtime.
+
+Languages come from ``i18n.SUPPORTED_LANGUAGES``. A catalog is skipped when
+the hash of its .po matches the stamp recorded by the last successful
+build and the .mo is still there; changed catalogs are compiled in a
+process pool with ``mo_catalog.build_mo`` (no external ``msgfmt``).
+Placeholders such as ``{error}`` are checked in the same pass: a
+translation whose fields differ from its msgid is left out and reported.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pofile
+
+PO_DIR = Path(__file__).parent
+SRC_DIR = PO_DIR.parent / 'src' / 'linux_hello_gui'
+LOCALE_DIR = SRC_DIR / 'locale'
+STAMP_FILE = PO_DIR / '.compile-stamps.json'
+
+sys.path.insert(0, str(SRC_DIR.parent))
+from linux_hello_gui.i18n import DOMAIN, SUPPORTED_LANGUAGES as LANGUAGES  # noqa: E402
+from linux_hello_gui.mo_catalog import build_mo  # noqa: E402
+
+# Bump when the compiler output changes, to rebuild every catalog
+STAMP_VERSION = 1
+
+
+def placeholders(text):
+    """Set of ``{field}`` names used in a format string."""
+    return {field for _literal, field, _spec, _conv in string.Formatter().parse(text)
+            if field is not None}
+
+
+def check_placeholders(entry):
+    """Problems with the placeholders of a translated entry (empty if fine)."""
+    forms = entry.msgstr if isinstance(entry.msgstr, list) else [entry.msgstr]
+    try:
+        expected = placeholders(entry.msgid)
+        if entry.msgid_plural is not None:
+            expected |= placeholders(entry.msgid_plural)
+    except ValueError:
+        # Not a format string: nothing to compare
+        return []
+
+    problems = []
+    for form in forms:
+        if not form:
+            continue
+        try:
+            found = placeholders(form)
+        except ValueError as e:
+            problems.append(f"{e}")
+            continue
+        missing = expected - found
+        unknown = found - expected
+        # Plural forms may leave out the count ("one file")
+        if entry.msgid_plural is not None:
+            missing = set()
+        if missing:
+            problems.append("missing " + ", ".join(f"{{{f}}}" for f in sorted(missing)))
+        if unknown:
+            problems.append("unknown " + ", ".join(f"{{{f}}}" for f in sorted(unknown)))
+    return problems
+
+
+def compile_catalog(po_path, mo_path):
+    """Compile one catalog; returns ``(messages, errors, milliseconds)``.
+
+    Fuzzy, untranslated and obsolete entries are skipped like msgfmt does.
+    """
+    start = time.perf_counter()
+    _comments, header, entries = pofile.parse_file(po_path)
+
+    messages = {'': header}
+    errors = []
+    for entry in entries:
+        if entry.obsolete or entry.fuzzy or not entry.translated:
+            continue
+        problems = check_placeholders(entry)
+        if problems:
+            errors.append(f"{entry.msgid!r}: {'; '.join(problems)}")
+            continue
+        if entry.msgid_plural is not None:
+            messages[f"{entry.msgid}\0{entry.msgid_plural}"] = '\0'.join(entry.msgstr)
+        else:
+            messages[entry.msgid] = entry.msgstr
+
+    data = build_mo(messages)
+    os.makedirs(os.path.dirname(mo_path), exist_ok=True)
+    tmp = f"{mo_path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, mo_path)
+
+    return len(messages) - 1, errors, (time.perf_counter() - start) * 1000
+
+
+def _file_hash(path):
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _load_stamps():
+    try:
+        with open(STAMP_FILE, 'r') as f:
+            stamps = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if stamps.get('version') != STAMP_VERSION:
+        return {}
+    return stamps.get('catalogs', {})
+
+
+def _save_stamps(catalogs):
+    tmp = STAMP_FILE.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'version': STAMP_VERSION, 'catalogs': catalogs}, f, indent=1, sort_keys=True)
+    os.replace(tmp, STAMP_FILE)
+
+
+def mo_path(lang_code, locale_dir=LOCALE_DIR):
+    return Path(locale_dir) / lang_code / 'LC_MESSAGES' / f'{DOMAIN}.mo'
+
+
+def compile_all(force=False, locale_dir=LOCALE_DIR):
+    """Compile every stale catalog; returns ``{lang: (messages, errors, ms)}``."""
+    stamps = _load_stamps()
+    pending = {}
+
+    for lang_code in LANGUAGES:
+        po_path = PO_DIR / f"{lang_code}.po"
+        if not po_path.exists():
+            print(f"⚠ {lang_code}: {po_path.name} not found")
+            continue
+        digest = _file_hash(po_path)
+        if not force and stamps.get(lang_code) == digest and mo_path(lang_code, locale_dir).exists():
+            continue
+        pending[lang_code] = (po_path, digest)
+
+    results = {}
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as pool:
+            futures = {
+                lang_code: pool.submit(compile_catalog, po_path, mo_path(lang_code, locale_dir))
+                for lang_code, (po_path, _digest) in pending.items()
+            }
+            for lang_code, future in futures.items():
+                results[lang_code] = future.result()
+
+    for lang_code, (_count, errors, _ms) in results.items():
+        # Catalogs with errors keep being rebuilt (and reported) until fixed
+        if errors:
+            stamps.pop(lang_code, None)
+        else:
+            stamps[lang_code] = pending[lang_code][1]
+    if results:
+        _save_stamps(stamps)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--force', action='store_true', help="rebuild every catalog")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = compile_all(force=args.force)
+    failed = False
+
+    for lang_code in LANGUAGES:
+        if lang_code not in results:
+            continue
+        count, errors, ms = results[lang_code]
+        mark = "✗" if errors else "✓"
+        print(f"{mark} Compiled: {lang_code} ({count} messages, {ms:.1f} ms)")
+        for error in errors:
+            print(f"    {error}")
+        failed = failed or bool(errors)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    skipped = len(LANGUAGES) - len(results)
+    print(f"{len(results)} compiled, {skipped} up to date in {elapsed:.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,289 +1,308 @@
 #!/usr/bin/env python3
-"""Extract translatable strings and create .po files."""
+"""Extract translatable strings and merge them into the .pot and .po files.
+
+Source files are parsed with ``ast`` to find ``_()``, ``N_()``,
+``ngettext()`` and ``retranslate.tr()`` calls with literal messages. Results
+are cached per file by content hash, so a re-run only parses files that
+changed; changed files are parsed in parallel. Catalogs are merged in
+place: existing translations are kept, messages that left the source
+become obsolete (``#~``) entries, and files are only rewritten when their
+content actually changes.
+"""
 
+import ast
+import hashlib
+import json
 import os
-import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Supported languages
-LANGUAGES = {
-    'ar': 'العربية',
-    'de': 'Deutsch',
-    'en': 'English',
-    'es': 'Español',
-    'fr': 'Français',
-    'it': 'Italiano',
-    'ja': '日本語',
-    'pt': 'Português',
-    'ru': 'Русский',
-    'zh_CN': '简体中文',
-}
-
-PO_TEMPLATE = """# {lang_name} translation for Linux Hello GUI
-# Copyright (C) 2025 Linux Hello Contributors
-#
-msgid ""
-msgstr ""
-"Project-Id-Version: linux-hello-gui 1.0.0\\n"
-"Content-Type: text/plain; charset=UTF-8\\n"
-"Language: {lang_code}\\n"
-
-msgid "Linux Hello – Configuration"
-msgstr ""
-
-msgid "Ready"
-msgstr ""
-
-msgid "&File"
-msgstr ""
-
-msgid "&Settings"
-msgstr ""
-
-msgid "&Quit"
-msgstr ""
-
-msgid "&Language"
-msgstr ""
-
-msgid "&Help"
-msgstr ""
-
-msgid "&About"
-msgstr ""
-
-msgid "About &Qt"
-msgstr ""
-
-msgid "Language Changed"
-msgstr ""
-
-msgid "Please restart the application for language changes to take effect."
-msgstr ""
-
-msgid "Settings"
-msgstr ""
-
-msgid "Settings can be modified in the Settings tab."
-msgstr ""
-
-msgid "About Linux Hello"
-msgstr ""
-
-msgid "Linux Hello – Configuration\\nVersion 1.0.0\\n\\nGraphical interface to configure the Linux Hello facial recognition service.\\n\\n© Linux Hello Contributors"
-msgstr ""
-
-msgid "Face Enrollment"
-msgstr ""
-
-msgid "Camera:"
-msgstr ""
-
-msgid "Refresh"
-msgstr ""
-
-msgid "Press 'Start Camera' to see preview"
-msgstr ""
-
-msgid "Username:"
-msgstr ""
-
-msgid "Ex: john.doe"
-msgstr ""
-
-msgid "Number of photos:"
-msgstr ""
-
-msgid "Start Camera"
-msgstr ""
-
-msgid "Stop Camera"
-msgstr ""
-
-msgid "Enroll Face"
-msgstr ""
-
-msgid "Error"
-msgstr ""
-
-msgid "Cannot open camera"
-msgstr ""
-
-msgid "Camera stopped"
-msgstr ""
-
-msgid "Please enter a username"
-msgstr ""
-
-msgid "Camera is not active"
-msgstr ""
-
-msgid "Success"
-msgstr ""
-
-msgid "Face for {{username}} enrolled with {{count}} photos"
-msgstr ""
+import pofile
 
-msgid "Incomplete enrollment: {{captured}}/{{total}} photos captured"
-msgstr ""
+PO_DIR = Path(__file__).parent
+SRC_DIR = PO_DIR.parent / 'src' / 'linux_hello_gui'
+POT_FILE = PO_DIR / 'linux-hello-gui.pot'
+CACHE_FILE = PO_DIR / '.extract-cache.json'
 
-msgid "PAM Configuration (Authentication)"
-msgstr ""
+sys.path.insert(0, str(SRC_DIR.parent))
+from linux_hello_gui.i18n import SUPPORTED_LANGUAGES as LANGUAGES  # noqa: E402
 
-msgid "PAM (Pluggable Authentication Modules) allows using facial recognition for system authentication."
-msgstr ""
+# Bump when the extraction rules change, to invalidate the cache
+CACHE_VERSION = 1
 
-msgid "PAM Configuration"
-msgstr ""
+# Below this many changed files, parsing in-process beats starting workers
+PARALLEL_MIN_FILES = 8
 
-msgid "Preset configuration:"
-msgstr ""
-
-msgid "Strict (facial recognition required)"
-msgstr ""
-
-msgid "Medium (facial recognition + password)"
-msgstr ""
-
-msgid "Permissive (facial recognition optional)"
-msgstr ""
-
-msgid "Apply"
-msgstr ""
-
-msgid "Options"
-msgstr ""
-
-msgid "Facial recognition required"
-msgstr ""
-
-msgid "Allow password as fallback"
-msgstr ""
-
-msgid "Cache results"
-msgstr ""
-
-msgid "Save Configuration"
-msgstr ""
-
-msgid "Reload from Disk"
-msgstr ""
-
-msgid "# PAM configuration not found"
-msgstr ""
-
-msgid "Error: Permission denied to read PAM configuration"
-msgstr ""
-
-msgid "Error: {{error}}"
-msgstr ""
-
-msgid "Confirmation"
-msgstr ""
-
-msgid "Are you sure you want to modify the PAM configuration?\\nThis requires administrator privileges."
-msgstr ""
-
-msgid "PAM configuration saved successfully"
-msgstr ""
-
-msgid "Error saving configuration: {{error}}"
-msgstr ""
-
-msgid "Linux Hello Settings"
-msgstr ""
-
-msgid "Camera Settings"
-msgstr ""
-
-msgid "Default camera index:"
-msgstr ""
-
-msgid "Video width:"
-msgstr ""
-
-msgid "Video height:"
-msgstr ""
-
-msgid "Recognition Settings"
-msgstr ""
-
-msgid "Similarity threshold:"
-msgstr ""
-
-msgid "Minimum confidence:"
-msgstr ""
-
-msgid "Performance Settings"
-msgstr ""
+# Function name -> positions of (msgid, msgid_plural) arguments
+KEYWORDS = {
+    '_': (0, None),
+    'N_': (0, None),
+    'ngettext': (0, 1),
+    'tr': (2, None),
+}
 
-msgid "Timeout:"
-msgstr ""
+POT_HEADER = {
+    'Project-Id-Version': 'linux-hello-gui 1.0.0',
+    'Report-Msgid-Bugs-To': '',
+    'POT-Creation-Date': '',
+    'PO-Revision-Date': 'YEAR-MO-DA HO:MI+ZONE',
+    'Last-Translator': 'FULL NAME <EMAIL@ADDRESS>',
+    'Language-Team': 'LANGUAGE <LL@li.org>',
+    'Language': '',
+    'MIME-Version': '1.0',
+    'Content-Type': 'text/plain; charset=UTF-8',
+    'Content-Transfer-Encoding': '8bit',
+}
 
-msgid "Max frames:"
-msgstr ""
 
-msgid " seconds"
-msgstr ""
+def _literal(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
 
-msgid "Logging"
-msgstr ""
 
-msgid "Log level:"
-msgstr ""
+def extract_source(source, filename='<string>'):
+    """Messages in Python source as ``[(msgid, msgid_plural, line), ...]``."""
+    messages = []
+    for node in ast.walk(ast.parse(source, filename)):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+        if name not in KEYWORDS:
+            continue
 
-msgid "Enable logging"
-msgstr ""
+        singular_pos, plural_pos = KEYWORDS[name]
+        if len(node.args) <= max(singular_pos, plural_pos or 0):
+            continue
+        msgid = _literal(node.args[singular_pos])
+        plural = _literal(node.args[plural_pos]) if plural_pos is not None else None
+        if msgid and (plural_pos is None or plural):
+            messages.append((msgid, plural, node.lineno))
 
-msgid "Save"
-msgstr ""
+    messages.sort(key=lambda m: m[2])
+    return messages
 
-msgid "Reload"
-msgstr ""
 
-msgid "Reset to Defaults"
-msgstr ""
+def extract_file(path):
+    """Parse one file (runs in a worker process for big batches)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return extract_source(data, str(path))
 
-msgid "Error loading configuration: {{error}}"
-msgstr ""
 
-msgid "Are you sure you want to save this configuration?\\nThis may require administrator privileges."
-msgstr ""
+def _load_cache():
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache
 
-msgid "Configuration saved successfully"
-msgstr ""
 
-msgid "Error saving configuration: {{error}}"
-msgstr ""
+def _save_cache(files, catalogs):
+    tmp = CACHE_FILE.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'files': files, 'catalogs': catalogs}, f)
+    os.replace(tmp, CACHE_FILE)
 
-msgid "Are you sure you want to reset to default settings?"
-msgstr ""
 
-msgid "👤 Face"
-msgstr ""
+def catalog_files():
+    return [POT_FILE] + [PO_DIR / f"{lang_code}.po" for lang_code in LANGUAGES]
 
-msgid "🔐 PAM"
-msgstr ""
 
-msgid "⚙️ Settings"
-msgstr ""
-"""
+def catalog_signatures():
+    """``{name: [mtime_ns, size]}`` of every catalog, to detect outside edits."""
+    signatures = {}
+    for path in catalog_files():
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signatures[path.name] = [st.st_mtime_ns, st.st_size]
+    return signatures
+
+
+def extract_all(sources, cache=None):
+    """Messages of every source file, re-parsing only files that changed.
+
+    Returns ``(files, parsed)``: the updated cache mapping file name to
+    ``{'hash', 'messages'}``, and the names that had to be parsed.
+    """
+    cache = {} if cache is None else cache
+    files = {}
+    changed = []
+
+    for path in sources:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        entry = cache.get(path.name)
+        if entry is not None and entry['hash'] == digest:
+            files[path.name] = entry
+        else:
+            files[path.name] = {'hash': digest}
+            changed.append(path)
+
+    if len(changed) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(extract_file, changed))
+    else:
+        results = [extract_file(path) for path in changed]
+
+    for path, messages in zip(changed, results):
+        files[path.name]['messages'] = [list(m) for m in messages]
+
+    return files, [path.name for path in changed]
+
+
+def collect_messages(files):
+    """Merge per-file results into ``{msgid: (msgid_plural, [file names])}``."""
+    messages = {}
+    for name in sorted(files):
+        for msgid, plural, _line in files[name]['messages']:
+            previous_plural, references = messages.setdefault(msgid, (plural, []))
+            if name not in references:
+                references.append(name)
+            if plural and not previous_plural:
+                messages[msgid] = (plural, references)
+    return messages
+
+
+def _brace_key(msgid):
+    # Old hand-written templates escaped placeholders as {{name}}
+    return msgid.replace('{{', '{').replace('}}', '}')
+
+
+def merge_entries(entries, messages, keep_translations=True):
+    """New entry list for ``messages``, reusing translations from ``entries``."""
+    existing = {e.msgid: e for e in entries}
+    by_brace_key = {_brace_key(e.msgid): e for e in entries if e.translated}
+    merged = []
+    used = set()
+
+    for msgid in sorted(messages):
+        plural, references = messages[msgid]
+        entry = pofile.Entry(msgid, plural, references=list(references))
+        old = existing.get(msgid)
+
+        if old is None and keep_translations:
+            # Same message once its placeholders are unescaped
+            candidate = by_brace_key.get(msgid)
+            if candidate is not None and candidate.msgid not in messages:
+                old = candidate
+
+        if old is not None:
+            used.add(old.msgid)
+            entry.comments = [c for c in old.comments if c.strip() != '#']
+            entry.flags = list(old.flags)
+            if keep_translations and (old.msgid_plural is None) == (plural is None):
+                if old.msgid == msgid:
+                    entry.msgstr = old.msgstr
+                elif isinstance(old.msgstr, str):
+                    entry.msgstr = _brace_key(old.msgstr)
+        merged.append(entry)
+
+    if keep_translations:
+        for old in entries:
+            if old.msgid not in used and old.msgid not in messages and old.translated:
+                old.obsolete = True
+                old.references = []
+                merged.append(old)
+
+    return merged
+
+
+def _write_if_changed(path, content):
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except OSError:
+        pass
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def _merge_file(path, messages, header_fields, header_comments, keep_translations):
+    if path.exists():
+        comments, header, entries = pofile.parse_file(path)
+        fields = pofile.parse_header(header)
+    else:
+        comments, entries, fields = list(header_comments), [], {}
+
+    for key, value in header_fields.items():
+        fields.setdefault(key, value)
+
+    merged = merge_entries(entries, messages, keep_translations)
+
+    content = pofile.format_catalog(comments, pofile.format_header(fields), merged)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+
+    # Only a real change gets a new creation date
+    fields['POT-Creation-Date'] = time.strftime('%Y-%m-%d %H:%M%z')
+    content = pofile.format_catalog(comments, pofile.format_header(fields), merged)
+    return _write_if_changed(path, content)
+
+
+def update_catalogs(messages):
+    """Merge ``messages`` into the .pot and every language's .po.
+
+    Returns the names of the files that were rewritten.
+    """
+    written = []
+
+    pot_comments = [
+        '# Linux Hello GUI Translation Template',
+        '# Copyright (C) 2025 Linux Hello Contributors',
+        '# This file is distributed under the same license as the linux-hello-gui package.',
+        '#',
+        '#, fuzzy',
+    ]
+    if _merge_file(POT_FILE, messages, POT_HEADER, pot_comments, keep_translations=False):
+        written.append(POT_FILE.name)
 
-def create_po_files():
-    """Create .po files for all languages."""
-    po_dir = Path(__file__).parent
-    
     for lang_code, lang_name in LANGUAGES.items():
-        # Skip if already exists (except en)
-        po_file = po_dir / f"{lang_code}.po"
-        if po_file.exists() and lang_code != 'en':
-            print(f"Skipping {lang_code}: file already exists")
-            continue
-        
-        content = PO_TEMPLATE.format(lang_code=lang_code, lang_name=lang_name)
-        po_file.write_text(content, encoding='utf-8')
-        print(f"Created: {po_file}")
+        po_file = PO_DIR / f"{lang_code}.po"
+        header = {
+            'Project-Id-Version': POT_HEADER['Project-Id-Version'],
+            'Language': lang_code,
+            'Content-Type': POT_HEADER['Content-Type'],
+        }
+        comments = [
+            f'# {lang_name} translation for Linux Hello GUI',
+            '# Copyright (C) 2025 Linux Hello Contributors',
+            '#',
+        ]
+        if _merge_file(po_file, messages, header, comments, keep_translations=True):
+            written.append(po_file.name)
+
+    return written
+
+
+def main():
+    start = time.perf_counter()
+
+    cache = _load_cache()
+    sources = sorted(SRC_DIR.glob('*.py'))
+    files, parsed = extract_all(sources, cache.get('files'))
+    messages = collect_messages(files)
+
+    # Nothing to merge when no source changed and no catalog was edited
+    unchanged = (not parsed and set(files) == set(cache.get('files', {}))
+                 and catalog_signatures() == cache.get('catalogs'))
+    written = [] if unchanged else update_catalogs(messages)
+    if not unchanged:
+        _save_cache(files, catalog_signatures())
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{len(messages)} messages from {len(sources)} files "
+          f"({len(parsed)} parsed, {len(written)} catalogs updated) in {elapsed:.1f} ms")
+    for name in written:
+        print(f"Updated: {name}")
+
 
 if __name__ == '__main__':
-    create_po_files()
-    print("Done!")
+    main()
@@ -0,0 +1,202 @@
+"""Minimal reader and writer for gettext .po/.pot files."""
+
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\'}
+
+
+class Entry:
+    """One message of a catalog."""
+
+    __slots__ = ('msgid', 'msgid_plural', 'msgstr', 'comments', 'references', 'flags', 'obsolete')
+
+    def __init__(self, msgid, msgid_plural=None, msgstr=None, comments=None,
+                 references=None, flags=None, obsolete=False):
+        self.msgid = msgid
+        self.msgid_plural = msgid_plural
+        # One string, or a list of plural forms when msgid_plural is set
+        self.msgstr = msgstr if msgstr is not None else ([] if msgid_plural else "")
+        self.comments = comments or []
+        self.references = references or []
+        self.flags = flags or []
+        self.obsolete = obsolete
+
+    @property
+    def translated(self):
+        if isinstance(self.msgstr, list):
+            return any(self.msgstr)
+        return bool(self.msgstr)
+
+    @property
+    def fuzzy(self):
+        return 'fuzzy' in self.flags
+
+
+def unquote(text):
+    """Decode one quoted .po string."""
+    text = text.strip()
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise ValueError(f"Expected a quoted string: {text}")
+
+    chars = []
+    i, end = 1, len(text) - 1
+    while i < end:
+        char = text[i]
+        if char == '\\' and i + 1 < end:
+            i += 1
+            chars.append(ESCAPES.get(text[i], text[i]))
+        else:
+            chars.append(char)
+        i += 1
+    return ''.join(chars)
+
+
+def quote(text):
+    """Encode a string as one quoted .po string."""
+    text = (text.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n').replace('\t', '\\t').replace('\r', '\\r'))
+    return f'"{text}"'
+
+
+def parse(text):
+    """Parse .po text into ``(header_comments, header_msgstr, entries)``."""
+    entries = []
+    header_comments = []
+    header = None
+
+    def new_entry():
+        return {'comments': [], 'references': [], 'flags': [], 'msgstr': {}, 'obsolete': False}
+
+    current = new_entry()
+    field = None
+
+    def flush():
+        nonlocal current, field, header
+        if 'msgid' in current:
+            msgstr = current['msgstr']
+            if current.get('msgid_plural') is not None:
+                value = [msgstr[i] for i in sorted(msgstr)]
+            else:
+                value = msgstr.get(0, "")
+            if current['msgid'] == "" and not current['obsolete']:
+                header_comments.extend(current['comments'])
+                if current['flags']:
+                    header_comments.append('#, ' + ', '.join(current['flags']))
+                header = value
+            else:
+                entries.append(Entry(
+                    current['msgid'], current.get('msgid_plural'), value,
+                    current['comments'], current['references'], current['flags'],
+                    current['obsolete']
+                ))
+        current = new_entry()
+        field = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        obsolete = line.startswith('#~')
+        if obsolete:
+            line = line[2:].strip()
+
+        if not line:
+            if 'msgid' in current:
+                flush()
+            continue
+
+        if line.startswith('#'):
+            if 'msgid' in current:
+                flush()
+            if line.startswith('#:'):
+                current['references'].extend(line[2:].split())
+            elif line.startswith('#,'):
+                current['flags'].extend(f.strip() for f in line[2:].split(',') if f.strip())
+            else:
+                current['comments'].append(line)
+            continue
+
+        current['obsolete'] = current['obsolete'] or obsolete
+        keyword, _sep, rest = line.partition(' ')
+        if line.startswith('"'):
+            value = unquote(line)
+            if field[0] == 'msgstr':
+                current['msgstr'][field[1]] += value
+            else:
+                current[field[0]] += value
+        elif keyword == 'msgid':
+            if 'msgid' in current:
+                flush()
+            current['msgid'] = unquote(rest)
+            field = ('msgid', None)
+        elif keyword == 'msgid_plural':
+            current['msgid_plural'] = unquote(rest)
+            field = ('msgid_plural', None)
+        elif keyword == 'msgstr':
+            current['msgstr'][0] = unquote(rest)
+            field = ('msgstr', 0)
+        elif keyword.startswith('msgstr['):
+            index = int(keyword[7:-1])
+            current['msgstr'][index] = unquote(rest)
+            field = ('msgstr', index)
+        elif keyword == 'msgctxt':
+            # Contexts are not used by this project
+            field = ('msgctxt', None)
+            current['msgctxt'] = unquote(rest)
+        else:
+            raise ValueError(f"Unexpected line: {raw}")
+
+    flush()
+    return header_comments, header or "", entries
+
+
+def parse_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse(f.read())
+
+
+def parse_header(header):
+    """Header msgstr as a dict of its ``Key: value`` lines."""
+    fields = {}
+    for line in header.splitlines():
+        key, sep, value = line.partition(':')
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def format_header(fields):
+    return ''.join(f"{key}: {value}\n" for key, value in fields.items())
+
+
+def _format_string(keyword, text, prefix=''):
+    """``keyword "text"``, split after each newline like msgmerge does."""
+    parts = text.splitlines(keepends=True)
+    if len(parts) <= 1:
+        return f"{prefix}{keyword} {quote(text)}"
+    return '\n'.join([f'{prefix}{keyword} ""'] + [prefix + quote(part) for part in parts])
+
+
+def _format_entry(entry):
+    prefix = '#~ ' if entry.obsolete else ''
+    lines = list(entry.comments)
+    if entry.references and not entry.obsolete:
+        lines.append('#: ' + ' '.join(entry.references))
+    if entry.flags:
+        lines.append('#, ' + ', '.join(entry.flags))
+
+    lines.append(_format_string('msgid', entry.msgid, prefix))
+    if entry.msgid_plural is not None:
+        lines.append(_format_string('msgid_plural', entry.msgid_plural, prefix))
+        forms = entry.msgstr or ["", ""]
+        for i, form in enumerate(forms):
+            lines.append(_format_string(f'msgstr[{i}]', form, prefix))
+    else:
+        lines.append(_format_string('msgstr', entry.msgstr, prefix))
+    return '\n'.join(lines)
+
+
+def format_catalog(header_comments, header, entries):
+    """Render a catalog; obsolete entries go last."""
+    header_lines = list(header_comments) + ['msgid ""', 'msgstr ""']
+    header_lines += [quote(line + '\n') for line in header.splitlines()]
+    blocks = ['\n'.join(header_lines)]
+    blocks += [_format_entry(e) for e in entries if not e.obsolete]
+    blocks += [_format_entry(e) for e in entries if e.obsolete]
+    return '\n\n'.join(blocks) + '\n'
@@ -1,922 +0,0 @@
-#!/usr/bin/env python3
-"""
-Translation filler - Generate .po files with translations for all languages
-"""
-
-# Translations dictionary: msgid -> {lang_code: msgstr}
-TRANSLATIONS = {
-    'Linux Hello – Configuration': {
-        "en": "Linux Hello – Configuration",
-        "ar": "Linux Hello – التكوين",
-        "de": "Linux Hello – Konfiguration",
-        "es": "Linux Hello – Configuración",
-        "it": "Linux Hello – Configurazione",
-        "ja": "Linux Hello – 設定",
-        "pt": "Linux Hello – Configuração",
-        "ru": "Linux Hello – Конфигурация",
-        "zh_CN": "Linux Hello – 配置",
-    },
-    "Ready": {
-        "en": "Ready",
-        "ar": "جاهز",
-        "de": "Bereit",
-        "es": "Listo",
-        "it": "Pronto",
-        "ja": "準備完了",
-        "pt": "Pronto",
-        "ru": "Готово",
-        "zh_CN": "准备就绪",
-    },
-    "&File": {
-        "en": "&File",
-        "ar": "&ملف",
-        "de": "&Datei",
-        "es": "&Archivo",
-        "it": "&File",
-        "ja": "&ファイル",
-        "pt": "&Arquivo",
-        "ru": "&Файл",
-        "zh_CN": "&文件",
-    },
-    "&Settings": {
-        "en": "&Settings",
-        "ar": "&إعدادات",
-        "de": "&Einstellungen",
-        "es": "&Configuración",
-        "it": "&Impostazioni",
-        "ja": "&設定",
-        "pt": "&Configurações",
-        "ru": "&Параметры",
-        "zh_CN": "&设置",
-    },
-    "&Quit": {
-        "en": "&Quit",
-        "ar": "&خروج",
-        "de": "&Beenden",
-        "es": "&Salir",
-        "it": "&Esci",
-        "ja": "&終了",
-        "pt": "&Sair",
-        "ru": "&Выход",
-        "zh_CN": "&退出",
-    },
-    "&Language": {
-        "en": "&Language",
-        "ar": "&اللغة",
-        "de": "&Sprache",
-        "es": "&Idioma",
-        "it": "&Lingua",
-        "ja": "&言語",
-        "pt": "&Idioma",
-        "ru": "&Язык",
-        "zh_CN": "&语言",
-    },
-    "&Help": {
-        "en": "&Help",
-        "ar": "&ساعدة",
-        "de": "&Hilfe",
-        "es": "A&yuda",
-        "it": "&Aiuto",
-        "ja": "&ヘルプ",
-        "pt": "Aj&uda",
-        "ru": "&Справка",
-        "zh_CN": "&帮助",
-    },
-    "&About": {
-        "en": "&About",
-        "ar": "&حول",
-        "de": "&Über",
-        "es": "Ac&erca de",
-        "it": "I&nfo",
-        "ja": "&について",
-        "pt": "&Sobre",
-        "ru": "&О программе",
-        "zh_CN": "&关于",
-    },
-    "About &Qt": {
-        "en": "About &Qt",
-        "ar": "حول &Qt",
-        "de": "Über &Qt",
-        "es": "Acerca de &Qt",
-        "it": "Info su &Qt",
-        "ja": "&Qt について",
-        "pt": "Sobre o &Qt",
-        "ru": "О &Qt",
-        "zh_CN": "关于 &Qt",
-    },
-    "Language Changed": {
-        "en": "Language Changed",
-        "ar": "تم تغيير اللغة",
-        "de": "Sprache geändert",
-        "es": "Idioma cambiado",
-        "it": "Lingua modificata",
-        "ja": "言語が変更されました",
-        "pt": "Idioma alterado",
-        "ru": "Язык изменен",
-        "zh_CN": "语言已更改",
-    },
-    "Please restart the application for language changes to take effect.": {
-        "en": "Please restart the application for language changes to take effect.",
-        "ar": "يرجى إعادة تشغيل التطبيق لكي تسري تغييرات اللغة.",
-        "de": "Bitte starten Sie die Anwendung neu, damit die Sprachänderungen wirksam werden.",
-        "es": "Por favor, reinicie la aplicación para que los cambios de idioma surtan efecto.",
-        "it": "Si prega di riavviare l'applicazione affinché le modifiche della lingua abbiano effetto.",
-        "ja": "言語の変更を有効にするには、アプリケーションを再起動してください。",
-        "pt": "Por favor, reinicie o aplicativo para que as mudanças de idioma tenham efeito.",
-        "ru": "Пожалуйста, перезагрузите приложение, чтобы изменения языка вступили в силу.",
-        "zh_CN": "请重新启动应用程序以使语言更改生效。",
-    },
-    "Settings": {
-        "en": "Settings",
-        "ar": "إعدادات",
-        "de": "Einstellungen",
-        "es": "Configuración",
-        "it": "Impostazioni",
-        "ja": "設定",
-        "pt": "Configurações",
-        "ru": "Параметры",
-        "zh_CN": "设置",
-    },
-    "Settings can be modified in the Settings tab.": {
-        "en": "Settings can be modified in the Settings tab.",
-        "ar": "يمكن تعديل الإعدادات في علامة التبويب الإعدادات.",
-        "de": "Die Einstellungen können auf der Registerkarte \\"Einstellungen\\" geändert werden.",
-        "es": "La configuración se puede modificar en la pestaña Configuración.",
-        "it": "Le impostazioni possono essere modificate nella scheda Impostazioni.",
-        "ja": "設定は\\u300c設定\\u300dタブで変更できます。",
-        "pt": "As configurações podem ser modificadas na aba Configurações.",
-        "ru": "Параметры можно изменить на вкладке \\"Параметры\\".",
-        "zh_CN": "可以在\\u201c设置\\u201d选项卡中修改设置。",
-    },
-    "About Linux Hello": {
-        "en": "About Linux Hello",
-        "ar": "حول Linux Hello",
-        "de": "Über Linux Hello",
-        "es": "Acerca de Linux Hello",
-        "it": "Info su Linux Hello",
-        "ja": "Linux Hello について",
-        "pt": "Sobre o Linux Hello",
-        "ru": "О Linux Hello",
-        "zh_CN": "关于 Linux Hello",
-    },
-    "Linux Hello – Configuration\nVersion 1.0.0\n\nGraphical interface to configure the Linux Hello facial recognition service.\n\n© Linux Hello Contributors": {
-        "en": "Linux Hello – Configuration\nVersion 1.0.0\n\nGraphical interface to configure the Linux Hello facial recognition service.\n\n© Linux Hello Contributors",
-        "ar": "Linux Hello – التكوين\nالإصدار 1.0.0\n\nواجهة رسومية لتكوين خدمة التعرف على الوجه Linux Hello.\n\n© مساهمو Linux Hello",
-        "de": "Linux Hello – Konfiguration\nVersion 1.0.0\n\nGraphische Oberfläche zur Konfiguration des Linux Hello Facial Recognition Service.\n\n© Linux Hello-Mitwirkende",
-        "es": "Linux Hello – Configuración\nVersión 1.0.0\n\nInterfaz gráfica para configurar el servicio de reconocimiento facial Linux Hello.\n\n© Colaboradores de Linux Hello",
-        "it": "Linux Hello – Configurazione\nVersione 1.0.0\n\nInterfaccia grafica per configurare il servizio di riconoscimento facciale Linux Hello.\n\n© Collaboratori di Linux Hello",
-        "ja": "Linux Hello – 設定\nバージョン 1.0.0\n\nLinux Hello 顔認識サービスを設定するためのグラフィカル インターフェイス。\n\n© Linux Hello 貢献者",
-        "pt": "Linux Hello – Configuração\nVersão 1.0.0\n\nInterface gráfica para configurar o serviço de reconhecimento facial Linux Hello.\n\n© Colaboradores do Linux Hello",
-        "ru": "Linux Hello – Конфигурация\nВерсия 1.0.0\n\nГрафический интерфейс для настройки сервиса распознавания лиц Linux Hello.\n\n© Участники Linux Hello",
-        "zh_CN": "Linux Hello – 配置\n版本 1.0.0\n\n用于配置 Linux Hello 面部识别服务的图形界面。\n\n© Linux Hello 贡献者",
-    },
-    "Face Enrollment": {
-        "en": "Face Enrollment",
-        "ar": "تسجيل الوجه",
-        "de": "Gesichtserkennung",
-        "es": "Inscripción de rostro",
-        "it": "Registrazione del viso",
-        "ja": "顔登録",
-        "pt": "Inscrição de rosto",
-        "ru": "Регистрация лица",
-        "zh_CN": "人脸登记",
-    },
-    "Camera:": {
-        "en": "Camera:",
-        "ar": "الكاميرا:",
-        "de": "Kamera:",
-        "es": "Cámara:",
-        "it": "Telecamera:",
-        "ja": "カメラ:",
-        "pt": "Câmera:",
-        "ru": "Камера:",
-        "zh_CN": "相机:",
-    },
-    "Refresh": {
-        "en": "Refresh",
-        "ar": "تحديث",
-        "de": "Aktualisieren",
-        "es": "Actualizar",
-        "it": "Aggiorna",
-        "ja": "更新",
-        "pt": "Atualizar",
-        "ru": "Обновить",
-        "zh_CN": "刷新",
-    },
-    "Press 'Start Camera' to see preview": {
-        "en": "Press 'Start Camera' to see preview",
-        "ar": "اضغط على 'بدء الكاميرا' لرؤية المعاينة",
-        "de": "Drücken Sie \"Kamera starten\", um eine Vorschau zu sehen",
-        "es": "Presione 'Iniciar cámara' para ver la vista previa",
-        "it": "Premere 'Avvia fotocamera' per visualizzare l'anteprima",
-        "ja": "「カメラを開始」を押してプレビューを表示します",
-        "pt": "Pressione 'Iniciar câmera' para ver a visualização",
-        "ru": "Нажмите \"Запустить камеру\", чтобы увидеть предпросмотр",
-        "zh_CN": "按"启动相机"查看预览",
-    },
-    "Username:": {
-        "en": "Username:",
-        "ar": "اسم المستخدم:",
-        "de": "Benutzername:",
-        "es": "Nombre de usuario:",
-        "it": "Nome utente:",
-        "ja": "ユーザー名:",
-        "pt": "Nome de usuário:",
-        "ru": "Имя пользователя:",
-        "zh_CN": "用户名:",
-    },
-    "Ex: john.doe": {
-        "en": "Ex: john.doe",
-        "ar": "مثال: john.doe",
-        "de": "Bsp.: john.doe",
-        "es": "Ej: john.doe",
-        "it": "Es: john.doe",
-        "ja": "例: john.doe",
-        "pt": "Ex: john.doe",
-        "ru": "Пример: john.doe",
-        "zh_CN": "例: john.doe",
-    },
-    "Number of photos:": {
-        "en": "Number of photos:",
-        "ar": "عدد الصور:",
-        "de": "Anzahl der Fotos:",
-        "es": "Número de fotos:",
-        "it": "Numero di foto:",
-        "ja": "写真の枚数:",
-        "pt": "Número de fotos:",
-        "ru": "Количество фотографий:",
-        "zh_CN": "照片数量:",
-    },
-    "Start Camera": {
-        "en": "Start Camera",
-        "ar": "بدء الكاميرا",
-        "de": "Kamera starten",
-        "es": "Iniciar cámara",
-        "it": "Avvia fotocamera",
-        "ja": "カメラを開始",
-        "pt": "Iniciar câmera",
-        "ru": "Запустить камеру",
-        "zh_CN": "启动相机",
-    },
-    "Stop Camera": {
-        "en": "Stop Camera",
-        "ar": "إيقاف الكاميرا",
-        "de": "Kamera stoppen",
-        "es": "Detener cámara",
-        "it": "Ferma fotocamera",
-        "ja": "カメラを停止",
-        "pt": "Parar câmera",
-        "ru": "Остановить камеру",
-        "zh_CN": "停止相机",
-    },
-    "Enroll Face": {
-        "en": "Enroll Face",
-        "ar": "تسجيل الوجه",
-        "de": "Gesicht registrieren",
-        "es": "Inscribir rostro",
-        "it": "Registra viso",
-        "ja": "顔を登録",
-        "pt": "Inscrever rosto",
-        "ru": "Зарегистрировать лицо",
-        "zh_CN": "登记人脸",
-    },
-    "Error": {
-        "en": "Error",
-        "ar": "خطأ",
-        "de": "Fehler",
-        "es": "Error",
-        "it": "Errore",
-        "ja": "エラー",
-        "pt": "Erro",
-        "ru": "Ошибка",
-        "zh_CN": "错误",
-    },
-    "Cannot open camera": {
-        "en": "Cannot open camera",
-        "ar": "لا يمكن فتح الكاميرا",
-        "de": "Kann Kamera nicht öffnen",
-        "es": "No se puede abrir la cámara",
-        "it": "Impossibile aprire la fotocamera",
-        "ja": "カメラを開くことができません",
-        "pt": "Não é possível abrir a câmera",
-        "ru": "Не удается открыть камеру",
-        "zh_CN": "无法打开相机",
-    },
-    "Camera stopped": {
-        "en": "Camera stopped",
-        "ar": "تم إيقاف الكاميرا",
-        "de": "Kamera gestoppt",
-        "es": "Cámara detenida",
-        "it": "Fotocamera arrestata",
-        "ja": "カメラが停止しました",
-        "pt": "Câmera parada",
-        "ru": "Камера остановлена",
-        "zh_CN": "相机已停止",
-    },
-    "Please enter a username": {
-        "en": "Please enter a username",
-        "ar": "يرجى إدخال اسم المستخدم",
-        "de": "Bitte geben Sie einen Benutzernamen ein",
-        "es": "Por favor ingrese un nombre de usuario",
-        "it": "Si prega di inserire un nome utente",
-        "ja": "ユーザー名を入力してください",
-        "pt": "Por favor, insira um nome de usuário",
-        "ru": "Пожалуйста, введите имя пользователя",
-        "zh_CN": "请输入用户名",
-    },
-    "Camera is not active": {
-        "en": "Camera is not active",
-        "ar": "الكاميرا غير نشطة",
-        "de": "Kamera ist nicht aktiv",
-        "es": "La cámara no está activa",
-        "it": "La fotocamera non è attiva",
-        "ja": "カメラが有効になっていません",
-        "pt": "Câmera não está ativa",
-        "ru": "Камера неактивна",
-        "zh_CN": "相机未激活",
-    },
-    "Success": {
-        "en": "Success",
-        "ar": "نجاح",
-        "de": "Erfolg",
-        "es": "Éxito",
-        "it": "Successo",
-        "ja": "成功",
-        "pt": "Sucesso",
-        "ru": "Успех",
-        "zh_CN": "成功",
-    },
-    "Face for {username} enrolled with {count} photos": {
-        "en": "Face for {username} enrolled with {count} photos",
-        "ar": "تم تسجيل وجه {username} مع {count} صور",
-        "de": "Gesicht für {username} mit {count} Fotos registriert",
-        "es": "Rostro para {username} inscrito con {count} fotos",
-        "it": "Viso per {username} registrato con {count} foto",
-        "ja": "{username} のフェイスが {count} 枚の写真に登録されました",
-        "pt": "Rosto de {username} inscrito com {count} fotos",
-        "ru": "Лицо для {username} зарегистрировано с {count} фотографиями",
-        "zh_CN": "已使用 {count} 张照片为 {username} 登记人脸",
-    },
-    "Incomplete enrollment: {captured}/{total} photos captured": {
-        "en": "Incomplete enrollment: {captured}/{total} photos captured",
-        "ar": "تسجيل غير مكتمل: تم التقاط {captured}/{total} صور",
-        "de": "Unvollständige Registrierung: {captured}/{total} Fotos erfasst",
-        "es": "Inscripción incompleta: {captured}/{total} fotos capturadas",
-        "it": "Registrazione incompleta: {captured}/{total} foto acquisite",
-        "ja": "登録が不完全です: {captured}/{total} 枚の写真がキャプチャされました",
-        "pt": "Inscrição incompleta: {captured}/{total} fotos capturadas",
-        "ru": "Неполная регистрация: захвачено {captured}/{total} фотографий",
-        "zh_CN": "登记不完整：已捕获 {captured}/{total} 张照片",
-    },
-    "PAM Configuration (Authentication)": {
-        "en": "PAM Configuration (Authentication)",
-        "ar": "تكوين PAM (المصادقة)",
-        "de": "PAM-Konfiguration (Authentifizierung)",
-        "es": "Configuración PAM (Autenticación)",
-        "it": "Configurazione PAM (Autenticazione)",
-        "ja": "PAM 構成 (認証)",
-        "pt": "Configuração PAM (Autenticação)",
-        "ru": "Конфигурация PAM (аутентификация)",
-        "zh_CN": "PAM 配置（身份验证）",
-    },
-    "PAM (Pluggable Authentication Modules) allows using facial recognition for system authentication.": {
-        "en": "PAM (Pluggable Authentication Modules) allows using facial recognition for system authentication.",
-        "ar": "يسمح PAM (وحدات المصادقة القابلة للتوصيل) باستخدام التعرف على الوجه للمصادقة في النظام.",
-        "de": "PAM (Pluggable Authentication Modules) ermöglicht die Verwendung von Gesichtserkennung für die Systemauthentifizierung.",
-        "es": "PAM (módulos de autenticación conectables) permite utilizar el reconocimiento facial para la autenticación del sistema.",
-        "it": "PAM (Pluggable Authentication Modules) consente di utilizzare il riconoscimento facciale per l'autenticazione del sistema.",
-        "ja": "PAM（プラグイン可能な認証モジュール）により、顔認識をシステム認証に使用できます。",
-        "pt": "PAM (Módulos de Autenticação Conectáveis) permite usar reconhecimento facial para autenticação do sistema.",
-        "ru": "PAM (модули подключаемой аутентификации) позволяет использовать распознавание лиц для аутентификации системы.",
-        "zh_CN": "PAM（可插拔身份验证模块）允许为系统身份验证使用面部识别。",
-    },
-    "PAM Configuration": {
-        "en": "PAM Configuration",
-        "ar": "تكوين PAM",
-        "de": "PAM-Konfiguration",
-        "es": "Configuración PAM",
-        "it": "Configurazione PAM",
-        "ja": "PAM 構成",
-        "pt": "Configuração PAM",
-        "ru": "Конфигурация PAM",
-        "zh_CN": "PAM 配置",
-    },
-    "Preset configuration:": {
-        "en": "Preset configuration:",
-        "ar": "التكوين المسبق:",
-        "de": "Vorkonfiguration:",
-        "es": "Configuración preestablecida:",
-        "it": "Configurazione preimpostata:",
-        "ja": "プリセット構成:",
-        "pt": "Configuração predefinida:",
-        "ru": "Предустановленная конфигурация:",
-        "zh_CN": "预设配置:",
-    },
-    "Strict (facial recognition required)": {
-        "en": "Strict (facial recognition required)",
-        "ar": "صارم (التعرف على الوجه مطلوب)",
-        "de": "Streng (Gesichtserkennung erforderlich)",
-        "es": "Estricto (reconocimiento facial requerido)",
-        "it": "Rigoroso (riconoscimento facciale richiesto)",
-        "ja": "厳密（顔認識が必須）",
-        "pt": "Rigoroso (reconhecimento facial obrigatório)",
-        "ru": "Строгий (требуется распознавание лиц)",
-        "zh_CN": "严格（需要面部识别）",
-    },
-    "Medium (facial recognition + password)": {
-        "en": "Medium (facial recognition + password)",
-        "ar": "متوسط (التعرف على الوجه + كلمة المرور)",
-        "de": "Mittel (Gesichtserkennung + Passwort)",
-        "es": "Medio (reconocimiento facial + contraseña)",
-        "it": "Medio (riconoscimento facciale + password)",
-        "ja": "中（顔認識+パスワード）",
-        "pt": "Médio (reconhecimento facial + senha)",
-        "ru": "Средний (распознавание лиц + пароль)",
-        "zh_CN": "中等（面部识别+密码）",
-    },
-    "Permissive (facial recognition optional)": {
-        "en": "Permissive (facial recognition optional)",
-        "ar": "متساهل (التعرف على الوجه اختياري)",
-        "de": "Permissiv (Gesichtserkennung optional)",
-        "es": "Permisivo (reconocimiento facial opcional)",
-        "it": "Permissivo (riconoscimento facciale opzionale)",
-        "ja": "許可的（顔認識はオプション）",
-        "pt": "Permissivo (reconhecimento facial opcional)",
-        "ru": "Разрешительный (распознавание лиц опционально)",
-        "zh_CN": "宽松（面部识别可选）",
-    },
-    "Apply": {
-        "en": "Apply",
-        "ar": "تطبيق",
-        "de": "Anwenden",
-        "es": "Aplicar",
-        "it": "Applica",
-        "ja": "適用",
-        "pt": "Aplicar",
-        "ru": "Применить",
-        "zh_CN": "应用",
-    },
-    "Options": {
-        "en": "Options",
-        "ar": "خيارات",
-        "de": "Optionen",
-        "es": "Opciones",
-        "it": "Opzioni",
-        "ja": "オプション",
-        "pt": "Opções",
-        "ru": "Параметры",
-        "zh_CN": "选项",
-    },
-    "Facial recognition required": {
-        "en": "Facial recognition required",
-        "ar": "التعرف على الوجه مطلوب",
-        "de": "Gesichtserkennung erforderlich",
-        "es": "Reconocimiento facial requerido",
-        "it": "Riconoscimento facciale richiesto",
-        "ja": "顔認識が必須です",
-        "pt": "Reconhecimento facial obrigatório",
-        "ru": "Требуется распознавание лиц",
-        "zh_CN": "需要面部识别",
-    },
-    "Allow password as fallback": {
-        "en": "Allow password as fallback",
-        "ar": "السماح بكلمة المرور كبديل",
-        "de": "Passwort als Fallback zulassen",
-        "es": "Permitir contraseña como alternativa",
-        "it": "Consenti password come fallback",
-        "ja": "パスワードをフォールバックとして許可",
-        "pt": "Permitir senha como fallback",
-        "ru": "Разрешить пароль в качестве резервного варианта",
-        "zh_CN": "允许密码作为备用",
-    },
-    "Cache results": {
-        "en": "Cache results",
-        "ar": "نتائج ذاكرة التخزين المؤقت",
-        "de": "Ergebnisse zwischenspeichern",
-        "es": "Resultados en caché",
-        "it": "Risultati cache",
-        "ja": "キャッシュ結果",
-        "pt": "Armazenar em cache resultados",
-        "ru": "Кэшировать результаты",
-        "zh_CN": "缓存结果",
-    },
-    "Save Configuration": {
-        "en": "Save Configuration",
-        "ar": "حفظ التكوين",
-        "de": "Konfiguration speichern",
-        "es": "Guardar configuración",
-        "it": "Salva configurazione",
-        "ja": "構成を保存",
-        "pt": "Salvar configuração",
-        "ru": "Сохранить конфигурацию",
-        "zh_CN": "保存配置",
-    },
-    "Reload from Disk": {
-        "en": "Reload from Disk",
-        "ar": "إعادة تحميل من القرص",
-        "de": "Vom Datenträger neu laden",
-        "es": "Recargar desde disco",
-        "it": "Ricarica dal disco",
-        "ja": "ディスクから再度読み込み",
-        "pt": "Recarregar do disco",
-        "ru": "Перезагрузить с диска",
-        "zh_CN": "从磁盘重新加载",
-    },
-    "# PAM configuration not found": {
-        "en": "# PAM configuration not found",
-        "ar": "# لم يتم العثور على تكوين PAM",
-        "de": "# PAM-Konfiguration nicht gefunden",
-        "es": "# Configuración PAM no encontrada",
-        "it": "# Configurazione PAM non trovata",
-        "ja": "# PAM 構成が見つかりません",
-        "pt": "# Configuração PAM não encontrada",
-        "ru": "# Конфигурация PAM не найдена",
-        "zh_CN": "# 找不到 PAM 配置",
-    },
-    "Error: Permission denied to read PAM configuration": {
-        "en": "Error: Permission denied to read PAM configuration",
-        "ar": "خطأ: تم رفض الإذن لقراءة تكوين PAM",
-        "de": "Fehler: Berechtigung zum Lesen der PAM-Konfiguration verweigert",
-        "es": "Error: Permiso denegado para leer la configuración PAM",
-        "it": "Errore: Permesso negato per leggere la configurazione PAM",
-        "ja": "エラー: PAM 構成を読み取る権限がありません",
-        "pt": "Erro: Permissão negada para ler a configuração PAM",
-        "ru": "Ошибка: доступ запрещен при чтении конфигурации PAM",
-        "zh_CN": "错误：读取 PAM 配置的权限被拒绝",
-    },
-    "Error: {error}": {
-        "en": "Error: {error}",
-        "ar": "خطأ: {error}",
-        "de": "Fehler: {error}",
-        "es": "Error: {error}",
-        "it": "Errore: {error}",
-        "ja": "エラー: {error}",
-        "pt": "Erro: {error}",
-        "ru": "Ошибка: {error}",
-        "zh_CN": "错误：{error}",
-    },
-    "Confirmation": {
-        "en": "Confirmation",
-        "ar": "تأكيد",
-        "de": "Bestätigung",
-        "es": "Confirmación",
-        "it": "Conferma",
-        "ja": "確認",
-        "pt": "Confirmação",
-        "ru": "Подтверждение",
-        "zh_CN": "确认",
-    },
-    "Are you sure you want to modify the PAM configuration?\nThis requires administrator privileges.": {
-        "en": "Are you sure you want to modify the PAM configuration?\nThis requires administrator privileges.",
-        "ar": "هل أنت متأكد من أنك تريد تعديل تكوين PAM؟\nيتطلب هذا امتيازات المسؤول.",
-        "de": "Sind Sie sicher, dass Sie die PAM-Konfiguration ändern möchten?\nDies erfordert Administratorrechte.",
-        "es": "¿Está seguro de que desea modificar la configuración PAM?\nEsto requiere privilegios de administrador.",
-        "it": "Sei sicuro di voler modificare la configurazione PAM?\nCiò richiede privilegi di amministratore.",
-        "ja": "PAM 構成を変更しますか？\nこれには管理者権限が必要です。",
-        "pt": "Tem certeza de que deseja modificar a configuração PAM?\nIsso requer privilégios de administrador.",
-        "ru": "Вы уверены, что хотите изменить конфигурацию PAM?\nЭто требует прав администратора.",
-        "zh_CN": "确定要修改 PAM 配置吗？\n这需要管理员权限。",
-    },
-    "PAM configuration saved successfully": {
-        "en": "PAM configuration saved successfully",
-        "ar": "تم حفظ تكوين PAM بنجاح",
-        "de": "PAM-Konfiguration erfolgreich gespeichert",
-        "es": "Configuración PAM guardada correctamente",
-        "it": "Configurazione PAM salvata con successo",
-        "ja": "PAM 構成が正常に保存されました",
-        "pt": "Configuração PAM salva com sucesso",
-        "ru": "Конфигурация PAM успешно сохранена",
-        "zh_CN": "PAM 配置已成功保存",
-    },
-    "Error saving configuration: {error}": {
-        "en": "Error saving configuration: {error}",
-        "ar": "خطأ في حفظ التكوين: {error}",
-        "de": "Fehler beim Speichern der Konfiguration: {error}",
-        "es": "Error al guardar la configuración: {error}",
-        "it": "Errore nel salvataggio della configurazione: {error}",
-        "ja": "構成の保存エラー: {error}",
-        "pt": "Erro ao salvar configuração: {error}",
-        "ru": "Ошибка при сохранении конфигурации: {error}",
-        "zh_CN": "保存配置错误: {error}",
-    },
-    "Linux Hello Settings": {
-        "en": "Linux Hello Settings",
-        "ar": "إعدادات Linux Hello",
-        "de": "Linux Hello-Einstellungen",
-        "es": "Configuración de Linux Hello",
-        "it": "Impostazioni di Linux Hello",
-        "ja": "Linux Hello 設定",
-        "pt": "Configurações do Linux Hello",
-        "ru": "Параметры Linux Hello",
-        "zh_CN": "Linux Hello 设置",
-    },
-    "Camera Settings": {
-        "en": "Camera Settings",
-        "ar": "إعدادات الكاميرا",
-        "de": "Kameraeinstellungen",
-        "es": "Configuración de cámara",
-        "it": "Impostazioni della fotocamera",
-        "ja": "カメラ設定",
-        "pt": "Configurações da câmera",
-        "ru": "Параметры камеры",
-        "zh_CN": "相机设置",
-    },
-    "Default camera index:": {
-        "en": "Default camera index:",
-        "ar": "فهرس الكاميرا الافتراضي:",
-        "de": "Standard-Kameraindex:",
-        "es": "Índice de cámara predeterminado:",
-        "it": "Indice fotocamera predefinito:",
-        "ja": "デフォルトカメラインデックス:",
-        "pt": "Índice de câmera padrão:",
-        "ru": "Индекс камеры по умолчанию:",
-        "zh_CN": "默认相机索引:",
-    },
-    "Video width:": {
-        "en": "Video width:",
-        "ar": "عرض الفيديو:",
-        "de": "Videobreite:",
-        "es": "Ancho de vídeo:",
-        "it": "Larghezza video:",
-        "ja": "ビデオ幅:",
-        "pt": "Largura do vídeo:",
-        "ru": "Ширина видео:",
-        "zh_CN": "视频宽度:",
-    },
-    "Video height:": {
-        "en": "Video height:",
-        "ar": "ارتفاع الفيديو:",
-        "de": "Videohöhe:",
-        "es": "Altura de vídeo:",
-        "it": "Altezza video:",
-        "ja": "ビデオ高さ:",
-        "pt": "Altura do vídeo:",
-        "ru": "Высота видео:",
-        "zh_CN": "视频高度:",
-    },
-    "Recognition Settings": {
-        "en": "Recognition Settings",
-        "ar": "إعدادات التعرف",
-        "de": "Erkennungseinstellungen",
-        "es": "Configuración de reconocimiento",
-        "it": "Impostazioni di riconoscimento",
-        "ja": "認識設定",
-        "pt": "Configurações de reconhecimento",
-        "ru": "Параметры распознавания",
-        "zh_CN": "识别设置",
-    },
-    "Similarity threshold:": {
-        "en": "Similarity threshold:",
-        "ar": "عتبة التشابه:",
-        "de": "Ähnlichkeitsschwelle:",
-        "es": "Umbral de similitud:",
-        "it": "Soglia di somiglianza:",
-        "ja": "類似度のしきい値:",
-        "pt": "Limite de similaridade:",
-        "ru": "Порог сходства:",
-        "zh_CN": "相似度阈值:",
-    },
-    "Minimum confidence:": {
-        "en": "Minimum confidence:",
-        "ar": "الحد الأدنى للثقة:",
-        "de": "Minimales Vertrauen:",
-        "es": "Confianza mínima:",
-        "it": "Confidenza minima:",
-        "ja": "最小信頼度:",
-        "pt": "Confiança mínima:",
-        "ru": "Минимальная уверенность:",
-        "zh_CN": "最小置信度:",
-    },
-    "Performance Settings": {
-        "en": "Performance Settings",
-        "ar": "إعدادات الأداء",
-        "de": "Leistungseinstellungen",
-        "es": "Configuración de rendimiento",
-        "it": "Impostazioni di prestazioni",
-        "ja": "パフォーマンス設定",
-        "pt": "Configurações de desempenho",
-        "ru": "Параметры производительности",
-        "zh_CN": "性能设置",
-    },
-    "Timeout:": {
-        "en": "Timeout:",
-        "ar": "انتهاء المهلة الزمنية:",
-        "de": "Zeitüberschreitung:",
-        "es": "Tiempo de espera:",
-        "it": "Timeout:",
-        "ja": "タイムアウト:",
-        "pt": "Tempo limite:",
-        "ru": "Время ожидания:",
-        "zh_CN": "超时:",
-    },
-    "Max frames:": {
-        "en": "Max frames:",
-        "ar": "الحد الأقصى للإطارات:",
-        "de": "Max. Bilder:",
-        "es": "Máximo de fotogramas:",
-        "it": "Fotogrammi massimi:",
-        "ja": "最大フレーム:",
-        "pt": "Máximo de quadros:",
-        "ru": "Максимальное количество кадров:",
-        "zh_CN": "最大帧数:",
-    },
-    " seconds": {
-        "en": " seconds",
-        "ar": " ثواني",
-        "de": " Sekunden",
-        "es": " segundos",
-        "it": " secondi",
-        "ja": " 秒",
-        "pt": " segundos",
-        "ru": " секунд",
-        "zh_CN": " 秒",
-    },
-    "Logging": {
-        "en": "Logging",
-        "ar": "التسجيل",
-        "de": "Protokollierung",
-        "es": "Registro",
-        "it": "Registrazione",
-        "ja": "ロギング",
-        "pt": "Registro",
-        "ru": "Ведение журнала",
-        "zh_CN": "日志记录",
-    },
-    "Log level:": {
-        "en": "Log level:",
-        "ar": "مستوى السجل:",
-        "de": "Protokollstufe:",
-        "es": "Nivel de registro:",
-        "it": "Livello di log:",
-        "ja": "ログレベル:",
-        "pt": "Nível de registro:",
-        "ru": "Уровень логирования:",
-        "zh_CN": "日志级别:",
-    },
-    "Enable logging": {
-        "en": "Enable logging",
-        "ar": "تمكين التسجيل",
-        "de": "Protokollierung aktivieren",
-        "es": "Habilitar registro",
-        "it": "Abilita registrazione",
-        "ja": "ロギングを有効にする",
-        "pt": "Habilitar registro",
-        "ru": "Включить логирование",
-        "zh_CN": "启用日志记录",
-    },
-    "Save": {
-        "en": "Save",
-        "ar": "احفظ",
-        "de": "Speichern",
-        "es": "Guardar",
-        "it": "Salva",
-        "ja": "保存",
-        "pt": "Guardar",
-        "ru": "Сохранить",
-        "zh_CN": "保存",
-    },
-    "Reload": {
-        "en": "Reload",
-        "ar": "إعادة تحميل",
-        "de": "Neuladen",
-        "es": "Recargar",
-        "it": "Ricarica",
-        "ja": "リロード",
-        "pt": "Recarregar",
-        "ru": "Перезагрузить",
-        "zh_CN": "重新加载",
-    },
-    "Reset to Defaults": {
-        "en": "Reset to Defaults",
-        "ar": "إعادة تعيين إلى الإعدادات الافتراضية",
-        "de": "Auf Standardwerte zurücksetzen",
-        "es": "Restaurar valores predeterminados",
-        "it": "Reimposta predefiniti",
-        "ja": "デフォルトにリセット",
-        "pt": "Redefinir para padrões",
-        "ru": "Восстановить значения по умолчанию",
-        "zh_CN": "重置为默认值",
-    },
-    "Error loading configuration: {error}": {
-        "en": "Error loading configuration: {error}",
-        "ar": "خطأ في تحميل التكوين: {error}",
-        "de": "Fehler beim Laden der Konfiguration: {error}",
-        "es": "Error al cargar la configuración: {error}",
-        "it": "Errore durante il caricamento della configurazione: {error}",
-        "ja": "構成の読み込みエラー: {error}",
-        "pt": "Erro ao carregar configuração: {error}",
-        "ru": "Ошибка при загрузке конфигурации: {error}",
-        "zh_CN": "加载配置错误: {error}",
-    },
-    "Are you sure you want to save this configuration?\nThis may require administrator privileges.": {
-        "en": "Are you sure you want to save this configuration?\nThis may require administrator privileges.",
-        "ar": "هل أنت متأكد من أنك تريد حفظ هذا التكوين؟\nقد يتطلب امتيازات المسؤول.",
-        "de": "Sind Sie sicher, dass Sie diese Konfiguration speichern möchten?\nDies kann Administratorrechte erfordern.",
-        "es": "¿Está seguro de que desea guardar esta configuración?\nPuede requerir privilegios de administrador.",
-        "it": "Sei sicuro di voler salvare questa configurazione?\nPuò richiedere privilegi di amministratore.",
-        "ja": "この構成を保存しますか？\nこれには管理者権限が必要な場合があります。",
-        "pt": "Tem certeza de que deseja salvar esta configuração?\nPode exigir privilégios de administrador.",
-        "ru": "Вы уверены, что хотите сохранить эту конфигурацию?\nЭто может потребовать прав администратора.",
-        "zh_CN": "确定要保存此配置吗？\n这可能需要管理员权限。",
-    },
-    "Configuration saved successfully": {
-        "en": "Configuration saved successfully",
-        "ar": "تم حفظ التكوين بنجاح",
-        "de": "Konfiguration erfolgreich gespeichert",
-        "es": "Configuración guardada correctamente",
-        "it": "Configurazione salvata con successo",
-        "ja": "構成が正常に保存されました",
-        "pt": "Configuração salva com sucesso",
-        "ru": "Конфигурация успешно сохранена",
-        "zh_CN": "配置已成功保存",
-    },
-    "Are you sure you want to reset to default settings?": {
-        "en": "Are you sure you want to reset to default settings?",
-        "ar": "هل أنت متأكد من أنك تريد إعادة تعيين الإعدادات الافتراضية؟",
-        "de": "Sind Sie sicher, dass Sie die Einstellungen auf Standardwerte zurücksetzen möchten?",
-        "es": "¿Está seguro de que desea restaurar la configuración predeterminada?",
-        "it": "Sei sicuro di voler reimpostare le impostazioni predefinite?",
-        "ja": "デフォルト設定にリセットしますか？",
-        "pt": "Tem certeza de que deseja redefinir para as configurações padrão?",
-        "ru": "Вы уверены, что хотите восстановить параметры по умолчанию?",
-        "zh_CN": "确定要重置为默认设置吗？",
-    },
-    "👤 Face": {
-        "en": "👤 Face",
-        "ar": "👤 وجه",
-        "de": "👤 Gesicht",
-        "es": "👤 Rostro",
-        "it": "👤 Viso",
-        "ja": "👤 顔",
-        "pt": "👤 Rosto",
-        "ru": "👤 Лицо",
-        "zh_CN": "👤 人脸",
-    },
-    "🔐 PAM": {
-        "en": "🔐 PAM",
-        "ar": "🔐 PAM",
-        "de": "🔐 PAM",
-        "es": "🔐 PAM",
-        "it": "🔐 PAM",
-        "ja": "🔐 PAM",
-        "pt": "🔐 PAM",
-        "ru": "🔐 PAM",
-        "zh_CN": "🔐 PAM",
-    },
-    "⚙️ Settings": {
-        "en": "⚙️ Settings",
-        "ar": "⚙️ إعدادات",
-        "de": "⚙️ Einstellungen",
-        "es": "⚙️ Configuración",
-        "it": "⚙️ Impostazioni",
-        "ja": "⚙️ 設定",
-        "pt": "⚙️ Configurações",
-        "ru": "⚙️ Параметры",
-        "zh_CN": "⚙️ 设置",
-    },
-}
-
-def generate_po_file(lang_code, lang_name):
-    """Generate a .po file with translations for a language."""
-    content = f"""# {lang_name} translation for Linux Hello GUI
-# Copyright (C) 2025 Linux Hello Contributors
-#
-msgid ""
-msgstr ""
-"Project-Id-Version: linux-hello-gui 1.0.0\\n"
-"Content-Type: text/plain; charset=UTF-8\\n"
-"Language: {lang_code}\\n"
-
-"""
-    
-    for msgid, translations in TRANSLATIONS.items():
-        msgstr = translations.get(lang_code, "")
-        content += f'msgid "{msgid}"\n'
-        content += f'msgstr "{msgstr}"\n\n'
-    
-    return content
-
-if __name__ == "__main__":
-    import os
-    
-    po_dir = os.path.dirname(os.path.abspath(__file__))
-    languages = {
-        "ar": "Arabic",
-        "de": "German",
-        "en": "English",
-        "es": "Spanish",
-        "it": "Italian",
-        "ja": "Japanese",
-        "pt": "Portuguese",
-        "ru": "Russian",
-        "zh_CN": "Simplified Chinese",
-    }
-    
-    for lang_code, lang_name in languages.items():
-        po_file = os.path.join(po_dir, f"{lang_code}.po")
-        content = generate_po_file(lang_code, lang_name)
-        with open(po_file, "w", encoding="utf-8") as f:
-            f.write(content)
-        print(f"Generated: {po_file}")
-    
-    print("Done!")
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""Performance benchmarks for Linux Hello GUI."""
+
+import sys
+import os
+import json
+import subprocess
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Benchmarks do not need a visible window
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def timed(function, *args):
+    """Run ``function`` once and return ``(result, milliseconds)``."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+class BenchmarkRunner:
+    """Run performance benchmarks on the Linux Hello GUI."""
+
+    def __init__(self, clips=None):
+        from PySide6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        # Recorded clips with faces, for benchmarks that need real footage
+        self.clips = clips or []
+
+    def bench_language_switch(self):
+        """Switch the whole main window through every supported language."""
+        print("\n🌐 Language switching...")
+
+        from PySide6.QtCore import QCoreApplication, QEvent
+        from linux_hello_gui import i18n, retranslate
+        from linux_hello_gui.window import MainWindow
+        from linux_hello_gui.config_editor import ConfigEditorWidget
+
+        window = MainWindow()
+        editor = ConfigEditorWidget()
+        widgets = retranslate.registered_count()
+        print(f"  {widgets} widgets registered")
+
+        languages = list(i18n.SUPPORTED_LANGUAGES) + [i18n.DEFAULT_LANGUAGE]
+        for label, rounds in (("cold", 1), ("warm", 5)):
+            timings = []
+            for _round in range(rounds):
+                for language in languages:
+                    _result, ms = timed(i18n.set_language, language)
+                    timings.append(ms)
+            timings.sort()
+            print(f"  {label}: median {timings[len(timings) // 2]:.2f} ms, "
+                  f"max {timings[-1]:.2f} ms per switch")
+
+        window.close()
+        editor.close()
+        # Delete them now, on this thread: left to the garbage collector they
+        # may be destroyed on a worker thread of a later benchmark
+        window.deleteLater()
+        editor.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def bench_catalog_loading(self):
+        """Import time and first lookup, in a fresh interpreter each time."""
+        print("\n📖 Translation catalog loading...")
+
+        script = (
+            "import json, sys, time\n"
+            "sys.path.insert(0, sys.argv[1])\n"
+            "start = time.perf_counter()\n"
+            "from linux_hello_gui import i18n\n"
+            "imported = time.perf_counter()\n"
+            "i18n.setup_gettext(sys.argv[2])\n"
+            "i18n._('Settings')\n"
+            "first = time.perf_counter()\n"
+            "for i in range(10000): i18n._('Settings')\n"
+            "done = time.perf_counter()\n"
+            "print(json.dumps([imported - start, first - imported, (done - first) / 10000]))\n"
+        )
+        src = str(Path(__file__).parent / "src")
+        for language in ("fr", "ja"):
+            runs = []
+            for _round in range(5):
+                output = subprocess.run(
+                    [sys.executable, "-c", script, src, language],
+                    capture_output=True, text=True, check=True
+                ).stdout
+                runs.append(json.loads(output))
+            import_ms, first_ms, lookup_us = (sorted(column)[len(column) // 2] for column in zip(*runs))
+            print(f"  {language}: import {import_ms * 1000:.2f} ms, first lookup {first_ms * 1000:.3f} ms, "
+                  f"cached lookup {lookup_us * 1e6:.3f} µs")
+
+    def bench_icon_cache(self):
+        """Theme icon lookups and pixmap rendering, cold and cached."""
+        print("\n🖼  Icon cache...")
+
+        from linux_hello_gui.kde_integration import IconManager
+
+        IconManager.invalidate()
+        names = list(IconManager.ICONS)
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            for name in names:
+                for size in IconManager.SIZES:
+                    IconManager.get_pixmap(name, size)
+            ms = (time.perf_counter() - start) * 1000
+            print(f"  {label}: {ms:.2f} ms for {len(names) * len(IconManager.SIZES)} pixmaps")
+        print(f"  counters: {IconManager.stats()}")
+
+    def bench_app_icon(self):
+        """Window icon cost: full-size icon.png versus the generated icon set."""
+        print("\n🪪 Application icon...")
+
+        script = (
+            "import json, sys, time\n"
+            "sys.path.insert(0, sys.argv[1])\n"
+            "from PySide6.QtGui import QGuiApplication, QIcon\n"
+            "from PySide6.QtCore import QSize\n"
+            "from linux_hello_gui import app_icon\n"
+            "app = QGuiApplication(sys.argv[:1])\n"
+            "def rss():\n"
+            "    with open('/proc/self/status') as f:\n"
+            "        return next(int(l.split()[1]) for l in f if l.startswith('VmRSS'))\n"
+            "before = rss()\n"
+            "start = time.perf_counter()\n"
+            "if sys.argv[2] == 'set':\n"
+            "    icon = app_icon.load_app_icon()\n"
+            "else:\n"
+            "    icon = QIcon(str(app_icon.SOURCE_ICON))\n"
+            "# Sizes a window manager asks for\n"
+            "for size in (16, 32, 48):\n"
+            "    icon.pixmap(QSize(size, size))\n"
+            "print(json.dumps([time.perf_counter() - start, rss() - before]))\n"
+        )
+        src = str(Path(__file__).parent / "src")
+        for label, variant in (("icon.png", "png"), ("icon set", "set")):
+            runs = []
+            for _round in range(5):
+                output = subprocess.run(
+                    [sys.executable, "-c", script, src, variant],
+                    capture_output=True, text=True, check=True
+                ).stdout
+                runs.append(json.loads(output.splitlines()[-1]))
+            seconds, rss_kb = (sorted(column)[len(column) // 2] for column in zip(*runs))
+            print(f"  {label}: {seconds * 1000:.1f} ms, +{rss_kb / 1024:.1f} MB RSS")
+
+    def bench_enrollment_index(self):
+        """Index 10,000 enrolled users, then refresh after a single change."""
+        print("\n👥 Enrollment index...")
+
+        import tempfile
+        import numpy as np
+        from PySide6.QtCore import Qt
+        from linux_hello_gui.enrollment_admin import EnrollmentTableModel, StoreIndex
+
+        def apply(index, model):
+            for changed, removed in index.update():
+                model.apply_changes(changed, removed)
+
+        with tempfile.TemporaryDirectory() as store:
+            template = np.zeros((5, 128), np.float32)
+            for i in range(10000):
+                np.save(os.path.join(store, f"user{i:05d}.npy"), template)
+
+            index = StoreIndex((store,))
+            model = EnrollmentTableModel()
+            _result, ms = timed(apply, index, model)
+            print(f"  full scan: {ms:.1f} ms, {model.rowCount()} of {model.total_count()} rows loaded")
+
+            _result, ms = timed(model.sort, 3, Qt.DescendingOrder)
+            print(f"  sort: {ms:.1f} ms")
+            _result, ms = timed(model.set_filter, "user09")
+            print(f"  filter: {ms:.1f} ms ({model.matching_count()} matches)")
+            model.set_filter("")
+
+            np.save(os.path.join(store, "user00042.npy"), np.zeros((9, 128), np.float32))
+            _result, ms = timed(apply, index, model)
+            print(f"  refresh after one change: {ms:.1f} ms")
+
+    def bench_session_recorder(self):
+        """Recorder cost at camera pace (640×480, 30 fps) and playback speed."""
+        print("\n🎞  Session recorder...")
+
+        import tempfile
+        import numpy as np
+        from linux_hello_gui.session_recorder import SessionPlayer, SessionRecorder
+
+        # Smooth scene with sensor noise and a moving object, like a webcam
+        rng = np.random.default_rng(0)
+        y, x = np.mgrid[0:480, 0:640]
+        scene = np.dstack([x * 255 // 640, y * 255 // 480, (x + y) * 255 // 1120]).astype(np.int16)
+        noise = [rng.normal(0, 2, scene.shape).astype(np.int16) for _i in range(8)]
+        frames = []
+        for i in range(90):
+            frame = scene + noise[i % len(noise)]
+            frame[150:330, 100 + 4 * i:280 + 4 * i] = 128
+            frames.append(np.clip(frame, 0, 255).astype(np.uint8))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bench.lhrec")
+            recorder = SessionRecorder(path, {"width": 640, "height": 480, "fps": 30})
+            write_times = []
+            start = time.perf_counter()
+            for i, frame in enumerate(frames):
+                # Pace like a 30 fps camera
+                delay = start + i / 30 - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                _result, ms = timed(recorder.write, frame)
+                write_times.append(ms)
+            recorder.close()
+            stats = recorder.stats()
+
+            write_times.sort()
+            print(f"  capture thread: median {write_times[len(write_times) // 2]:.3f} ms, "
+                  f"max {write_times[-1]:.3f} ms per frame")
+            print(f"  writer thread: {100 * stats['writer_cpu'] / stats['duration']:.1f}% of one core")
+            print(f"  {stats['bytes'] / stats['duration'] / 1e6:.2f} MB/s "
+                  f"(raw {stats['raw_bytes'] / stats['duration'] / 1e6:.1f} MB/s), "
+                  f"{stats['dropped']} frames dropped")
+
+            player = SessionPlayer(path)
+            start = time.perf_counter()
+            count = 0
+            while player.read()[0]:
+                count += 1
+            seconds = time.perf_counter() - start
+            print(f"  unthrottled playback: {count / seconds:.0f} fps")
+            player.release()
+
+    def bench_frame_ring(self):
+        """Cost of feeding the failure ring from a 640×480 preview."""
+        print("\n⏺  Frame ring...")
+
+        import numpy as np
+        from linux_hello_gui.frame_ring import FrameRing
+
+        ring = FrameRing()
+        frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        stored = []
+        skipped = []
+        for i in range(300):
+            kept, ms = timed(ring.push, frame, i / 30)
+            (stored if kept else skipped).append(ms)
+        stored.sort()
+        skipped.sort()
+        print(f"  {ring.capacity} frames of {ring.size[0]}×{ring.size[1]}, {ring.nbytes / 1e6:.1f} MB")
+        print(f"  push: median {stored[len(stored) // 2]:.3f} ms stored, "
+              f"{skipped[len(skipped) // 2]:.4f} ms skipped")
+        _result, ms = timed(ring.snapshot)
+        print(f"  snapshot before dump: {ms:.1f} ms")
+
+    def bench_diagnostics(self):
+        """Diagnostics on this machine: concurrent run against the sum of its checks."""
+        print("\n🩺 Diagnostics...")
+
+        from linux_hello_gui import diagnostics
+
+        ctx = diagnostics.DiagnosticsContext.from_config()
+        diagnostics.clear_cache()
+        results, ms = timed(diagnostics.run_checks, ctx)
+        for result in sorted(results, key=lambda r: -r.duration):
+            print(f"  {result.check:<16} {result.duration * 1000:8.1f} ms  {result.status}")
+        total = sum(result.duration for result in results) * 1000
+        print(f"  concurrent: {ms:.1f} ms (sequential would be {total:.1f} ms)")
+        _results, ms = timed(diagnostics.run_checks, ctx)
+        print(f"  cached: {ms:.3f} ms")
+        diagnostics.clear_cache()
+
+    def bench_exposure(self):
+        """Per-frame cost of following auto-exposure until it settles."""
+        print("\n🔆 Exposure convergence...")
+
+        import numpy as np
+        from linux_hello_gui import exposure
+
+        frame = np.random.default_rng(0).integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+        for name, source in (("1280×720 BGR", frame), ("640×480 gray", frame[:480, :640, 0].copy())):
+            times = []
+            for _i in range(200):
+                monitor = exposure.ExposureMonitor()
+                times.append(timed(monitor.update, source)[1])
+            times.sort()
+            print(f"  {name}: median {times[len(times) // 2]:.3f} ms per frame")
+        monitor.stable = True
+        _result, ms = timed(monitor.update, frame)
+        print(f"  once stable: {ms * 1000:.1f} µs")
+
+    def bench_enhancement(self):
+        """Low-light enhancement cost per frame, and its effect on face detection."""
+        print("\n🌗 Low-light enhancement...")
+
+        import numpy as np
+        from linux_hello_gui import enhance
+
+        rng = np.random.default_rng(0)
+        for width, height in ((1280, 720), (1920, 1080)):
+            # Full-range gradient with noise: left alone unless dimmed
+            gradient = np.linspace(0, 255, width)[None, :, None] + rng.normal(0, 8, (height, width, 3))
+            scene = np.clip(gradient, 0, 255).astype(np.uint8)
+            dark = enhance.darken(scene, 0.3)
+            for name, source in (("dim", dark), ("well lit", scene)):
+                enhancer = enhance.Enhancer()
+                times = []
+                for _i in range(30):
+                    frame = source.copy()
+                    times.append(timed(enhancer.apply, frame)[1])
+                times.sort()
+                print(f"  {width}×{height} {name}: median {times[len(times) // 2]:.2f} ms, "
+                      f"{enhancer.lut_builds} table builds")
+
+        if not self.clips:
+            print("  detection hit rate: pass recorded clips as arguments to measure it")
+            return
+        for (dimmed, enhanced), rate in enhance.compare_hit_rates(self.clips, max_frames=150).items():
+            light = "dimmed" if dimmed else "recorded"
+            print(f"  {light}, {'enhanced' if enhanced else 'plain'}: {rate:.1%} frames with a face")
+
+    def bench_video_view(self):
+        """Preview cost per 720p frame: QLabel.setPixmap against VideoView."""
+        print("\n🎞  Video preview...")
+
+        import cv2
+        import numpy as np
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QImage, QPixmap
+        from PySide6.QtWidgets import QLabel
+        from linux_hello_gui.video_view import VideoView, Box, Caption
+
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8) for _i in range(4)]
+
+        label = QLabel()
+        label.setMinimumSize(600, 400)
+        label.setAlignment(Qt.AlignCenter)
+        label.resize(700, 450)
+        label.show()
+
+        def show_label(frame):
+            # What the preview did before VideoView
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            h, w, ch = rgb.shape
+            image = QImage(rgb.data, w, h, ch * w, QImage.Format_RGB888)
+            label.setPixmap(QPixmap.fromImage(image).scaledToWidth(600, Qt.SmoothTransformation))
+            label.repaint()
+
+        view = VideoView(minimum_size=(600, 400))
+        view.resize(700, 450)
+        view.show()
+        # Mapped and exposed, so repaint() really paints
+        self.app.processEvents()
+        overlays = [Box((400, 150, 400, 400), "alice"), Caption("30 fps")]
+
+        def show_view(frame):
+            view.set_frame(frame)
+            view.repaint()
+
+        def show_view_overlays(frame):
+            view.set_layer("faces", overlays)
+            show_view(frame)
+
+        for name, show in (("QLabel.setPixmap", show_label), ("VideoView", show_view),
+                           ("VideoView + overlays", show_view_overlays)):
+            view.paints = 0
+            times = sorted(timed(show, frames[i % len(frames)])[1] for i in range(60))
+            print(f"  {name}: median {times[len(times) // 2]:.2f} ms per frame")
+
+        # Frames pushed faster than the event loop paints: only the last is scaled
+        view.paints = 0
+        start = time.perf_counter()
+        for i in range(60):
+            view.set_frame(frames[i % len(frames)])
+            if i % 3 == 2:
+                self.app.processEvents()
+        ms = (time.perf_counter() - start) * 1000
+        print(f"  60 frames, event loop every 3rd: {view.paints} paints, {ms / 60:.2f} ms per frame")
+        label.close()
+        view.close()
+
+    def bench_face_alignment(self):
+        """Aligned enrollment crops against whole frames: capture cost, storage, reuse."""
+        print("\n🎯 Face alignment...")
+
+        import tempfile
+        import cv2
+        import numpy as np
+        from linux_hello_gui import alignment
+        from linux_hello_gui.face_features import detect_faces, load_templates
+        from linux_hello_gui.session_recorder import open_capture
+
+        # (frame, face box) samples: faces from recorded clips, else a textured scene
+        samples = []
+        for path in self.clips:
+            cap = open_capture(path)
+            while len(samples) < 30:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                faces = detect_faces(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+                if faces:
+                    samples.append((frame, faces[0]))
+            cap.release()
+        source = "recorded clips"
+        if not samples:
+            rng = np.random.default_rng(0)
+            texture = cv2.GaussianBlur(rng.normal(0, 30, (720, 1280, 3)), (0, 0), 4)
+            scene = np.clip(np.linspace(40, 220, 1280)[None, :, None] + texture, 0, 255).astype(np.uint8)
+            samples = [(scene, (490, 210, 300, 300))] * 30
+            source = "synthetic frames (pass recorded clips for real faces)"
+        print(f"  {len(samples)} samples from {source}")
+
+        aligned = []
+        times = []
+        for frame, face in samples:
+            result, ms = timed(alignment.align_face, frame, face)
+            aligned.append(result)
+            times.append(ms)
+        times.sort()
+        measured = sum(a.measured for a in aligned)
+        print(f"  landmarks + warp: median {times[len(times) // 2]:.2f} ms per frame, "
+              f"eyes found in {measured}/{len(aligned)}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            whole_dir = os.path.join(tmp_dir, "whole")
+            crop_dir = os.path.join(tmp_dir, "aligned")
+            os.makedirs(whole_dir)
+            os.makedirs(crop_dir)
+            for i, ((frame, _face), result) in enumerate(zip(samples, aligned)):
+                cv2.imwrite(os.path.join(whole_dir, f"face_{i:03d}.jpg"), frame)
+                cv2.imwrite(os.path.join(crop_dir, f"face_{i:03d}.jpg"), result.image)
+            alignment.save_manifest(crop_dir, {f"face_{i:03d}.jpg": a for i, a in enumerate(aligned)})
+
+            def size(directory):
+                return sum(os.path.getsize(os.path.join(directory, n)) for n in os.listdir(directory))
+
+            whole_kb = size(whole_dir) / len(samples) / 1024
+            crop_kb = size(crop_dir) / len(samples) / 1024
+            print(f"  storage per sample: {whole_kb:.1f} KiB whole frame, {crop_kb:.1f} KiB aligned "
+                  f"crop with landmarks ({whole_kb / crop_kb:.0f}× smaller)")
+
+            _templates, whole_ms = timed(load_templates, whole_dir)
+            _templates, crop_ms = timed(load_templates, crop_dir)
+            print(f"  loading templates: {whole_ms / len(samples):.2f} ms per whole frame, "
+                  f"{crop_ms / len(samples):.2f} ms per aligned crop")
+
+    def bench_liveness(self):
+        """Per-frame cost of the liveness signals on aligned crops."""
+        print("\n👁  Liveness...")
+
+        import numpy as np
+        from linux_hello_gui import liveness
+
+        rng = np.random.default_rng(0)
+        crops = [rng.integers(60, 200, (112, 112), dtype=np.uint8) for _i in range(8)]
+        monitor = liveness.LivenessMonitor()
+        times = sorted(timed(monitor.update, crops[i % len(crops)])[1] for i in range(300))
+        print(f"  update: median {times[len(times) // 2]:.2f} ms, p95 {times[int(len(times) * 0.95)]:.2f} ms per frame "
+              f"(budget {liveness.BUDGET_MS:.0f} ms)")
+        _result, ms = timed(monitor.result)
+        print(f"  score over {monitor.window} frames: {ms:.2f} ms")
+
+    def bench_multi_camera(self):
+        """Pairing of an RGB and an IR stream: latency, unpaired frames, cost."""
+        print("\n📷 Multi-camera pairing...")
+
+        import tempfile
+        import numpy as np
+        from linux_hello_gui import multicam
+        from linux_hello_gui.session_recorder import SessionRecorder
+
+        rng = np.random.default_rng(0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rgb = os.path.join(tmp_dir, "rgb.lhrec")
+            infrared = os.path.join(tmp_dir, "ir.lhrec")
+            frame = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+            with SessionRecorder(rgb, {"width": 640, "height": 480}) as recorder:
+                for i in range(90):
+                    recorder.write(frame, i / 30)
+            # IR: 2 ms of jitter, one frame in twenty lost
+            with SessionRecorder(infrared, {"width": 640, "height": 360}) as recorder:
+                for i in range(90):
+                    if i == 0 or rng.random() >= 0.05:
+                        recorder.write(frame[:360, :, 0], i / 30 + abs(rng.normal(0, 0.002)) * (i > 0))
+
+            for label, realtime in (("as fast as possible", False), ("at 30 fps", True)):
+                group = multicam.CaptureGroup([rgb, infrared], offsets=[0.0, 0.004], realtime=realtime)
+                start = time.perf_counter()
+                while group.read_set() is not None:
+                    pass
+                ms = (time.perf_counter() - start) * 1000
+                group.release()
+                stats = group.stats()
+                rates = ", ".join(f"{rate:.1%}" for rate in stats["unpaired_rate"])
+                print(f"  {label}: {stats['paired']} sets in {ms:.0f} ms, latency median "
+                      f"{stats['latency_ms']:.2f} ms, p95 {stats['latency_p95_ms']:.2f} ms, unpaired {rates}")
+
+            sets = [multicam.FrameSet((frame, frame[:360, :, 0]), (0.0, 0.0), 0.0)] * 30
+            for layout in (multicam.LAYOUT_SIDE_BY_SIDE, multicam.LAYOUT_PICTURE_IN_PICTURE):
+                times = sorted(timed(multicam.compose, s.frames, layout)[1] for s in sets)
+                print(f"  compose {layout}: median {times[len(times) // 2]:.2f} ms")
+
+    def bench_augmentation(self):
+        """Enrollment augmentation: batched vs per crop, process pool, accuracy per kind."""
+        print("\n🧬 Enrollment augmentation...")
+
+        import cv2
+        import numpy as np
+        from linux_hello_gui import augment
+
+        rng = np.random.default_rng(0)
+        crops = rng.integers(0, 256, (100, 112, 112), dtype=np.uint8)
+        for kind in augment.KINDS:
+            value = augment.VARIANTS[kind][-1]
+            augment.apply(kind, crops[:1], value)
+            _, batched = timed(augment.apply, kind, crops, value)
+            _, single = timed(lambda: [augment.apply(kind, crop[None], value) for crop in crops])
+            print(f"  {kind}: 100 crops batched {batched:.2f} ms, one by one {single:.2f} ms")
+
+        workers = os.cpu_count() or 1
+        for photos in (crops[:30], np.concatenate([crops] * 3)):
+            _, serial = timed(augment.expand, photos, 4, augment.KINDS, 0)
+            _, pooled = timed(augment.expand, photos, 4, augment.KINDS, workers)
+            print(f"  expand {len(photos)} photos x4: in process {serial:.0f} ms, "
+                  f"{workers} processes {pooled:.0f} ms")
+
+        # Synthetic people photographed at other angles and in other light;
+        # python -m linux_hello_gui.augment DATASET measures real faces
+        dataset = {}
+        for k in range(30):
+            base = cv2.resize(rng.integers(0, 256, (8, 8), dtype=np.uint8), (112, 112),
+                              interpolation=cv2.INTER_CUBIC)
+            shots = []
+            for _ in range(8):
+                matrix = cv2.getRotationMatrix2D((56, 56), rng.uniform(-12, 12), 1.0)
+                shot = cv2.warpAffine(base, matrix, (112, 112), borderMode=cv2.BORDER_REPLICATE)
+                shot = 255.0 * (shot / 255.0) ** rng.uniform(0.6, 1.6) + rng.integers(-60, 60)
+                shots.append(np.clip(shot + rng.normal(0, 20, shot.shape), 0, 255).astype(np.uint8))
+            dataset[f"person{k}"] = np.stack(shots)
+        accuracy = augment.compare_kinds(dataset, enroll=1)
+        print("  synthetic accuracy: " + ", ".join(f"{label} {value:.1%}" for label, value in accuracy.items()))
+
+    def run_all_benchmarks(self):
+        """Run all benchmarks."""
+        print("=" * 60)
+        print("⏱  Linux Hello GUI Benchmarks")
+        print("=" * 60)
+
+        self.bench_language_switch()
+        self.bench_catalog_loading()
+        self.bench_icon_cache()
+        self.bench_app_icon()
+        self.bench_enrollment_index()
+        self.bench_session_recorder()
+        self.bench_frame_ring()
+        self.bench_diagnostics()
+        self.bench_exposure()
+        self.bench_enhancement()
+        self.bench_video_view()
+        self.bench_face_alignment()
+        self.bench_liveness()
+        self.bench_multi_camera()
+        self.bench_augmentation()
+
+        print("=" * 60)
+        return 0
+
+
+if __name__ == "__main__":
+    # python run_benchmarks.py [CLIP...]
+    runner = BenchmarkRunner(sys.argv[1:])
+    sys.exit(runner.run_all_benchmarks())
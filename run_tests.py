@@ -31,6 +31,33 @@ class TestRunner:
             "linux_hello_gui.camera_widget",
             "linux_hello_gui.kde_integration",
             "linux_hello_gui.sudo_helper",
+            "linux_hello_gui.pam_profiles",
+            "linux_hello_gui.config_watcher",
+            "linux_hello_gui.config",
+            "linux_hello_gui.tuner",
+            "linux_hello_gui.tune_dialog",
+            "linux_hello_gui.face_features",
+            "linux_hello_gui.calibration",
+            "linux_hello_gui.calibration_view",
+            "linux_hello_gui.decision",
+            "linux_hello_gui.retranslate",
+            "linux_hello_gui.mo_catalog",
+            "linux_hello_gui.app_icon",
+            "linux_hello_gui.enrollment",
+            "linux_hello_gui.enrollment_admin",
+            "linux_hello_gui.session_recorder",
+            "linux_hello_gui.frame_ring",
+            "linux_hello_gui.diagnostics",
+            "linux_hello_gui.diagnostics_dialog",
+            "linux_hello_gui.frame_timing",
+            "linux_hello_gui.frame_timing_view",
+            "linux_hello_gui.exposure",
+            "linux_hello_gui.enhance",
+            "linux_hello_gui.video_view",
+            "linux_hello_gui.alignment",
+            "linux_hello_gui.liveness",
+            "linux_hello_gui.multicam",
+            "linux_hello_gui.augment",
         ]
         
         for module in modules:
@@ -153,6 +180,1533 @@ class TestRunner:
             self.tests_failed += 1
             self.errors.append(("widgets", str(e)))
     
+    def test_icon_cache(self):
+        """Test IconManager cache keys, invalidation and counters."""
+        print("\n🖼  Testing icon cache...")
+        
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui.kde_integration import IconManager
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        IconManager.invalidate()
+        before = IconManager.stats()
+        
+        def delta():
+            now = IconManager.stats()
+            return {key: now[key] - before[key] for key in ("hits", "misses", "icon_hits", "icon_misses")}
+        
+        first = IconManager.get_pixmap("save", 24, 1.0)
+        again = IconManager.get_pixmap("save", 24, 1.0)
+        after_repeat = delta()
+        IconManager.get_pixmap("save", 32, 1.0)
+        IconManager.get_pixmap("save", 24, 2.0)
+        after_keys = delta()
+        IconManager.get_icon("camera")
+        IconManager.get_icon("camera")
+        after_icons = delta()
+        pixmaps = IconManager.stats()["pixmaps"]
+        IconManager.invalidate()
+        IconManager.get_pixmap("save", 24, 1.0)
+        after_invalidate = delta()
+        
+        checks = [
+            ("repeat is a hit", after_repeat["hits"] == 1 and after_repeat["misses"] == 1
+             and first.cacheKey() == again.cacheKey()),
+            ("size and DPR are part of the key", after_keys["misses"] == 3 and after_keys["hits"] == 1),
+            ("theme lookups counted", after_icons["icon_misses"] == 2 and after_icons["icon_hits"] == 3),
+            ("pixmaps cached", pixmaps == 3),
+            ("invalidate drops the cache", after_invalidate["misses"] == 4
+             and IconManager.stats()["pixmaps"] == 1 and IconManager.stats()["icons"] == 1),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("icon_cache", name))
+    
+    def test_config_model(self):
+        """Test typed config validation, caching and publishing."""
+        print("\n🧾 Testing config model...")
+        
+        import json
+        import tempfile
+        from linux_hello_gui.config import Config, ConfigError, ConfigStore
+        
+        def rejects(**values):
+            try:
+                Config(**values)
+            except ConfigError:
+                return True
+            return False
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.json")
+            store = ConfigStore(path, revalidate_interval=0)
+            missing = store.get()
+            
+            first = store.publish(Config(timeout=7))
+            cached = store.get()
+            cache_hit = cached is store.get()
+            
+            # External writer replacing the file
+            with open(path + ".new", "w") as f:
+                json.dump({"timeout": 9, "generation": 5}, f)
+            os.replace(path + ".new", path)
+            external = store.get()
+            
+            second = store.publish(external.replace(max_frames=50))
+            reader = ConfigStore(path)
+            
+            # One bad value is repaired, the rest of the file still loads
+            lenient_path = os.path.join(tmp_dir, "lenient.json")
+            with open(lenient_path, "w") as f:
+                json.dump({"timeout": 60, "threshold": "high", "max_frames": 50}, f)
+            lenient = ConfigStore(lenient_path)
+            repaired = lenient.load()
+            
+            broken_path = os.path.join(tmp_dir, "broken.json")
+            with open(broken_path, "w") as f:
+                f.write("{not json")
+            broken = ConfigStore(broken_path)
+            try:
+                broken.load()
+                broken_raised = False
+            except ConfigError:
+                broken_raised = True
+            
+            checks = [
+                ("defaults when file is missing", missing == Config()),
+                ("range validation", rejects(timeout=0) and rejects(threshold=1.5)),
+                ("type validation", rejects(enable_logging="yes") and rejects(log_level="LOUD")),
+                ("int accepted for float field", Config(threshold=1).threshold == 1.0),
+                ("cached object reused", cache_hit),
+                ("external change detected", external.timeout == 9),
+                ("generation increases", first == 1 and second == 6),
+                ("published version readable", reader.get().max_frames == 50 and reader.generation == 6),
+                ("out-of-range value clamped", repaired.timeout == 30 and repaired.max_frames == 50),
+                ("invalid value defaulted", repaired.threshold == Config().threshold),
+                ("repairs reported", len(lenient.problems) == 2 and "timeout" in lenient.problems[0]),
+                ("failed load does not cache the stat key", broken_raised and broken._stat_key is None),
+            ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("config", name))
+    
+    def test_config_editor(self):
+        """Test the config editor's reaction to file errors and rapid edits."""
+        print("\n👀 Testing configuration editor...")
+        
+        import time
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui.config_editor import ConfigEditorWidget
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        import json
+        import tempfile
+        from linux_hello_gui.config import ConfigStore
+        
+        editor = ConfigEditorWidget()
+        editor.watcher.fileError.emit("/etc/linux-hello/config.json", "Expecting value: line 1 column 1")
+        text = editor.banner.label.text()
+        
+        # A file with one value out of range still fills the fields
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.json")
+            with open(path, "w") as f:
+                json.dump({"timeout": 60, "max_frames": 50}, f)
+            store = editor.store
+            editor.store = ConfigStore(path)
+            editor.load_config()
+            editor.store = store
+        adjusted = (editor.timeout.value() == 30 and editor.max_frames.value() == 50
+                    and not editor.banner.isHidden() and "timeout" in editor.banner.label.text())
+        
+        # Holding an arrow key: one simulation after the burst, not one per step
+        from linux_hello_gui import config_editor
+        simulate = config_editor.decision.expected_frames
+        runs = []
+        config_editor.decision.expected_frames = lambda *args, **kwargs: runs.append(1) or simulate(*args, **kwargs)
+        try:
+            for _step in range(20):
+                editor.max_frames.stepUp()
+            during = len(runs)
+            deadline = time.monotonic() + 2.0
+            while not runs and time.monotonic() < deadline:
+                app.processEvents()
+                time.sleep(0.01)
+        finally:
+            config_editor.decision.expected_frames = simulate
+        
+        checks = [
+            ("expected frames debounced", during == 0 and len(runs) == 1),
+            ("error shown", "Expecting value: line 1 column 1" in text),
+            ("path not shown as the error", "/etc/linux-hello/config.json" not in text),
+            ("reload not offered", editor.banner.reload_btn.isHidden()),
+            ("out-of-range value loaded clamped", adjusted),
+        ]
+        editor.deleteLater()
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("config_editor", name))
+    
+    def test_tune_dialog(self):
+        """Test that the tune dialog ignores results of older benchmark runs."""
+        print("\n🎛  Testing Benchmark & Tune dialog...")
+        
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui import tuner
+        from linux_hello_gui.tune_dialog import TuneDialog
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        measurement = tuner.Measurement(640, 480, "MJPG", 30.0, 5.0, 0.5, first_face_s=0.2, frames=30)
+        
+        dialog = TuneDialog()
+        # Two runs started: the first one was cancelled by the restart
+        dialog.generation = 2
+        dialog.measuring = True
+        dialog.on_progress(1, 5, 5)
+        dialog.on_measured(1, [measurement, measurement])
+        stale_ignored = dialog.table.rowCount() == 0 and dialog.measuring and dialog.progress_bar.value() != 5
+        dialog.on_measured(2, [measurement])
+        current_applied = dialog.table.rowCount() == 1 and dialog.recommendation is not None
+        
+        dialog.done(TuneDialog.Rejected)
+        dialog.on_measured(2, [measurement, measurement])
+        closed_ignored = dialog.table.rowCount() == 1
+        dialog.deleteLater()
+        
+        checks = [
+            ("stale run ignored", stale_ignored),
+            ("current run applied", current_applied),
+            ("results after closing ignored", closed_ignored),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("tune_dialog", name))
+    
+    def test_calibration(self):
+        """Test FAR/FRR curves on synthetic genuine/impostor scores."""
+        print("\n📈 Testing threshold calibration...")
+        
+        import numpy as np
+        from PySide6.QtWidgets import QApplication, QMessageBox
+        from linux_hello_gui import calibration, calibration_view
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        def confirmed(result, answer):
+            """Thresholds applied by the panel when the user answers ``answer``."""
+            panel = calibration_view.CalibrationPanel(lambda: 3)
+            panel.target_far.setValue(0.0001)
+            panel.on_calibrated(result)
+            applied = []
+            panel.thresholdSuggested.connect(applied.append)
+            question = QMessageBox.question
+            QMessageBox.question = staticmethod(lambda *args: answer)
+            try:
+                panel.apply_suggestion()
+            finally:
+                QMessageBox.question = question
+            panel.deleteLater()
+            return applied
+        
+        genuine = [np.array([0.1, 0.5, 0.9], dtype=np.float32), np.array([0.6, 0.7], dtype=np.float32)]
+        impostor = [np.array([0.2, 0.3, 0.4], dtype=np.float32), np.array([0.1, 0.1], dtype=np.float32)]
+        result = calibration.calibrate({"genuine": genuine, "impostor": impostor}, max_frames=3, steps=11)
+        at = result.index_of
+        
+        checks = [
+            ("frame FAR", np.isclose(result.frame_far[at(0.3)], 0.4)),
+            ("frame FRR", np.isclose(result.frame_frr[at(0.6)], 0.4)),
+            ("attempt FAR", np.isclose(result.attempt_far[at(0.3)], 0.5)),
+            ("attempt FRR", result.attempt_frr[at(0.8)] == 0.5),
+            ("frames to decision", np.isclose(result.genuine_frames[at(0.5)], 1.5)),
+            ("suggested threshold", np.isclose(result.suggest_threshold(0.0), 0.5)),
+            ("export names the score scale", result.to_dict()["score_scale"] == calibration.SCORE_SCALE),
+            ("suggestion needs confirmation", confirmed(result, QMessageBox.No) == []
+             and np.allclose(confirmed(result, QMessageBox.Yes), [0.5])),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("calibration", name))
+    
+    def test_decision_engine(self):
+        """Test the sequential decision engine with synthetic score streams."""
+        print("\n⏱️  Testing sequential decision...")
+        
+        from linux_hello_gui import decision
+        from linux_hello_gui.config import Config
+        
+        engine = decision.from_config(Config(max_frames=50, timeout=5))
+        clear_genuine = engine.run([0.9] * 50)
+        borderline = engine.run([0.42] * 50)
+        impostor = engine.run([0.05] * 50)
+        no_face = engine.run([None] * 50)
+        undecided = engine.run([0.35] * 50)
+        slow = engine.run([0.35] * 50, timestamps=[0.5 * i for i in range(1, 51)])
+        genuine_frames, impostor_frames = decision.expected_frames(engine, trials=200)
+        
+        checks = [
+            ("clear genuine accepted on first frame",
+             clear_genuine.decision == decision.ACCEPT and clear_genuine.frames_used == 1),
+            ("borderline genuine needs more frames",
+             borderline.decision == decision.ACCEPT and 1 < borderline.frames_used < 50),
+            ("clear impostor rejected fast", impostor.decision == decision.REJECT and impostor.frames_used <= 2),
+            ("empty frames fail early", no_face.reason == decision.REASON_NO_FACE and no_face.frames_used < 50),
+            ("frame budget ends attempt", undecided.reason == decision.REASON_BUDGET and undecided.frames_used == 50),
+            ("timeout ends attempt", slow.reason == decision.REASON_TIMEOUT and slow.time_to_decision == 5.0),
+            ("expected frames within budget", 1 <= genuine_frames < 50 and 1 <= impostor_frames < 50),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("decision", name))
+    
+    def test_pam_profiles(self):
+        """Test per-service PAM profile rendering against a fixture /etc/pam.d."""
+        print("\n🔐 Testing PAM profiles...")
+        
+        import tempfile
+        from linux_hello_gui import pam_profiles
+        
+        with tempfile.TemporaryDirectory() as pam_dir:
+            with open(os.path.join(pam_dir, "sudo"), "w") as f:
+                f.write("#%PAM-1.0\n@include linux-hello-sudo\n@include common-auth\n")
+            with open(os.path.join(pam_dir, "sddm"), "w") as f:
+                f.write("auth include common-auth\n")
+            
+            profiles = pam_profiles.get_default_profiles()
+            profiles["sudo"].timeout = 2
+            profiles["sudo"].fallback = pam_profiles.FALLBACK_FACE_ONLY
+            
+            for file_name, content in pam_profiles.render_all(profiles).items():
+                with open(os.path.join(pam_dir, file_name), "w") as f:
+                    f.write(content)
+            
+            results = pam_profiles.validate_all(profiles, pam_dir)
+            round_trip = pam_profiles.load_profiles(pam_dir) == profiles
+            
+            # A profile that exists but cannot be read is reported
+            unreadable = os.path.join(pam_dir, pam_profiles.PROFILE_PREFIX + "sudo")
+            os.unlink(unreadable)
+            os.mkdir(unreadable)
+            errors = []
+            fallback = pam_profiles.load_profiles(pam_dir, errors)
+            checks = [
+                ("round trip", round_trip),
+                ("unreadable profile reported", [path for path, _error in errors] == [unreadable]
+                 and fallback["sudo"] == pam_profiles.get_default_profiles()["sudo"]),
+                ("included service is valid", results["sudo"] == []),
+                ("missing include is reported", len(results["sddm"]) == 1),
+                ("missing service file is reported", len(results["kde"]) == 1),
+                ("disabled service is ignored", results["login"] == []),
+            ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("pam_profiles", name))
+    
+    def test_language_switch(self):
+        """Test runtime language switching and catalog caching."""
+        print("\n🌐 Testing language switching...")
+        
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui import i18n
+        from linux_hello_gui.config_watcher import ConflictBanner
+        from linux_hello_gui.retranslate import tr, unbind
+        from linux_hello_gui.video_view import VideoView
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        notified = []
+        i18n.add_language_listener(notified.append)
+        try:
+            i18n.set_language("fr")
+            french = i18n._("Settings")
+            catalog = i18n._get_catalog("fr")
+            i18n.set_language("de")
+            i18n.set_language("fr")
+            checks = [
+                ("listeners notified", notified == ["fr", "de", "fr"]),
+                ("active language reported", i18n.get_language() == "fr"),
+                ("catalog cached", i18n._get_catalog("fr") is catalog),
+                ("translation switched", french != "Settings" or not catalog.info()),
+            ]
+            
+            banner = ConflictBanner()
+            banner.show_error("boom")
+            stopped = VideoView()
+            tr(stopped, "setText", "Camera stopped")
+            running = VideoView()
+            tr(running, "setText", "Camera stopped")
+            unbind(running, "setText")
+            running.setText("")
+            i18n.set_language("de")
+            checks += [
+                ("error banner retranslated",
+                 banner.label.text() == i18n._("Error: {error}").format(error="boom")),
+                ("preview message retranslated", stopped.text() == i18n._("Camera stopped")),
+                ("unbound message not restored", running.text() == ""),
+            ]
+        finally:
+            i18n.remove_language_listener(notified.append)
+            i18n.set_language(i18n.DEFAULT_LANGUAGE)
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("i18n", name))
+    
+    def test_translation_catalogs(self):
+        """Test memory-mapped catalogs against the standard gettext parser."""
+        print("\n📖 Testing translation catalogs...")
+        
+        import gettext
+        from linux_hello_gui import i18n
+        from linux_hello_gui.mo_catalog import MoCatalog
+        
+        for language in i18n.SUPPORTED_LANGUAGES:
+            path = i18n.LOCALE_DIR / language / "LC_MESSAGES" / f"{i18n.DOMAIN}.mo"
+            if not path.exists():
+                print(f"  ⚠ {language}: no compiled catalog")
+                continue
+            
+            with open(path, "rb") as f:
+                reference = gettext.GNUTranslations(f)
+            catalog = MoCatalog(path)
+            unhashed = MoCatalog(path)
+            unhashed._hash_size = 0
+            
+            messages = [k for k in reference._catalog if isinstance(k, str) and k]
+            ok = all(
+                catalog.gettext(m) == unhashed.gettext(m) == reference.gettext(m)
+                for m in messages
+            )
+            ok = ok and catalog.gettext("\0missing") == "\0missing"
+            ok = ok and catalog.ngettext("file", "files", 2) == "files"
+            if ok:
+                print(f"  ✓ {language} ({len(messages)} messages)")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {language}")
+                self.tests_failed += 1
+                self.errors.append(("catalog", language))
+    
+    def test_string_extraction(self):
+        """Test the po/ string extractor and catalog merge."""
+        print("\n🔤 Testing string extraction...")
+        
+        sys.path.insert(0, str(Path(__file__).parent / "po"))
+        import extract_strings
+        import pofile
+        
+        source = (
+            "from .i18n import _, ngettext\n"
+            "label = _('Ready')\n"
+            "tr(button, 'setText', 'Save')\n"
+            "ngettext('{n} face', '{n} faces', 2)\n"
+            "_(variable)\n"
+        )
+        found = [(m[0], m[1]) for m in extract_strings.extract_source(source)]
+        
+        old = pofile.parse(
+            'msgid ""\nmsgstr "Language: fr\\n"\n\n'
+            'msgid "Ready"\nmsgstr "Prêt"\n\n'
+            'msgid "Gone"\nmsgstr "Parti"\n'
+        )[2]
+        with open(Path(__file__).parent / "src" / "linux_hello_gui" / "pam_profiles.py") as f:
+            pam_messages = {m[0] for m in extract_strings.extract_source(f.read())}
+        messages = extract_strings.collect_messages({"a.py": {"messages": [[m, p, 1] for m, p in found]}})
+        merged = {e.msgid: e for e in extract_strings.merge_entries(old, messages)}
+        
+        checks = [
+            ("literal calls found", found == [("Ready", None), ("Save", None), ("{n} face", "{n} faces")]),
+            ("translation kept", merged["Ready"].msgstr == "Prêt"),
+            ("new message added", merged["Save"].msgstr == ""),
+            ("removed message obsolete", merged["Gone"].obsolete),
+            ("N_ marked service labels found", {"Screen locker", "Console login"} <= pam_messages),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("extract_strings", name))
+    
+    def test_translation_compiler(self):
+        """Test the built-in .mo writer and placeholder validation."""
+        print("\n🛠  Testing translation compiler...")
+        
+        import gettext
+        import io
+        
+        sys.path.insert(0, str(Path(__file__).parent / "po"))
+        import compile_translations
+        import pofile
+        from linux_hello_gui.mo_catalog import build_mo
+        
+        messages = {"": "Content-Type: text/plain; charset=UTF-8\n"}
+        messages.update({f"Message {i}": f"Nachricht {i}" for i in range(200)})
+        messages["{n} face\0{n} faces"] = "{n} Gesicht\0{n} Gesichter"
+        catalog = gettext.GNUTranslations(io.BytesIO(build_mo(messages)))
+        
+        good = pofile.Entry("Error: {error}", msgstr="Fehler: {error}")
+        bad = pofile.Entry("Error: {error}", msgstr="Fehler: {fehler}")
+        
+        checks = [
+            ("messages readable", all(catalog.gettext(f"Message {i}") == f"Nachricht {i}" for i in range(200))),
+            ("plural forms readable", catalog.ngettext("{n} face", "{n} faces", 2) == "{n} Gesichter"),
+            ("matching placeholders accepted", compile_translations.check_placeholders(good) == []),
+            ("renamed placeholder reported", len(compile_translations.check_placeholders(bad)) == 2),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("compile_translations", name))
+    
+    def test_app_icon_set(self):
+        """Test icon set generation from icon.png."""
+        print("\n🪪 Testing application icon set...")
+        
+        import tempfile
+        import cv2
+        import numpy as np
+        from linux_hello_gui import app_icon
+        
+        with tempfile.TemporaryDirectory() as destination:
+            written = app_icon.generate_icon_set(destination=destination, sizes=(16, 48))
+            shapes = [cv2.imread(str(path), cv2.IMREAD_UNCHANGED).shape[:2] for path in written]
+            again = app_icon.generate_icon_set(destination=destination, sizes=(16, 48))
+            # The committed set is what packages install: it must match icon.png
+            fresh = os.path.join(destination, "fresh")
+            app_icon.generate_icon_set(destination=fresh, force=True)
+            stale = [size for size in app_icon.ICON_SIZES
+                     if not app_icon.icon_path(app_icon.PACKAGE_ICONS, size).exists()
+                     or not np.array_equal(
+                         cv2.imread(str(app_icon.icon_path(app_icon.PACKAGE_ICONS, size)), cv2.IMREAD_UNCHANGED),
+                         cv2.imread(str(app_icon.icon_path(fresh, size)), cv2.IMREAD_UNCHANGED))]
+            checks = [
+                ("one file per size", shapes == [(16, 16), (48, 48)]),
+                ("up-to-date sizes skipped", again == []),
+                ("packaged set matches icon.png (make icons)", stale == []),
+            ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("app_icon", name))
+    
+    def test_enrollment_status(self):
+        """Test profile status reading and debounced change notification."""
+        print("\n👤 Testing enrollment status...")
+        
+        import tempfile
+        import numpy as np
+        from PySide6.QtCore import QEventLoop, QTimer
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui.enrollment import EnrollmentWatcher, read_profile
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            user_store = os.path.join(tmp_dir, "home", "faces")
+            system_store = os.path.join(tmp_dir, "system")
+            os.makedirs(system_store)
+            np.save(os.path.join(system_store, "alice.npy"), np.zeros((4, 128), np.float32))
+            
+            system = read_profile("alice", (user_store, system_store))
+            missing = read_profile("bob", (user_store, system_store))
+            
+            watcher = EnrollmentWatcher("bob", (user_store, system_store), delay=50, create=(), poll=50)
+            received = []
+            # No parent of the missing store exists: polled for, nothing above watched
+            watched_before = set(watcher._watcher.directories())
+            watcher.statusChanged.connect(received.append)
+            initial = watcher.read_now()
+            
+            # Store created after the watcher started, then written in a burst
+            os.makedirs(user_store)
+            for i in range(3):
+                with open(os.path.join(user_store, f"face_{i:03d}.jpg"), "wb") as f:
+                    f.write(b"\0" * 100)
+            
+            loop = QEventLoop()
+            watcher.statusChanged.connect(lambda _status: loop.quit())
+            QTimer.singleShot(3000, loop.quit)
+            # The parent directory fires first; the new store is picked up on flush
+            while not received or received[-1].samples < 3:
+                before = len(received)
+                loop.exec()
+                if len(received) == before:
+                    break
+            
+            private_store = os.path.join(tmp_dir, "private", "faces")
+            private = EnrollmentWatcher("bob", (private_store,), create=(private_store,))
+            private_parent = os.path.join(tmp_dir, "private")
+            private_watched = set(private._watcher.directories()) == {private_parent}
+            private_mode = os.stat(private_parent).st_mode & 0o777
+            
+            checks = [
+                ("no home-wide watch", watched_before == {system_store}),
+                ("store parent created private", private_watched and private_mode == 0o700),
+                ("template rows counted", system.samples == 4 and system.store == system_store),
+                ("missing profile not enrolled", not missing.enrolled and initial == missing),
+                ("new samples pushed", bool(received) and received[-1].samples == 3),
+                ("store size reported", bool(received) and received[-1].size == 300),
+                ("burst coalesced", len(received) <= 2),
+            ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("enrollment", name))
+    
+    def test_enrollment_index(self):
+        """Test the all-users index, paging, sorting and incremental updates."""
+        print("\n👥 Testing enrollment index...")
+        
+        import tempfile
+        import numpy as np
+        from PySide6.QtCore import Qt
+        from linux_hello_gui import enrollment_admin
+        from linux_hello_gui.enrollment_admin import EnrollmentTableModel, StoreIndex
+        
+        def apply(index, model):
+            batches = list(index.update(workers=4))
+            for changed, removed in batches:
+                model.apply_changes(changed, removed)
+            return batches
+        
+        with tempfile.TemporaryDirectory() as store:
+            for i in range(450):
+                np.save(os.path.join(store, f"user{i:03d}.npy"), np.zeros((1 + i % 7, 8), np.float32))
+            
+            index = StoreIndex((store,))
+            model = EnrollmentTableModel()
+            apply(index, model)
+            first_page = model.rowCount()
+            while model.canFetchMore():
+                model.fetchMore()
+            fetched = model.rowCount()
+            
+            model.sort(1, Qt.DescendingOrder)
+            most_samples = model.status(0).samples
+            model.set_filter("user04")
+            filtered = model.matching_count()
+            model.set_filter("")
+            model.sort(0, Qt.AscendingOrder)
+            
+            # One new user, one removed, one re-enrolled
+            np.save(os.path.join(store, "aaron.npy"), np.zeros((3, 8), np.float32))
+            os.remove(os.path.join(store, "user001.npy"))
+            np.save(os.path.join(store, "user002.npy"), np.zeros((9, 8), np.float32))
+            batches = apply(index, model)
+            changed = [status.user for batch, _removed in batches for status in batch]
+            removed = [user for _batch, batch in batches for user in batch]
+            idle = apply(index, model)
+            while model.canFetchMore():
+                model.fetchMore()
+            
+            rows = [model.status(row).user for row in range(model.rowCount())]
+            checks = [
+                ("first page only", first_page == enrollment_admin.PAGE_SIZE),
+                ("all users fetched", fetched == 450),
+                ("sorted by samples", most_samples == 7),
+                ("filtered in memory", filtered == 10),
+                ("only changed users re-read", sorted(changed) == ["aaron", "user002"]),
+                ("removed user reported", removed == ["user001"]),
+                ("nothing re-read when unchanged", idle == []),
+                ("rows updated in place", rows[:3] == ["aaron", "user000", "user002"]
+                 and model.status(2).samples == 9 and len(rows) == 450),
+            ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("enrollment_admin", name))
+    
+    def test_session_recorder(self):
+        """Test session recording round trip and playback as a camera source."""
+        print("\n🎞  Testing session recorder...")
+        
+        import tempfile
+        import cv2
+        import numpy as np
+        from linux_hello_gui.calibration import score_clip
+        from linux_hello_gui.session_recorder import SessionPlayer, SessionRecorder
+        
+        rng = np.random.default_rng(0)
+        background = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+        frames = []
+        for i in range(45):
+            frame = background.copy()
+            frame[40:80, i:i + 40] = 255 - i
+            frames.append(frame)
+        # A resolution change mid-stream
+        frames.append(rng.integers(0, 256, (60, 80, 3), dtype=np.uint8))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "enroll.lhrec")
+            recorder = SessionRecorder(path, {"width": 160, "height": 120}, chunk_frames=20, queue_frames=100)
+            for i, frame in enumerate(frames):
+                recorder.write(frame, timestamp=10.0 + i / 30)
+            recorder.close()
+            stats = recorder.stats()
+            
+            player = SessionPlayer(path)
+            played = []
+            while True:
+                ret, frame = player.read()
+                if not ret:
+                    break
+                played.append(frame)
+            rewound = player.set(cv2.CAP_PROP_POS_FRAMES, 0) and player.read()[0]
+            fps = player.get(cv2.CAP_PROP_FPS)
+            player.release()
+            
+            # Recording cut short before its index was written
+            with open(path, "rb") as f:
+                data = f.read()
+            cut = os.path.join(tmp_dir, "cut.lhrec")
+            with open(cut, "wb") as f:
+                f.write(data[:stats["bytes"] * 2 // 3])
+            partial = SessionPlayer(cut)
+            
+            checks = [
+                ("frames restored exactly", len(played) == len(frames)
+                 and all(np.array_equal(a, b) for a, b in zip(frames, played))),
+                ("compressed", stats["bytes"] < stats["raw_bytes"] // 2),
+                ("timestamps kept", abs(fps - 30.0) < 0.01),
+                ("rewind supported", rewound),
+                ("truncated file readable", 0 < partial.frame_count < len(frames)),
+                ("usable as clip source", len(score_clip(path, np.zeros((0, 1), np.float32))) == len(frames)),
+            ]
+            partial.release()
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("session_recorder", name))
+    
+    def test_frame_ring(self):
+        """Test the bounded frame ring and its failure dump."""
+        print("\n⏺  Testing frame ring...")
+        
+        import tempfile
+        import numpy as np
+        from linux_hello_gui.frame_ring import FrameRing
+        from linux_hello_gui.session_recorder import SessionPlayer
+        
+        ring = FrameRing(seconds=2, fps=10, size=(64, 48))
+        storage = ring._frames
+        size = ring.nbytes
+        # 30 fps camera for 5 seconds: every third frame is sampled
+        for i in range(150):
+            ring.push(np.full((480, 640, 3), i % 256, np.uint8), timestamp=i / 30)
+        frames, timestamps = ring.snapshot()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = ring.dump("test", {"stderr": "no face"}, directory=tmp_dir)
+            ring.last_dump.join()
+            player = SessionPlayer(path)
+            ret, first = player.read()
+            checks = [
+                ("capacity from seconds and fps", ring.capacity == 20 and ring.count == 20),
+                ("storage preallocated", ring._frames is storage and ring.nbytes == size),
+                ("oldest first", bool(np.all(np.diff(timestamps) > 0)) and frames[-1][0, 0, 0] == 147),
+                ("sampled at ring rate", abs(float(np.median(np.diff(timestamps))) - 0.1) < 1e-6),
+                ("dump readable", ret and player.frame_count == 20 and first.shape == (48, 64, 3)),
+                ("output kept", player.metadata.get("stderr") == "no face"),
+            ]
+            player.release()
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("frame_ring", name))
+    
+    def test_diagnostics(self):
+        """Test the concurrent diagnostics against fixture directories."""
+        print("\n🩺 Testing diagnostics...")
+        
+        import tempfile
+        import time
+        import numpy as np
+        from linux_hello_gui import diagnostics, pam_profiles
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            v4l_dir = os.path.join(tmp_dir, "video4linux")
+            for index, name in ((0, "Integrated IR Camera"), (2, "Integrated RGB Camera")):
+                os.makedirs(os.path.join(v4l_dir, f"video{index}"))
+                with open(os.path.join(v4l_dir, f"video{index}", "name"), "w") as f:
+                    f.write(name + "\n")
+            
+            pam_dir = os.path.join(tmp_dir, "pam.d")
+            os.makedirs(pam_dir)
+            profiles = pam_profiles.get_default_profiles()
+            for file_name, content in pam_profiles.render_all(profiles).items():
+                with open(os.path.join(pam_dir, file_name), "w") as f:
+                    f.write(content)
+            with open(os.path.join(pam_dir, "sudo"), "w") as f:
+                f.write("@include linux-hello-sudo\n@include common-auth\n")
+            with open(os.path.join(pam_dir, "common-auth"), "w") as f:
+                f.write("auth include sudo\n")
+            
+            config_path = os.path.join(tmp_dir, "config.json")
+            with open(config_path, "w") as f:
+                f.write("{not json")
+            
+            faces_dir = os.path.join(tmp_dir, "faces")
+            os.makedirs(faces_dir, mode=0o700)
+            os.chmod(faces_dir, 0o700)
+            np.save(os.path.join(faces_dir, "alice.npy"), np.zeros((3, 7), np.float32))
+            
+            ctx = diagnostics.DiagnosticsContext(
+                camera_index=1, config_path=config_path, pam_dir=pam_dir,
+                faces_dir=faces_dir, video4linux_dir=v4l_dir, hello_binary="hello-missing",
+            )
+            checks = {name: diagnostics.CHECKS[name]
+                      for name in ("camera_devices", "pam", "config", "face_store", "hello")}
+            results = {r.check: r for r in diagnostics.run_checks(ctx, checks, force=True)}
+            cycle = any("→" in value for _label, value in results["pam"].details)
+            
+            # Concurrency, per-check timeout and cache reuse with slow checks
+            def slow(ctx):
+                time.sleep(0.3)
+                return diagnostics.STATUS_OK, "slow", []
+            
+            def hung(ctx):
+                time.sleep(2)
+                return diagnostics.STATUS_OK, "late", []
+            
+            diagnostics.clear_cache()
+            slow_checks = {"a": slow, "b": slow, "c": slow, "hung": hung}
+            reported = []
+            start = time.perf_counter()
+            timed = diagnostics.run_checks(ctx, slow_checks, timeout=0.6, on_result=reported.append)
+            elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            again = diagnostics.run_checks(ctx, {name: slow for name in "abc"})
+            cached_elapsed = time.perf_counter() - start
+            retried = diagnostics.run_checks(ctx, {"hung": hung}, timeout=0.1)
+            forced = diagnostics.run_checks(ctx, {"a": slow}, force=True)
+            
+            # A timed out camera check lets go of the device when asked
+            class SlowCamera:
+                released = False
+                
+                def __init__(self, index):
+                    pass
+                
+                def isOpened(self):
+                    return True
+                
+                def set(self, prop, value):
+                    return True
+                
+                def get(self, prop):
+                    return 30.0
+                
+                def read(self):
+                    time.sleep(0.05)
+                    return True, np.random.randint(0, 256, (48, 64, 3), np.uint8)
+                
+                def release(self):
+                    SlowCamera.released = True
+            
+            video_capture = diagnostics.cv2.VideoCapture
+            diagnostics.cv2.VideoCapture = SlowCamera
+            try:
+                stream = diagnostics.run_checks(ctx, {"stream": diagnostics.check_camera_stream}, timeout=0.2)
+                held = not SlowCamera.released
+                start = time.perf_counter()
+                released = diagnostics.release_camera(timeout=2.0) and SlowCamera.released
+                release_elapsed = time.perf_counter() - start
+            finally:
+                diagnostics.cv2.VideoCapture = video_capture
+            diagnostics.clear_cache()
+        
+        checks = [
+            ("missing camera reported", results["camera_devices"].status == diagnostics.STATUS_ERROR
+             and len(results["camera_devices"].details) == 2),
+            ("PAM include cycle found", results["pam"].status == diagnostics.STATUS_ERROR and cycle),
+            ("bad config reported", results["config"].status == diagnostics.STATUS_ERROR),
+            ("damaged template reported", results["face_store"].status == diagnostics.STATUS_ERROR),
+            ("missing hello reported", results["hello"].status == diagnostics.STATUS_ERROR),
+            ("results in check order", [r.check for r in timed] == list(slow_checks)),
+            ("checks run concurrently", elapsed < 0.9),
+            ("hung check times out", timed[-1].status == diagnostics.STATUS_TIMEOUT
+             and diagnostics.worst_status(timed) == diagnostics.STATUS_TIMEOUT),
+            ("each result reported once", sorted(r.check for r in reported) == sorted(slow_checks)),
+            ("recent results reused", all(r.cached for r in again) and cached_elapsed < 0.1),
+            ("timed out check retried", not retried[0].cached),
+            ("force skips the cache", not forced[0].cached),
+            ("camera released on request", stream[0].status == diagnostics.STATUS_TIMEOUT and held
+             and released and release_elapsed < 0.5),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("diagnostics", name))
+    
+    def test_frame_timing(self):
+        """Test the frame timing analysis on a synthetic camera in simulated time."""
+        print("\n⏲  Testing frame timing...")
+        
+        from linux_hello_gui import frame_timing
+        
+        class Clock:
+            def __init__(self):
+                self.now = 100.0
+            
+            def __call__(self):
+                return self.now
+            
+            def sleep(self, seconds):
+                self.now += max(0.0, seconds)
+        
+        def run(interval_ms, **options):
+            clock = Clock()
+            source = frame_timing.PacedSource(30, buffers=4, clock=clock, sleep=clock.sleep, **options)
+            log = frame_timing.measure(source, 5, interval_ms, clock=clock, sleep=clock.sleep)
+            return source, log, frame_timing.analyze(log)
+        
+        _source, _log, steady = run(0)
+        slow_source, _log, slow = run(40)
+        _source, _log, lossy = run(0, drop_every=10)
+        _source, _log, repeated = run(0, repeat_every=10)
+        _source, log, jittery = run(33, jitter=0.003)
+        paint_log = frame_timing.FrameTimingLog()
+        for driver, arrival in zip(log.driver, log.arrival):
+            paint_log.record_frame(driver, arrival)
+            paint_log.record_paint(arrival + 0.005)
+        paint_log.record_paint(log.arrival[-1] + 0.010)
+        painted = frame_timing.analyze(paint_log)
+        
+        file_log = frame_timing.FrameTimingLog()
+        for i in range(10):
+            file_log.record_frame(i / 30, 5000.0 + i / 30)
+        
+        checks = [
+            ("steady source", steady.dropped == 0 and steady.duplicated == 0
+             and steady.buffered_max == 0 and abs(steady.driver_fps - 30) < 0.1),
+            ("slow reader fills the driver queue", 3 <= slow.buffered <= 4 and slow.latency_ms[0] > 100),
+            ("queue overflow counted as dropped", slow.dropped == slow_source.overflows > 0),
+            ("sensor drops counted", lossy.dropped == 15),
+            ("repeated buffers counted", repeated.duplicated == 15),
+            ("jitter measured", 2 < jittery.jitter_ms < 5 and jittery.jitter_p95_ms > 0),
+            ("paint latency", abs(painted.paint_latency_ms[0] - jittery.latency_ms[0] - 5) < 0.5
+             and painted.repaints == 1 and painted.unpainted == 0),
+            ("foreign clock made relative", not frame_timing.analyze(file_log).clock_aligned),
+            ("rows for display", len(painted.rows()) == 13),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("frame_timing", name))
+    
+    def test_exposure_convergence(self):
+        """Test auto-exposure convergence on a simulated exposure ramp."""
+        print("\n🔆 Testing exposure convergence...")
+        
+        import tempfile
+        import numpy as np
+        from linux_hello_gui import exposure
+        
+        rng = np.random.default_rng(0)
+        scene = rng.integers(0, 256, (480, 640), dtype=np.uint8)
+        
+        def frame(gain):
+            noise = rng.normal(0, 2, scene.shape)
+            return np.clip(scene * gain + noise, 0, 255).astype(np.uint8)
+        
+        # Gain ramps up from almost black over ~0.5 s, then holds, at 30 fps
+        gains = [1 - 0.95 * 0.7 ** i for i in range(60)]
+        monitor = exposure.ExposureMonitor()
+        monitor.reset(opened_at=0.0)
+        stable_at = next(i for i, gain in enumerate(gains) if monitor.update(frame(gain), i / 30))
+        
+        # Black frames before exposure starts look stable on their own
+        black = exposure.ExposureMonitor()
+        black.reset(opened_at=0.0)
+        fooled = any(black.update(np.zeros((480, 640), np.uint8), i / 30) for i in range(10))
+        primed = exposure.ExposureMonitor(expected=1.0)
+        primed.reset(opened_at=0.0)
+        early = next(i for i in range(60) if primed.update(frame(1.0), i / 30))
+        
+        flicker = exposure.ExposureMonitor(max_wait=1.0)
+        flicker.reset(opened_at=0.0)
+        given_up = next(i for i in range(60) if flicker.update(frame(0.5 + 0.4 * (i % 2)), i / 30))
+        
+        class Capture:
+            def __init__(self):
+                self.frames = [frame(gain) for gain in gains]
+            
+            def read(self):
+                return (True, self.frames.pop(0)) if self.frames else (False, None)
+        
+        skipper = exposure.ExposureMonitor()
+        first = exposure.skip_warmup(Capture(), skipper)
+        
+        # Test waits for the preview's exposure before checking liveness
+        from PySide6.QtWidgets import QApplication
+        from linux_hello_gui.i18n import _
+        from linux_hello_gui.window import MainWindow
+        app = QApplication.instance() or QApplication(sys.argv)
+        window = MainWindow()
+        window.stop_camera()
+        window.cap = Capture()
+        window.cap.frames = [np.dstack([f] * 3) for f in window.cap.frames]
+        window.cap.isOpened = lambda: True
+        window.cap.release = lambda: None
+        window.exposure = exposure.ExposureMonitor()
+        window.run_test()
+        waiting = window.statusBar().currentMessage()
+        held = True
+        while not window.exposure.stable:
+            held = held and window.liveness_started is None
+            window.update_frame()
+        checked = window.liveness is not None and window.liveness_started is not None
+        window.liveness = None
+        window.cap = None
+        window.close()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "exposure.json")
+            unknown = exposure.predict("cam", path)
+            for seconds in [0.5] * 12 + [0.9]:
+                prediction = exposure.record("cam", seconds, path)
+            samples = exposure.load_history(path)["cam"]
+            primed_from_file = exposure.monitor_for("cam", path).expected
+        
+        checks = [
+            ("stable after the ramp", monitor.converged and 8 <= stable_at <= 25),
+            ("warm-up frames skipped", monitor.skipped == stable_at),
+            ("black start frames are not stable", not fooled),
+            ("prediction delays the verdict", primed.converged and primed.time_to_stable >= 0.5 and early >= 15),
+            ("flicker gives up at max wait", flicker.stable and not flicker.converged and given_up == 30),
+            ("skip_warmup returns a settled frame", first is not None and skipper.converged),
+            ("test waits for exposure", held and checked and waiting == _("Waiting for the camera exposure to settle...")),
+            ("history capped and predicted", unknown is None and len(samples) == exposure.HISTORY_SIZE
+             and prediction == 0.5 and primed_from_file == 0.5),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("exposure", name))
+    
+    def test_enhancement(self):
+        """Test the low-light enhancement stage on synthetic frames."""
+        print("\n🌗 Testing low-light enhancement...")
+        
+        import tempfile
+        import cv2
+        import numpy as np
+        from linux_hello_gui import enhance
+        from linux_hello_gui.session_recorder import SessionRecorder
+        
+        rng = np.random.default_rng(0)
+        # Well exposed: a full-range gradient with some texture
+        texture = cv2.GaussianBlur(rng.normal(0, 20, (480, 640, 3)), (0, 0), 3)
+        gradient = np.linspace(0, 255, 640)[None, :, None]
+        scene = np.clip(gradient + texture, 0, 255).astype(np.uint8)
+        dark = enhance.darken(scene, 0.3)
+        
+        lut = enhance.build_lut(1.8, 1.2)
+        identity = enhance.build_lut()
+        
+        manual = enhance.Enhancer()
+        manual.set_params(gamma=1.5, contrast=1.2)
+        for _i in range(5):
+            manual.apply(dark.copy())
+        builds = manual.lut_builds
+        manual.set_params(gamma=1.6)
+        manual.apply(dark.copy())
+        
+        auto = enhance.Enhancer()
+        frame = dark.copy()
+        result = auto.apply(frame)
+        for _i in range(30):
+            auto.apply(enhance.darken(scene, 0.3, rng=rng))
+        
+        bright = scene.copy()
+        untouched = enhance.Enhancer().apply(bright)
+        infrared = dark[:, :, 1].copy()
+        enhance.Enhancer().apply(infrared)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "dark.lhrec")
+            with SessionRecorder(path, {"width": 640, "height": 480}) as recorder:
+                for i in range(5):
+                    recorder.write(dark, i / 30)
+            hits, frames = enhance.detection_hits(path, enhance.Enhancer())
+        
+        checks = [
+            ("identity table", np.array_equal(identity, np.arange(256))),
+            ("tone curve brightens, monotonic", lut[64] > 64 and bool(np.all(np.diff(lut.astype(int)) >= 0))),
+            ("table rebuilt only on change", builds == 1 and manual.lut_builds == 2),
+            ("in place", result is frame),
+            ("dark frame brightened", frame.mean() > dark.mean() + 30 and frame.std() > dark.std()),
+            ("automatic mode picks strength", auto.gamma > 1.5 and auto.clahe > 0),
+            ("steady scene keeps its table", auto.lut_builds <= 5),
+            ("bright frame left alone", np.array_equal(untouched, scene)),
+            ("grayscale frames", infrared.mean() > dark[:, :, 1].mean() + 30),
+            ("hit rate counts clip frames", frames == 5 and hits == 0),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("enhance", name))
+    
+    def test_video_view(self):
+        """Test the paint-based video preview widget."""
+        print("\n🎞  Testing video view...")
+        
+        import numpy as np
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QColor
+        from linux_hello_gui.video_view import VideoView, Box, Caption
+        
+        app = QApplication.instance() or QApplication(sys.argv)
+        view = VideoView(minimum_size=(400, 300))
+        view.resize(800, 400)
+        hint = view.sizeHint()
+        
+        frame = np.zeros((480, 640, 3), np.uint8)
+        frame[:, :, 2] = 255
+        view.set_frame(frame)
+        rect = view.video_rect()
+        image = view.grab().toImage()
+        scaled = view._scaled[0]
+        view.grab()
+        cached = view._scaled[0] is scaled
+        
+        view.set_layer("faces", [Box((100, 100, 200, 200), "alice", "#00ff00"), Caption("12 fps")])
+        boxed = view.grab().toImage()
+        left = rect.x() + 100 * rect.width() / 640
+        top = rect.y() + 200 * rect.height() / 480
+        view.set_layer("faces", [])
+        
+        view.setText("Camera stopped")
+        texted = view.text()
+        view.set_frame(np.full((240, 320), 128, np.uint8))
+        gray = view.grab().toImage().pixelColor(400, 200)
+        
+        checks = [
+            ("aspect kept and centred", round(rect.width()) == 533 and rect.height() == 400 and rect.x() == 133),
+            ("frame painted", image.pixelColor(400, 200) == QColor(255, 0, 0)),
+            ("bars left black", image.pixelColor(20, 200) == QColor(0, 0, 0)),
+            ("scaled once per frame", cached and scaled.width() == 533),
+            ("box overlay in frame coordinates", boxed.pixelColor(round(left), round(top)).green() > 200),
+            ("overlay layer removed", "faces" not in view._layers),
+            ("message shown until next frame", texted == "Camera stopped" and view.text() == ""),
+            ("grayscale frames", gray == QColor(128, 128, 128)),
+            ("size hint independent of frames", view.sizeHint() == hint),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("video_view", name))
+    
+    def test_face_alignment(self):
+        """Test landmark alignment of enrollment samples."""
+        print("\n🎯 Testing face alignment...")
+        
+        import tempfile
+        import cv2
+        import numpy as np
+        from linux_hello_gui import alignment
+        from linux_hello_gui.face_features import face_vector, frame_vector, load_templates
+        
+        # Two bright "eyes" on a tilted line in a 720p frame
+        eyes = np.array([[560.0, 300.0], [700.0, 340.0]])
+        frame = np.full((720, 1280, 3), 40, np.uint8)
+        for x, y in eyes:
+            cv2.circle(frame, (int(x), int(y)), 6, (255, 255, 255), -1)
+        
+        aligned = alignment.align(frame, eyes)
+        gray = aligned.image[:, :, 0]
+        blobs = []
+        for half in (gray[:, :alignment.ALIGNED_SIZE // 2], gray[:, alignment.ALIGNED_SIZE // 2:]):
+            ys, xs = np.nonzero(half > 128)
+            blobs.append((xs.mean(), ys.mean()))
+        blobs[1] = (blobs[1][0] + alignment.ALIGNED_SIZE // 2, blobs[1][1])
+        mapped = cv2.transform(eyes[None], aligned.matrix)[0]
+        
+        blank = np.zeros((480, 640), np.uint8)
+        estimated, measured = alignment.find_landmarks(blank, (200, 100, 200, 200))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cv2.imwrite(os.path.join(tmp_dir, "face_000.jpg"), aligned.image)
+            alignment.save_manifest(tmp_dir, {"face_000.jpg": aligned})
+            alignment.save_manifest(tmp_dir, {"face_001.jpg": alignment.align(frame, eyes, measured=False)})
+            manifest = alignment.load_manifest(tmp_dir)
+            templates = load_templates(tmp_dir)
+            stored = cv2.imread(os.path.join(tmp_dir, "face_000.jpg"), cv2.IMREAD_GRAYSCALE)
+        
+        checks = [
+            ("similarity maps eyes exactly", np.allclose(mapped, alignment.CANONICAL_EYES)),
+            ("crop has the canonical size", aligned.image.shape == (112, 112, 3)),
+            ("eyes land on canonical positions",
+             np.allclose(blobs, alignment.CANONICAL_EYES, atol=1.0)),
+            ("uniform scale, no shear",
+             np.isclose(aligned.matrix[0, 0], aligned.matrix[1, 1]) and np.isclose(aligned.matrix[0, 1], -aligned.matrix[1, 0])),
+            ("box estimate without eyes",
+             not measured and np.allclose(estimated, [[260, 176], [340, 176]])),
+            ("manifest merges samples",
+             sorted(manifest) == ["face_000.jpg", "face_001.jpg"] and manifest["face_000.jpg"]["measured"]
+             and not manifest["face_001.jpg"]["measured"]),
+            ("manifest keeps landmarks", np.allclose(manifest["face_000.jpg"]["landmarks"], eyes)),
+            ("aligned crops used without detection",
+             templates.shape == (1, 10000) and float(templates[0] @ face_vector(stored)) > 0.999),
+            ("no face, no vector", frame_vector(frame) is None),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("alignment", name))
+    
+    def test_liveness(self):
+        """Test the temporal liveness signals and their use in the decision."""
+        print("\n👁  Testing liveness...")
+        
+        import cv2
+        import numpy as np
+        from linux_hello_gui import liveness
+        from linux_hello_gui.alignment import CANONICAL_EYES
+        from linux_hello_gui.decision import (
+            ACCEPT, REJECT, REASON_NOT_LIVE, GaussianScoreModel, SequentialDecision
+        )
+        
+        rng = np.random.default_rng(0)
+        # Aligned crop: skin texture, dark eyes at the canonical places
+        face = 130 + cv2.GaussianBlur(rng.normal(0, 25, (112, 112)), (0, 0), 1.2)
+        for x, y in CANONICAL_EYES:
+            cv2.ellipse(face, (int(x), int(y)), (9, 5), 0, 0, 360, 30, -1)
+        ys, xs = np.mgrid[0:112, 0:112].astype(np.float32)
+        
+        def live_crop(i):
+            crop = face.copy()
+            if i in (20, 21, 22):
+                for x, y in CANONICAL_EYES:
+                    cv2.ellipse(crop, (int(x), int(y)), (10, 6), 0, 0, 360, 130, -1)
+            # Smooth non-rigid warp, different every frame
+            shift = cv2.GaussianBlur(rng.normal(0, 3, (112, 112)).astype(np.float32), (0, 0), 6) * 4
+            crop = cv2.remap(crop.astype(np.float32), xs + shift, ys + shift.T, cv2.INTER_LINEAR)
+            return np.clip(crop + rng.normal(0, 2, crop.shape), 0, 255).astype(np.uint8)
+        
+        photo = cv2.GaussianBlur(face, (0, 0), 1.5)
+        screen = photo + 25 * np.sin(np.arange(112) * 2.8)[None, :]
+        
+        def run(crops):
+            monitor = liveness.LivenessMonitor()
+            for crop in crops:
+                monitor.update(crop)
+            return monitor
+        
+        def still(image):
+            return [np.clip(image + rng.normal(0, 2, image.shape), 0, 255).astype(np.uint8) for _i in range(45)]
+        
+        live = run([live_crop(i) for i in range(45)]).result()
+        printed = run(still(photo)).result()
+        shown = run(still(screen)).result()
+        # Past the window: the blink at frames 20-22 has left it
+        wrapped = run([live_crop(i) for i in range(45)] + still(face)[:40])
+        early = run(still(face)[:5]).result()
+        
+        engine = SequentialDecision(GaussianScoreModel.from_threshold(0.35), min_liveness=0.5)
+        waiting = engine.run([0.8] * 20, liveness=[0.1] * 20)
+        confirmed = engine.run([0.8] * 20, liveness=[0.1] * 10 + [0.9] * 10)
+        unchecked = SequentialDecision(GaussianScoreModel.from_threshold(0.35)).run([0.8] * 20)
+        # Matches made by the recognizer (hello test) go through the same gate
+        recognized = [engine.confirm(score) for score in (printed.score, live.score, None)]
+        recognized_reason = engine.reason
+        unchecked_recognized = SequentialDecision(GaussianScoreModel.from_threshold(0.35)).confirm(None)
+        
+        checks = [
+            ("live face scores high", live.score >= 0.7 and live.blinks == 1),
+            ("printed photo scores low", printed.score < 0.4 and printed.blinks == 0),
+            ("screen scores low", shown.score < 0.4 and shown.texture > live.texture),
+            ("photo leaves no non-rigid motion", printed.motion < liveness.MOTION_NONE * 2 < live.motion),
+            ("window slides", wrapped.frames == 85 and wrapped.blinks() == 0),
+            ("no score before enough frames", early.score == 0.0),
+            ("within the per-frame budget", live.within_budget and 0 < live.ms_per_frame),
+            ("result rows", len(live.rows()) == 6),
+            ("not live: rejected", waiting.decision == REJECT and waiting.reason == REASON_NOT_LIVE),
+            ("accept waits for liveness", confirmed.decision == ACCEPT and confirmed.frames_used == 11),
+            ("off by default", unchecked.decision == ACCEPT and unchecked.frames_used < 11),
+            ("recognized photo rejected", recognized == [REJECT, ACCEPT, REJECT]
+             and recognized_reason == REASON_NOT_LIVE and unchecked_recognized == ACCEPT),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("liveness", name))
+    
+    def test_multi_camera(self):
+        """Test synchronized capture from two file-backed sources."""
+        print("\n📷 Testing multi-camera capture...")
+        
+        import tempfile
+        import numpy as np
+        from linux_hello_gui import multicam
+        from linux_hello_gui.session_recorder import SessionRecorder
+        
+        def record(path, shape, skip=()):
+            with SessionRecorder(path, {"width": shape[1], "height": shape[0]}) as recorder:
+                for i in range(60):
+                    if i not in skip:
+                        # The frame number is the pixel value
+                        recorder.write(np.full(shape, i, np.uint8), i / 30)
+        
+        def drain(group):
+            sets = []
+            while True:
+                frame_set = group.read_set()
+                if frame_set is None:
+                    break
+                sets.append(frame_set)
+            group.release()
+            return sets
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rgb = os.path.join(tmp_dir, "rgb.lhrec")
+            infrared = os.path.join(tmp_dir, "ir.lhrec")
+            record(rgb, (48, 64, 3))
+            # IR sensor losing every tenth frame; started 5 ms later
+            record(infrared, (24, 32), skip=range(5, 60, 10))
+            
+            group = multicam.CaptureGroup([rgb, infrared], offsets=[0.0, 0.005])
+            sets = drain(group)
+            stats = group.stats()
+            bounded = multicam.CaptureGroup([rgb, infrared], offsets=[0.0, 0.005], latency_samples=10)
+            drain(bounded)
+            loose = drain(multicam.CaptureGroup([rgb, rgb], offsets=[0.0, 0.015]))
+            strict = drain(multicam.CaptureGroup([rgb, rgb], offsets=[0.0, 0.015], tolerance=0.010))
+            
+            preview = multicam.CaptureGroup([rgb, infrared])
+            ret, composed = preview.read()
+            preview.release()
+            missing = multicam.CaptureGroup([rgb, os.path.join(tmp_dir, "missing.lhrec")])
+            missing.release()
+        
+        pip = multicam.compose(sets[-1].frames, multicam.LAYOUT_PICTURE_IN_PICTURE)
+        inset = multicam.compose((np.zeros((48, 64, 3), np.uint8), np.full((24, 32), 200, np.uint8)),
+                                 multicam.LAYOUT_PICTURE_IN_PICTURE)
+        
+        checks = [
+            ("frames paired", len(sets) == 54 and stats["paired"] == 54),
+            ("pairs are simultaneous",
+             all(int(s.frames[0][0, 0, 0]) == int(s.frames[1][0, 0]) for s in sets)),
+            ("skew within tolerance", max(s.skew for s in sets) <= multicam.TOLERANCE),
+            ("unpaired frames counted", stats["unpaired"] == [6, 0] and abs(stats["unpaired_rate"][0] - 0.1) < 1e-9),
+            ("pairing latency measured", stats["latency_ms"] >= 0 and stats["latency_p95_ms"] >= stats["latency_ms"]),
+            ("latency history bounded", bounded.paired == 54 and len(bounded.latencies) == 10),
+            ("tolerance respected", len(loose) == 60 and len(strict) == 0),
+            ("side by side", ret and composed.shape == (48, 128, 3)),
+            ("picture in picture", pip.shape == (48, 64, 3) and inset[-9, -9, 0] == 200 and inset[0, 0, 0] == 0),
+            ("missing source", not missing.isOpened()),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("multicam", name))
+    
+    def test_augmentation(self):
+        """Test batched enrollment augmentation and the augmented template set."""
+        print("\n🧬 Testing enrollment augmentation...")
+        
+        import tempfile
+        import cv2
+        import numpy as np
+        from types import SimpleNamespace
+        from linux_hello_gui import augment, diagnostics
+        from linux_hello_gui.enrollment_admin import StoreIndex
+        from linux_hello_gui.face_features import AUGMENTED_DIR, FEATURE_DIM, face_vector, load_templates
+        
+        rng = np.random.default_rng(5)
+        
+        def person():
+            # Smooth random pattern standing in for a face
+            base = cv2.resize(rng.integers(0, 256, (8, 8), dtype=np.uint8), (112, 112),
+                              interpolation=cv2.INTER_CUBIC)
+            shots = [base]
+            for angle in (-6, -3, 3, 6):
+                matrix = cv2.getRotationMatrix2D((56, 56), angle, 1.0)
+                shots.append(cv2.warpAffine(base, matrix, (112, 112), borderMode=cv2.BORDER_REPLICATE))
+            return np.stack(shots)
+        
+        crops = np.stack([person()[0] for _ in range(6)])
+        images, labels = augment.augment(crops, per_sample=augment.MAX_PER_SAMPLE)
+        plan = augment.plan(per_sample=4)
+        serial = augment.expand(crops, 2, workers=0)
+        pooled = augment.expand(crops, 2, workers=2)
+        dataset = {f"person{k}": person() for k in range(4)}
+        accuracy = augment.compare_kinds(dataset, enroll=1)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, crop in enumerate(crops):
+                cv2.imwrite(os.path.join(tmp_dir, f"face_{i:03d}.jpg"), crop)
+            written = augment.augment_directory(tmp_dir, 3, workers=0)
+            with_augmented = len(load_templates(tmp_dir))
+            # The augmented set is not a user of the store
+            index = StoreIndex((tmp_dir,))
+            listed = [status.user for changed, _removed in index.update() for status in changed]
+            store_check = diagnostics.check_face_store(SimpleNamespace(faces_dir=tmp_dir))
+            removed = augment.augment_directory(tmp_dir, 0)
+            without = len(load_templates(tmp_dir))
+            stale = os.path.exists(os.path.join(tmp_dir, AUGMENTED_DIR, augment.AUGMENTED_NAME))
+            # A daemon template array next to the GUI captures replaces them
+            np.save(os.path.join(tmp_dir, "daemon.npy"), np.ones((4, FEATURE_DIM), np.float32))
+            mixed_check = diagnostics.check_face_store(SimpleNamespace(faces_dir=tmp_dir))
+            mixed_loaded = len(load_templates(tmp_dir))
+            for name, shots in dataset.items():
+                os.makedirs(os.path.join(tmp_dir, "dataset", name))
+                for i, shot in enumerate(shots):
+                    cv2.imwrite(os.path.join(tmp_dir, "dataset", name, f"{i}.png"), shot)
+            loaded = augment.load_dataset(os.path.join(tmp_dir, "dataset"))
+        
+        flipped = images[augment.MAX_PER_SAMPLE + labels.index("flip")]
+        checks = [
+            ("every variant applied", images.shape == (6 * augment.MAX_PER_SAMPLE, 112, 112)
+             and sorted(set(labels)) == sorted(augment.KINDS)),
+            ("plan mixes kinds", len({kind for kind, _value in plan}) == 4),
+            ("flip mirrors", np.array_equal(flipped, crops[1][:, ::-1])),
+            ("brightness clipped", images[labels.index("brightness")].dtype == np.uint8),
+            ("originals first", serial.shape == (18, FEATURE_DIM)
+             and np.allclose(serial[0], face_vector(crops[0]), atol=1e-5)),
+            ("process pool matches", np.allclose(serial, pooled, atol=1e-6)),
+            ("accuracy per kind", set(accuracy) == {"none", "all", *augment.KINDS}
+             and all(0.0 <= a <= 1.0 for a in accuracy.values())),
+            ("rotation helps rotated probes", accuracy["rotation"] >= accuracy["none"]),
+            ("template set written", written == 24 and with_augmented == 24),
+            ("no fake user in the store", listed == [] and not index.profiles),
+            ("store check counts samples", store_check[1] == "6 samples"),
+            ("template set removed", removed == 0 and without == 6 and not stale),
+            ("store check counts what is loaded", mixed_check[1] == "4 templates" and mixed_loaded == 4
+             and any("6" in value for _label, value in mixed_check[2])),
+            ("dataset loaded", sorted(loaded) == sorted(dataset)
+             and all(np.array_equal(loaded[name], dataset[name]) for name in dataset)),
+        ]
+        
+        for name, ok in checks:
+            if ok:
+                print(f"  ✓ {name}")
+                self.tests_passed += 1
+            else:
+                print(f"  ✗ {name}")
+                self.tests_failed += 1
+                self.errors.append(("augment", name))
+    
     def run_all_tests(self):
         """Run all tests."""
         print("=" * 60)
@@ -164,6 +1718,31 @@ class TestRunner:
         self.test_files()
         self.test_configuration()
         self.test_widget_creation()
+        self.test_icon_cache()
+        self.test_config_model()
+        self.test_config_editor()
+        self.test_tune_dialog()
+        self.test_calibration()
+        self.test_decision_engine()
+        self.test_pam_profiles()
+        self.test_language_switch()
+        self.test_translation_catalogs()
+        self.test_string_extraction()
+        self.test_translation_compiler()
+        self.test_app_icon_set()
+        self.test_enrollment_status()
+        self.test_enrollment_index()
+        self.test_session_recorder()
+        self.test_frame_ring()
+        self.test_diagnostics()
+        self.test_frame_timing()
+        self.test_exposure_convergence()
+        self.test_enhancement()
+        self.test_video_view()
+        self.test_face_alignment()
+        self.test_liveness()
+        self.test_multi_camera()
+        self.test_augmentation()
         
         # Print summary
         print("\n" + "=" * 60)
@@ -21,6 +21,7 @@ setup(
     package_data={
         'linux_hello_gui': [
             'locale/*/LC_MESSAGES/*.mo',
+            'icons/hicolor/*/apps/*.png',
         ],
     },
     install_requires=[
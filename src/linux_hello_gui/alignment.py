@@ -0,0 +1,160 @@
+"""Landmark-based face alignment for enrollment samples.
+
+Instead of whole camera frames, enrollment stores each sample as a small
+canonical crop: the eye centres are located inside the detected face, one
+similarity transform (rotation, uniform scale, translation) per frame maps
+them onto fixed positions, and a single ``cv2.warpAffine`` produces the
+``ALIGNED_SIZE`` crop directly from the full frame. Later consumers use the
+crop as is, without detecting or aligning the face again.
+
+Eyes are found with OpenCV's eye cascade on a small copy of the upper half
+of the face; when it does not find both, their usual position in the face
+box is used and the sample is marked as estimated.
+
+The landmarks of every sample, with the transform that produced its crop,
+are kept in ``landmarks.json`` next to the samples.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# Side of the aligned crop, and where the eye centres land in it
+# (image-left eye first, the usual 112-pixel recognition layout)
+ALIGNED_SIZE = 112
+CANONICAL_EYES = np.array([[38.3, 51.7], [73.5, 51.7]], dtype=np.float64)
+
+# Eye centres relative to a frontal Haar face box, used as fallback
+BOX_EYES = np.array([[0.3, 0.38], [0.7, 0.38]], dtype=np.float64)
+
+# The eye cascade runs on the upper half of the face scaled to this width
+EYE_SEARCH_WIDTH = 160
+
+MANIFEST_NAME = "landmarks.json"
+
+_eye_cascade = None
+
+
+def get_eye_cascade():
+    """Get the shared eye detector."""
+    global _eye_cascade
+    if _eye_cascade is None:
+        _eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_eye.xml")
+    return _eye_cascade
+
+
+@dataclass
+class AlignedFace:
+    """An aligned crop and where it came from.
+
+    ``landmarks`` are the eye centres in frame pixels, ``matrix`` the 2×3
+    transform from frame to crop, and ``measured`` False when the eyes were
+    estimated from the face box.
+    """
+
+    image: np.ndarray
+    landmarks: np.ndarray
+    matrix: np.ndarray
+    measured: bool
+
+    def to_dict(self):
+        return {
+            "landmarks": np.round(self.landmarks, 2).tolist(),
+            "matrix": np.round(self.matrix, 6).tolist(),
+            "measured": self.measured,
+        }
+
+
+def find_landmarks(gray, face):
+    """Eye centres ``[[x, y], [x, y]]`` in ``face`` of ``gray``, image-left first.
+
+    Returns ``(points, measured)``; ``measured`` is False when the points
+    were estimated from the face box.
+    """
+    x, y, w, h = face
+    estimated = np.array([x, y], dtype=np.float64) + BOX_EYES * (w, h)
+    upper = gray[y:y + h // 2, x:x + w]
+    if upper.size == 0:
+        return estimated, False
+
+    scale = EYE_SEARCH_WIDTH / upper.shape[1]
+    small = cv2.resize(upper, (EYE_SEARCH_WIDTH, max(1, round(upper.shape[0] * scale))),
+                       interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+    eyes = get_eye_cascade().detectMultiScale(
+        small, scaleFactor=1.1, minNeighbors=4,
+        minSize=(EYE_SEARCH_WIDTH // 8, EYE_SEARCH_WIDTH // 8),
+        maxSize=(EYE_SEARCH_WIDTH // 2, EYE_SEARCH_WIDTH // 2))
+
+    # Largest candidate on each side of the face
+    best = [None, None]
+    for ex, ey, ew, eh in eyes:
+        side = 0 if ex + ew / 2 < EYE_SEARCH_WIDTH / 2 else 1
+        if best[side] is None or ew > best[side][2]:
+            best[side] = (ex, ey, ew, eh)
+    if best[0] is None or best[1] is None:
+        return estimated, False
+
+    points = np.array([[ex + ew / 2, ey + eh / 2] for ex, ey, ew, eh in best], dtype=np.float64)
+    return points / scale + (x, y), True
+
+
+def similarity_matrix(points, target=CANONICAL_EYES):
+    """2×3 similarity transform taking two ``points`` onto ``target``."""
+    # With complex numbers, z -> a*z + b is exactly a similarity
+    p = points[:, 0] + 1j * points[:, 1]
+    q = target[:, 0] + 1j * target[:, 1]
+    a = (q[1] - q[0]) / (p[1] - p[0])
+    b = q[0] - a * p[0]
+    return np.array([[a.real, -a.imag, b.real], [a.imag, a.real, b.imag]], dtype=np.float64)
+
+
+def align(frame, landmarks, measured=True, size=ALIGNED_SIZE):
+    """Warp ``frame`` so the eye ``landmarks`` land on ``CANONICAL_EYES``."""
+    target = CANONICAL_EYES * (size / ALIGNED_SIZE)
+    matrix = similarity_matrix(np.asarray(landmarks, dtype=np.float64), target)
+    image = cv2.warpAffine(frame, matrix, (size, size), flags=cv2.INTER_LINEAR,
+                           borderMode=cv2.BORDER_REPLICATE)
+    return AlignedFace(image, np.asarray(landmarks, dtype=np.float64), matrix, measured)
+
+
+def align_face(frame, face, gray=None):
+    """Aligned crop of the detected ``face`` box ``(x, y, w, h)`` in ``frame``."""
+    if gray is None:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    landmarks, measured = find_landmarks(gray, face)
+    return align(frame, landmarks, measured)
+
+
+def is_aligned(image):
+    """True for a crop written by enrollment rather than a whole frame."""
+    return image.shape[:2] == (ALIGNED_SIZE, ALIGNED_SIZE)
+
+
+def load_manifest(directory):
+    """``{sample name: landmark dict}`` of the samples in ``directory``."""
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    samples = manifest.get("samples") if isinstance(manifest, dict) else None
+    return samples if isinstance(samples, dict) else {}
+
+
+def save_manifest(directory, samples):
+    """Merge ``{sample name: AlignedFace}`` into the manifest of ``directory``."""
+    entries = load_manifest(directory)
+    entries.update((name, aligned.to_dict()) for name, aligned in samples.items())
+    manifest = {"size": ALIGNED_SIZE, "eyes": CANONICAL_EYES.tolist(), "samples": entries}
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".landmarks-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, os.path.join(directory, MANIFEST_NAME))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
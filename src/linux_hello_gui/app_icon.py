@@ -0,0 +1,106 @@
+"""Application icon set.
+
+``icon.png`` is a 1024×1024 source image. ``make icons`` scales it into a
+hicolor-style set of small PNGs (``icons/hicolor/NxN/apps/linux-hello-gui.png``),
+committed with the package and installed as-is by packaging; at runtime
+each size is registered with ``QIcon.addFile``, which decodes a file only
+when Qt first needs that size.
+
+    python -m linux_hello_gui.app_icon [source.png] [destination]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ICON_NAME = "linux-hello-gui"
+ICON_SIZES = (16, 22, 24, 32, 48, 64, 128, 256, 512)
+
+PACKAGE_ICONS = Path(__file__).parent / "icons" / "hicolor"
+SOURCE_ICON = Path(__file__).parent.parent.parent / "icon.png"
+
+# Installed icon sets first, then the one shipped in the package
+ICON_DIRS = [
+    Path("/usr/share/icons/hicolor"),
+    PACKAGE_ICONS,
+]
+
+# Full-size images, used only when no icon set exists
+FALLBACK_ICONS = [
+    SOURCE_ICON,
+    Path("/usr/share/linux-hello-gui/icon.png"),
+]
+
+
+def icon_path(root, size):
+    return Path(root) / f"{size}x{size}" / "apps" / f"{ICON_NAME}.png"
+
+
+def generate_icon_set(source=SOURCE_ICON, destination=PACKAGE_ICONS, sizes=ICON_SIZES, force=False):
+    """Scale ``source`` into one PNG per size; returns the files written.
+
+    Sizes whose file is newer than the source are left alone.
+    """
+    import cv2
+
+    source = Path(source)
+    source_mtime = source.stat().st_mtime
+    image = None
+    written = []
+
+    for size in sizes:
+        path = icon_path(destination, size)
+        if not force and path.exists() and path.stat().st_mtime >= source_mtime:
+            continue
+        if image is None:
+            image = cv2.imread(str(source), cv2.IMREAD_UNCHANGED)
+            if image is None:
+                raise OSError(f"Cannot read {source}")
+
+        scaled = cv2.resize(image, (size, size), interpolation=cv2.INTER_AREA)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not cv2.imwrite(str(path), scaled, [cv2.IMWRITE_PNG_COMPRESSION, 9]):
+            raise OSError(f"Cannot write {path}")
+        written.append(path)
+
+    return written
+
+
+def load_app_icon():
+    """Application icon with every available size registered lazily.
+
+    Returns None when no icon set is installed.
+    """
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QIcon
+
+    for root in ICON_DIRS:
+        sizes = [size for size in ICON_SIZES if icon_path(root, size).exists()]
+        if not sizes:
+            continue
+        icon = QIcon()
+        for size in sizes:
+            # Only records the file; it is decoded on first use at that size
+            icon.addFile(str(icon_path(root, size)), QSize(size, size))
+        return icon
+
+    for path in FALLBACK_ICONS:
+        if path.exists():
+            icon = QIcon()
+            icon.addFile(str(path))
+            return icon
+
+    return None
+
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else SOURCE_ICON
+    destination = sys.argv[2] if len(sys.argv) > 2 else PACKAGE_ICONS
+    written = generate_icon_set(source, destination)
+    for path in written:
+        print(f"✓ {os.path.relpath(path)} ({path.stat().st_size // 1024} KB)")
+    print(f"{len(written)} icons generated, {len(ICON_SIZES) - len(written)} up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Enrollment augmentation: more templates from the same captures.
+
+Long enrollments are tedious, yet more samples make matching more robust.
+After capture, ``expand`` derives extra templates from the aligned crops
+with mild changes a later attempt may show: brightness and gamma shifts,
+small rotations, horizontal flips and blur. Each variant is applied to the
+whole batch at once: the crops are stacked as channels of one image, so a
+single ``cv2.LUT``, ``cv2.warpAffine`` or ``cv2.GaussianBlur`` call covers
+up to 512 of them.
+
+Large batches are split over a process pool (started with ``spawn``, so it
+is safe from the GUI's threads); small ones run in process, where the pool
+start-up would cost more than the work.
+
+``python -m linux_hello_gui.augment DATASET`` measures the identification
+accuracy gained by each kind of augmentation on a local dataset: one
+directory per person holding face images (aligned crops or whole frames).
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from .alignment import align_face, is_aligned
+from .face_features import AUGMENTED_DIR, detect_faces, face_vectors
+
+KINDS = ("brightness", "gamma", "rotation", "flip", "blur")
+
+# Variants of each kind: grey-level offsets, gammas, degrees, blur sigmas
+VARIANTS = {
+    "brightness": (-30, 30),
+    "gamma": (0.7, 1.4),
+    "rotation": (-8.0, 8.0),
+    "flip": (None,),
+    "blur": (1.0,),
+}
+
+# Extra templates per captured sample, by default and at most (every variant)
+PER_SAMPLE = 4
+MAX_PER_SAMPLE = sum(len(values) for values in VARIANTS.values())
+
+# Channels OpenCV accepts in one image
+MAX_CHANNELS = 512
+
+# Below this many augmented images, a process pool costs more than it saves
+POOL_MIN_IMAGES = 2000
+
+# Templates derived by augmentation, in the faces dir's AUGMENTED_DIR
+AUGMENTED_NAME = "templates.npy"
+
+
+def _channels(crops):
+    """``(N, H, W)`` crops as chunks of ``(H, W, n)`` images for OpenCV."""
+    for start in range(0, len(crops), MAX_CHANNELS):
+        yield np.ascontiguousarray(np.moveaxis(crops[start:start + MAX_CHANNELS], 0, -1))
+
+
+def _unstack(images, shape):
+    out = np.concatenate([np.moveaxis(img.reshape(shape[1], shape[2], -1), -1, 0) for img in images])
+    return out.reshape(shape)
+
+
+def apply(kind, crops, value):
+    """Apply variant ``value`` of ``kind`` to a ``(N, H, W)`` uint8 batch."""
+    if kind == "flip":
+        return np.ascontiguousarray(crops[:, :, ::-1])
+    if kind in ("brightness", "gamma"):
+        # Per grey level: one table lookup for the whole batch
+        levels = np.arange(256, dtype=np.float64)
+        levels = levels + value if kind == "brightness" else 255.0 * (levels / 255.0) ** (1.0 / value)
+        return cv2.LUT(crops, np.clip(np.round(levels), 0, 255).astype(np.uint8))
+
+    height, width = crops.shape[1:]
+    if kind == "rotation":
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), value, 1.0)
+        images = [cv2.warpAffine(chunk, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                                 borderMode=cv2.BORDER_REPLICATE) for chunk in _channels(crops)]
+    elif kind == "blur":
+        images = [cv2.GaussianBlur(chunk, (0, 0), value) for chunk in _channels(crops)]
+    else:
+        raise ValueError(f"unknown augmentation {kind!r}")
+    return _unstack(images, crops.shape)
+
+
+def plan(kinds=KINDS, per_sample=PER_SAMPLE):
+    """The ``per_sample`` ``(kind, value)`` variants used, spread over ``kinds``."""
+    variants = [(kind, value) for kind in kinds for value in VARIANTS[kind]]
+    if per_sample >= len(variants):
+        return variants
+    # Interleave kinds so a short plan still covers as many as possible
+    order = sorted(range(len(variants)), key=lambda i: (VARIANTS[variants[i][0]].index(variants[i][1]), i))
+    return [variants[i] for i in order[:per_sample]]
+
+
+def augment(crops, kinds=KINDS, per_sample=PER_SAMPLE):
+    """Augmented copies of ``crops``: ``(images, kinds)``, ``per_sample`` per crop.
+
+    The copies of each crop follow each other, in ``plan`` order.
+    """
+    crops = np.asarray(crops, dtype=np.uint8)
+    variants = plan(kinds, per_sample)
+    if not variants:
+        return np.empty((0,) + crops.shape[1:], np.uint8), []
+    images = np.stack([apply(kind, crops, value) for kind, value in variants], axis=1)
+    labels = [kind for kind, _value in variants] * len(crops)
+    return images.reshape((-1,) + crops.shape[1:]), labels
+
+
+def _augmented_vectors(crops, kinds, per_sample):
+    images, _labels = augment(crops, kinds, per_sample)
+    return face_vectors(images)
+
+
+def expand(crops, per_sample=PER_SAMPLE, kinds=KINDS, workers=None):
+    """Template vectors of ``crops`` followed by those of their augmented copies.
+
+    ``workers`` processes share the work (default: one per CPU when the
+    batch is large enough, otherwise none); 0 keeps it in this process.
+    """
+    crops = np.asarray(crops, dtype=np.uint8)
+    originals = face_vectors(crops)
+    if not per_sample or not len(crops):
+        return originals
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(crops) * per_sample >= POOL_MIN_IMAGES else 0
+    if workers <= 1:
+        return np.concatenate([originals, _augmented_vectors(crops, kinds, per_sample)])
+
+    chunks = np.array_split(crops, min(workers, len(crops)))
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+        parts = list(pool.map(_augmented_vectors, chunks, [kinds] * len(chunks), [per_sample] * len(chunks)))
+    return np.concatenate([originals] + parts)
+
+
+def save_templates(faces_dir, templates):
+    """Write the augmented template set (atomically); None removes it."""
+    directory = os.path.join(faces_dir, AUGMENTED_DIR)
+    path = os.path.join(directory, AUGMENTED_NAME)
+    if templates is None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        return None
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".templates-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, templates.astype(np.float32))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def augment_directory(faces_dir, per_sample=PER_SAMPLE, kinds=KINDS, workers=None):
+    """Rebuild the augmented templates of the aligned crops in ``faces_dir``.
+
+    The set holds the captured samples too, as it replaces them in
+    ``face_features.load_templates``. With ``per_sample`` 0 it is removed.
+    Returns the number of templates written.
+    """
+    crops = [cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+             for path in sorted(glob.glob(os.path.join(faces_dir, "*.jpg")))]
+    crops = [crop for crop in crops if crop is not None and is_aligned(crop)]
+    # Never leave a set that misses the latest samples
+    save_templates(faces_dir, None)
+    if not per_sample or not crops:
+        return 0
+    templates = expand(np.stack(crops), per_sample, kinds, workers)
+    save_templates(faces_dir, templates)
+    return len(templates)
+
+
+def load_face(path):
+    """Grayscale aligned crop of the face in an image file, or None."""
+    image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+    if is_aligned(image):
+        return image
+    faces = detect_faces(image)
+    return align_face(image, faces[0], image).image if faces else None
+
+
+def load_dataset(root):
+    """``{person: (N, H, W) crops}`` from one sub-directory of images per person."""
+    dataset = {}
+    for directory in sorted(glob.glob(os.path.join(root, "*", ""))):
+        paths = sorted(p for p in glob.glob(os.path.join(directory, "*"))
+                       if p.lower().endswith((".jpg", ".jpeg", ".png", ".pgm", ".bmp")))
+        crops = [crop for crop in map(load_face, paths) if crop is not None]
+        if crops:
+            dataset[os.path.basename(os.path.dirname(directory))] = np.stack(crops)
+    return dataset
+
+
+def identification_accuracy(dataset, enroll=5, kinds=KINDS, per_sample=PER_SAMPLE, workers=0):
+    """Share of probes matched to the right person.
+
+    The first ``enroll`` crops of each person are enrolled (with their
+    augmentations), the others are probes.
+    """
+    templates = []
+    owners = []
+    probes = []
+    truth = []
+    for person, crops in dataset.items():
+        vectors = expand(crops[:enroll], per_sample if kinds else 0, kinds, workers)
+        templates.append(vectors)
+        owners.extend([person] * len(vectors))
+        if len(crops) > enroll:
+            probes.append(face_vectors(crops[enroll:]))
+            truth.extend([person] * (len(crops) - enroll))
+    if not probes:
+        raise ValueError("no probe images: each person needs more than the enrolled samples")
+    best = np.argmax(np.concatenate(probes) @ np.concatenate(templates).T, axis=1)
+    return float(np.mean(np.array(owners)[best] == np.array(truth)))
+
+
+def compare_kinds(dataset, enroll=5, per_sample=PER_SAMPLE):
+    """Identification accuracy with no augmentation, each kind alone, and all."""
+    runs = [("none", ())] + [(kind, (kind,)) for kind in KINDS] + [("all", KINDS)]
+    return {label: identification_accuracy(dataset, enroll, kinds, per_sample) for label, kinds in runs}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m linux_hello_gui.augment",
+        description="Measure the accuracy gained by each enrollment augmentation.")
+    parser.add_argument("dataset", help="directory with one sub-directory of face images per person")
+    parser.add_argument("--enroll", type=int, default=5, help="samples enrolled per person")
+    parser.add_argument("--per-sample", type=int, default=PER_SAMPLE, help="extra templates per sample")
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.dataset)
+    if len(dataset) < 2:
+        print("Need faces of at least two people")
+        return 1
+    crops = np.concatenate(list(dataset.values()))
+    for label, workers in (("in process", 0), (f"process pool ({os.cpu_count()})", os.cpu_count())):
+        started = time.perf_counter()
+        expand(crops, args.per_sample, workers=workers)
+        print(f"expand {len(crops)} samples {label}: {time.perf_counter() - started:.2f} s")
+
+    baseline = None
+    for label, accuracy in compare_kinds(dataset, args.enroll, args.per_sample).items():
+        baseline = accuracy if baseline is None else baseline
+        print(f"{label:>10}: {accuracy:6.1%} ({accuracy - baseline:+.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
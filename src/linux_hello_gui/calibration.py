@@ -0,0 +1,221 @@
+"""Threshold calibration from recorded genuine and impostor sessions.
+
+A calibration directory holds two sub-directories of recorded clips:
+``genuine/`` (the enrolled user) and ``impostor/`` (anyone else). Every frame
+is scored against the enrolled templates, then FAR/FRR curves are computed
+for all thresholds at once with sorted scores and ``searchsorted``.
+
+Curves are given per frame and per attempt. An attempt is one clip cut to
+``max_frames``: it is accepted as soon as one frame reaches the threshold,
+which is also how many frames the decision took.
+
+Scores come from ``face_features``, the GUI's own stand-in features, not
+from the recognizer's model: the curves and the suggested threshold are on
+that scale and only advise on the daemon's ``threshold``.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .face_features import NO_FACE_SCORE, frame_vector, match_scores
+from .session_recorder import RECORDING_EXTENSION, open_capture
+
+GENUINE_DIR = "genuine"
+IMPOSTOR_DIR = "impostor"
+CLIP_EXTENSIONS = (".mp4", ".avi", ".mkv", ".webm", RECORDING_EXTENSION)
+
+# What the scores measure, recorded in exports: not the daemon's scale
+SCORE_SCALE = "linux-hello-gui face_features correlation"
+
+# Attempt-level false accept rate the suggested threshold aims for
+TARGET_FAR = 0.01
+
+THRESHOLD_STEPS = 1001
+
+
+def find_clips(root):
+    """List genuine and impostor clips under a calibration directory."""
+    clips = {}
+    for label in (GENUINE_DIR, IMPOSTOR_DIR):
+        directory = os.path.join(root, label)
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            names = []
+        clips[label] = [os.path.join(directory, name) for name in names
+                        if name.lower().endswith(CLIP_EXTENSIONS)]
+    return clips
+
+
+def score_clip(path, templates, max_frames=None):
+    """Score every frame of a clip; frames without a face get ``NO_FACE_SCORE``."""
+    cap = open_capture(path)
+    vectors = []
+    has_face = []
+    try:
+        while max_frames is None or len(has_face) < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            vector = frame_vector(frame)
+            has_face.append(vector is not None)
+            if vector is not None:
+                vectors.append(vector)
+    finally:
+        cap.release()
+
+    scores = np.full(len(has_face), NO_FACE_SCORE, dtype=np.float32)
+    if vectors and len(templates):
+        # One matrix product for the whole clip
+        scores[np.array(has_face)] = match_scores(np.stack(vectors), templates)
+    return scores
+
+
+def score_directory(root, templates, max_frames=None, progress=None, cancelled=None):
+    """Score all clips of a calibration directory in parallel.
+
+    Returns ``{"genuine": [scores, ...], "impostor": [scores, ...]}``.
+    ``progress`` is called with ``(done, total)`` after each clip.
+    """
+    clips = find_clips(root)
+    jobs = [(label, path) for label, paths in clips.items() for path in paths]
+    results = {label: [None] * len(paths) for label, paths in clips.items()}
+    indexes = {}
+    for label, paths in clips.items():
+        for i, path in enumerate(paths):
+            indexes[path] = i
+
+    # OpenCV releases the GIL while decoding and detecting
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {pool.submit(score_clip, path, templates, max_frames): (label, path)
+                   for label, path in jobs}
+        for done, future in enumerate(futures, 1):
+            if cancelled is not None and cancelled():
+                for pending in futures:
+                    pending.cancel()
+                break
+            label, path = futures[future]
+            results[label][indexes[path]] = future.result()
+            if progress is not None:
+                progress(done, len(jobs))
+
+    return {label: [scores for scores in clip_scores if scores is not None]
+            for label, clip_scores in results.items()}
+
+
+@dataclass
+class CalibrationResult:
+    """FAR/FRR curves over a grid of thresholds."""
+
+    thresholds: np.ndarray
+    frame_far: np.ndarray
+    frame_frr: np.ndarray
+    attempt_far: np.ndarray
+    attempt_frr: np.ndarray
+    genuine_frames: np.ndarray
+    impostor_frames: np.ndarray
+    genuine_count: int
+    impostor_count: int
+    max_frames: int
+
+    def index_of(self, threshold):
+        return int(np.clip(np.searchsorted(self.thresholds, threshold), 0, len(self.thresholds) - 1))
+
+    @property
+    def eer(self):
+        """Frame-level equal error rate and its threshold."""
+        i = int(np.argmin(np.abs(self.frame_far - self.frame_frr)))
+        return float((self.frame_far[i] + self.frame_frr[i]) / 2), float(self.thresholds[i])
+
+    def suggest_threshold(self, target_far=TARGET_FAR):
+        """Lowest threshold whose attempt-level FAR is at most ``target_far``.
+
+        Returns None without impostor sessions.
+        """
+        if not self.impostor_count:
+            return None
+        meeting = np.flatnonzero(self.attempt_far <= target_far)
+        return float(self.thresholds[meeting[0]]) if len(meeting) else None
+
+    def to_dict(self, target_far=TARGET_FAR):
+        eer, eer_threshold = self.eer
+        return {
+            "score_scale": SCORE_SCALE,
+            "max_frames": self.max_frames,
+            "genuine_sessions": self.genuine_count,
+            "impostor_sessions": self.impostor_count,
+            "eer": eer,
+            "eer_threshold": eer_threshold,
+            "target_far": target_far,
+            "suggested_threshold": self.suggest_threshold(target_far),
+            "thresholds": self.thresholds.round(4).tolist(),
+            "frame_far": self.frame_far.round(6).tolist(),
+            "frame_frr": self.frame_frr.round(6).tolist(),
+            "attempt_far": self.attempt_far.round(6).tolist(),
+            "attempt_frr": self.attempt_frr.round(6).tolist(),
+            "genuine_frames_to_decision": self.genuine_frames.round(3).tolist(),
+            "impostor_frames_to_decision": self.impostor_frames.round(3).tolist(),
+        }
+
+    def export_json(self, path, target_far=TARGET_FAR):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(target_far), f, indent=2)
+
+
+def _rate_at_or_above(scores, thresholds):
+    """Fraction of ``scores`` >= each threshold."""
+    if not len(scores):
+        return np.zeros(len(thresholds))
+    ordered = np.sort(scores)
+    return 1.0 - np.searchsorted(ordered, thresholds, side="left") / len(ordered)
+
+
+def _frames_to_decision(clips, thresholds):
+    """Mean frames each threshold needs to decide, over a set of attempts.
+
+    An attempt stops at the first frame reaching the threshold, or uses
+    every frame it has.
+    """
+    if not clips:
+        return np.zeros(len(thresholds))
+
+    lengths = np.array([len(scores) for scores in clips])
+    padded = np.full((len(clips), max(lengths.max(), 1)), -np.inf, dtype=np.float32)
+    for i, scores in enumerate(clips):
+        padded[i, :len(scores)] = scores
+
+    # Running best score is non-decreasing, so frames below t are a prefix
+    running = np.maximum.accumulate(padded, axis=1)
+    below = np.stack([np.searchsorted(row, thresholds, side="left") for row in running])
+    frames = np.minimum(below + 1, lengths[:, None])
+    return frames.mean(axis=0)
+
+
+def calibrate(scores, max_frames=100, steps=THRESHOLD_STEPS):
+    """Compute curves from ``score_directory`` output."""
+    thresholds = np.linspace(0.0, 1.0, steps)
+    genuine = [s[:max_frames] for s in scores.get(GENUINE_DIR, []) if len(s)]
+    impostor = [s[:max_frames] for s in scores.get(IMPOSTOR_DIR, []) if len(s)]
+
+    def flat(clips):
+        return np.concatenate(clips) if clips else np.empty(0, dtype=np.float32)
+
+    def best(clips):
+        return np.array([s.max() for s in clips], dtype=np.float32)
+
+    return CalibrationResult(
+        thresholds=thresholds,
+        frame_far=_rate_at_or_above(flat(impostor), thresholds),
+        frame_frr=1.0 - _rate_at_or_above(flat(genuine), thresholds) if genuine else np.zeros(steps),
+        attempt_far=_rate_at_or_above(best(impostor), thresholds),
+        attempt_frr=1.0 - _rate_at_or_above(best(genuine), thresholds) if genuine else np.zeros(steps),
+        genuine_frames=_frames_to_decision(genuine, thresholds),
+        impostor_frames=_frames_to_decision(impostor, thresholds),
+        genuine_count=len(genuine),
+        impostor_count=len(impostor),
+        max_frames=max_frames,
+    )
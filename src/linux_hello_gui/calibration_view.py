@@ -0,0 +1,278 @@
+"""Threshold calibration panel for the settings tab."""
+
+import os
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QDoubleSpinBox,
+    QProgressBar, QFileDialog, QMessageBox
+)
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+from PySide6.QtCore import Qt, QPointF, QThread, Signal
+from . import calibration
+from .face_features import load_templates
+from .i18n import _
+from .retranslate import tr
+
+
+class CalibrationWorker(QThread):
+    """Score a calibration directory off the GUI thread."""
+
+    progress = Signal(int, int)
+    calibrated = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, root, faces_dir, max_frames, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.faces_dir = faces_dir
+        self.max_frames = max_frames
+
+    def run(self):
+        try:
+            templates = load_templates(self.faces_dir)
+            if not len(templates):
+                self.failed.emit(_("No enrolled face found in {path}").format(path=self.faces_dir))
+                return
+
+            scores = calibration.score_directory(
+                self.root, templates, self.max_frames,
+                progress=self.progress.emit, cancelled=self.isInterruptionRequested
+            )
+            if not scores[calibration.GENUINE_DIR] and not scores[calibration.IMPOSTOR_DIR]:
+                self.failed.emit(_("No recorded clips found in {path}").format(path=self.root))
+                return
+
+            self.calibrated.emit(calibration.calibrate(scores, self.max_frames))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class CurvePlot(QWidget):
+    """Minimal line plot of curves over thresholds in [0, 1]."""
+
+    MARGIN = 28
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(160)
+        self.x = None
+        self.curves = []
+        self.marker = None
+
+    def set_curves(self, x, curves):
+        """Set curves as a list of ``(values, color, label)``, values in [0, 1]."""
+        self.x = x
+        self.curves = curves
+        self.update()
+
+    def set_marker(self, value):
+        self.marker = value
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        m = self.MARGIN
+        w = self.width() - 2 * m
+        h = self.height() - 2 * m
+        text_color = self.palette().color(self.foregroundRole())
+
+        painter.setPen(QPen(text_color, 1))
+        painter.drawRect(m, m, w, h)
+        painter.drawText(m - 8, self.height() - 8, "0")
+        painter.drawText(m + w - 4, self.height() - 8, "1")
+        painter.drawText(m + w // 2 - 30, self.height() - 8, _("Threshold"))
+
+        if self.x is None:
+            return
+
+        for values, color, label in self.curves:
+            polygon = QPolygonF([QPointF(m + x * w, m + (1.0 - y) * h) for x, y in zip(self.x, values)])
+            painter.setPen(QPen(QColor(color), 2))
+            painter.drawPolyline(polygon)
+
+        # Legend
+        for i, (_values, color, label) in enumerate(self.curves):
+            painter.setPen(QPen(QColor(color), 2))
+            painter.drawText(m + 6, m + 14 + 14 * i, label)
+
+        if self.marker is not None:
+            painter.setPen(QPen(text_color, 1, Qt.DashLine))
+            x = m + self.marker * w
+            painter.drawLine(QPointF(x, m), QPointF(x, m + h))
+
+
+class CalibrationPanel(QWidget):
+    """Calibrate the similarity threshold from recorded sessions."""
+
+    thresholdSuggested = Signal(float)
+
+    def __init__(self, max_frames, parent=None):
+        super().__init__(parent)
+        self.max_frames = max_frames
+        self.faces_dir = os.path.join(os.path.expanduser("~"), ".linux-hello", "faces")
+        self.result = None
+        self.worker = None
+        self.threshold = None
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        controls = QHBoxLayout()
+        self.calibrate_btn = tr(QPushButton(), "setText", "Calibrate from recordings...")
+        tr(self.calibrate_btn, "setToolTip", "Choose a folder with 'genuine' and 'impostor' sub-folders of recorded clips")
+        self.calibrate_btn.clicked.connect(self.choose_directory)
+        controls.addWidget(self.calibrate_btn)
+
+        controls.addWidget(tr(QLabel(), "setText", "Target FAR:"))
+        self.target_far = QDoubleSpinBox()
+        self.target_far.setDecimals(4)
+        self.target_far.setRange(0.0001, 0.5)
+        self.target_far.setSingleStep(0.001)
+        self.target_far.setValue(calibration.TARGET_FAR)
+        self.target_far.valueChanged.connect(self.update_summary)
+        controls.addWidget(self.target_far)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        self.plot = CurvePlot()
+        self.plot.hide()
+        layout.addWidget(self.plot)
+
+        self.summary = QLabel()
+        self.summary.setWordWrap(True)
+        self.summary.hide()
+        layout.addWidget(self.summary)
+
+        result_buttons = QHBoxLayout()
+        self.apply_btn = tr(QPushButton(), "setText", "Use suggested threshold...")
+        self.apply_btn.clicked.connect(self.apply_suggestion)
+        self.apply_btn.hide()
+        result_buttons.addWidget(self.apply_btn)
+
+        self.export_btn = tr(QPushButton(), "setText", "Export JSON")
+        self.export_btn.clicked.connect(self.export_json)
+        self.export_btn.hide()
+        result_buttons.addWidget(self.export_btn)
+        result_buttons.addStretch()
+        layout.addLayout(result_buttons)
+
+    def choose_directory(self):
+        root = QFileDialog.getExistingDirectory(self, _("Calibration recordings"))
+        if root:
+            self.start(root)
+
+    def start(self, root):
+        """Score the recordings in ``root`` in the background."""
+        self.calibrate_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+        self.worker = CalibrationWorker(root, self.faces_dir, self.max_frames(), self)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.calibrated.connect(self.on_calibrated)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def on_progress(self, done, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def on_finished(self):
+        self.calibrate_btn.setEnabled(True)
+        self.progress_bar.hide()
+
+    def on_failed(self, message):
+        QMessageBox.warning(self, _("Error"), message)
+
+    def on_calibrated(self, result):
+        self.result = result
+        self.plot.set_curves(result.thresholds, [
+            (result.attempt_far, "#d32f2f", _("FAR (attempt)")),
+            (result.attempt_frr, "#1976d2", _("FRR (attempt)")),
+            (result.genuine_frames / max(result.max_frames, 1), "#388e3c", _("Frames to decision")),
+        ])
+        self.plot.set_marker(self.threshold)
+        for widget in (self.plot, self.summary, self.apply_btn, self.export_btn):
+            widget.show()
+        self.update_summary()
+
+    def set_threshold(self, threshold):
+        """Mark the configured threshold on the plot."""
+        self.threshold = threshold
+        self.plot.set_marker(threshold)
+        self.update_summary()
+
+    def update_summary(self):
+        if self.result is None:
+            return
+
+        result = self.result
+        target = self.target_far.value()
+        suggested = result.suggest_threshold(target)
+        eer, eer_threshold = result.eer
+
+        lines = [_("Scores from the GUI's own face features, not the recognizer's model: "
+                   "use the thresholds below as advice only."),
+                 _("{genuine} genuine and {impostor} impostor sessions, "
+                   "frame-level EER {eer:.1%} at {threshold:.2f}").format(
+            genuine=result.genuine_count, impostor=result.impostor_count,
+            eer=eer, threshold=eer_threshold)]
+
+        if suggested is not None:
+            i = result.index_of(suggested)
+            lines.append(_("Suggested threshold {threshold:.2f} for FAR ≤ {far:.2%}: "
+                           "FRR {frr:.1%}, {frames:.1f} frames to decision").format(
+                threshold=suggested, far=target, frr=result.attempt_frr[i],
+                frames=result.genuine_frames[i]))
+        else:
+            lines.append(_("No threshold reaches the target FAR with these recordings"))
+
+        if self.threshold is not None:
+            i = result.index_of(self.threshold)
+            lines.append(_("Current threshold {threshold:.2f}: FAR {far:.1%}, FRR {frr:.1%}, "
+                           "{frames:.1f} frames to decision").format(
+                threshold=self.threshold, far=result.attempt_far[i], frr=result.attempt_frr[i],
+                frames=result.genuine_frames[i]))
+
+        self.summary.setText("\n".join(lines))
+        self.apply_btn.setEnabled(suggested is not None)
+
+    def apply_suggestion(self):
+        if self.result is None:
+            return
+        suggested = self.result.suggest_threshold(self.target_far.value())
+        if suggested is None:
+            return
+        reply = QMessageBox.question(
+            self,
+            _("Confirmation"),
+            _("The suggested threshold {threshold:.2f} was measured with the GUI's own face "
+              "features, not with the recognizer's model, whose scores may be on another scale.\n\n"
+              "Use it as the recognizer threshold anyway?").format(threshold=suggested),
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self.thresholdSuggested.emit(suggested)
+
+    def export_json(self):
+        if self.result is None:
+            return
+        path, _filter = QFileDialog.getSaveFileName(
+            self, _("Export JSON"), "calibration.json", _("JSON files (*.json)")
+        )
+        if not path:
+            return
+        try:
+            self.result.export_json(path, self.target_far.value())
+        except OSError as e:
+            QMessageBox.critical(self, _("Error"), _("Error: {error}").format(error=str(e)))
@@ -0,0 +1,313 @@
+"""Typed Linux Hello configuration shared by the GUI and the recognizer.
+
+``Config`` is an immutable, validated view of ``/etc/linux-hello/config.json``.
+``ConfigStore`` caches it per file and revalidates with the (inode, mtime)
+stat tuple, so hot paths can call ``get()`` freely. Writers publish a new
+version with ``publish()``, which bumps the ``generation`` counter stored in
+the file and replaces it with an atomic rename.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+
+CONFIG_PATH = "/etc/linux-hello/config.json"
+
+# Range limits, shared with the widgets of ConfigEditorWidget
+FIELD_LIMITS = {
+    "camera_index": (0, 10),
+    "camera_width": (320, 1920),
+    "camera_height": (240, 1080),
+    "threshold": (0.0, 1.0),
+    "confidence": (0.0, 1.0),
+    "timeout": (1, 30),
+    "max_frames": (1, 1000),
+    "decision_far": (0.000001, 0.5),
+    "decision_frr": (0.000001, 0.5),
+    "liveness_threshold": (0.0, 1.0),
+}
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# How long get() trusts its cache before it stats the file again
+REVALIDATE_INTERVAL = 1.0
+
+# dataclass(slots=True) needs Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration fails schema or range validation."""
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Config:
+    """Validated Linux Hello configuration."""
+
+    camera_index: int = 0
+    camera_width: int = 1280
+    camera_height: int = 720
+    threshold: float = 0.35
+    confidence: float = 0.80
+    timeout: int = 5
+    max_frames: int = 100
+    early_exit: bool = True
+    decision_far: float = 0.001
+    decision_frr: float = 0.01
+    liveness_threshold: float = 0.0
+    log_level: str = "INFO"
+    enable_logging: bool = True
+
+    def __post_init__(self):
+        for field in fields(self):
+            value = getattr(self, field.name)
+            expected = field.type
+
+            if expected is float and isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+                object.__setattr__(self, field.name, value)
+            elif expected is int and isinstance(value, float) and value.is_integer():
+                value = int(value)
+                object.__setattr__(self, field.name, value)
+
+            if type(value) is not expected:
+                raise ConfigError(f"{field.name}: expected {expected.__name__}, "
+                                  f"got {type(value).__name__}")
+
+            if field.name in FIELD_LIMITS:
+                low, high = FIELD_LIMITS[field.name]
+                if not low <= value <= high:
+                    raise ConfigError(f"{field.name}: {value} is not between {low} and {high}")
+
+        if self.log_level not in LOG_LEVELS:
+            raise ConfigError(f"log_level: unknown level {self.log_level!r}")
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a config from a dict, using defaults for missing keys.
+
+        Unknown keys are ignored.
+        """
+        if not isinstance(data, dict):
+            raise ConfigError("configuration must be a JSON object")
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    @classmethod
+    def coerce(cls, data, problems):
+        """Like ``from_dict``, but repair bad values instead of rejecting them all.
+
+        Out-of-range numbers are clamped to ``FIELD_LIMITS``; other invalid
+        values fall back to their default. Each repair is described in
+        ``problems``.
+        """
+        if not isinstance(data, dict):
+            raise ConfigError("configuration must be a JSON object")
+        defaults = asdict(cls())
+        values = {}
+        for key, value in data.items():
+            if key not in defaults:
+                continue
+            try:
+                cls(**{key: value})
+            except ConfigError as e:
+                error = str(e)
+            else:
+                values[key] = value
+                continue
+            if key in FIELD_LIMITS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                low, high = FIELD_LIMITS[key]
+                clamped = min(max(value, low), high)
+                try:
+                    cls(**{key: clamped})
+                except ConfigError:
+                    pass
+                else:
+                    values[key] = clamped
+                    problems.append(f"{error}, using {clamped}")
+                    continue
+            problems.append(f"{error}, using the default {defaults[key]!r}")
+        return cls(**values)
+
+    def to_dict(self):
+        return asdict(self)
+
+    def replace(self, **changes):
+        """Get a validated copy with some fields changed."""
+        data = self.to_dict()
+        data.update(changes)
+        return Config(**data)
+
+
+def read_config(path, problems=None):
+    """Read and validate a config file.
+
+    Returns ``(config, generation)``; a missing file gives the defaults and
+    generation 0. Invalid values are repaired (see ``Config.coerce``) and
+    described in ``problems`` when a list is given.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return Config(), 0
+    except json.JSONDecodeError as e:
+        raise ConfigError(str(e)) from e
+
+    config = Config.coerce(data, [] if problems is None else problems)
+    generation = data.get("generation", 0)
+    return config, generation if isinstance(generation, int) else 0
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns)
+
+
+class ConfigStore:
+    """Cached access to one config file."""
+
+    def __init__(self, path=CONFIG_PATH, revalidate_interval=REVALIDATE_INTERVAL):
+        self.path = path
+        self.revalidate_interval = revalidate_interval
+        self.generation = 0
+        self.error = None
+        # Values repaired when the current config was read
+        self.problems = []
+        self._config = None
+        self._stat_key = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Get the current config.
+
+        Within ``revalidate_interval`` of the last check this returns the
+        cached object without a syscall; after that it costs one ``stat``
+        unless the file changed. An invalid file keeps the last good config
+        and records the problem in ``error``.
+        """
+        config = self._config
+        if config is not None and time.monotonic() - self._checked_at < self.revalidate_interval:
+            return config
+
+        with self._lock:
+            self._revalidate()
+            return self._config
+
+    def load(self):
+        """Re-read the file unconditionally, raising ``ConfigError`` if invalid."""
+        with self._lock:
+            key = _stat_key(self.path)
+            problems = []
+            self._config, self.generation = read_config(self.path, problems)
+            self._stat_key = key
+            self._checked_at = time.monotonic()
+            self.error = None
+            self.problems = problems
+            return self._config
+
+    def _revalidate(self):
+        key = _stat_key(self.path)
+        self._checked_at = time.monotonic()
+        if self._config is not None and key == self._stat_key:
+            return
+
+        self._stat_key = key
+        try:
+            problems = []
+            self._config, self.generation = read_config(self.path, problems)
+            self.error = None
+            self.problems = problems
+        except (OSError, ConfigError) as e:
+            self.error = str(e)
+            if self._config is None:
+                self._config = Config()
+
+    def publish(self, config):
+        """Write a new config version atomically and return its generation.
+
+        The file is written next to its destination and renamed over it. If
+        the directory is not writable, the same copy-then-rename is done
+        through ``sudo``.
+        """
+        with self._lock:
+            try:
+                _config, generation = read_config(self.path)
+            except (OSError, ConfigError):
+                generation = self.generation
+            generation = max(generation, self.generation) + 1
+
+            data = config.to_dict()
+            data["generation"] = generation
+            content = json.dumps(data, indent=4)
+
+            directory = os.path.dirname(self.path)
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".config-", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        f.write(content)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.chmod(tmp_path, 0o644)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except PermissionError:
+                self._publish_privileged(content)
+
+            self._config = config
+            self.generation = generation
+            self._stat_key = _stat_key(self.path)
+            self._checked_at = time.monotonic()
+            self.error = None
+            self.problems = []
+            return generation
+
+    def _publish_privileged(self, content):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
+            tmp.write(content)
+            tmp_path = tmp.name
+
+        try:
+            # Copy next to the destination, then rename over it
+            result = subprocess.run(
+                ["sudo", "sh", "-c",
+                 'mkdir -p "$(dirname "$2")" && install -m 644 "$1" "$2.new" && mv -f "$2.new" "$2"',
+                 "sh", tmp_path, self.path],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                raise PermissionError(result.stderr.strip() or "sudo failed")
+        finally:
+            os.remove(tmp_path)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path=CONFIG_PATH):
+    """Get the process-wide store for ``path``."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = ConfigStore(path)
+        return store
+
+
+def get(path=CONFIG_PATH):
+    """Get the current config for ``path`` from its cached store."""
+    return get_store(path).get()
@@ -5,11 +5,21 @@ from PySide6.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QMessageBox, QGroupBox, QFormLayout,
     QComboBox, QCheckBox
 )
-from PySide6.QtCore import Qt
-import json
-import os
-import subprocess
+from PySide6.QtCore import Qt, QTimer
 from .i18n import _
+from .retranslate import tr
+from .config import CONFIG_PATH, FIELD_LIMITS, LOG_LEVELS, Config, get_store, read_config
+from . import decision
+from .config_watcher import ConfigWatcher, ConflictBanner, diff_config
+from .calibration_view import CalibrationPanel
+
+# Quiet time after the last edit before the expected frames are re-simulated
+EXPECTED_FRAMES_DELAY_MS = 200
+
+
+def _parse_config(path):
+    """Parse and validate a config file for the watcher."""
+    return read_config(path)[0].to_dict()
 
 
 class ConfigEditorWidget(QWidget):
@@ -17,118 +27,191 @@ class ConfigEditorWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.config_path = "/etc/linux-hello/config.json"
+        self.config_path = CONFIG_PATH
+        self.store = get_store(self.config_path)
         self.config = {}
+        self._ui_snapshot = {}
         self.init_ui()
         self.load_config()
         
+        # Pick up edits made outside the application
+        self.watcher = ConfigWatcher(parser=_parse_config, parent=self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watcher.fileError.connect(self.on_file_error)
+        self.watcher.watch(self.config_path)
+        
     def init_ui(self):
         layout = QVBoxLayout()
         
         # Title
-        title = QLabel(_("Linux Hello Settings"))
+        title = tr(QLabel(), "setText", "Linux Hello Settings")
         title.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(title)
         
+        self.banner = ConflictBanner()
+        self.banner.reloadRequested.connect(self.apply_conflicting_changes)
+        layout.addWidget(self.banner)
+        
         # Camera settings
-        camera_group = QGroupBox(_("Camera Settings"))
+        camera_group = tr(QGroupBox(), "setTitle", "Camera Settings")
         camera_layout = QFormLayout()
         
         self.camera_index = QSpinBox()
-        self.camera_index.setMinimum(0)
-        self.camera_index.setMaximum(10)
+        self.camera_index.setRange(*FIELD_LIMITS["camera_index"])
         self.camera_index.setValue(0)
-        camera_layout.addRow(_("Default camera index:"), self.camera_index)
+        camera_layout.addRow(tr(QLabel(), "setText", "Default camera index:"), self.camera_index)
         
         self.camera_width = QSpinBox()
-        self.camera_width.setMinimum(320)
-        self.camera_width.setMaximum(1920)
+        self.camera_width.setRange(*FIELD_LIMITS["camera_width"])
         self.camera_width.setValue(1280)
         self.camera_width.setSingleStep(10)
-        camera_layout.addRow(_("Video width:"), self.camera_width)
+        camera_layout.addRow(tr(QLabel(), "setText", "Video width:"), self.camera_width)
         
         self.camera_height = QSpinBox()
-        self.camera_height.setMinimum(240)
-        self.camera_height.setMaximum(1080)
+        self.camera_height.setRange(*FIELD_LIMITS["camera_height"])
         self.camera_height.setValue(720)
         self.camera_height.setSingleStep(10)
-        camera_layout.addRow(_("Video height:"), self.camera_height)
+        camera_layout.addRow(tr(QLabel(), "setText", "Video height:"), self.camera_height)
         
         camera_group.setLayout(camera_layout)
         layout.addWidget(camera_group)
         
         # Recognition settings
-        recognition_group = QGroupBox(_("Recognition Settings"))
+        recognition_group = tr(QGroupBox(), "setTitle", "Recognition Settings")
         recognition_layout = QFormLayout()
         
         self.threshold = QDoubleSpinBox()
-        self.threshold.setMinimum(0.0)
-        self.threshold.setMaximum(1.0)
+        self.threshold.setRange(*FIELD_LIMITS["threshold"])
         self.threshold.setSingleStep(0.01)
         self.threshold.setValue(0.35)
-        recognition_layout.addRow(_("Similarity threshold:"), self.threshold)
+        recognition_layout.addRow(tr(QLabel(), "setText", "Similarity threshold:"), self.threshold)
         
         self.confidence = QDoubleSpinBox()
-        self.confidence.setMinimum(0.0)
-        self.confidence.setMaximum(1.0)
+        self.confidence.setRange(*FIELD_LIMITS["confidence"])
         self.confidence.setSingleStep(0.05)
         self.confidence.setValue(0.80)
-        recognition_layout.addRow(_("Minimum confidence:"), self.confidence)
+        recognition_layout.addRow(tr(QLabel(), "setText", "Minimum confidence:"), self.confidence)
+        
+        # 0 turns the liveness check off
+        self.liveness_threshold = QDoubleSpinBox()
+        self.liveness_threshold.setRange(*FIELD_LIMITS["liveness_threshold"])
+        self.liveness_threshold.setSingleStep(0.05)
+        self.liveness_threshold.setValue(0.0)
+        tr(self.liveness_threshold, "setSpecialValueText", "Off")
+        tr(self.liveness_threshold, "setToolTip", "Blinks and facial motion required before a match is accepted")
+        recognition_layout.addRow(tr(QLabel(), "setText", "Minimum liveness:"), self.liveness_threshold)
+        
+        # Threshold evidence from recorded sessions
+        self.calibration = CalibrationPanel(lambda: self.max_frames.value())
+        self.calibration.thresholdSuggested.connect(self.threshold.setValue)
+        self.threshold.valueChanged.connect(self.calibration.set_threshold)
+        self.calibration.set_threshold(self.threshold.value())
+        recognition_layout.addRow(self.calibration)
         
         recognition_group.setLayout(recognition_layout)
         layout.addWidget(recognition_group)
         
         # Performance settings
-        perf_group = QGroupBox(_("Performance Settings"))
+        perf_group = tr(QGroupBox(), "setTitle", "Performance Settings")
         perf_layout = QFormLayout()
         
         self.timeout = QSpinBox()
-        self.timeout.setMinimum(1)
-        self.timeout.setMaximum(30)
+        self.timeout.setRange(*FIELD_LIMITS["timeout"])
         self.timeout.setValue(5)
-        self.timeout.setSuffix(_(" seconds"))
-        perf_layout.addRow(_("Timeout:"), self.timeout)
+        tr(self.timeout, "setSuffix", " seconds")
+        perf_layout.addRow(tr(QLabel(), "setText", "Timeout:"), self.timeout)
         
         self.max_frames = QSpinBox()
-        self.max_frames.setMinimum(1)
-        self.max_frames.setMaximum(1000)
+        self.max_frames.setRange(*FIELD_LIMITS["max_frames"])
         self.max_frames.setValue(100)
-        perf_layout.addRow(_("Max frames:"), self.max_frames)
+        perf_layout.addRow(tr(QLabel(), "setText", "Max frames:"), self.max_frames)
+        
+        # Sequential decision (early exit)
+        self.early_exit = tr(QCheckBox(), "setText", "Stop as soon as the decision is certain")
+        self.early_exit.setChecked(True)
+        perf_layout.addRow(self.early_exit)
+        
+        self.decision_far = QDoubleSpinBox()
+        self.decision_far.setDecimals(6)
+        self.decision_far.setRange(*FIELD_LIMITS["decision_far"])
+        self.decision_far.setSingleStep(0.0005)
+        self.decision_far.setValue(0.001)
+        perf_layout.addRow(tr(QLabel(), "setText", "Accepted false accept rate:"), self.decision_far)
+        
+        self.decision_frr = QDoubleSpinBox()
+        self.decision_frr.setDecimals(6)
+        self.decision_frr.setRange(*FIELD_LIMITS["decision_frr"])
+        self.decision_frr.setSingleStep(0.005)
+        self.decision_frr.setValue(0.01)
+        perf_layout.addRow(tr(QLabel(), "setText", "Accepted false reject rate:"), self.decision_frr)
+        
+        self.expected_frames_label = QLabel()
+        perf_layout.addRow(tr(QLabel(), "setText", "Expected frames to decision:"), self.expected_frames_label)
+        
+        # The simulation runs on the GUI thread: once per burst of edits, not per step
+        self._expected_frames_timer = QTimer(self)
+        self._expected_frames_timer.setSingleShot(True)
+        self._expected_frames_timer.setInterval(EXPECTED_FRAMES_DELAY_MS)
+        self._expected_frames_timer.timeout.connect(self.update_expected_frames)
+        for widget in (self.threshold, self.timeout, self.max_frames, self.decision_far, self.decision_frr):
+            widget.valueChanged.connect(self._expected_frames_timer.start)
+        self.early_exit.toggled.connect(self._expected_frames_timer.start)
+        self.early_exit.toggled.connect(self.decision_far.setEnabled)
+        self.early_exit.toggled.connect(self.decision_frr.setEnabled)
+        
+        tune_btn = tr(QPushButton(), "setText", "Benchmark & Tune")
+        tr(tune_btn, "setToolTip", "Measure this camera and CPU to recommend resolution, timeout and max frames")
+        tune_btn.clicked.connect(self.run_tuner)
+        perf_layout.addRow(tune_btn)
         
         perf_group.setLayout(perf_layout)
         layout.addWidget(perf_group)
         
         # Logging settings
-        log_group = QGroupBox(_("Logging"))
+        log_group = tr(QGroupBox(), "setTitle", "Logging")
         log_layout = QFormLayout()
         
         self.log_level = QComboBox()
-        self.log_level.addItem("DEBUG", "DEBUG")
-        self.log_level.addItem("INFO", "INFO")
-        self.log_level.addItem("WARNING", "WARNING")
-        self.log_level.addItem("ERROR", "ERROR")
-        self.log_level.addItem("CRITICAL", "CRITICAL")
-        log_layout.addRow(_("Log level:"), self.log_level)
-        
-        self.enable_logging = QCheckBox(_("Enable logging"))
+        for level in LOG_LEVELS:
+            self.log_level.addItem(level, level)
+        log_layout.addRow(tr(QLabel(), "setText", "Log level:"), self.log_level)
+        
+        self.enable_logging = tr(QCheckBox(), "setText", "Enable logging")
         self.enable_logging.setChecked(True)
         log_layout.addRow(self.enable_logging)
         
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
         
+        # Config key -> (getter, setter) for each field widget
+        self.fields = {
+            "camera_index": (self.camera_index.value, self.camera_index.setValue),
+            "camera_width": (self.camera_width.value, self.camera_width.setValue),
+            "camera_height": (self.camera_height.value, self.camera_height.setValue),
+            "threshold": (self.threshold.value, self.threshold.setValue),
+            "confidence": (self.confidence.value, self.confidence.setValue),
+            "timeout": (self.timeout.value, self.timeout.setValue),
+            "max_frames": (self.max_frames.value, self.max_frames.setValue),
+            "early_exit": (self.early_exit.isChecked, self.early_exit.setChecked),
+            "decision_far": (self.decision_far.value, self.decision_far.setValue),
+            "decision_frr": (self.decision_frr.value, self.decision_frr.setValue),
+            "liveness_threshold": (self.liveness_threshold.value, self.liveness_threshold.setValue),
+            "log_level": (self.log_level.currentData, self.log_level.setCurrentText),
+            "enable_logging": (self.enable_logging.isChecked, self.enable_logging.setChecked),
+        }
+        
         # Buttons
         button_layout = QHBoxLayout()
         
-        save_btn = QPushButton(_("Save"))
+        save_btn = tr(QPushButton(), "setText", "Save")
         save_btn.clicked.connect(self.save_config)
         button_layout.addWidget(save_btn)
         
-        reload_btn = QPushButton(_("Reload"))
+        reload_btn = tr(QPushButton(), "setText", "Reload")
         reload_btn.clicked.connect(self.load_config)
         button_layout.addWidget(reload_btn)
         
-        reset_btn = QPushButton(_("Reset to Defaults"))
+        reset_btn = tr(QPushButton(), "setText", "Reset to Defaults")
         reset_btn.clicked.connect(self.reset_to_defaults)
         button_layout.addWidget(reset_btn)
         
@@ -136,45 +219,99 @@ class ConfigEditorWidget(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
+        self.update_expected_frames()
     
     def load_config(self):
         """Load configuration from file."""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    self.config = json.load(f)
-            else:
-                self.config = self.get_default_config()
+            self.config = self.store.load().to_dict()
             
             # Update UI from config
-            self.camera_index.setValue(self.config.get("camera_index", 0))
-            self.camera_width.setValue(self.config.get("camera_width", 1280))
-            self.camera_height.setValue(self.config.get("camera_height", 720))
-            self.threshold.setValue(self.config.get("threshold", 0.35))
-            self.confidence.setValue(self.config.get("confidence", 0.80))
-            self.timeout.setValue(self.config.get("timeout", 5))
-            self.max_frames.setValue(self.config.get("max_frames", 100))
-            self.log_level.setCurrentText(self.config.get("log_level", "INFO"))
-            self.enable_logging.setChecked(self.config.get("enable_logging", True))
+            self.apply_config(self.config)
+            if self.store.problems:
+                self.banner.show_adjusted(self.store.problems)
+            else:
+                self.banner.hide()
             
         except Exception as e:
             QMessageBox.warning(self, _("Error"), _("Error loading configuration: {error}").format(error=str(e)))
     
+    def apply_config(self, config, keys=None):
+        """Update field widgets from config, optionally only for some keys."""
+        defaults = self.get_default_config()
+        
+        for key in (self.fields if keys is None else keys):
+            if key not in self.fields:
+                continue
+            getter, setter = self.fields[key]
+            setter(config.get(key, defaults[key]))
+            # Remember what the widget shows to detect unsaved edits
+            self._ui_snapshot[key] = getter()
+    
+    def get_ui_config(self):
+        """Build config from the field widgets."""
+        return {key: getter() for key, (getter, _setter) in self.fields.items()}
+    
+    def get_dirty_fields(self):
+        """Get keys edited in the UI since they were last loaded."""
+        return [key for key, value in self.get_ui_config().items()
+                if self._ui_snapshot.get(key) != value]
+    
+    def on_file_error(self, path, error):
+        """Show why the changed file could not be read."""
+        self.banner.show_error(error)
+    
+    def on_file_changed(self, path, new_config):
+        """Apply an external change to the fields that actually changed."""
+        if not isinstance(new_config, dict):
+            self.banner.show_error(_("Invalid configuration format"))
+            return
+        
+        changes = diff_config(self.config, new_config)
+        if not changes:
+            return
+        
+        dirty = self.get_dirty_fields()
+        conflicts = [key for key in changes if key in dirty]
+        
+        self.config = new_config
+        self.apply_config(new_config, [key for key in changes if key not in dirty])
+        
+        if conflicts:
+            self.banner.show_conflict(conflicts)
+    
+    def apply_conflicting_changes(self):
+        """Discard unsaved edits in favour of the file on disk."""
+        self.apply_config(self.config, self.get_dirty_fields())
+    
+    def update_expected_frames(self):
+        """Show the average frames the decision engine needs with these settings."""
+        try:
+            engine = decision.from_config(Config.from_dict(self.get_ui_config()))
+        except ValueError:
+            self.expected_frames_label.setText("—")
+            return
+        
+        genuine, impostor = decision.expected_frames(engine, trials=500)
+        self.expected_frames_label.setText(
+            _("{genuine:.1f} (genuine), {impostor:.1f} (impostor)").format(genuine=genuine, impostor=impostor)
+        )
+    
+    def run_tuner(self):
+        """Benchmark the hardware and apply the recommended settings."""
+        from .tune_dialog import TuneDialog
+        
+        dialog = TuneDialog(self.camera_index.value(), self)
+        if dialog.exec() == TuneDialog.Accepted and dialog.recommendation:
+            # Shown as unsaved edits until the user saves them
+            for key, value in dialog.recommendation.items():
+                self.fields[key][1](value)
+    
     def save_config(self):
         """Save configuration to file."""
         try:
-            # Build config from UI
-            self.config = {
-                "camera_index": self.camera_index.value(),
-                "camera_width": self.camera_width.value(),
-                "camera_height": self.camera_height.value(),
-                "threshold": self.threshold.value(),
-                "confidence": self.confidence.value(),
-                "timeout": self.timeout.value(),
-                "max_frames": self.max_frames.value(),
-                "log_level": self.log_level.currentData(),
-                "enable_logging": self.enable_logging.isChecked(),
-            }
+            # Build config from UI (validated against the same limits)
+            config = Config.from_dict(self.get_ui_config())
             
             # Ask for confirmation
             reply = QMessageBox.question(
@@ -188,27 +325,12 @@ class ConfigEditorWidget(QWidget):
             if reply != QMessageBox.Yes:
                 return
             
-            # Create directory if needed
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            # Atomic replace, through sudo if needed
+            self.store.publish(config)
             
-            # Write config
-            config_json = json.dumps(self.config, indent=4)
-            
-            # Try direct write first
-            try:
-                with open(self.config_path, 'w') as f:
-                    f.write(config_json)
-            except PermissionError:
-                # Use sudo if needed
-                result = subprocess.run(
-                    ['sudo', 'tee', self.config_path],
-                    input=config_json,
-                    text=True,
-                    capture_output=True
-                )
-                
-                if result.returncode != 0:
-                    raise Exception(result.stderr)
+            self.config = config.to_dict()
+            self.apply_config(self.config)
+            self.banner.hide()
             
             QMessageBox.information(
                 self,
@@ -229,20 +351,12 @@ class ConfigEditorWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.config = self.get_default_config()
-            self.load_config()
+            # Shown as unsaved edits until the user saves them
+            defaults = self.get_default_config()
+            for key, (_getter, setter) in self.fields.items():
+                setter(defaults[key])
     
     @staticmethod
     def get_default_config():
         """Get default configuration."""
-        return {
-            "camera_index": 0,
-            "camera_width": 1280,
-            "camera_height": 720,
-            "threshold": 0.35,
-            "confidence": 0.80,
-            "timeout": 5,
-            "max_frames": 100,
-            "log_level": "INFO",
-            "enable_logging": True,
-        }
+        return Config().to_dict()
@@ -0,0 +1,220 @@
+"""Live reload of configuration files.
+
+``ConfigWatcher`` wraps ``QFileSystemWatcher``: change bursts are debounced,
+files are re-read and parsed on the global thread pool, and only files whose
+stat signature actually changed are reported. Widgets then use
+``diff_config`` to update just the fields that differ, and ``ConflictBanner``
+to tell the user when the file changed under unsaved edits.
+"""
+
+import json
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QThreadPool, QTimer, Signal
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+
+from .retranslate import tr
+
+# Delay before a burst of change notifications is handled
+DEBOUNCE_MS = 250
+
+
+def parse_json(path):
+    """Parse a JSON configuration file."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def parse_text(path):
+    """Read a plain text configuration file."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def diff_config(old, new):
+    """Field-level diff of two config dicts.
+
+    Returns ``{key: (old_value, new_value)}`` for every key that was added,
+    removed or changed.
+    """
+    changes = {}
+    for key in old.keys() | new.keys():
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value != new_value:
+            changes[key] = (old_value, new_value)
+    return changes
+
+
+def _stat_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class ConfigWatcher(QObject):
+    """Watch configuration files and report parsed contents when they change."""
+
+    fileChanged = Signal(str, object)
+    fileError = Signal(str, str)
+
+    # Internal: parse result delivered from the worker thread
+    _parsed = Signal(str, int, object, str)
+
+    def __init__(self, parser=parse_json, delay=DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.parser = parser
+        self._signatures = {}
+        self._generations = {}
+        self._pending = set()
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._flush)
+
+        self._parsed.connect(self._on_parsed)
+
+    def watch(self, path):
+        """Start watching ``path``.
+
+        The parent directory is watched too, so that files replaced by an
+        atomic rename or created later are still picked up.
+        """
+        path = os.path.abspath(path)
+        self._signatures[path] = _stat_signature(path)
+        self._generations.setdefault(path, 0)
+
+        directory = os.path.dirname(path)
+        if os.path.isdir(directory) and directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        if os.path.exists(path) and path not in self._watcher.files():
+            self._watcher.addPath(path)
+
+    def unwatch(self, path):
+        """Stop watching ``path``."""
+        path = os.path.abspath(path)
+        self._signatures.pop(path, None)
+        self._generations.pop(path, None)
+        self._pending.discard(path)
+        if path in self._watcher.files():
+            self._watcher.removePath(path)
+
+        directory = os.path.dirname(path)
+        if not any(os.path.dirname(p) == directory for p in self._signatures):
+            if directory in self._watcher.directories():
+                self._watcher.removePath(directory)
+
+    def watched_files(self):
+        return list(self._signatures)
+
+    def _on_file_changed(self, path):
+        self._schedule(path)
+
+    def _on_directory_changed(self, directory):
+        for path in self._signatures:
+            if os.path.dirname(path) == directory:
+                self._schedule(path)
+
+    def _schedule(self, path):
+        if path not in self._signatures:
+            return
+        self._pending.add(path)
+        self._timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, set()
+
+        for path in pending:
+            # QFileSystemWatcher drops files that were replaced or removed
+            if os.path.exists(path) and path not in self._watcher.files():
+                self._watcher.addPath(path)
+
+            signature = _stat_signature(path)
+            if signature == self._signatures.get(path):
+                continue
+            self._signatures[path] = signature
+            if signature is None:
+                continue
+
+            self._generations[path] += 1
+            generation = self._generations[path]
+            QThreadPool.globalInstance().start(
+                lambda path=path, generation=generation: self._parse(path, generation)
+            )
+
+    def _parse(self, path, generation):
+        """Parse a file (runs on the thread pool)."""
+        try:
+            data = self.parser(path)
+        except Exception as e:
+            self._parsed.emit(path, generation, None, str(e))
+        else:
+            self._parsed.emit(path, generation, data, "")
+
+    def _on_parsed(self, path, generation, data, error):
+        # Drop results overtaken by a newer change
+        if self._generations.get(path) != generation:
+            return
+        if error:
+            self.fileError.emit(path, error)
+        else:
+            self.fileChanged.emit(path, data)
+
+
+class ConflictBanner(QFrame):
+    """Non-modal banner shown when a file changed under unsaved edits."""
+
+    reloadRequested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet(
+            "ConflictBanner { background-color: #fff3cd; border: 1px solid #f0ad4e; "
+            "border-radius: 4px; } QLabel { color: #664d03; }"
+        )
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+
+        self.label = QLabel()
+        self.label.setWordWrap(True)
+        layout.addWidget(self.label, 1)
+
+        self.reload_btn = tr(QPushButton(), "setText", "Reload")
+        self.reload_btn.clicked.connect(self.reloadRequested)
+        self.reload_btn.clicked.connect(self.hide)
+        layout.addWidget(self.reload_btn)
+
+        keep_btn = tr(QPushButton(), "setText", "Keep my changes")
+        keep_btn.clicked.connect(self.hide)
+        layout.addWidget(keep_btn)
+
+        self.hide()
+
+    def show_conflict(self, fields):
+        """Show which unsaved fields were also changed on disk."""
+        tr(self.label, "setText",
+           "The file was changed outside the application. "
+           "Your unsaved changes conflict with: {fields}", fields=", ".join(fields))
+        self.reload_btn.show()
+        self.show()
+
+    def show_adjusted(self, problems):
+        """Show settings that were invalid in the file and replaced when read."""
+        tr(self.label, "setText", "Some settings were invalid and have been adjusted: {problems}",
+           problems="; ".join(problems))
+        self.reload_btn.hide()
+        self.show()
+    
+    def show_error(self, message):
+        """Show a read error without offering to reload."""
+        tr(self.label, "setText", "Error: {error}", error=message)
+        self.reload_btn.hide()
+        self.show()
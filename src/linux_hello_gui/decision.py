@@ -0,0 +1,260 @@
+"""Early-exit sequential decision over per-frame match scores.
+
+Instead of spending the whole ``max_frames``/``timeout`` budget, each frame's
+score is turned into a log-likelihood ratio (genuine vs impostor) under a
+Gaussian score model and accumulated. Wald's sequential probability ratio
+test accepts as soon as the sum crosses ``log((1 - frr) / far)`` and rejects
+as soon as it falls under ``log(frr / (1 - far))``. Frames without a face
+carry no evidence but a run of them fails the attempt early.
+
+With ``min_liveness`` set, an accept also needs the liveness score of the
+stream (see ``liveness``) to reach it: confident matches wait for it, and
+an attempt that runs out of frames or time while waiting is rejected as
+not live.
+
+The engine has no camera or Qt dependency: feed it scores (synthetic or
+real) with ``update`` or ``run``. When the match itself was made elsewhere
+(``hello test`` only reports whether it recognized the face), ``confirm``
+applies the same liveness requirement to it.
+"""
+
+import math
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .face_features import NO_FACE_SCORE
+
+ACCEPT = "accept"
+REJECT = "reject"
+
+# Why an attempt ended
+REASON_CONFIDENT = "confident"
+REASON_BUDGET = "max-frames"
+REASON_TIMEOUT = "timeout"
+REASON_NO_FACE = "no-face"
+REASON_NOT_LIVE = "not-live"
+
+# Default score model around the configured threshold
+SCORE_MARGIN = 0.15
+SCORE_STD = 0.12
+
+# One frame may not contribute more than this much evidence
+LLR_CLAMP = 10.0
+
+# Consecutive frames without a face before giving up
+MAX_EMPTY_FRAMES = 15
+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class GaussianScoreModel:
+    """Per-frame score distributions of genuine users and impostors."""
+
+    genuine_mean: float
+    genuine_std: float
+    impostor_mean: float
+    impostor_std: float
+
+    @classmethod
+    def from_threshold(cls, threshold, margin=SCORE_MARGIN, std=SCORE_STD):
+        """Equal-variance model whose decision boundary is ``threshold``."""
+        return cls(threshold + margin, std, threshold - margin, std)
+
+    @classmethod
+    def fit(cls, genuine_scores, impostor_scores):
+        """Fit the model to recorded scores, ignoring frames without a face."""
+        genuine = np.asarray(genuine_scores, dtype=np.float64)
+        impostor = np.asarray(impostor_scores, dtype=np.float64)
+        genuine = genuine[genuine > NO_FACE_SCORE]
+        impostor = impostor[impostor > NO_FACE_SCORE]
+        return cls(float(genuine.mean()), max(float(genuine.std()), 1e-3),
+                   float(impostor.mean()), max(float(impostor.std()), 1e-3))
+
+    def llr(self, scores):
+        """Clamped log-likelihood ratio of each score (vectorized)."""
+        scores = np.asarray(scores, dtype=np.float64)
+        zg = (scores - self.genuine_mean) / self.genuine_std
+        zi = (scores - self.impostor_mean) / self.impostor_std
+        llr = math.log(self.impostor_std / self.genuine_std) + 0.5 * (zi * zi - zg * zg)
+        return np.clip(llr, -LLR_CLAMP, LLR_CLAMP)
+
+    def sample(self, genuine, shape, rng):
+        """Draw synthetic scores from the genuine or impostor distribution."""
+        if genuine:
+            return rng.normal(self.genuine_mean, self.genuine_std, shape)
+        return rng.normal(self.impostor_mean, self.impostor_std, shape)
+
+
+@dataclass
+class Attempt:
+    """Outcome of one recognition attempt."""
+
+    decision: str
+    reason: str
+    frames_used: int
+    time_to_decision: float
+    llr: float
+
+
+class SequentialDecision:
+    """Accumulate per-frame scores until accept or reject is decided."""
+
+    def __init__(self, model, far=0.001, frr=0.01, max_frames=100, timeout=5.0,
+                 max_empty_frames=MAX_EMPTY_FRAMES, early_exit=True, threshold=None,
+                 min_liveness=None, clock=time.monotonic):
+        self.model = model
+        self.min_liveness = min_liveness
+        self.max_frames = max_frames
+        self.timeout = timeout
+        self.max_empty_frames = max_empty_frames
+        self.early_exit = early_exit
+        self.clock = clock
+        self.accept_llr = math.log((1.0 - frr) / far)
+        self.reject_llr = math.log(frr / (1.0 - far))
+        if threshold is None:
+            threshold = (model.genuine_mean + model.impostor_mean) / 2
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self, timestamp=None):
+        """Start a new attempt."""
+        self.llr = 0.0
+        self.frames_used = 0
+        self.empty_frames = 0
+        self.decision = None
+        self.reason = None
+        self.matched = False
+        self.started = self.clock() if timestamp is None else timestamp
+        self.decided_at = None
+
+    @property
+    def time_to_decision(self):
+        if self.decided_at is None:
+            return None
+        return self.decided_at - self.started
+
+    def _decide(self, decision, reason, timestamp):
+        self.decision = decision
+        self.reason = reason
+        self.decided_at = timestamp
+        return decision
+
+    def _live(self, liveness):
+        return self.min_liveness is None or (liveness is not None and liveness >= self.min_liveness)
+
+    def update(self, score, timestamp=None, liveness=None):
+        """Feed one frame; ``score`` is None for a frame without a face.
+
+        ``liveness`` is the current liveness score of the stream, if known.
+        Returns ``ACCEPT`` or ``REJECT`` once decided, None to keep going.
+        """
+        if self.decision is not None:
+            return self.decision
+
+        timestamp = self.clock() if timestamp is None else timestamp
+        self.frames_used += 1
+
+        if score is None or score <= NO_FACE_SCORE:
+            self.empty_frames += 1
+            if self.empty_frames >= self.max_empty_frames:
+                return self._decide(REJECT, REASON_NO_FACE, timestamp)
+        else:
+            self.empty_frames = 0
+            if self.early_exit:
+                self.llr += float(self.model.llr(score))
+                if self.llr >= self.accept_llr:
+                    self.matched = True
+                elif self.llr <= self.reject_llr:
+                    return self._decide(REJECT, REASON_CONFIDENT, timestamp)
+            elif score >= self.threshold:
+                self.matched = True
+
+        if self.matched and self._live(liveness):
+            return self._decide(ACCEPT, REASON_CONFIDENT, timestamp)
+
+        out_of_frames = self.frames_used >= self.max_frames
+        if out_of_frames or timestamp - self.started >= self.timeout:
+            if self.matched:
+                return self._decide(REJECT, REASON_NOT_LIVE, timestamp)
+            return self._decide(REJECT, REASON_BUDGET if out_of_frames else REASON_TIMEOUT, timestamp)
+        return None
+
+    def confirm(self, liveness, timestamp=None):
+        """Decide on a match made by the recognizer, given the stream's liveness.
+
+        Accepts when no minimum liveness is set or ``liveness`` reaches it,
+        otherwise rejects as not live (also when ``liveness`` is unknown).
+        """
+        timestamp = self.clock() if timestamp is None else timestamp
+        self.reset(timestamp)
+        self.matched = True
+        if self._live(liveness):
+            return self._decide(ACCEPT, REASON_CONFIDENT, timestamp)
+        return self._decide(REJECT, REASON_NOT_LIVE, timestamp)
+
+    def run(self, scores, timestamps=None, liveness=None):
+        """Run a whole score stream and return its ``Attempt``.
+
+        ``timestamps`` are seconds since the start of the attempt; without
+        them, frames are taken to arrive at 30 fps. ``liveness`` gives the
+        liveness score after each frame.
+        """
+        if timestamps is None:
+            timestamps = [i / 30.0 for i in range(1, len(scores) + 1)]
+        if liveness is None:
+            liveness = [None] * len(scores)
+        self.reset(timestamp=0.0)
+
+        for score, timestamp, live in zip(scores, timestamps, liveness):
+            if self.update(score, timestamp, live) is not None:
+                break
+
+        if self.decision is None:
+            # Stream ended before a decision: the attempt failed
+            reason = REASON_NOT_LIVE if self.matched else REASON_BUDGET
+            self._decide(REJECT, reason, timestamps[-1] if len(timestamps) else 0.0)
+
+        return Attempt(self.decision, self.reason, self.frames_used, self.time_to_decision, self.llr)
+
+
+def from_config(config, clock=time.monotonic):
+    """Build an engine from a ``Config``."""
+    return SequentialDecision(
+        GaussianScoreModel.from_threshold(config.threshold),
+        far=config.decision_far,
+        frr=config.decision_frr,
+        max_frames=config.max_frames,
+        timeout=config.timeout,
+        early_exit=config.early_exit,
+        threshold=config.threshold,
+        min_liveness=config.liveness_threshold or None,
+        clock=clock,
+    )
+
+
+def expected_frames(engine, trials=2000, seed=0):
+    """Average frames to decision for genuine users and impostors.
+
+    Simulates ``trials`` attempts of each kind from the engine's score model,
+    all at once: cumulative evidence per attempt, then the first frame that
+    crosses either bound (or the frame budget).
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for genuine in (True, False):
+        scores = engine.model.sample(genuine, (trials, engine.max_frames), rng)
+        if engine.early_exit:
+            evidence = np.cumsum(engine.model.llr(scores), axis=1)
+            crossed = (evidence >= engine.accept_llr) | (evidence <= engine.reject_llr)
+        else:
+            crossed = scores >= engine.threshold
+        decided = crossed.any(axis=1)
+        frames = np.where(decided, crossed.argmax(axis=1) + 1, engine.max_frames)
+        results.append(float(frames.mean()))
+
+    return tuple(results)
@@ -0,0 +1,504 @@
+"""In-process system diagnostics.
+
+Each check is a plain function returning ``(status, summary, details)``.
+``run_checks`` starts all of them at once, each on its own thread with its
+own deadline: a check that hangs (a camera stuck in its driver, say) is
+reported as timed out and abandoned instead of holding up the others.
+``release_camera`` then makes abandoned camera checks give the device up.
+Results are kept for ``CACHE_TTL`` seconds, so asking again right away
+costs nothing.
+
+Everything here is plain Python, usable without Qt and against any
+directories laid out like the real system ones.
+"""
+
+import os
+import queue
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from . import config as config_module
+from . import exposure
+from . import pam_profiles
+from .enrollment import USER_FACES_DIR
+from .face_features import FEATURE_DIM
+from .i18n import _, ngettext
+
+STATUS_OK = "ok"
+STATUS_WARNING = "warning"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+# Worst first, for the overall result
+STATUS_ORDER = (STATUS_ERROR, STATUS_TIMEOUT, STATUS_WARNING, STATUS_OK)
+
+VIDEO4LINUX_DIR = "/sys/class/video4linux"
+HELLO_BINARY = "hello"
+
+# Seconds a check may take, and how long its result is reused
+CHECK_TIMEOUT = 10.0
+CACHE_TTL = 30.0
+
+# Checks that legitimately take longer than CHECK_TIMEOUT
+TIMEOUTS = {
+    "camera_stream": 15.0,
+}
+
+# Frames read to measure the achieved frame rate
+FPS_SAMPLE_FRAMES = 30
+
+# Share of a USB bus an uncompressed stream may use before it is a concern
+USB_BUDGET = 0.6
+
+# How long the preview may wait for camera checks to let go of the device
+CAMERA_RELEASE_TIMEOUT = 3.0
+
+# Camera checks holding a device; they stop reading once _camera_stop is set
+_camera_users = 0
+_camera_free = threading.Condition()
+_camera_stop = threading.Event()
+
+
+@dataclass
+class DiagnosticsContext:
+    """What the checks look at; defaults are the live system."""
+
+    camera_index: int = 0
+    camera_width: int = 1280
+    camera_height: int = 720
+    config_path: str = config_module.CONFIG_PATH
+    pam_dir: str = pam_profiles.PAM_DIR
+    faces_dir: str = USER_FACES_DIR
+    video4linux_dir: str = VIDEO4LINUX_DIR
+    hello_binary: str = HELLO_BINARY
+
+    @classmethod
+    def from_config(cls, **overrides):
+        try:
+            cfg = config_module.get()
+        except config_module.ConfigError:
+            cfg = config_module.Config()
+        values = dict(camera_index=cfg.camera_index, camera_width=cfg.camera_width,
+                      camera_height=cfg.camera_height)
+        values.update(overrides)
+        return cls(**values)
+
+    def key(self):
+        return tuple(sorted(vars(self).items()))
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check."""
+
+    check: str
+    status: str
+    summary: str
+    details: list = field(default_factory=list)
+    duration: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self):
+        return self.status == STATUS_OK
+
+
+def get_check_title(check):
+    """Display name of a check."""
+    titles = {
+        "camera_devices": _("Camera devices"),
+        "camera_stream": _("Camera open latency and frame rate"),
+        "usb_bandwidth": _("USB bandwidth"),
+        "pam": _("PAM configuration"),
+        "config": _("Configuration file"),
+        "face_store": _("Face store"),
+        "hello": _("hello command"),
+    }
+    return titles.get(check, check)
+
+
+def worst_status(results):
+    statuses = {result.status for result in results}
+    for status in STATUS_ORDER:
+        if status in statuses:
+            return status
+    return STATUS_OK
+
+
+# Checks
+
+def _read_sysfs(path):
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _video_devices(video4linux_dir):
+    """``[(name, sysfs path), ...]`` of the video4linux devices."""
+    try:
+        names = sorted(os.listdir(video4linux_dir), key=lambda n: (len(n), n))
+    except OSError:
+        return []
+    return [(name, os.path.join(video4linux_dir, name)) for name in names if name.startswith("video")]
+
+
+def check_camera_devices(ctx):
+    devices = _video_devices(ctx.video4linux_dir)
+    if not devices:
+        return STATUS_ERROR, _("No video devices found"), []
+    details = [(f"/dev/{name}", _read_sysfs(os.path.join(path, "name")) or "?") for name, path in devices]
+    wanted = f"video{ctx.camera_index}"
+    if wanted not in [name for name, _path in devices]:
+        return STATUS_ERROR, _("Configured camera /dev/{name} is missing").format(name=wanted), details
+    return STATUS_OK, ngettext("{count} video device", "{count} video devices", len(devices)).format(
+        count=len(devices)), details
+
+
+def check_camera_stream(ctx):
+    device = exposure.device_key(ctx.camera_index, ctx.video4linux_dir)
+    monitor = exposure.monitor_for(device)
+    started = time.perf_counter()
+    monitor.reset(opened_at=started)
+    global _camera_users
+    with _camera_free:
+        _camera_users += 1
+    cap = cv2.VideoCapture(ctx.camera_index)
+    try:
+        if not cap.isOpened():
+            return STATUS_ERROR, _("Cannot open camera {index}").format(index=ctx.camera_index), []
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, ctx.camera_width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, ctx.camera_height)
+        ret, frame = cap.read()
+        first_frame = time.perf_counter() - started
+        if not ret:
+            return STATUS_ERROR, _("Camera opened but returned no frame"), []
+
+        monitor.update(frame, time.perf_counter())
+
+        frames = 0
+        sample_started = time.perf_counter()
+        while frames < FPS_SAMPLE_FRAMES and not _camera_stop.is_set():
+            ret, sample = cap.read()
+            if not ret:
+                break
+            frames += 1
+            monitor.update(sample, time.perf_counter())
+        fps = frames / (time.perf_counter() - sample_started) if frames else 0.0
+        reported = cap.get(cv2.CAP_PROP_FPS)
+
+        # Keep reading until auto-exposure settles (bounded by its max_wait)
+        while not monitor.stable and not _camera_stop.is_set():
+            ret, sample = cap.read()
+            if not ret:
+                break
+            monitor.update(sample, time.perf_counter())
+    finally:
+        cap.release()
+        with _camera_free:
+            _camera_users -= 1
+            _camera_free.notify_all()
+
+    height, width = frame.shape[:2]
+    details = [
+        (_("Time to first frame"), f"{first_frame * 1000:.0f} ms"),
+        (_("Resolution"), f"{width}×{height}"),
+        (_("Achieved frame rate"), f"{fps:.1f} fps"),
+        (_("Reported frame rate"), f"{reported:.1f} fps"),
+    ]
+    if monitor.converged:
+        exposure.record(device, monitor.time_to_stable)
+        details.append((_("Exposure settles after"), f"{monitor.time_to_stable * 1000:.0f} ms"))
+    else:
+        details.append((_("Exposure settles after"), _("not within {seconds:.0f} s").format(
+            seconds=monitor.max_wait)))
+    status = STATUS_OK
+    if fps < 10 or first_frame > 2.0 or not monitor.converged:
+        status = STATUS_WARNING
+    return status, _("{fps:.1f} fps, first frame after {ms:.0f} ms").format(
+        fps=fps, ms=first_frame * 1000), details
+
+
+def _usb_device_dir(device_path):
+    """sysfs directory of the USB device behind a video4linux device."""
+    try:
+        path = os.path.realpath(os.path.join(device_path, "device"))
+    except OSError:
+        return None
+    # Walk up from the interface to the device that knows its speed
+    while path and path != "/":
+        if os.path.exists(os.path.join(path, "speed")):
+            return path
+        path = os.path.dirname(path)
+    return None
+
+
+def check_usb_bandwidth(ctx):
+    devices = dict(_video_devices(ctx.video4linux_dir))
+    device_path = devices.get(f"video{ctx.camera_index}")
+    if device_path is None:
+        return STATUS_WARNING, _("Configured camera not found"), []
+    usb_dir = _usb_device_dir(device_path)
+    if usb_dir is None:
+        return STATUS_OK, _("Not a USB camera"), []
+
+    speed = float(_read_sysfs(os.path.join(usb_dir, "speed")) or 0)
+    # Uncompressed YUYV at 30 fps, the worst case the camera may negotiate
+    needed = ctx.camera_width * ctx.camera_height * 16 * 30 / 1e6
+    product = " ".join(filter(None, (_read_sysfs(os.path.join(usb_dir, "manufacturer")),
+                                     _read_sysfs(os.path.join(usb_dir, "product")))))
+    details = [
+        (_("Device"), product or os.path.basename(usb_dir)),
+        (_("Bus speed"), f"{speed:.0f} Mbit/s"),
+        (_("Uncompressed stream"), f"{needed:.0f} Mbit/s"),
+    ]
+    if speed and needed > speed * USB_BUDGET:
+        return STATUS_WARNING, _("{speed:.0f} Mbit/s bus: uncompressed {width}×{height} needs MJPG").format(
+            speed=speed, width=ctx.camera_width, height=ctx.camera_height), details
+    return STATUS_OK, _("{speed:.0f} Mbit/s bus").format(speed=speed), details
+
+
+_INCLUDE_RE = re.compile(r"^\s*(?:@include\s+(\S+)|-?\w+\s+(?:include|substack)\s+(\S+))")
+
+
+def pam_include_issues(service, pam_dir):
+    """Missing targets and cycles in the include graph of a PAM service file."""
+    issues = []
+    visiting = []
+
+    def visit(name):
+        if name in visiting:
+            issues.append(_("Include cycle: {chain}").format(chain=" → ".join(visiting + [name])))
+            return
+        path = os.path.join(pam_dir, name)
+        try:
+            with open(path, "r") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            if visiting:
+                issues.append(_("{parent} includes missing {name}").format(parent=visiting[-1], name=name))
+            return
+        visiting.append(name)
+        for line in lines:
+            match = _INCLUDE_RE.match(line.split("#", 1)[0])
+            if match:
+                visit(match.group(1) or match.group(2))
+        visiting.pop()
+
+    visit(service)
+    return issues
+
+
+def check_pam(ctx):
+    errors = []
+    profiles = pam_profiles.load_profiles(ctx.pam_dir, errors)
+    details = [(os.path.basename(path), _("unreadable: {error}").format(error=error)) for path, error in errors]
+    problems = len(errors)
+    enabled = [profile for profile in profiles.values() if profile.enabled]
+    if not enabled and not problems:
+        return STATUS_WARNING, _("Face authentication is not enabled for any service"), []
+
+    for profile in enabled:
+        issues = (pam_profiles.validate_profile(profile, ctx.pam_dir)
+                  + pam_include_issues(profile.service, ctx.pam_dir))
+        problems += len(issues)
+        details.append((profile.service, "; ".join(issues) if issues else "✓"))
+
+    if not os.path.exists(pam_profiles.PAM_HELPER):
+        problems += 1
+        details.append((_("PAM helper"), _("{path} not found").format(path=pam_profiles.PAM_HELPER)))
+
+    if problems:
+        return STATUS_ERROR, ngettext("{count} problem found", "{count} problems found", problems).format(
+            count=problems), details
+    return STATUS_OK, ngettext("{count} service configured", "{count} services configured", len(enabled)).format(
+        count=len(enabled)), details
+
+
+def check_config(ctx):
+    if not os.path.exists(ctx.config_path):
+        return STATUS_WARNING, _("{path} not found, using defaults").format(path=ctx.config_path), []
+    problems = []
+    try:
+        cfg, generation = config_module.read_config(ctx.config_path, problems)
+    except config_module.ConfigError as e:
+        return STATUS_ERROR, str(e), []
+    except OSError as e:
+        return STATUS_ERROR, _("Error: {error}").format(error=str(e)), []
+    details = [(name, str(value)) for name, value in cfg.to_dict().items()]
+    if problems:
+        details = [(_("Invalid"), problem) for problem in problems] + details
+        return STATUS_WARNING, ngettext("{count} invalid setting adjusted", "{count} invalid settings adjusted",
+                                        len(problems)).format(count=len(problems)), details
+    return STATUS_OK, _("Valid (generation {generation})").format(generation=generation), details
+
+
+def check_face_store(ctx):
+    try:
+        names = sorted(os.listdir(ctx.faces_dir))
+        mode = os.stat(ctx.faces_dir).st_mode
+    except OSError:
+        return STATUS_WARNING, _("No face registered"), []
+
+    details = []
+    bad = 0
+    # Counted apart: like face_features.load_templates, arrays win over images
+    templates = 0
+    images = 0
+    for name in names:
+        path = os.path.join(ctx.faces_dir, name)
+        if name.endswith(".npy"):
+            try:
+                data = np.load(path, mmap_mode="r")
+                valid = data.ndim == 2 and data.shape[1] == FEATURE_DIM
+                templates += data.shape[0] if valid else 0
+            except (OSError, ValueError):
+                valid = False
+        elif name.endswith(".jpg"):
+            valid = cv2.imread(path, cv2.IMREAD_REDUCED_GRAYSCALE_8) is not None
+            images += valid
+        else:
+            continue
+        if not valid:
+            bad += 1
+            details.append((name, _("unreadable")))
+
+    if mode & 0o077:
+        details.append((_("Permissions"), _("{mode:o}: readable by other users").format(mode=mode & 0o777)))
+    if bad:
+        return STATUS_ERROR, ngettext("{count} damaged file", "{count} damaged files", bad).format(count=bad), details
+    if not templates and not images:
+        return STATUS_WARNING, _("No face registered"), details
+    status = STATUS_WARNING if mode & 0o077 else STATUS_OK
+    if not templates:
+        return status, ngettext("{count} sample", "{count} samples", images).format(count=images), details
+    if images:
+        details.append((_("Sample images"), ngettext(
+            "{count} unused: template arrays take precedence",
+            "{count} unused: template arrays take precedence", images).format(count=images)))
+    return status, ngettext("{count} template", "{count} templates", templates).format(count=templates), details
+
+
+def check_hello(ctx):
+    path = shutil.which(ctx.hello_binary)
+    if path is None:
+        return STATUS_ERROR, _("{name} not found in PATH").format(name=ctx.hello_binary), []
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return STATUS_ERROR, _("Error: {error}").format(error=str(e)), [(_("Path"), path)]
+    version = (output.stdout or output.stderr).strip().splitlines()
+    version = version[0] if version else "?"
+    details = [(_("Path"), path), (_("Version"), version)]
+    if output.returncode != 0:
+        return STATUS_WARNING, _("{name} --version failed").format(name=ctx.hello_binary), details
+    return STATUS_OK, version, details
+
+
+# Check id -> function; all independent of each other, run concurrently
+CHECKS = {
+    "camera_devices": check_camera_devices,
+    "camera_stream": check_camera_stream,
+    "usb_bandwidth": check_usb_bandwidth,
+    "pam": check_pam,
+    "config": check_config,
+    "face_store": check_face_store,
+    "hello": check_hello,
+}
+
+
+def _run_one(check, function, ctx):
+    started = time.perf_counter()
+    try:
+        status, summary, details = function(ctx)
+    except Exception as e:
+        status, summary, details = STATUS_ERROR, _("Error: {error}").format(error=str(e)), []
+    return CheckResult(check, status, summary, details, time.perf_counter() - started)
+
+
+# (check, context key) -> (expiry, result)
+_cache = {}
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def release_camera(timeout=CAMERA_RELEASE_TIMEOUT):
+    """Stop running camera checks; True once none of them holds a camera.
+
+    A check stuck inside the driver cannot be interrupted: past ``timeout``
+    this gives up and returns False.
+    """
+    _camera_stop.set()
+    with _camera_free:
+        return _camera_free.wait_for(lambda: _camera_users == 0, timeout)
+
+
+def run_checks(ctx=None, checks=None, timeout=CHECK_TIMEOUT, ttl=CACHE_TTL, force=False, on_result=None):
+    """Run checks concurrently; returns their results in ``checks`` order.
+
+    ``checks`` maps ids to functions (default ``CHECKS``). Fresh cached
+    results are reused unless ``force``. ``on_result`` is called with each
+    result as soon as it is known.
+    """
+    ctx = ctx or DiagnosticsContext.from_config()
+    checks = CHECKS if checks is None else checks
+    key = ctx.key()
+    now = time.monotonic()
+    results = {}
+
+    for check in checks:
+        cached = _cache.get((check, key))
+        if not force and cached is not None and cached[0] > now:
+            result = cached[1]
+            results[check] = CheckResult(result.check, result.status, result.summary,
+                                         result.details, result.duration, cached=True)
+            if on_result is not None:
+                on_result(results[check])
+
+    # One daemon thread per check: a hung check is abandoned, and it cannot
+    # keep the application from exiting either
+    _camera_stop.clear()
+    finished = queue.Queue()
+    started = time.monotonic()
+    deadlines = {}
+    for check in checks:
+        if check in results:
+            continue
+        deadlines[check] = started + TIMEOUTS.get(check, timeout)
+        threading.Thread(
+            target=lambda check=check: finished.put(_run_one(check, checks[check], ctx)),
+            name=f"diagnostics-{check}", daemon=True,
+        ).start()
+
+    while deadlines:
+        try:
+            result = finished.get(timeout=max(0.0, min(deadlines.values()) - time.monotonic()))
+        except queue.Empty:
+            result = None
+        if result is not None and result.check in deadlines:
+            del deadlines[result.check]
+            results[result.check] = result
+            _cache[(result.check, key)] = (time.monotonic() + ttl, result)
+            if on_result is not None:
+                on_result(result)
+
+        now = time.monotonic()
+        for check in [check for check, deadline in deadlines.items() if deadline <= now]:
+            del deadlines[check]
+            limit = TIMEOUTS.get(check, timeout)
+            results[check] = CheckResult(
+                check, STATUS_TIMEOUT, _("No answer after {seconds:.0f} s").format(seconds=limit), [], limit)
+            if on_result is not None:
+                on_result(results[check])
+
+    return [results[check] for check in checks]
@@ -0,0 +1,126 @@
+"""Diagnostics dialog: results of every check as a tree, with timings."""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTreeWidget, QTreeWidgetItem
+)
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtCore import QThread, Signal
+import time
+from . import diagnostics
+from .i18n import _, ngettext
+from .retranslate import bind, tr
+
+STATUS_MARKS = {
+    diagnostics.STATUS_OK: ("✓", "#388e3c"),
+    diagnostics.STATUS_WARNING: ("⚠", "#f57c00"),
+    diagnostics.STATUS_ERROR: ("✗", "#d32f2f"),
+    diagnostics.STATUS_TIMEOUT: ("⏱", "#d32f2f"),
+}
+
+
+class DiagnosticsWorker(QThread):
+    """Run the checks off the GUI thread, reporting each result as it comes."""
+
+    resultReady = Signal(object)
+
+    def __init__(self, ctx, force=False, parent=None):
+        super().__init__(parent)
+        self.ctx = ctx
+        self.force = force
+        self.results = []
+
+    def run(self):
+        self.results = diagnostics.run_checks(self.ctx, force=self.force, on_result=self.resultReady.emit)
+
+
+class DiagnosticsDialog(QDialog):
+    """Run the diagnostics and show one expandable row per check."""
+
+    def __init__(self, ctx=None, parent=None):
+        super().__init__(parent)
+        tr(self, "setWindowTitle", "Diagnostics")
+        self.resize(640, 420)
+        self.ctx = ctx or diagnostics.DiagnosticsContext.from_config()
+        self.worker = None
+        self.results = []
+        self.items = {}
+        self.started = 0.0
+
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(3)
+        bind(self.tree, "setHeaderLabels", lambda: [_("Check"), _("Result"), _("Time")])
+        self.tree.setColumnWidth(0, 240)
+        self.tree.setColumnWidth(1, 300)
+        layout.addWidget(self.tree)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.rerun_btn = tr(QPushButton(), "setText", "Run Again")
+        self.rerun_btn.clicked.connect(lambda: self.start(force=True))
+        button_layout.addWidget(self.rerun_btn)
+        close_btn = tr(QPushButton(), "setText", "Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    def start(self, force=False):
+        """Run every check; recent results are reused unless ``force``."""
+        self.rerun_btn.setEnabled(False)
+        self.tree.clear()
+        self.items = {}
+        for check in diagnostics.CHECKS:
+            item = QTreeWidgetItem([diagnostics.get_check_title(check), _("Running..."), ""])
+            self.tree.addTopLevelItem(item)
+            self.items[check] = item
+        tr(self.summary_label, "setText", "Running diagnostics...")
+
+        self.started = time.perf_counter()
+        self.worker = DiagnosticsWorker(self.ctx, force, self)
+        self.worker.resultReady.connect(self.show_result)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def show_result(self, result):
+        item = self.items.get(result.check)
+        if item is None:
+            return
+        mark, color = STATUS_MARKS.get(result.status, ("?", "#666"))
+        item.setText(0, f"{mark} {diagnostics.get_check_title(result.check)}")
+        item.setForeground(0, QBrush(QColor(color)))
+        item.setText(1, result.summary)
+        item.setToolTip(1, result.summary)
+        duration = f"{result.duration * 1000:.0f} ms"
+        item.setText(2, _("{time} (cached)").format(time=duration) if result.cached else duration)
+        item.takeChildren()
+        for label, value in result.details:
+            child = QTreeWidgetItem([label, value, ""])
+            child.setToolTip(1, value)
+            item.addChild(child)
+        # Problems are shown expanded
+        item.setExpanded(result.status != diagnostics.STATUS_OK)
+
+    def on_finished(self):
+        self.results = self.worker.results
+        self.rerun_btn.setEnabled(True)
+        problems = sum(1 for result in self.results if not result.ok)
+        elapsed = time.perf_counter() - self.started
+        if problems:
+            bind(self.summary_label, "setText", lambda: ngettext(
+                "✗ {count} check needs attention ({time:.1f} s)",
+                "✗ {count} checks need attention ({time:.1f} s)", problems,
+            ).format(count=problems, time=elapsed))
+        else:
+            tr(self.summary_label, "setText", "✓ All systems operational ({time:.1f} s)", time=elapsed)
+
+    def done(self, result):
+        # run_checks returns within the longest check timeout
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()
+        if self.worker is not None:
+            self.results = self.worker.results
+        super().done(result)
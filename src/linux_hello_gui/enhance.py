@@ -0,0 +1,236 @@
+"""Low-light and IR contrast enhancement for the preview and enrollment.
+
+``Enhancer.apply`` brightens a frame in place in two steps:
+
+* a global tone curve (gamma, then contrast around mid-grey) applied with
+  ``cv2.LUT``; the 256-entry table is rebuilt only when the parameters
+  change,
+* local contrast: CLAHE runs on a small luminance copy of the frame, and
+  the ratio between its output and input becomes a gain map that is
+  upscaled and multiplied into the frame. Colours keep their hue and the
+  full-size frame is never converted or equalized.
+
+In automatic mode the parameters follow the luminance histogram of each
+frame, smoothed and rounded so the table rarely changes. Bright, well
+spread frames are left untouched.
+
+``python -m linux_hello_gui.enhance CLIP...`` compares the face detection
+hit rate with and without enhancement on recorded clips.
+"""
+
+import math
+import sys
+
+import cv2
+import numpy as np
+
+from .face_features import detect_faces
+from .session_recorder import open_capture
+
+# Width of the luminance copy used for statistics and CLAHE
+WORK_WIDTH = 320
+CLAHE_TILES = (8, 8)
+
+# Automatic mode: mean luminance aimed for, p5-p95 spread below which
+# contrast is stretched, and limits of each parameter
+TARGET_MEAN = 110.0
+TARGET_SPREAD = 160.0
+MAX_GAMMA = 2.5
+MAX_CONTRAST = 1.8
+AUTO_CLAHE = 2.0
+# Frames darker or flatter than this also get local contrast
+CLAHE_BELOW_MEAN = 80.0
+CLAHE_BELOW_SPREAD = 100.0
+
+# Automatic parameters move this much towards each new frame's, in these steps
+SMOOTHING = 0.2
+STEP = 0.05
+
+# Fixed point of the gain map: gain = value / GAIN_ONE (at most ~4x)
+GAIN_ONE = 64
+
+
+def build_lut(gamma=1.0, contrast=1.0):
+    """256-entry tone curve: gamma above 1 brightens, contrast stretches around mid-grey."""
+    x = np.arange(256, dtype=np.float64) / 255.0
+    y = (x ** (1.0 / gamma) - 0.5) * contrast + 0.5
+    return np.clip(np.round(y * 255.0), 0, 255).astype(np.uint8)
+
+
+def auto_params(histogram):
+    """``(gamma, contrast, clahe)`` for a 256-bin luminance histogram."""
+    total = histogram.sum()
+    if total == 0:
+        return 1.0, 1.0, 0.0
+    mean = float(np.dot(np.arange(256), histogram) / total)
+    cumulative = np.cumsum(histogram) / total
+    low, high = np.searchsorted(cumulative, (0.05, 0.95))
+    spread = float(max(high - low, 1))
+
+    gamma = 1.0
+    if 0 < mean < TARGET_MEAN:
+        gamma = min(MAX_GAMMA, math.log(mean / 255.0) / math.log(TARGET_MEAN / 255.0))
+    contrast = min(MAX_CONTRAST, TARGET_SPREAD / spread) if spread < TARGET_SPREAD else 1.0
+    clahe = AUTO_CLAHE if mean < CLAHE_BELOW_MEAN or spread < CLAHE_BELOW_SPREAD else 0.0
+    return gamma, contrast, clahe
+
+
+class Enhancer:
+    """Tone curve plus local contrast, applied in place on each frame.
+
+    With ``auto`` the parameters come from each frame; otherwise
+    ``gamma``, ``contrast`` and ``clahe`` (a CLAHE clip limit, 0 for off)
+    are used as given.
+    """
+
+    def __init__(self, auto=True, gamma=1.0, contrast=1.0, clahe=0.0):
+        self.auto = auto
+        self.gamma = gamma
+        self.contrast = contrast
+        self.clahe = clahe
+        self.lut_builds = 0
+        self._lut_key = None
+        self._lut = None
+        self._clahe_limit = None
+        self._clahe = None
+        self._smoothed = None
+        # Reused between frames of the same size
+        self._small = None
+        self._gain_full = None
+
+    def set_params(self, gamma=None, contrast=None, clahe=None):
+        """Fix the parameters (and leave automatic mode)."""
+        self.auto = False
+        if gamma is not None:
+            self.gamma = gamma
+        if contrast is not None:
+            self.contrast = contrast
+        if clahe is not None:
+            self.clahe = clahe
+
+    @property
+    def identity(self):
+        return self.gamma == 1.0 and self.contrast == 1.0 and not self.clahe
+
+    def _get_lut(self):
+        key = (self.gamma, self.contrast)
+        if key != self._lut_key:
+            self._lut = build_lut(self.gamma, self.contrast)
+            self._lut_key = key
+            self.lut_builds += 1
+        return self._lut
+
+    def _update_auto(self, small):
+        histogram = np.bincount(small.ravel(), minlength=256)
+        target = np.array(auto_params(histogram))
+        if self._smoothed is None:
+            self._smoothed = target
+        else:
+            self._smoothed += SMOOTHING * (target - self._smoothed)
+        gamma, contrast, clahe = (round(value / STEP) * STEP for value in self._smoothed)
+        self.gamma = max(1.0, round(gamma, 2))
+        self.contrast = max(1.0, round(contrast, 2))
+        self.clahe = round(clahe, 2) if clahe >= 0.5 else 0.0
+
+    def _small_luminance(self, frame):
+        height, width = frame.shape[:2]
+        size = (WORK_WIDTH, max(1, round(height * WORK_WIDTH / width)))
+        if self._small is None or self._small.shape[::-1] != size:
+            self._small = np.empty(size[::-1], np.uint8)
+        if frame.ndim == 3:
+            small = cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+            cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self._small)
+        else:
+            cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_LINEAR)
+        return self._small
+
+    def apply(self, frame):
+        """Enhance ``frame`` (uint8 BGR or grayscale) in place and return it."""
+        small = self._small_luminance(frame)
+        if self.auto:
+            self._update_auto(small)
+        if self.identity:
+            return frame
+
+        lut = self._get_lut()
+        if self._lut_key != (1.0, 1.0):
+            cv2.LUT(frame, lut, dst=frame)
+        if not self.clahe:
+            return frame
+
+        if self._clahe_limit != self.clahe:
+            self._clahe = cv2.createCLAHE(clipLimit=self.clahe, tileGridSize=CLAHE_TILES)
+            self._clahe_limit = self.clahe
+        toned = cv2.LUT(small, lut)
+        equalized = self._clahe.apply(toned)
+        # Gain that takes each region from its toned to its equalized level
+        gain = (equalized.astype(np.float32) + 1.0) / (toned.astype(np.float32) + 1.0)
+        gain = np.clip(gain * GAIN_ONE, 0, 255).astype(np.uint8)
+        if frame.ndim == 3:
+            gain = cv2.cvtColor(gain, cv2.COLOR_GRAY2BGR)
+
+        height, width = frame.shape[:2]
+        if self._gain_full is None or self._gain_full.shape != frame.shape:
+            self._gain_full = np.empty_like(frame)
+        cv2.resize(gain, (width, height), dst=self._gain_full, interpolation=cv2.INTER_LINEAR)
+        cv2.multiply(frame, self._gain_full, dst=frame, scale=1.0 / GAIN_ONE)
+        return frame
+
+
+def darken(frame, level=0.35, noise=4.0, rng=None):
+    """Simulate a dim room: scale brightness down and add sensor noise."""
+    rng = rng or np.random.default_rng(0)
+    dark = frame.astype(np.float32) * level + rng.normal(0, noise, frame.shape)
+    return np.clip(dark, 0, 255).astype(np.uint8)
+
+
+def detection_hits(path, enhancer=None, dim=None, max_frames=None):
+    """``(frames with a face, frames)`` of a clip, optionally dimmed and/or enhanced."""
+    cap = open_capture(path)
+    hits = frames = 0
+    rng = np.random.default_rng(0)
+    try:
+        while max_frames is None or frames < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if dim is not None:
+                frame = darken(frame, dim, rng=rng)
+            if enhancer is not None:
+                enhancer.apply(frame)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            hits += bool(detect_faces(gray))
+            frames += 1
+    finally:
+        cap.release()
+    return hits, frames
+
+
+def compare_hit_rates(paths, max_frames=None):
+    """Detection hit rates ``{(dimmed, enhanced): rate}`` over all clips."""
+    rates = {}
+    for dim in (None, 0.35):
+        for enhanced in (False, True):
+            hits = frames = 0
+            for path in paths:
+                h, f = detection_hits(path, Enhancer() if enhanced else None, dim, max_frames)
+                hits += h
+                frames += f
+            rates[(dim is not None, enhanced)] = hits / frames if frames else 0.0
+    return rates
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python -m linux_hello_gui.enhance CLIP...")
+        return 1
+    rates = compare_hit_rates(paths)
+    for (dimmed, enhanced), rate in rates.items():
+        light = "dimmed  " if dimmed else "recorded"
+        print(f"{light} {'enhanced' if enhanced else 'plain   '}  {rate:6.1%} frames with a face")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Enrollment status of a user, pushed to the UI when the face stores change.
+
+Profiles live in the user's own store (``~/.linux-hello/faces``, written by
+the GUI and the CLI) and in the daemon's system-wide store. A profile is a
+``<user>.npy`` template array (one row per sample) plus any captured
+``face_*.jpg`` samples; the daemon touches ``<user>.last-auth`` after each
+successful authentication. ``EnrollmentWatcher`` relies on
+``QFileSystemWatcher`` (inotify on Linux), so it costs nothing while idle.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import QObject, QFileSystemWatcher, QThreadPool, QTimer, Signal
+
+USER_FACES_DIR = os.path.join(os.path.expanduser("~"), ".linux-hello", "faces")
+SYSTEM_FACES_DIR = "/var/lib/linux-hello/faces"
+
+# Captured sample images in a user's own store
+SAMPLE_PREFIX = "face_"
+SAMPLE_SUFFIX = ".jpg"
+
+# Template array and last-authentication stamp of a user
+TEMPLATE_SUFFIX = ".npy"
+LAST_AUTH_SUFFIX = ".last-auth"
+
+# .npy headers are padded to 64 or 128 bytes; the shape is in the first line
+HEADER_PEEK = 128
+_SHAPE_RE = re.compile(rb"'shape': \((\d*)")
+
+# Delay before a burst of change notifications is handled
+DEBOUNCE_MS = 300
+
+# How often a store is looked for while its parent directory does not exist
+POLL_MS = 5000
+
+
+@dataclass(frozen=True)
+class ProfileStatus:
+    """What is enrolled for one user."""
+
+    user: str
+    samples: int = 0
+    last_enrolled: float = None
+    size: int = 0
+    store: str = None
+    last_auth: float = None
+
+    @property
+    def enrolled(self):
+        return self.samples > 0
+
+
+def template_rows(path):
+    """Number of samples in a template array, reading only its header."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER_PEEK)
+            match = _SHAPE_RE.search(header) if header.startswith(b"\x93NUMPY") else None
+            if match is not None:
+                return int(match.group(1) or 0)
+            # Unusual header: let numpy parse it
+            f.seek(0)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _order, _dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _order, _dtype = np.lib.format.read_array_header_2_0(f)
+    except (OSError, ValueError):
+        return 0
+    return int(shape[0]) if shape else 0
+
+
+def _last_auth(user, stores):
+    times = []
+    for store in stores:
+        try:
+            times.append(os.stat(os.path.join(store, user + LAST_AUTH_SUFFIX)).st_mtime)
+        except OSError:
+            pass
+    return max(times) if times else None
+
+
+def read_profile(user, stores=(USER_FACES_DIR, SYSTEM_FACES_DIR), own_samples=True):
+    """Status of ``user``'s profile in the first store that has one.
+
+    ``own_samples`` also counts the ``face_*.jpg`` captures of the first
+    store, which only holds the current user's samples.
+    """
+    for index, store in enumerate(stores):
+        paths = []
+        samples = 0
+
+        template = os.path.join(store, user + TEMPLATE_SUFFIX)
+        if os.path.isfile(template):
+            paths.append(template)
+            samples = template_rows(template)
+
+        if own_samples and index == 0:
+            try:
+                names = os.listdir(store)
+            except OSError:
+                names = []
+            captures = [os.path.join(store, n) for n in names
+                        if n.startswith(SAMPLE_PREFIX) and n.endswith(SAMPLE_SUFFIX)]
+            paths.extend(captures)
+            samples = max(samples, len(captures))
+
+        stats = []
+        for path in paths:
+            try:
+                stats.append(os.stat(path))
+            except OSError:
+                pass
+        if samples and stats:
+            return ProfileStatus(
+                user, samples,
+                max(st.st_mtime for st in stats),
+                sum(st.st_size for st in stats),
+                store,
+                _last_auth(user, stores),
+            )
+
+    return ProfileStatus(user, last_auth=_last_auth(user, stores))
+
+
+class EnrollmentWatcher(QObject):
+    """Report a user's ``ProfileStatus`` whenever the face stores change."""
+
+    statusChanged = Signal(object)
+
+    # Internal: status computed on the thread pool
+    _read = Signal(int, object)
+
+    def __init__(self, user, stores=(USER_FACES_DIR, SYSTEM_FACES_DIR), delay=DEBOUNCE_MS,
+                 create=(USER_FACES_DIR,), poll=POLL_MS, parent=None):
+        super().__init__(parent)
+        self.user = user
+        self.stores = tuple(stores)
+        # Stores whose parent directory is created (private) rather than polled for
+        self.create = tuple(create)
+        self.status = None
+        self._generation = 0
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._flush)
+
+        self._poll = QTimer(self)
+        self._poll.setInterval(poll)
+        self._poll.timeout.connect(self._on_poll)
+
+        self._read.connect(self._on_read)
+        self._update_watches()
+
+    def _update_watches(self):
+        """Watch each store, or its parent until it is created; True if that changed.
+
+        Ancestors further up (the home directory) see unrelated changes, so
+        a store without a parent is polled for instead.
+        """
+        wanted = set()
+        missing = False
+        for store in self.stores:
+            if os.path.isdir(store):
+                wanted.add(store)
+                continue
+            parent = os.path.dirname(store)
+            if not os.path.isdir(parent) and store in self.create:
+                try:
+                    os.makedirs(parent, mode=0o700, exist_ok=True)
+                except OSError:
+                    pass
+            if os.path.isdir(parent):
+                wanted.add(parent)
+            else:
+                missing = True
+
+        if missing:
+            self._poll.start()
+        else:
+            self._poll.stop()
+
+        current = set(self._watcher.directories())
+        for path in current - wanted:
+            self._watcher.removePath(path)
+        for path in wanted - current:
+            self._watcher.addPath(path)
+        return wanted != current
+
+    def _on_poll(self):
+        if self._update_watches():
+            self._timer.start()
+
+    def _on_directory_changed(self, _path):
+        self._timer.start()
+
+    def read_now(self):
+        """Read the status synchronously, without emitting; for first display."""
+        self._generation += 1
+        self.status = read_profile(self.user, self.stores)
+        return self.status
+
+    def refresh(self):
+        """Re-read the status in the background (only emitted if it changed)."""
+        self._timer.stop()
+        self._flush()
+
+    def _flush(self):
+        # A store may have been created or removed
+        self._update_watches()
+        self._generation += 1
+        generation = self._generation
+        QThreadPool.globalInstance().start(
+            lambda: self._read.emit(generation, read_profile(self.user, self.stores))
+        )
+
+    def _on_read(self, generation, status):
+        # Drop results overtaken by a newer change
+        if generation != self._generation or status == self.status:
+            return
+        self.status = status
+        self.statusChanged.emit(status)
@@ -0,0 +1,437 @@
+"""Administrator view of every profile enrolled on the machine.
+
+``StoreIndex`` keeps the ``ProfileStatus`` of every user found in the face
+stores together with the signature (mtime, size) of the files it was read
+from. Stores are listed in parallel and, on later updates, only users whose
+files changed are re-read. ``EnrollmentTableModel`` exposes the index to a
+view in pages (``canFetchMore``/``fetchMore``) and sorts and filters it in
+memory, so neither needs a re-scan.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTableView
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QFileSystemWatcher, QThread, QTimer, Signal
+)
+from .enrollment import (
+    SYSTEM_FACES_DIR, USER_FACES_DIR, DEBOUNCE_MS, LAST_AUTH_SUFFIX, TEMPLATE_SUFFIX,
+    ProfileStatus, template_rows,
+)
+from .i18n import _, ngettext
+from .retranslate import bind
+
+STORES = (SYSTEM_FACES_DIR, USER_FACES_DIR)
+
+# Rows handed to the view per fetchMore, and profiles per update batch
+PAGE_SIZE = 200
+BATCH_SIZE = 500
+
+# Updates touching more rows than this are applied with a model reset
+RESET_MIN_ROWS = 1000
+
+# Worker threads reading template headers (I/O bound)
+SCAN_WORKERS = 8
+
+COLUMNS = ("user", "samples", "size", "last_enrolled", "last_auth")
+
+
+def _list_store(store):
+    """``{user: {path: (mtime_ns, size)}}`` of the profile files in ``store``."""
+    users = {}
+    try:
+        entries = list(os.scandir(store))
+    except OSError:
+        return users
+    for entry in entries:
+        name = entry.name
+        if name.endswith(TEMPLATE_SUFFIX):
+            user = name[:-len(TEMPLATE_SUFFIX)]
+        elif name.endswith(LAST_AUTH_SUFFIX):
+            user = name[:-len(LAST_AUTH_SUFFIX)]
+        else:
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        users.setdefault(user, {})[entry.path] = (st.st_mtime_ns, st.st_size)
+    return users
+
+
+def _read_user(user, files, stores):
+    """``ProfileStatus`` of ``user`` from its listed files; the first store wins."""
+    last_auth = None
+    for path, (mtime_ns, _size) in files.items():
+        if path.endswith(LAST_AUTH_SUFFIX):
+            last_auth = max(last_auth or 0, mtime_ns / 1e9)
+
+    for store in stores:
+        path = os.path.join(store, user + TEMPLATE_SUFFIX)
+        if path in files:
+            mtime_ns, size = files[path]
+            samples = template_rows(path)
+            if samples:
+                return ProfileStatus(user, samples, mtime_ns / 1e9, size, store, last_auth)
+
+    return ProfileStatus(user, last_auth=last_auth)
+
+
+class StoreIndex:
+    """Profiles of every user in ``stores``, updated incrementally."""
+
+    def __init__(self, stores=STORES):
+        self.stores = tuple(stores)
+        self.files = {}
+        self.profiles = {}
+
+    def update(self, workers=SCAN_WORKERS, cancelled=None):
+        """Re-list the stores and re-read users whose files changed.
+
+        Yields ``(changed, removed)`` batches: new ``ProfileStatus`` objects
+        of at most ``BATCH_SIZE`` users, and user names no longer enrolled.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            listed = {}
+            for users in pool.map(_list_store, self.stores):
+                for user, files in users.items():
+                    listed.setdefault(user, {}).update(files)
+
+            removed = []
+            for user in [user for user in self.files if user not in listed]:
+                del self.files[user]
+                if self.profiles.pop(user, None) is not None:
+                    removed.append(user)
+
+            changed = [user for user, files in listed.items() if self.files.get(user) != files]
+            for start in range(0, len(changed), BATCH_SIZE):
+                if cancelled is not None and cancelled():
+                    return
+                users = changed[start:start + BATCH_SIZE]
+                # One task per worker: per-user futures would cost more than the reads
+                step = -(-len(users) // workers)
+                chunks = pool.map(
+                    lambda chunk: [_read_user(user, listed[user], self.stores) for user in chunk],
+                    [users[i:i + step] for i in range(0, len(users), step)]
+                )
+                statuses = [status for chunk in chunks for status in chunk]
+
+                batch = []
+                for user, status in zip(users, statuses):
+                    self.files[user] = listed[user]
+                    if status.enrolled:
+                        self.profiles[user] = status
+                        batch.append(status)
+                    elif self.profiles.pop(user, None) is not None:
+                        removed.append(user)
+
+                yield batch, removed
+                removed = []
+
+            if removed:
+                yield [], removed
+
+
+class IndexWorker(QThread):
+    """Bring a ``StoreIndex`` up to date off the GUI thread."""
+
+    batchReady = Signal(list, list)
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+
+    def run(self):
+        for changed, removed in self.index.update(cancelled=self.isInterruptionRequested):
+            self.batchReady.emit(changed, removed)
+
+
+def _format_time(timestamp):
+    if timestamp is None:
+        return "—"
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+class EnrollmentTableModel(QAbstractTableModel):
+    """Enrolled profiles, sorted and filtered in memory and paged into the view."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._profiles = {}
+        # Users matching the filter, in sort order, with their sort keys
+        self._rows = []
+        self._keys = []
+        # Rows exposed to the view, and how many it asked for
+        self._fetched = 0
+        self._wanted = PAGE_SIZE
+        self._column = 0
+        self._order = Qt.AscendingOrder
+        self._filter = ""
+        self._headers = [""] * len(COLUMNS)
+
+    def set_header_labels(self, labels):
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(COLUMNS) - 1)
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(PAGE_SIZE, len(self._rows) - self._fetched)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self._wanted = max(self._wanted, self._fetched)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        status = self._profiles[self._rows[index.row()]]
+        column = COLUMNS[index.column()]
+
+        if role == Qt.DisplayRole:
+            if column == "user":
+                return status.user
+            if column == "samples":
+                return str(status.samples)
+            if column == "size":
+                return f"{max(1, status.size // 1024)} KB"
+            if column == "last_enrolled":
+                return _format_time(status.last_enrolled)
+            return _format_time(status.last_auth)
+        if role == Qt.ToolTipRole:
+            return status.store
+        if role == Qt.TextAlignmentRole and column in ("samples", "size"):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._column = column
+        self._order = order
+        self._rebuild()
+
+    # Contents
+
+    def status(self, row):
+        return self._profiles[self._rows[row]]
+
+    def total_count(self):
+        return len(self._profiles)
+
+    def matching_count(self):
+        return len(self._rows)
+
+    def set_filter(self, text):
+        """Show only users whose name contains ``text`` (case-insensitive)."""
+        self._filter = text.strip().lower()
+        self._rebuild()
+
+    def _matches(self, user):
+        return self._filter in user.lower()
+
+    def _key(self, user):
+        status = self._profiles[user]
+        value = getattr(status, COLUMNS[self._column])
+        # Missing dates sort last in ascending order; ties by user
+        return (value is None, value if value is not None else 0, user)
+
+    def _rebuild(self):
+        self.beginResetModel()
+        users = [user for user in self._profiles if self._matches(user)]
+        keys = sorted(((self._key(user), user) for user in users),
+                      reverse=self._order == Qt.DescendingOrder)
+        self._keys = [key for key, _user in keys]
+        self._rows = [user for _key, user in keys]
+        self._fetched = min(len(self._rows), self._wanted)
+        self.endResetModel()
+
+    def _position(self, key):
+        """Row where ``key`` belongs in the current sort order."""
+        descending = self._order == Qt.DescendingOrder
+        lo, hi = 0, len(self._keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (self._keys[mid] > key) if descending else (self._keys[mid] < key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _take(self, user):
+        """Remove ``user``'s row if it is shown."""
+        status = self._profiles.get(user)
+        if status is None or not self._matches(user):
+            return
+        row = self._position(self._key(user))
+        if row >= len(self._rows) or self._rows[row] != user:
+            row = self._rows.index(user)
+        if row < self._fetched:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row], self._keys[row]
+            self._fetched -= 1
+            self.endRemoveRows()
+            # Keep the loaded page full
+            if self._fetched < len(self._rows):
+                self.beginInsertRows(QModelIndex(), self._fetched, self._fetched)
+                self._fetched += 1
+                self.endInsertRows()
+        else:
+            del self._rows[row], self._keys[row]
+
+    def _put(self, user):
+        """Insert ``user``'s row at its sorted position if it matches."""
+        if not self._matches(user):
+            return
+        key = self._key(user)
+        row = self._position(key)
+        # Rows past the loaded page are inserted silently, fetched later
+        if row < self._fetched or self._fetched < self._wanted:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, user)
+            self._keys.insert(row, key)
+            self._fetched += 1
+            self.endInsertRows()
+            # The page keeps its size: its last row moves out
+            if self._fetched > self._wanted:
+                self.beginRemoveRows(QModelIndex(), self._fetched - 1, self._fetched - 1)
+                self._fetched -= 1
+                self.endRemoveRows()
+        else:
+            self._rows.insert(row, user)
+            self._keys.insert(row, key)
+
+    def apply_changes(self, changed, removed):
+        """Merge new statuses and drop removed users, moving only their rows."""
+        if not self._profiles or len(changed) + len(removed) >= max(RESET_MIN_ROWS, len(self._profiles) // 4):
+            for user in removed:
+                self._profiles.pop(user, None)
+            for status in changed:
+                self._profiles[status.user] = status
+            self._rebuild()
+            return
+
+        for user in removed:
+            self._take(user)
+            self._profiles.pop(user, None)
+        for status in changed:
+            previous = self._profiles.get(status.user)
+            if previous == status:
+                continue
+            if previous is not None:
+                self._take(status.user)
+            self._profiles[status.user] = status
+            self._put(status.user)
+
+
+class EnrollmentAdminWidget(QWidget):
+    """Every enrolled user with sample count, size and activity dates."""
+
+    def __init__(self, stores=STORES, delay=DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.index = StoreIndex(stores)
+        self.worker = None
+        self._pending = False
+
+        layout = QVBoxLayout(self)
+
+        top_layout = QHBoxLayout()
+        self.filter_edit = QLineEdit()
+        bind(self.filter_edit, "setPlaceholderText", lambda: _("Filter users..."))
+        self.filter_edit.textChanged.connect(self.on_filter_changed)
+        top_layout.addWidget(self.filter_edit)
+        self.count_label = QLabel()
+        top_layout.addWidget(self.count_label)
+        layout.addLayout(top_layout)
+
+        self.model = EnrollmentTableModel(self)
+        bind(self.model, "set_header_labels", lambda: [
+            _("User"), _("Samples"), _("Size"), _("Last enrolled"), _("Last authentication")
+        ])
+
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setSortingEnabled(True)
+        self.view.sortByColumn(0, Qt.AscendingOrder)
+        self.view.setSelectionBehavior(QTableView.SelectRows)
+        self.view.verticalHeader().hide()
+        self.view.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.view)
+
+        # Re-index shortly after a store changes; nothing runs while idle
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(lambda _path: self._timer.start())
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.refresh)
+
+        self._started = False
+        self.update_count()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._started:
+            # Only scan once the tab is first opened
+            self._started = True
+            self.refresh()
+
+    def refresh(self):
+        """Bring the list up to date, reading only changed profiles."""
+        for store in self.index.stores:
+            if os.path.isdir(store) and store not in self._watcher.directories():
+                self._watcher.addPath(store)
+
+        if self.worker is not None and self.worker.isRunning():
+            self._pending = True
+            return
+        self.worker = IndexWorker(self.index, self)
+        self.worker.batchReady.connect(self.on_batch)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def on_batch(self, changed, removed):
+        self.model.apply_changes(changed, removed)
+        self.update_count()
+
+    def on_finished(self):
+        if self._pending:
+            self._pending = False
+            self.refresh()
+
+    def on_filter_changed(self, text):
+        self.model.set_filter(text)
+        self.update_count()
+
+    def update_count(self):
+        total = self.model.total_count()
+        shown = self.model.matching_count()
+        if shown == total:
+            bind(self.count_label, "setText", lambda: ngettext(
+                "{count} enrolled user", "{count} enrolled users", total).format(count=total))
+        else:
+            bind(self.count_label, "setText", lambda: _("{shown} of {total}").format(shown=shown, total=total))
+
+    def stop(self):
+        """Stop indexing; call before the widget is destroyed."""
+        self._timer.stop()
+        self._pending = False
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
@@ -0,0 +1,188 @@
+"""Auto-exposure convergence: tell when a freshly opened camera has settled.
+
+The first frames after opening a camera are too dark or too bright while
+its auto-exposure ramps. ``ExposureMonitor`` follows the mean luminance and
+a coarse histogram of each frame, computed on a small downscaled copy, and
+declares the stream stable once both stay within tolerance for a few
+frames in a row. Callers skip frames until then.
+
+How long that took is kept per camera in ``~/.linux-hello/exposure.json``
+so the next open knows what to expect: a camera that usually needs
+0.8 s is not declared stable on the unchanging frames some drivers
+deliver before exposure starts moving.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".linux-hello", "exposure.json")
+VIDEO4LINUX_DIR = "/sys/class/video4linux"
+
+# Statistics are computed on a frame this small
+STATS_SIZE = (64, 48)
+HISTOGRAM_BINS = 32
+
+# Consecutive frames that must agree, and how much they may differ:
+# mean luminance in grey levels, histograms in L1 distance (0 to 2)
+STABLE_FRAMES = 5
+MEAN_TOLERANCE = 3.0
+HISTOGRAM_TOLERANCE = 0.15
+
+# Mean luminance outside this range means exposure is still ramping
+LUMINANCE_RANGE = (8, 247)
+
+# Never wait longer than this: some scenes flicker forever
+MAX_WAIT = 3.0
+
+# Time-to-stable samples kept per camera
+HISTORY_SIZE = 10
+
+
+def frame_stats(frame):
+    """``(mean luminance, normalized histogram)`` of a downscaled ``frame``."""
+    # Every n-th pixel first: averaging all of a 720p frame costs 1 ms
+    step = max(1, min(frame.shape[1] // STATS_SIZE[0], frame.shape[0] // STATS_SIZE[1]) // 2)
+    small = cv2.resize(frame[::step, ::step], STATS_SIZE, interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    histogram = np.bincount((small >> 3).ravel(), minlength=HISTOGRAM_BINS).astype(np.float32)
+    histogram /= small.size
+    return float(small.mean()), histogram
+
+
+class ExposureMonitor:
+    """Follow frame statistics until auto-exposure has converged.
+
+    ``expected`` is the usual time-to-stable of this camera (see
+    ``predict``): the stream is not declared stable before half of it.
+    Past ``max_wait`` it is declared stable anyway, with ``converged``
+    left False.
+    """
+
+    def __init__(self, expected=None, max_wait=MAX_WAIT, frames=STABLE_FRAMES,
+                 mean_tolerance=MEAN_TOLERANCE, histogram_tolerance=HISTOGRAM_TOLERANCE):
+        self.expected = expected
+        self.max_wait = max_wait
+        self.frames = frames
+        self.mean_tolerance = mean_tolerance
+        self.histogram_tolerance = histogram_tolerance
+        self.reset()
+
+    def reset(self, opened_at=None):
+        """Start over, for a camera opened at ``opened_at`` (default: now)."""
+        self.opened_at = time.monotonic() if opened_at is None else opened_at
+        self.stable = False
+        self.converged = False
+        self.time_to_stable = None
+        self.skipped = 0
+        self._means = []
+        self._histograms = []
+
+    def _settled(self):
+        if len(self._means) < self.frames:
+            return False
+        low, high = LUMINANCE_RANGE
+        if not low <= self._means[-1] <= high:
+            return False
+        if max(self._means) - min(self._means) > self.mean_tolerance:
+            return False
+        histograms = np.stack(self._histograms)
+        return float(np.abs(histograms - histograms[-1]).sum(axis=1).max()) <= self.histogram_tolerance
+
+    def update(self, frame, timestamp=None):
+        """Feed one frame; returns True once the stream is stable."""
+        if self.stable:
+            return True
+        now = time.monotonic() if timestamp is None else timestamp
+        mean, histogram = frame_stats(frame)
+        self._means.append(mean)
+        self._histograms.append(histogram)
+        if len(self._means) > self.frames:
+            del self._means[0]
+            del self._histograms[0]
+
+        elapsed = now - self.opened_at
+        early = self.expected is not None and elapsed < 0.5 * self.expected
+        if self._settled() and not early:
+            self.stable = self.converged = True
+        elif elapsed >= self.max_wait:
+            self.stable = True
+        if self.stable:
+            self.time_to_stable = elapsed
+        else:
+            self.skipped += 1
+        return self.stable
+
+
+def device_key(index, video4linux_dir=VIDEO4LINUX_DIR):
+    """Name a camera so its history survives renumbering when possible."""
+    if isinstance(index, str):
+        return index
+    try:
+        with open(os.path.join(video4linux_dir, f"video{index}", "name"), "r") as f:
+            return f"{f.read().strip()} (video{index})"
+    except OSError:
+        return f"video{index}"
+
+
+def load_history(path=HISTORY_PATH):
+    try:
+        with open(path, "r") as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return history if isinstance(history, dict) else {}
+
+
+def predict(device, path=HISTORY_PATH):
+    """Usual time-to-stable of ``device`` in seconds, or None if unknown."""
+    samples = load_history(path).get(device)
+    if not samples:
+        return None
+    return float(np.median(samples))
+
+
+def record(device, seconds, path=HISTORY_PATH):
+    """Add a time-to-stable sample for ``device``; returns the new prediction."""
+    history = load_history(path)
+    samples = (history.get(device) or [])[-(HISTORY_SIZE - 1):] + [round(seconds, 3)]
+    history[device] = samples
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".exposure-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(history, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Only a prediction: losing it costs nothing
+        pass
+    return float(np.median(samples))
+
+
+def monitor_for(device, path=HISTORY_PATH, **options):
+    """``ExposureMonitor`` primed with the history of ``device``."""
+    return ExposureMonitor(expected=predict(device, path), **options)
+
+
+def skip_warmup(cap, monitor, cancelled=None):
+    """Read ``cap`` until ``monitor`` is stable; returns the first stable frame.
+
+    Returns None if the capture ends (or ``cancelled()``) first.
+    """
+    while cancelled is None or not cancelled():
+        ret, frame = cap.read()
+        if not ret:
+            return None
+        if monitor.update(frame):
+            return frame
+    return None
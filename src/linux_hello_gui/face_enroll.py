@@ -2,16 +2,24 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QLineEdit, QMessageBox, QComboBox, QSpinBox
+    QLineEdit, QMessageBox, QComboBox, QSpinBox, QCheckBox
 )
 from PySide6.QtCore import Qt, QSize, QTimer
-from PySide6.QtGui import QPixmap, QImage
 import cv2
 import numpy as np
 import json
 import os
 import getpass
+from . import alignment, augment, exposure, multicam
+from .enhance import Enhancer
+from .face_features import detect_faces
+from .video_view import VideoView
 from .i18n import _
+from .retranslate import bind, tr, unbind
+from .session_recorder import RecordingCapture, SessionRecorder, camera_metadata, recording_path
+
+# Give up when this many frames in a row show no face
+MAX_FRAMES_WITHOUT_FACE = 300
 
 
 class FaceEnrollWidget(QWidget):
@@ -24,42 +32,41 @@ class FaceEnrollWidget(QWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
         self.recording = False
+        self.exposure = None
+        self.enhancer = Enhancer()
         
     def init_ui(self):
         layout = QVBoxLayout()
         
         # Title
-        title = QLabel(_("Face Enrollment"))
+        title = tr(QLabel(), "setText", "Face Enrollment")
         title.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(title)
         
         # Camera selector
         cam_layout = QHBoxLayout()
-        cam_layout.addWidget(QLabel(_("Camera:")))
+        cam_layout.addWidget(tr(QLabel(), "setText", "Camera:"))
         self.camera_combo = QComboBox()
         self.refresh_cameras()
         cam_layout.addWidget(self.camera_combo)
-        refresh_btn = QPushButton(_("Refresh"))
+        refresh_btn = tr(QPushButton(), "setText", "Refresh")
         refresh_btn.clicked.connect(self.refresh_cameras)
         cam_layout.addWidget(refresh_btn)
         layout.addLayout(cam_layout)
         
         # Video preview
-        self.video_label = QLabel()
-        self.video_label.setMinimumSize(400, 300)
-        self.video_label.setStyleSheet("background-color: black; color: white; font-weight: bold;")
-        self.video_label.setText(_("Press 'Start Camera' to see preview"))
-        self.video_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.video_label)
+        self.video_view = VideoView(minimum_size=(400, 300))
+        tr(self.video_view, "setText", "Press 'Start Camera' to see preview")
+        layout.addWidget(self.video_view)
         
         # Current user info
         current_user = getpass.getuser()
-        user_info = QLabel(_("Enrolling face for user: <b>{}</b>").format(current_user))
+        user_info = bind(QLabel(), "setText", lambda: _("Enrolling face for user: <b>{}</b>").format(current_user))
         layout.addWidget(user_info)
         
         # Number of samples
         samples_layout = QHBoxLayout()
-        samples_layout.addWidget(QLabel(_("Number of photos:")))
+        samples_layout.addWidget(tr(QLabel(), "setText", "Number of photos:"))
         self.samples_spinbox = QSpinBox()
         self.samples_spinbox.setMinimum(10)
         self.samples_spinbox.setMaximum(100)
@@ -67,19 +74,42 @@ class FaceEnrollWidget(QWidget):
         samples_layout.addWidget(self.samples_spinbox)
         layout.addLayout(samples_layout)
         
+        # Templates derived from each photo (brightness, rotation, flip...)
+        augment_layout = QHBoxLayout()
+        augment_layout.addWidget(tr(QLabel(), "setText", "Extra templates per photo:"))
+        self.augment_spinbox = QSpinBox()
+        self.augment_spinbox.setMinimum(0)
+        self.augment_spinbox.setMaximum(augment.MAX_PER_SAMPLE)
+        self.augment_spinbox.setValue(augment.PER_SAMPLE)
+        tr(self.augment_spinbox, "setSpecialValueText", "Off")
+        augment_layout.addWidget(self.augment_spinbox)
+        layout.addLayout(augment_layout)
+        
+        # Opt-in: keep the raw camera stream to reproduce failures offline
+        self.record_checkbox = tr(QCheckBox(), "setText", "Record session for troubleshooting")
+        layout.addWidget(self.record_checkbox)
+        
+        # RGB + IR laptops: store both modalities in the same session
+        self.all_cameras_checkbox = tr(QCheckBox(), "setText", "Use all cameras (RGB + IR)")
+        layout.addWidget(self.all_cameras_checkbox)
+        
+        # Brightens the preview and the saved photos in dim light
+        self.enhance_checkbox = tr(QCheckBox(), "setText", "Enhance low-light video")
+        layout.addWidget(self.enhance_checkbox)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
-        self.start_btn = QPushButton(_("Start Camera"))
+        self.start_btn = tr(QPushButton(), "setText", "Start Camera")
         self.start_btn.clicked.connect(self.start_camera)
         button_layout.addWidget(self.start_btn)
         
-        self.stop_btn = QPushButton(_("Stop Camera"))
+        self.stop_btn = tr(QPushButton(), "setText", "Stop Camera")
         self.stop_btn.clicked.connect(self.stop_camera)
         self.stop_btn.setEnabled(False)
         button_layout.addWidget(self.stop_btn)
         
-        self.enroll_btn = QPushButton(_("Enroll Face"))
+        self.enroll_btn = tr(QPushButton(), "setText", "Enroll Face")
         self.enroll_btn.clicked.connect(self.enroll_face)
         self.enroll_btn.setEnabled(False)
         button_layout.addWidget(self.enroll_btn)
@@ -101,16 +131,29 @@ class FaceEnrollWidget(QWidget):
     def start_camera(self):
         """Start camera feed."""
         camera_idx = self.camera_combo.currentData()
-        self.cap = cv2.VideoCapture(camera_idx)
+        self.exposure_device = exposure.device_key(camera_idx)
+        self.exposure = exposure.monitor_for(self.exposure_device)
+        others = [self.camera_combo.itemData(i) for i in range(self.camera_combo.count())
+                  if self.camera_combo.itemData(i) != camera_idx]
+        if self.all_cameras_checkbox.isChecked() and others:
+            # The selected camera is the main one; the preview never waits
+            self.cap = multicam.CaptureGroup([camera_idx] + others, read_timeout=0)
+        else:
+            self.cap = cv2.VideoCapture(camera_idx)
         
         if not self.cap.isOpened():
+            self.cap.release()
+            self.cap = None
             QMessageBox.warning(self, _("Error"), _("Cannot open camera"))
             return
         
+        # Frames replace the message; it must not come back on a language change
+        unbind(self.video_view, "setText")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.enroll_btn.setEnabled(True)
         self.camera_combo.setEnabled(False)
+        self.all_cameras_checkbox.setEnabled(False)
         self.timer.start(30)
     
     def stop_camera(self):
@@ -124,8 +167,9 @@ class FaceEnrollWidget(QWidget):
         self.stop_btn.setEnabled(False)
         self.enroll_btn.setEnabled(False)
         self.camera_combo.setEnabled(True)
-        self.video_label.setText(_("Camera stopped"))
-        self.video_label.setPixmap(QPixmap())
+        self.all_cameras_checkbox.setEnabled(True)
+        self.video_view.clear()
+        tr(self.video_view, "setText", "Camera stopped")
     
     def update_frame(self):
         """Update video frame."""
@@ -135,21 +179,40 @@ class FaceEnrollWidget(QWidget):
         ret, frame = self.cap.read()
         if not ret:
             return
+        self.check_exposure(frame)
         
-        # Resize for display
-        frame = cv2.resize(frame, (400, 300))
-        
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Convert to QImage
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        
-        # Display
-        pixmap = QPixmap.fromImage(qt_image)
-        self.video_label.setPixmap(pixmap)
+        if self.enhance_checkbox.isChecked():
+            self.enhancer.apply(frame)
+        self.video_view.set_frame(frame)
+    
+    def check_exposure(self, frame):
+        """Feed the exposure monitor; True once the camera has settled."""
+        if self.exposure is None or self.exposure.stable:
+            return True
+        if not self.exposure.update(frame):
+            return False
+        if self.exposure.converged:
+            exposure.record(self.exposure_device, self.exposure.time_to_stable)
+        return True
+    
+    def read_frames(self, cap):
+        """Next frame of every camera, main camera first; empty once the stream ends."""
+        if isinstance(cap, multicam.CaptureGroup):
+            frame_set = cap.read_set()
+            return frame_set.frames if frame_set is not None else ()
+        ret, frame = cap.read()
+        return (frame,) if ret else ()
+    
+    def store_sample(self, directory, name, frame, samples):
+        """Save the aligned face of ``frame`` as ``directory/name``; False without a face."""
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = detect_faces(gray)
+        if not faces:
+            return False
+        aligned = alignment.align_face(frame, faces[0], gray)
+        cv2.imwrite(os.path.join(directory, name), aligned.image)
+        samples.setdefault(directory, {})[name] = aligned
+        return True
     
     def enroll_face(self):
         """Enroll face for current user."""
@@ -167,24 +230,78 @@ class FaceEnrollWidget(QWidget):
         
         num_samples = self.samples_spinbox.value()
         captured = 0
+        misses = 0
+        # Directory -> {sample name: AlignedFace}; other cameras in camera1/, ...
+        aligned_samples = {}
+        grouped = isinstance(self.cap, multicam.CaptureGroup)
+        camera_dirs = []
+        if grouped:
+            for k in range(1, len(self.cap.streams)):
+                camera_dirs.append(os.path.join(enroll_dir, f"camera{k}"))
+                os.makedirs(camera_dirs[-1], mode=0o700, exist_ok=True)
+        
+        cap = self.cap
+        recorder = None
+        if self.record_checkbox.isChecked():
+            metadata = dict(camera_metadata(self.cap), user=current_user, samples=num_samples)
+            recorder = SessionRecorder(recording_path("enroll"), metadata)
+            if not grouped:
+                cap = RecordingCapture(self.cap, recorder)
         
         self.enroll_btn.setEnabled(False)
         
-        while captured < num_samples:
-            ret, frame = self.cap.read()
-            if not ret:
+        while captured < num_samples and misses < MAX_FRAMES_WITHOUT_FACE:
+            frames = self.read_frames(cap)
+            if not frames:
                 break
+            frame = frames[0]
+            if grouped and recorder is not None:
+                # Recordings keep the main camera
+                recorder.write(frame)
             
-            # Save frame
-            filename = os.path.join(enroll_dir, f"face_{captured:03d}.jpg")
-            cv2.imwrite(filename, frame)
+            # Frames taken while auto-exposure still ramps make bad samples
+            if not self.check_exposure(frame):
+                self.video_view.setText(_("Waiting for the camera exposure to settle..."))
+                continue
+            
+            if self.enhance_checkbox.isChecked():
+                self.enhancer.apply(frame)
+            
+            # Store the aligned face, not the whole frame
+            name = f"face_{captured:03d}.jpg"
+            if not self.store_sample(enroll_dir, name, frame, aligned_samples):
+                misses += 1
+                self.video_view.setText(_("No face found, look at the camera"))
+                continue
+            misses = 0
+            # Same instant from the other cameras, when they see the face too
+            for directory, other in zip(camera_dirs, frames[1:]):
+                self.store_sample(directory, name, other, aligned_samples)
             captured += 1
             
             # Update display
-            self.video_label.setText(_("Capture {current}/{total}").format(current=captured, total=num_samples))
-            self.video_label.update()
+            self.video_view.setText(_("Capture {current}/{total}").format(current=captured, total=num_samples))
         
         self.enroll_btn.setEnabled(True)
+        for directory, samples in aligned_samples.items():
+            try:
+                alignment.save_manifest(directory, samples)
+            except OSError:
+                # The crops are usable without their landmarks
+                pass
+        
+        if captured:
+            self.video_view.setText(_("Preparing templates..."))
+            try:
+                augment.augment_directory(enroll_dir, self.augment_spinbox.value())
+            except OSError:
+                # The captured samples are still used on their own
+                pass
+        
+        recorded = ""
+        if recorder is not None:
+            recorder.close()
+            recorded = "\n\n" + _("Session recorded to {path}").format(path=recorder.path)
         
         if captured == num_samples:
             QMessageBox.information(
@@ -192,7 +309,7 @@ class FaceEnrollWidget(QWidget):
                 _("Success"), 
                 _("Face enrolled successfully with {count} photos").format(
                     count=num_samples
-                )
+                ) + recorded
             )
         else:
             QMessageBox.warning(
@@ -200,5 +317,5 @@ class FaceEnrollWidget(QWidget):
                 _("Error"), 
                 _("Incomplete enrollment: {captured}/{total} photos captured").format(
                     captured=captured, total=num_samples
-                )
+                ) + recorded
             )
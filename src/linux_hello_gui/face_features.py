@@ -0,0 +1,112 @@
+"""Face detection and template features shared by the analysis tools.
+
+The recognizer itself runs in the Linux Hello daemon; the GUI tools (tuner,
+calibration, ...) need a local stand-in to time and score frames. Faces are
+found with OpenCV's frontal Haar cascade, aligned on the eyes (see
+``alignment``) and described by a mean-centred, L2-normalized grayscale
+crop, so the similarity of two faces is a dot product.
+"""
+
+import glob
+import os
+
+import cv2
+import numpy as np
+
+from .alignment import align_face, is_aligned
+
+# Side of the square crop used as feature vector
+TEMPLATE_SIZE = 100
+FEATURE_DIM = TEMPLATE_SIZE * TEMPLATE_SIZE
+
+# Score given to frames without a detected face
+NO_FACE_SCORE = -1.0
+
+# Sub-directory of a faces dir holding templates derived from its samples
+# (see ``augment``); a sub-directory, so no store lists it as a user
+AUGMENTED_DIR = "augmented"
+
+_cascade = None
+
+
+def get_cascade():
+    """Get the shared frontal face detector."""
+    global _cascade
+    if _cascade is None:
+        _cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+    return _cascade
+
+
+def detect_faces(gray):
+    """Detect faces in a grayscale frame, largest first."""
+    faces = get_cascade().detectMultiScale(gray, scaleFactor=1.2, minNeighbors=5, minSize=(60, 60))
+    if len(faces) == 0:
+        return []
+    return sorted((tuple(int(v) for v in face) for face in faces), key=lambda f: f[2] * f[3], reverse=True)
+
+
+def face_vector(face):
+    """Feature vector for a grayscale face crop."""
+    vector = cv2.resize(face, (TEMPLATE_SIZE, TEMPLATE_SIZE)).astype(np.float32).ravel()
+    vector -= vector.mean()
+    vector /= np.linalg.norm(vector) + 1e-6
+    return vector
+
+
+def face_vectors(faces):
+    """Feature vectors (rows) for a ``(N, H, W)`` batch of grayscale crops."""
+    faces = np.asarray(faces)
+    if faces.shape[1:] != (TEMPLATE_SIZE, TEMPLATE_SIZE):
+        faces = np.stack([cv2.resize(face, (TEMPLATE_SIZE, TEMPLATE_SIZE)) for face in faces]) \
+            if len(faces) else np.empty((0, TEMPLATE_SIZE, TEMPLATE_SIZE), np.uint8)
+    vectors = faces.reshape(len(faces), FEATURE_DIM).astype(np.float32)
+    vectors -= vectors.mean(axis=1, keepdims=True)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-6
+    return vectors
+
+
+def frame_vector(frame):
+    """Feature vector of the largest face in a BGR frame, or None."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    faces = detect_faces(gray)
+    if not faces:
+        return None
+    return face_vector(align_face(gray, faces[0], gray).image)
+
+
+def match_scores(vectors, templates):
+    """Best similarity of each row of ``vectors`` against the templates."""
+    return (np.atleast_2d(vectors) @ templates.T).max(axis=1)
+
+
+def load_templates(faces_dir):
+    """Load enrolled templates from a faces directory.
+
+    Uses ``*.npy`` arrays whose rows are feature vectors, then the
+    augmented set derived from the enrolled samples, and otherwise the
+    sample images: aligned crops directly, whole frames (older
+    enrollments) after detection. Returns an ``(N, FEATURE_DIM)`` array.
+    """
+    vectors = []
+
+    for directory in (faces_dir, os.path.join(faces_dir, AUGMENTED_DIR)):
+        for path in sorted(glob.glob(os.path.join(directory, "*.npy"))):
+            try:
+                data = np.load(path)
+            except (OSError, ValueError):
+                continue
+            if data.ndim == 2 and data.shape[1] == FEATURE_DIM:
+                vectors.extend(data.astype(np.float32))
+        if vectors:
+            break
+
+    if not vectors:
+        for path in sorted(glob.glob(os.path.join(faces_dir, "*.jpg"))):
+            frame = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if frame is None:
+                continue
+            vector = face_vector(frame) if is_aligned(frame) else frame_vector(frame)
+            if vector is not None:
+                vectors.append(vector)
+
+    return np.array(vectors, dtype=np.float32).reshape(-1, FEATURE_DIM)
@@ -0,0 +1,93 @@
+"""Last few seconds of preview frames, kept for failure reports.
+
+``FrameRing`` preallocates one array for all of its frames: pushing resizes
+the camera frame straight into the next slot, so filling the ring allocates
+nothing and its memory never grows. When an action fails, ``dump`` copies
+the ring in time order and writes it, with the action's output, as a
+session recording (``session_recorder``) on a background thread.
+"""
+
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from .session_recorder import SessionRecorder, recording_path
+
+FAILURES_DIR = os.path.join(os.path.expanduser("~"), ".linux-hello", "failures")
+
+# Seconds kept, frames per second sampled, and stored frame size
+RING_SECONDS = 5
+RING_FPS = 15
+RING_SIZE = (320, 240)
+
+
+class FrameRing:
+    """Fixed-size ring of downscaled frames with their timestamps."""
+
+    def __init__(self, seconds=RING_SECONDS, fps=RING_FPS, size=RING_SIZE, channels=3):
+        self.seconds = seconds
+        self.capacity = max(1, int(seconds * fps))
+        self.interval = 1.0 / fps
+        self.size = tuple(size)
+        width, height = self.size
+        self._frames = np.zeros((self.capacity, height, width, channels), np.uint8)
+        self._timestamps = np.zeros(self.capacity, np.float64)
+        self._next = 0
+        self.count = 0
+        self.last_dump = None
+
+    @property
+    def nbytes(self):
+        """Memory held by the ring (it never changes)."""
+        return self._frames.nbytes + self._timestamps.nbytes
+
+    def push(self, frame, timestamp=None):
+        """Store ``frame`` unless the previous one is more recent than the sampling interval."""
+        now = time.monotonic() if timestamp is None else timestamp
+        # Some slack so camera jitter does not halve the sampling rate
+        if self.count and now - self._timestamps[self._next - 1] < 0.75 * self.interval:
+            return False
+        slot = self._frames[self._next]
+        if frame.ndim == 2 and slot.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        # Resized in place: no allocation per frame
+        cv2.resize(frame, self.size, dst=slot, interpolation=cv2.INTER_AREA)
+        self._timestamps[self._next] = now
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return True
+
+    def clear(self):
+        self._next = 0
+        self.count = 0
+
+    def snapshot(self):
+        """Copies of the stored frames and timestamps, oldest first."""
+        if self.count < self.capacity:
+            return self._frames[:self.count].copy(), self._timestamps[:self.count].copy()
+        # Full: the oldest frame is the next to be overwritten
+        return (np.concatenate((self._frames[self._next:], self._frames[:self._next])),
+                np.concatenate((self._timestamps[self._next:], self._timestamps[:self._next])))
+
+    def dump(self, kind, metadata=None, directory=FAILURES_DIR):
+        """Write the ring to a new recording in the background; returns its path.
+
+        The frames are copied before returning, so the ring keeps filling.
+        """
+        frames, timestamps = self.snapshot()
+        path = recording_path(kind, directory)
+        metadata = dict(metadata or {}, width=self.size[0], height=self.size[1], kind=kind)
+
+        def write():
+            recorder = SessionRecorder(path, metadata, queue_frames=len(frames) + 1)
+            for frame, timestamp in zip(frames, timestamps):
+                recorder.write(frame, timestamp)
+            recorder.close()
+
+        thread = threading.Thread(target=write, name="frame-ring-dump", daemon=True)
+        thread.start()
+        self.last_dump = thread
+        return path
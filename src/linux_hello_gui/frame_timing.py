@@ -0,0 +1,372 @@
+"""Camera latency and frame-timing analysis.
+
+For every frame ``FrameTimingLog`` keeps three clocks: the driver's buffer
+timestamp (when the sensor delivered it, ``CAP_PROP_POS_MSEC``), when
+``read()`` returned it, and when it was first painted. ``analyze`` turns
+them into inter-frame jitter, dropped and duplicated frames, latency
+percentiles and an estimate of how many frames were waiting in the
+driver's queue when read.
+
+``measure`` runs the same loop headless, paced like the preview timer, and
+``PacedSource`` is a synthetic camera with a real frame clock and a bounded
+buffer queue, for tests and for trying pacing strategies without hardware::
+
+    python -m linux_hello_gui.frame_timing 0 --seconds 5
+    python -m linux_hello_gui.frame_timing --synthetic 30 --pace 25
+"""
+
+import argparse
+import collections
+import math
+import sys
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from .i18n import _
+from .session_recorder import open_capture
+
+# Interval of the preview timer, in milliseconds
+PREVIEW_INTERVAL_MS = 33
+
+MEASURE_SECONDS = 5.0
+
+# Driver timestamps further than this from time.monotonic() are taken to
+# be on another clock (file positions, some backends)
+CLOCK_SKEW_LIMIT = 5.0
+
+
+class PacedSource:
+    """Synthetic camera: frames on a fixed clock, queued like V4L2 buffers.
+
+    Frame ``n`` is captured at ``start + n / fps`` (plus ``jitter``). Up to
+    ``buffers`` captured frames wait for ``read()``; when the queue is full
+    new frames are dropped, as a driver does when no buffer is free.
+    ``drop_every`` loses every n-th frame at the sensor and
+    ``repeat_every`` delivers every n-th buffer twice. The first pixel row
+    holds the frame number.
+
+    ``clock`` and ``sleep`` can be replaced to run on simulated time.
+    """
+
+    def __init__(self, fps=30.0, buffers=4, jitter=0.0, drop_every=0, repeat_every=0,
+                 size=(64, 48), clock=time.monotonic, sleep=time.sleep, seed=0):
+        self.fps = fps
+        self.buffers = buffers
+        self.drop_every = drop_every
+        self.repeat_every = repeat_every
+        self.size = tuple(size)
+        self.clock = clock
+        self.sleep = sleep
+        self._jitter = jitter
+        self._rng = np.random.default_rng(seed)
+        self._start = clock()
+        self._produced = 0
+        self._queue = collections.deque()
+        self._timestamp = 0.0
+        self._opened = True
+        self.overflows = 0
+
+    def _capture_time(self, n):
+        t = self._start + n / self.fps
+        if self._jitter:
+            t += float(np.clip(self._rng.normal(0, self._jitter), -0.45 / self.fps, 0.45 / self.fps))
+        return t
+
+    def _capture_until(self, now):
+        while True:
+            t = self._capture_time(self._produced)
+            if t > now:
+                return t
+            n = self._produced
+            self._produced += 1
+            if self.drop_every and n % self.drop_every == self.drop_every - 1:
+                continue
+            if len(self._queue) >= self.buffers:
+                self.overflows += 1
+                continue
+            self._queue.append((n, t))
+            if self.repeat_every and n % self.repeat_every == self.repeat_every - 1 \
+                    and len(self._queue) < self.buffers:
+                self._queue.append((n, t))
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self):
+        if not self._opened:
+            return False, None
+        next_capture = self._capture_until(self.clock())
+        while not self._queue:
+            # Block until the sensor delivers, like a V4L2 DQBUF
+            self.sleep(max(0.0, next_capture - self.clock()))
+            next_capture = self._capture_until(self.clock())
+        n, self._timestamp = self._queue.popleft()
+        width, height = self.size
+        frame = np.zeros((height, width, 3), np.uint8)
+        frame[0, :4, 0] = np.frombuffer(np.uint32(n).tobytes(), np.uint8)
+        return True, frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return 1000.0 * self._timestamp
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if prop == cv2.CAP_PROP_BUFFERSIZE:
+            return float(self.buffers)
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.size[0])
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.size[1])
+        return 0.0
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        self._opened = False
+
+
+class FrameTimingLog:
+    """Timestamps of each frame through the preview pipeline, in seconds."""
+
+    def __init__(self):
+        self.driver = []
+        self.arrival = []
+        self.read_time = []
+        self.painted = []
+        self.paints = 0
+        self.repaints = 0
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def record_frame(self, driver_ts, arrival_ts, read_time=0.0):
+        """A frame returned by ``read()``; ``driver_ts`` is 0 when unknown."""
+        self.driver.append(driver_ts)
+        self.arrival.append(arrival_ts)
+        self.read_time.append(read_time)
+        self.painted.append(math.nan)
+
+    def record_capture(self, cap, read_started, arrival_ts):
+        """Shortcut for a frame just read from ``cap``."""
+        self.record_frame(cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, arrival_ts, arrival_ts - read_started)
+
+    def record_paint(self, paint_ts):
+        """The preview was painted: the first paint of the newest frame counts."""
+        self.paints += 1
+        if not self.painted:
+            return
+        if math.isnan(self.painted[-1]):
+            self.painted[-1] = paint_ts
+        else:
+            self.repaints += 1
+
+
+@dataclass
+class TimingReport:
+    """What ``analyze`` found; times in milliseconds."""
+
+    frames: int
+    seconds: float
+    driver_fps: float
+    arrival_fps: float
+    period_ms: float
+    jitter_ms: float
+    jitter_p95_ms: float
+    paint_jitter_ms: float
+    dropped: int
+    duplicated: int
+    unpainted: int
+    repaints: int
+    latency_ms: tuple
+    paint_latency_ms: tuple
+    read_ms: float
+    buffered: float
+    buffered_max: int
+    clock_aligned: bool
+
+    def rows(self):
+        """``[(label, value), ...]`` for display."""
+        def percentiles(values):
+            if values is None:
+                return "—"
+            return "p50 {:.1f} · p95 {:.1f} · p99 {:.1f} ms".format(*values)
+
+        rows = [
+            (_("Frames"), _("{count} in {seconds:.1f} s").format(count=self.frames, seconds=self.seconds)),
+            (_("Camera rate"), f"{self.driver_fps:.1f} fps ({self.period_ms:.1f} ms)"),
+            (_("Delivered rate"), f"{self.arrival_fps:.1f} fps"),
+            (_("Arrival jitter"), f"σ {self.jitter_ms:.1f} ms · p95 {self.jitter_p95_ms:.1f} ms"),
+            (_("Dropped frames"), str(self.dropped)),
+            (_("Duplicated frames"), str(self.duplicated)),
+            (_("Capture to read"), percentiles(self.latency_ms)),
+            (_("Capture to paint"), percentiles(self.paint_latency_ms)),
+            (_("Time blocked in read"), _("{time:.1f} ms median").format(time=self.read_ms)),
+            (_("Frames waiting in driver"), _("{median:.1f} median · {max} max").format(
+                median=self.buffered, max=self.buffered_max)),
+        ]
+        if self.paint_latency_ms is not None:
+            rows.insert(4, (_("Paint jitter"), f"σ {self.paint_jitter_ms:.1f} ms"))
+            rows.append((_("Never painted"), str(self.unpainted)))
+            rows.append((_("Repeated paints"), str(self.repaints)))
+        if not self.clock_aligned:
+            rows.append((_("Clock"), _("Driver timestamps are not on the monotonic clock; latencies are relative")))
+        return rows
+
+
+def _percentiles(values):
+    if len(values) == 0:
+        return None
+    return tuple(float(v) for v in np.percentile(values, (50, 95, 99)))
+
+
+def analyze(log, nominal_fps=0.0):
+    """Summarize ``log``; ``nominal_fps`` is used when driver timestamps are missing."""
+    if len(log) < 3:
+        raise ValueError("Need at least 3 frames")
+    driver = np.asarray(log.driver, np.float64)
+    arrival = np.asarray(log.arrival, np.float64)
+    painted = np.asarray(log.painted, np.float64)
+    # Backends without buffer timestamps report 0 throughout
+    has_driver = bool(np.any(driver > 0))
+
+    steps = np.diff(driver) if has_driver else np.diff(arrival)
+    advancing = steps[steps > 0]
+    if has_driver and len(advancing):
+        period = float(np.median(advancing))
+    else:
+        period = 1.0 / nominal_fps if nominal_fps > 0 else float(np.median(np.diff(arrival)))
+
+    # A driver timestamp that does not move is the same frame again; one
+    # that jumps by several periods skipped frames
+    duplicated = int(np.sum(steps < 0.5 * period)) if has_driver else 0
+    dropped = int(np.sum(np.maximum(np.round(advancing / period) - 1, 0))) if has_driver else 0
+    span = float(driver[-1] - driver[0]) if has_driver else float(arrival[-1] - arrival[0])
+    driver_fps = (len(advancing) + dropped) / span if span > 0 else 0.0
+
+    # Jitter: how far each interval strays from whole camera periods
+    intervals = np.diff(arrival)
+    deviation = np.abs(intervals - np.maximum(np.round(intervals / period), 1) * period)
+    jitter = float(np.std(intervals))
+    jitter_p95 = float(np.percentile(deviation, 95))
+    seconds = float(arrival[-1] - arrival[0])
+
+    latency = None
+    paint_latency = None
+    buffered = 0.0
+    buffered_max = 0
+    aligned = False
+    if has_driver:
+        offsets = arrival - driver
+        aligned = bool(0 <= np.median(offsets) < CLOCK_SKEW_LIMIT)
+        # On another clock only differences mean anything: take the
+        # freshest frame as zero
+        base = 0.0 if aligned else float(np.min(offsets))
+        latency = _percentiles((offsets - base) * 1000)
+        # Frames already captured while this one waited to be read
+        queued = np.floor((offsets - np.min(offsets)) / period + 1e-6)
+        buffered = float(np.median(queued))
+        buffered_max = int(np.max(queued))
+        shown = ~np.isnan(painted)
+        if np.any(shown):
+            paint_latency = _percentiles((painted[shown] - driver[shown] - base) * 1000)
+
+    shown = ~np.isnan(painted)
+    paint_jitter = float(np.std(np.diff(painted[shown]))) * 1000 if np.sum(shown) > 2 else 0.0
+    if paint_latency is None and np.any(shown):
+        paint_latency = _percentiles((painted[shown] - arrival[shown]) * 1000)
+
+    return TimingReport(
+        frames=len(log),
+        seconds=seconds,
+        driver_fps=driver_fps,
+        arrival_fps=(len(log) - 1) / seconds if seconds > 0 else 0.0,
+        period_ms=period * 1000,
+        jitter_ms=jitter * 1000,
+        jitter_p95_ms=jitter_p95 * 1000,
+        paint_jitter_ms=paint_jitter,
+        dropped=dropped,
+        duplicated=duplicated,
+        unpainted=int(np.sum(~shown)) if log.paints else 0,
+        repaints=log.repaints,
+        latency_ms=latency,
+        paint_latency_ms=paint_latency,
+        read_ms=float(np.median(log.read_time)) * 1000,
+        buffered=buffered,
+        buffered_max=buffered_max,
+        clock_aligned=aligned or not has_driver,
+    )
+
+
+def measure(cap, seconds=MEASURE_SECONDS, interval_ms=PREVIEW_INTERVAL_MS,
+            clock=time.monotonic, sleep=time.sleep):
+    """Read ``cap`` like the preview does, one frame per timer tick.
+
+    ``interval_ms`` 0 reads as fast as frames come. Returns the log.
+    """
+    log = FrameTimingLog()
+    interval = interval_ms / 1000.0
+    start = clock()
+    tick = start
+    while clock() - start < seconds:
+        read_started = clock()
+        ret, _frame = cap.read()
+        if not ret:
+            break
+        log.record_capture(cap, read_started, clock())
+        if interval:
+            # A QTimer fires on the next tick after the slot returns
+            tick += interval
+            now = clock()
+            while tick < now:
+                tick += interval
+            sleep(tick - now)
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m linux_hello_gui.frame_timing",
+        description="Measure camera frame timing as the preview sees it.")
+    parser.add_argument("source", nargs="?", default="0", help="camera index, clip or recording")
+    parser.add_argument("--seconds", type=float, default=MEASURE_SECONDS)
+    parser.add_argument("--pace", type=float, default=1000.0 / PREVIEW_INTERVAL_MS,
+                        help="reads per second, like the preview timer (0: as fast as possible)")
+    parser.add_argument("--synthetic", type=float, metavar="FPS",
+                        help="use a synthetic camera at FPS instead of SOURCE")
+    parser.add_argument("--buffers", type=int, default=4, help="queue depth of the synthetic camera")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        cap = PacedSource(args.synthetic, buffers=args.buffers)
+    else:
+        cap = open_capture(int(args.source) if args.source.isdigit() else args.source, realtime=True)
+    if not cap.isOpened():
+        print(f"✗ Cannot open {args.source}")
+        return 1
+
+    interval_ms = 1000.0 / args.pace if args.pace > 0 else 0
+    try:
+        log = measure(cap, args.seconds, interval_ms)
+        requested = cap.get(cv2.CAP_PROP_BUFFERSIZE)
+        nominal = cap.get(cv2.CAP_PROP_FPS)
+    finally:
+        cap.release()
+    if len(log) < 3:
+        print("✗ Not enough frames")
+        return 1
+
+    report = analyze(log, nominal)
+    width = max(len(label) for label, _value in report.rows())
+    for label, value in report.rows():
+        print(f"{label:<{width}}  {value}")
+    if requested > 0:
+        print(f"{'Buffer size':<{width}}  {requested:.0f} (CAP_PROP_BUFFERSIZE)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Frame timing panel: measures the live preview and shows the analysis."""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem,
+    QHeaderView, QProgressBar
+)
+from PySide6.QtCore import QObject, QEvent, QTimer, Signal
+import time
+from . import frame_timing
+from .i18n import _
+from .retranslate import bind, tr
+
+
+class PaintProbe(QObject):
+    """Event filter stamping each paint of a widget into a ``FrameTimingLog``."""
+
+    def __init__(self, log, widget):
+        super().__init__(widget)
+        self.log = log
+        self.widget = widget
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            self.log.record_paint(time.monotonic())
+        return False
+
+    def remove(self):
+        self.widget.removeEventFilter(self)
+        self.deleteLater()
+
+
+class FrameTimingDialog(QDialog):
+    """Record the preview for a few seconds, then show its frame timing.
+
+    ``measuring`` carries the log to fill while recording, then ``None``.
+    """
+
+    measuring = Signal(object)
+
+    def __init__(self, seconds=frame_timing.MEASURE_SECONDS, parent=None):
+        super().__init__(parent)
+        tr(self, "setWindowTitle", "Frame Timing")
+        self.resize(520, 420)
+        self.seconds = seconds
+        self.log = None
+        self.report = None
+        self.started = 0.0
+
+        layout = QVBoxLayout(self)
+
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        tr(self.status_label, "setText", "Measures how frames travel from the camera to the preview.")
+        layout.addWidget(self.status_label)
+
+        self.progress = QProgressBar()
+        self.progress.setRange(0, int(seconds * 1000))
+        self.progress.setTextVisible(False)
+        layout.addWidget(self.progress)
+
+        self.table = QTableWidget(0, 2)
+        bind(self.table, "setHorizontalHeaderLabels", lambda: [_("Measure"), _("Value")])
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.measure_btn = tr(QPushButton(), "setText", "Measure")
+        self.measure_btn.clicked.connect(self.start)
+        button_layout.addWidget(self.measure_btn)
+        close_btn = tr(QPushButton(), "setText", "Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.tick_timer = QTimer(self)
+        self.tick_timer.timeout.connect(self.tick)
+
+    def start(self):
+        """Start recording the preview's frame timestamps."""
+        self.log = frame_timing.FrameTimingLog()
+        self.started = time.monotonic()
+        self.measure_btn.setEnabled(False)
+        self.progress.setValue(0)
+        tr(self.status_label, "setText", "Measuring, keep the preview visible...")
+        self.measuring.emit(self.log)
+        self.tick_timer.start(100)
+
+    def tick(self):
+        elapsed = time.monotonic() - self.started
+        self.progress.setValue(int(elapsed * 1000))
+        if elapsed >= self.seconds:
+            self.finish()
+
+    def finish(self):
+        """Stop recording and show the analysis."""
+        self.tick_timer.stop()
+        self.measuring.emit(None)
+        self.measure_btn.setEnabled(True)
+        self.progress.setValue(self.progress.maximum())
+        try:
+            self.report = frame_timing.analyze(self.log)
+        except ValueError:
+            self.report = None
+            tr(self.status_label, "setText", "Not enough frames: is the camera running?")
+            self.table.setRowCount(0)
+            return
+        tr(self.status_label, "setText", "Frame timing of the last {seconds:.0f} seconds of preview:",
+           seconds=self.seconds)
+        self.show_report(self.report)
+
+    def show_report(self, report):
+        rows = report.rows()
+        self.table.setRowCount(len(rows))
+        for row, (label, value) in enumerate(rows):
+            self.table.setItem(row, 0, QTableWidgetItem(label))
+            self.table.setItem(row, 1, QTableWidgetItem(value))
+        self.table.resizeColumnToContents(0)
+
+    def done(self, result):
+        if self.tick_timer.isActive():
+            self.tick_timer.stop()
+            self.measuring.emit(None)
+        super().done(result)
@@ -1,9 +1,13 @@
 """Internationalization (i18n) module for Linux Hello GUI."""
 
 import os
+import functools
 import gettext
+import struct
 from pathlib import Path
 
+from .mo_catalog import MoCatalog
+
 # Supported languages
 SUPPORTED_LANGUAGES = {
     'ar': 'العربية',
@@ -24,8 +28,9 @@ DEFAULT_LANGUAGE = 'en'
 # Translation catalogs directory
 # Look in multiple locations: development (src/linux_hello_gui/locale)
 # and installed system (/usr/share/linux-hello-gui/locale)
+@functools.lru_cache(maxsize=None)
 def _get_locale_dir():
-    """Get locale directory path."""
+    """Get locale directory path (probed once, on first use)."""
     # First try system installation
     system_locale = Path('/usr/share/linux-hello-gui/locale')
     if system_locale.exists():
@@ -39,40 +44,80 @@ def _get_locale_dir():
     # Fallback to system location
     return system_locale
 
-LOCALE_DIR = _get_locale_dir()
+
+def __getattr__(name):
+    # LOCALE_DIR is resolved lazily so importing this module touches no files
+    if name == 'LOCALE_DIR':
+        return _get_locale_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+DOMAIN = 'linux-hello-gui'
+
+# Catalogs loaded so far, kept so switching back is instant
+_catalogs = {}
+
+# Callbacks run after the active language changed
+_listeners = []
+
+
+def _get_catalog(language):
+    """Get the (cached) translation catalog for a language.
+    
+    The ``.mo`` file is memory-mapped and looked up in place.
+    """
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        path = _get_locale_dir() / language / 'LC_MESSAGES' / f'{DOMAIN}.mo'
+        try:
+            catalog = MoCatalog(path)
+        except (OSError, ValueError, struct.error):
+            catalog = gettext.NullTranslations()
+        _catalogs[language] = catalog
+    return catalog
+
+
+def _language_from_environment():
+    """Language code from LANGUAGE or LANG."""
+    # Try LANGUAGE variable first, then LANG
+    language = os.environ.get('LANGUAGE', '').split(':')[0]
+    if not language:
+        # Extract language from LANG (e.g., 'fr_FR.UTF-8' -> 'fr')
+        lang_full = os.environ.get('LANG', DEFAULT_LANGUAGE)
+        language = lang_full.split('_')[0].split('.')[0]
+    return language
 
 
 def setup_gettext(language=None):
     """Setup gettext translation.
     
+    Only the language is chosen here; its catalog is loaded on the first
+    lookup.
+    
     Args:
         language: Language code (e.g., 'en', 'fr'). If None, uses system locale.
     """
-    global _translation
+    global _catalog, _language
     
     if language is None:
-        # Try LANGUAGE variable first, then LANG
-        language = os.environ.get('LANGUAGE', '').split(':')[0]
-        if not language:
-            # Extract language from LANG (e.g., 'fr_FR.UTF-8' -> 'fr')
-            lang_full = os.environ.get('LANG', DEFAULT_LANGUAGE)
-            language = lang_full.split('_')[0].split('.')[0]
+        language = _language_from_environment()
     
     # Normalize language code
     if language not in SUPPORTED_LANGUAGES:
         language = DEFAULT_LANGUAGE
     
-    try:
-        # Try to load translation catalog
-        translation = gettext.translation(
-            'linux-hello-gui',
-            localedir=str(LOCALE_DIR),
-            languages=[language],
-            fallback=True
-        )
-        _translation = translation.gettext
-    except Exception:
-        _translation = lambda x: x
+    if language != _language:
+        _catalog = None
+    _language = language
+
+
+def _active_catalog():
+    global _catalog
+    if _catalog is None:
+        if _language is None:
+            setup_gettext()
+        _catalog = _get_catalog(_language)
+    return _catalog
 
 
 def get_available_languages():
@@ -85,24 +130,47 @@ def get_language_name(lang_code):
     return SUPPORTED_LANGUAGES.get(lang_code, lang_code)
 
 
+def get_language():
+    """Get the active language code."""
+    if _language is None:
+        setup_gettext()
+    return _language
+
+
+def add_language_listener(callback):
+    """Call ``callback(language)`` whenever the active language changes."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_language_listener(callback):
+    """Stop notifying ``callback`` of language changes."""
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
 def set_language(language):
-    """Set active language and reload translations."""
+    """Set active language and notify listeners (no restart needed)."""
     setup_gettext(language)
+    for callback in list(_listeners):
+        callback(_language)
 
 
 def _(message):
     """Translate message."""
-    return _translation(message)
+    return (_catalog or _active_catalog()).gettext(message)
+
+
+def N_(message):
+    """Mark message for extraction; it is translated where it is shown."""
+    return message
 
 
 def ngettext(singular, plural, count):
     """Translate plural forms."""
-    try:
-        return _translation.ngettext(singular, plural, count)
-    except (AttributeError, TypeError):
-        return singular if count == 1 else plural
+    return (_catalog or _active_catalog()).ngettext(singular, plural, count)
 
 
-# Initialize with default language
-_translation = lambda x: x
-setup_gettext()
+# Language and catalog are resolved on first use
+_catalog = None
+_language = None
@@ -1,8 +1,8 @@
 """KDE integration and styling module."""
 
 from PySide6.QtWidgets import QApplication, QStyle
-from PySide6.QtGui import QIcon, QColor, QFont
-from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon, QColor, QFont, QPixmap
+from PySide6.QtCore import QSize, QObject, QEvent
 import sys
 
 
@@ -60,8 +60,24 @@ class KDEIntegration:
         return font
 
 
+class _ThemeWatcher(QObject):
+    """Event filter dropping cached icons when the icon or style theme changes."""
+    
+    THEME_EVENTS = (QEvent.ThemeChange, QEvent.StyleChange, QEvent.ApplicationPaletteChange)
+    
+    def eventFilter(self, obj, event):
+        if event.type() in self.THEME_EVENTS:
+            IconManager.invalidate()
+        return False
+
+
 class IconManager:
-    """Manage application icons with KDE theme fallbacks."""
+    """Manage application icons with KDE theme fallbacks.
+    
+    Theme lookups and rendered pixmaps are cached process-wide. Pixmaps are
+    keyed on ``(name, size, device pixel ratio, theme)``, so a button gets a
+    ready-made pixmap instead of rescaling at paint time.
+    """
     
     # Standard icon names for KDE
     ICONS = {
@@ -78,22 +94,86 @@ class IconManager:
         "success": "dialog-ok",
     }
     
+    # Common button and toolbar sizes
+    SIZES = (16, 24, 32)
+    
+    _icons = {}
+    _pixmaps = {}
+    _watcher = None
+    # Pixmap and theme icon cache counters
+    hits = 0
+    misses = 0
+    icon_hits = 0
+    icon_misses = 0
+    
     @staticmethod
-    def get_icon(icon_name: str) -> QIcon:
-        """Get an icon with KDE theme fallback."""
-        kde_name = IconManager.ICONS.get(icon_name, icon_name)
-        icon = QIcon.fromTheme(kde_name)
-        
-        if icon.isNull():
-            # Fallback if theme icon not found
-            return QIcon()
+    def _theme():
+        return QIcon.themeName()
+    
+    @staticmethod
+    def _device_pixel_ratio():
+        app = QApplication.instance()
+        return app.devicePixelRatio() if app else 1.0
+    
+    @classmethod
+    def get_icon(cls, icon_name: str) -> QIcon:
+        """Get an icon with KDE theme fallback (resolved once per theme)."""
+        kde_name = cls.ICONS.get(icon_name, icon_name)
+        key = (kde_name, cls._theme())
+        icon = cls._icons.get(key)
+        if icon is not None:
+            cls.icon_hits += 1
+            return icon
         
+        cls.icon_misses += 1
+        # Fallback (null icon) if theme icon not found
+        icon = cls._icons[key] = QIcon.fromTheme(kde_name)
         return icon
     
-    @staticmethod
-    def set_button_icon(button, icon_name: str):
+    @classmethod
+    def get_pixmap(cls, icon_name: str, size: int = 24, dpr: float = None) -> QPixmap:
+        """Get a pre-rendered pixmap of ``size`` logical pixels."""
+        dpr = dpr or cls._device_pixel_ratio()
+        key = (icon_name, size, dpr, cls._theme())
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is not None:
+            cls.hits += 1
+            return pixmap
+        
+        cls.misses += 1
+        pixmap = cls._pixmaps[key] = cls._render(icon_name, size, dpr)
+        return pixmap
+    
+    @classmethod
+    def _render(cls, icon_name, size, dpr):
+        icon = cls.get_icon(icon_name)
+        if icon.isNull():
+            return QPixmap()
+        return icon.pixmap(QSize(size, size), dpr)
+    
+    @classmethod
+    def set_button_icon(cls, button, icon_name: str, size: int = 24):
         """Set button icon with KDE integration."""
-        icon = IconManager.get_icon(icon_name)
-        if not icon.isNull():
-            button.setIcon(icon)
-            button.setIconSize(QSize(24, 24))
+        pixmap = cls.get_pixmap(icon_name, size, button.devicePixelRatioF())
+        if not pixmap.isNull():
+            button.setIcon(QIcon(pixmap))
+            button.setIconSize(QSize(size, size))
+    
+    @classmethod
+    def watch_theme(cls, window):
+        """Invalidate the cache when ``window`` sees a theme change."""
+        if cls._watcher is None:
+            cls._watcher = _ThemeWatcher()
+        window.installEventFilter(cls._watcher)
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop every cached icon and pixmap."""
+        cls._icons.clear()
+        cls._pixmaps.clear()
+    
+    @classmethod
+    def stats(cls):
+        """Cache counters as a dict."""
+        return {"hits": cls.hits, "misses": cls.misses, "pixmaps": len(cls._pixmaps),
+                "icon_hits": cls.icon_hits, "icon_misses": cls.icon_misses, "icons": len(cls._icons)}
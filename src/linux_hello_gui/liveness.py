@@ -0,0 +1,198 @@
+"""Cheap temporal liveness signals on aligned face crops.
+
+A printed photo or a phone screen held to the camera can match a template
+on a single frame. Heavy anti-spoofing models would cost more than the
+whole recognition, so ``LivenessMonitor`` only follows a few signals on the
+aligned crops (see ``alignment``) the pipeline already has, each a handful
+of vectorized operations on a 112-pixel image:
+
+* eye openness: contrast of the two eye regions, which sit at fixed places
+  in an aligned crop, relative to the whole face. A blink is a short dip
+  under the window's median,
+* micro-motion: dense optical flow between consecutive crops at half size.
+  Alignment cancels rigid head motion, so what is left is the non-rigid
+  motion of a real face; a photo moves as a whole and leaves almost none,
+* texture and specular highlights (IR cameras): high-frequency energy of
+  the skin, which printing removes and screens exaggerate (moiré), and the
+  share of saturated pixels, which live skin shows as small glints and a
+  glossy print or screen as large glare or none.
+
+``score()`` combines them over a sliding window into a value between 0 and
+1. The decision engine (``decision.SequentialDecision``) holds an accept
+until the score reaches the configured minimum.
+"""
+
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from .alignment import ALIGNED_SIZE, CANONICAL_EYES
+from .i18n import _
+
+# Frames in the sliding window (1.5 s at 30 fps) and frames needed for a score
+WINDOW = 45
+MIN_FRAMES = 10
+
+# Longest a check waits for the window to fill (frames without a face)
+CHECK_SECONDS = 3.0
+
+# Per-frame cost the signals are designed to stay under
+BUDGET_MS = 3.0
+
+# Eye regions around the canonical eye centres, in crop pixels
+EYE_HALF_SIZE = (12, 7)
+
+# A blink: openness under this fraction of the window median
+BLINK_DROP = 0.5
+
+# Non-rigid motion (median flow magnitude in half-size crop pixels) counted
+# as none, and as clearly alive
+MOTION_NONE = 0.03
+MOTION_ALIVE = 0.25
+
+# Laplacian energy relative to the face contrast: prints fall under the
+# band, screens (moiré) above it
+TEXTURE_BAND = (0.08, 0.9)
+
+# Share of saturated pixels: live skin under IR shows small glints
+SATURATED = 250
+SPECULAR_BAND = (0.0005, 0.03)
+
+# Weight of each signal in the score
+WEIGHTS = {"motion": 0.4, "blink": 0.3, "texture": 0.2, "specular": 0.1}
+
+
+def _eye_slices():
+    half_w, half_h = EYE_HALF_SIZE
+    return [(slice(int(y) - half_h, int(y) + half_h), slice(int(x) - half_w, int(x) + half_w))
+            for x, y in CANONICAL_EYES]
+
+
+_EYES = _eye_slices()
+
+
+def _band(value, low, high):
+    """1 inside ``[low, high]``, falling off by octaves outside."""
+    if value <= 0:
+        return 0.0
+    if value < low:
+        return max(0.0, 1.0 - np.log2(low / value) / 2)
+    if value > high:
+        return max(0.0, 1.0 - np.log2(value / high) / 2)
+    return 1.0
+
+
+@dataclass
+class LivenessResult:
+    """Liveness over the window, with what it cost per frame."""
+
+    score: float
+    blinks: int
+    motion: float
+    texture: float
+    specular: float
+    frames: int
+    ms_per_frame: float
+
+    @property
+    def within_budget(self):
+        return self.ms_per_frame <= BUDGET_MS
+
+    def rows(self):
+        """``(label, value)`` pairs for display."""
+        return [
+            (_("Liveness score"), f"{self.score:.2f}"),
+            (_("Blinks"), str(self.blinks)),
+            (_("Non-rigid motion"), f"{self.motion:.3f} px"),
+            (_("Skin texture"), f"{self.texture:.3f}"),
+            (_("Specular highlights"), f"{self.specular:.2%}"),
+            (_("Cost per frame"), f"{self.ms_per_frame:.2f} ms"),
+        ]
+
+
+class LivenessMonitor:
+    """Follow the liveness signals of a stream of aligned crops."""
+
+    def __init__(self, window=WINDOW, clock=time.perf_counter):
+        self.window = window
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.cost = 0.0
+        self._previous = None
+        # Ring buffers of the per-frame signals
+        self._openness = np.zeros(self.window, np.float32)
+        self._motion = np.zeros(self.window, np.float32)
+        self._texture = np.zeros(self.window, np.float32)
+        self._specular = np.zeros(self.window, np.float32)
+
+    @property
+    def ready(self):
+        return self.frames >= MIN_FRAMES
+
+    def update(self, crop):
+        """Feed one aligned crop (grayscale or BGR, ``ALIGNED_SIZE`` square)."""
+        started = self.clock()
+        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+        if gray.shape != (ALIGNED_SIZE, ALIGNED_SIZE):
+            gray = cv2.resize(gray, (ALIGNED_SIZE, ALIGNED_SIZE), interpolation=cv2.INTER_AREA)
+        i = self.frames % self.window
+
+        face_std = float(gray.std()) + 1e-3
+        self._openness[i] = sum(float(gray[eye].std()) for eye in _EYES) / (2 * face_std)
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S, ksize=1)
+        self._texture[i] = float(np.abs(laplacian).mean()) / face_std
+        self._specular[i] = np.count_nonzero(gray >= SATURATED) / gray.size
+
+        small = cv2.resize(gray, (ALIGNED_SIZE // 2, ALIGNED_SIZE // 2), interpolation=cv2.INTER_AREA)
+        if self._previous is not None:
+            flow = cv2.calcOpticalFlowFarneback(self._previous, small, None, 0.5, 2, 9, 2, 5, 1.1, 0)
+            # What remains once the common (rigid) motion is removed
+            residual = flow.reshape(-1, 2) - np.median(flow.reshape(-1, 2), axis=0)
+            self._motion[i] = float(np.median(np.hypot(residual[:, 0], residual[:, 1])))
+        self._previous = small
+
+        self.frames += 1
+        self.cost += self.clock() - started
+
+    def _recent(self, values):
+        count = min(self.frames, self.window)
+        start = self.frames % self.window if self.frames > self.window else 0
+        return np.roll(values, -start)[:count]
+
+    def blinks(self):
+        """Blinks in the window: dips of eye openness under ``BLINK_DROP`` of its median."""
+        openness = self._recent(self._openness)
+        if len(openness) < 3:
+            return 0
+        closed = openness < BLINK_DROP * np.median(openness)
+        # Count closed runs, not closed frames
+        return int(np.count_nonzero(closed[1:] & ~closed[:-1]) + closed[0])
+
+    def result(self):
+        """``LivenessResult`` over the window; the score is 0 until ``ready``."""
+        # The first frame of a stream has no motion
+        motion = self._recent(self._motion)[1 if self.frames <= self.window else 0:]
+        motion = float(np.median(motion)) if len(motion) else 0.0
+        texture = float(np.median(self._recent(self._texture))) if self.frames else 0.0
+        specular = float(np.median(self._recent(self._specular))) if self.frames else 0.0
+        blinks = self.blinks()
+        ms = 1000.0 * self.cost / self.frames if self.frames else 0.0
+
+        score = 0.0
+        if self.ready:
+            parts = {
+                "motion": float(np.clip((motion - MOTION_NONE) / (MOTION_ALIVE - MOTION_NONE), 0, 1)),
+                "blink": 1.0 if blinks else 0.0,
+                "texture": _band(texture, *TEXTURE_BAND),
+                "specular": _band(specular, *SPECULAR_BAND),
+            }
+            score = sum(WEIGHTS[name] * value for name, value in parts.items())
+        return LivenessResult(round(float(score), 3), blinks, motion, texture, specular, self.frames, ms)
+
+    def score(self):
+        return self.result().score
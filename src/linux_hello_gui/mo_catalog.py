@@ -0,0 +1,187 @@
+"""Memory-mapped GNU ``.mo`` catalogs.
+
+``MoCatalog`` maps the file and looks messages up in place: through the
+file's hash table when it has one (GNU msgfmt writes it), otherwise by
+binary search over the sorted originals table. Nothing is parsed up front
+and each message is decoded at most once. ``build_mo`` writes catalogs
+with a hash table, so building them needs no external ``msgfmt``.
+"""
+
+import gettext
+import mmap
+import struct
+
+# Magic number as read with each byte order
+MAGIC_LE = 0x950412de
+MAGIC_BE = 0xde120495
+
+
+def hash_string(data):
+    """GNU gettext's ``hash_string`` (hashpjw) of a msgid, as bytes."""
+    value = 0
+    for byte in data:
+        value = ((value << 4) + byte) & 0xFFFFFFFF
+        high = value & 0xF0000000
+        if high:
+            value ^= high >> 24
+            value ^= high
+    return value
+
+
+class MoCatalog:
+    """Read-only catalog looking messages up directly in a mapped ``.mo`` file.
+
+    Provides the ``gettext``/``ngettext`` subset of ``gettext.NullTranslations``.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic = struct.unpack_from('<I', self._data, 0)[0]
+        if magic == MAGIC_LE:
+            self._order = '<'
+        elif magic == MAGIC_BE:
+            self._order = '>'
+        else:
+            raise OSError(f"Bad magic number in {path}")
+
+        (_revision, self._count, self._originals, self._translations,
+         self._hash_size, self._hash_offset) = struct.unpack_from(self._order + '6I', self._data, 4)
+
+        self._cache = {}
+        self._plural = lambda n: int(n != 1)
+        self._charset = 'utf-8'
+        self._read_header()
+
+    def _entry(self, table, index):
+        length, offset = struct.unpack_from(self._order + '2I', self._data, table + 8 * index)
+        return self._data[offset:offset + length]
+
+    def _read_header(self):
+        index = self._find(b'')
+        if index is None:
+            return
+        for line in self._entry(self._translations, index).decode('ascii', 'replace').splitlines():
+            key, _sep, value = line.partition(':')
+            key = key.strip().lower()
+            if key == 'content-type' and 'charset=' in value:
+                self._charset = value.split('charset=')[1].strip()
+            elif key == 'plural-forms' and 'plural=' in value:
+                self._plural = gettext.c2py(value.split('plural=')[1].rstrip(';'))
+
+    def _find(self, msgid):
+        """Index of ``msgid`` (encoded, without plural) in the tables, or None."""
+        if self._hash_size > 2:
+            # Double hashing, as in GNU gettext's dcigettext.c
+            value = hash_string(msgid)
+            idx = value % self._hash_size
+            step = 1 + value % (self._hash_size - 2)
+            while True:
+                slot = struct.unpack_from(self._order + 'I', self._data, self._hash_offset + 4 * idx)[0]
+                if slot == 0:
+                    return None
+                original = self._entry(self._originals, slot - 1)
+                if original.split(b'\0', 1)[0] == msgid:
+                    return slot - 1
+                idx = (idx + step) % self._hash_size
+
+        # No hash table: originals are sorted
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            original = self._entry(self._originals, mid).split(b'\0', 1)[0]
+            if original == msgid:
+                return mid
+            if original < msgid:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _lookup(self, msgid):
+        """Translated plural forms of ``msgid``, or None (memoized)."""
+        try:
+            return self._cache[msgid]
+        except KeyError:
+            pass
+
+        forms = None
+        index = self._find(msgid.encode(self._charset))
+        if index is not None:
+            forms = self._entry(self._translations, index).decode(self._charset).split('\0')
+        self._cache[msgid] = forms
+        return forms
+
+    def gettext(self, message):
+        forms = self._lookup(message)
+        if not forms or not forms[0]:
+            return message
+        return forms[0]
+
+    def ngettext(self, singular, plural, n):
+        forms = self._lookup(singular)
+        if forms is None:
+            return singular if n == 1 else plural
+        index = self._plural(n)
+        if index < len(forms) and forms[index]:
+            return forms[index]
+        return singular if n == 1 else plural
+
+    def info(self):
+        return {'charset': self._charset}
+
+    def close(self):
+        self._data.close()
+
+
+def _next_prime(n):
+    n = max(n, 3) | 1
+    while any(n % d == 0 for d in range(3, int(n ** 0.5) + 1, 2)):
+        n += 2
+    return n
+
+
+def build_mo(messages):
+    """Build ``.mo`` data with a hash table from ``{msgid: msgstr}``.
+
+    Plural entries use ``"singular\\0plural"`` keys and ``"\\0"``-joined
+    forms, as in the file format. Include the header under ``""``.
+    """
+    items = sorted((key.encode('utf-8'), value.encode('utf-8')) for key, value in messages.items())
+    count = len(items)
+    hash_size = _next_prime(count * 4 // 3)
+
+    originals = 28
+    translations = originals + 8 * count
+    hash_offset = translations + 8 * count
+    data_offset = hash_offset + 4 * hash_size
+
+    table = [0] * hash_size
+    key_table = []
+    value_table = []
+    strings = bytearray()
+
+    for index, (key, value) in enumerate(items):
+        key_table.append((len(key), data_offset + len(strings)))
+        strings += key + b'\0'
+
+        # Only the singular is hashed, like msgfmt
+        hashed = hash_string(key.split(b'\0', 1)[0])
+        slot = hashed % hash_size
+        step = 1 + hashed % (hash_size - 2)
+        while table[slot]:
+            slot = (slot + step) % hash_size
+        table[slot] = index + 1
+
+    for key, value in items:
+        value_table.append((len(value), data_offset + len(strings)))
+        strings += value + b'\0'
+
+    output = bytearray(struct.pack('<7I', MAGIC_LE, 0, count, originals, translations,
+                                   hash_size, hash_offset))
+    for length, offset in key_table + value_table:
+        output += struct.pack('<2I', length, offset)
+    output += struct.pack(f'<{hash_size}I', *table)
+    output += strings
+    return bytes(output)
@@ -0,0 +1,311 @@
+"""Synchronized capture from several cameras, such as an RGB and an IR sensor.
+
+Laptops often expose their RGB and IR sensors as separate ``/dev/video*``
+nodes. ``CaptureGroup`` reads each source on its own thread into a short
+queue, and pairs frames by timestamp: whenever the oldest waiting frame of
+every stream lies within ``tolerance`` of the others they leave together as
+a ``FrameSet``; otherwise the oldest frame can never be paired (the other
+streams have already moved past it) and is dropped as unpaired.
+
+Camera frames are stamped when they arrive and their queues drop the
+oldest frame when full, so the preview stays live. Files (clips and
+``.lhrec`` recordings) use their own timestamps, counted from their first
+frame (``offsets`` shift them when the files did not start together), and
+wait for the slower stream instead of dropping frames; with ``realtime``
+they play at their recorded pace, like cameras.
+
+``CaptureGroup.read`` follows the ``cv2.VideoCapture`` interface and
+returns the newest set composed into one frame (side by side or picture
+in picture) for the preview; ``read_set`` returns every set, frames and
+all, for enrollment.
+
+    python -m linux_hello_gui.multicam SOURCE SOURCE...
+"""
+
+import argparse
+import collections
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from .session_recorder import open_capture
+
+# Frames of different streams further apart than this are not paired
+TOLERANCE = 0.020
+
+# Frames waiting per stream: cameras drop the oldest beyond this
+QUEUE_FRAMES = 4
+
+LAYOUT_SIDE_BY_SIDE = "side-by-side"
+LAYOUT_PICTURE_IN_PICTURE = "picture-in-picture"
+
+# Inset width as a fraction of the main frame, and its margin in pixels
+INSET_FRACTION = 0.3
+INSET_MARGIN = 8
+
+# How long a read waits for a set before reporting no frame
+READ_TIMEOUT = 1.0
+
+# Pairing latencies kept for ``stats``: the last 10 s at 30 fps
+LATENCY_SAMPLES = 300
+
+_END = object()
+
+
+@dataclass
+class FrameSet:
+    """Frames of all streams taken at (nearly) the same time."""
+
+    frames: tuple
+    timestamps: tuple
+    # Time between the arrival of the first and the last frame of the set
+    latency: float
+
+    @property
+    def skew(self):
+        return max(self.timestamps) - min(self.timestamps)
+
+
+def is_file_source(source):
+    return isinstance(source, str)
+
+
+def compose(frames, layout=LAYOUT_SIDE_BY_SIDE):
+    """One BGR frame showing all ``frames`` (grayscale frames are converted)."""
+    frames = [cv2.cvtColor(f, cv2.COLOR_GRAY2BGR) if f.ndim == 2 else f for f in frames]
+    main = frames[0]
+    height, width = main.shape[:2]
+    if layout == LAYOUT_PICTURE_IN_PICTURE:
+        out = main.copy()
+        inset_width = max(1, int(width * INSET_FRACTION))
+        right = width - INSET_MARGIN
+        for frame in frames[1:]:
+            inset_height = max(1, round(frame.shape[0] * inset_width / frame.shape[1]))
+            top = height - INSET_MARGIN - inset_height
+            if right - inset_width < 0 or top < 0:
+                break
+            out[top:top + inset_height, right - inset_width:right] = cv2.resize(
+                frame, (inset_width, inset_height), interpolation=cv2.INTER_AREA)
+            right -= inset_width + INSET_MARGIN
+        return out
+
+    scaled = [main] + [f if f.shape[0] == height else
+                       cv2.resize(f, (round(f.shape[1] * height / f.shape[0]), height),
+                                  interpolation=cv2.INTER_AREA)
+                       for f in frames[1:]]
+    return np.hstack(scaled)
+
+
+class CameraStream:
+    """Read one source on a daemon thread into a bounded queue."""
+
+    def __init__(self, source, queue_frames=QUEUE_FRAMES, offset=0.0, realtime=False, clock=time.monotonic):
+        self.source = source
+        self.offset = offset
+        self.clock = clock
+        self.from_file = is_file_source(source)
+        self.cap = open_capture(source, realtime) if self.from_file else cv2.VideoCapture(source)
+        self.frames = queue.Queue(maxsize=queue_frames)
+        self.read_count = 0
+        self.overflowed = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"camera-{source}")
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def start(self):
+        self._thread.start()
+
+    def _put(self, item):
+        if self.from_file:
+            # Wait for the other streams rather than lose a recorded frame
+            while not self._stop.is_set():
+                try:
+                    self.frames.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            return
+        while True:
+            try:
+                self.frames.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()
+                    self.overflowed += 1
+                except queue.Empty:
+                    pass
+
+    def _run(self):
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            arrived = self.clock()
+            if not ret:
+                break
+            self.read_count += 1
+            timestamp = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 if self.from_file else arrived
+            self._put((timestamp + self.offset, frame, arrived))
+        self._put(_END)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+        self.cap.release()
+
+
+class CaptureGroup:
+    """Stream several sources at once and pair their frames by timestamp.
+
+    The first source is the main one: its properties are those of the
+    group, and it is drawn first (or full size) by ``read``. ``offsets``
+    are seconds added to the timestamps of each source. ``stats`` reports
+    the latency of the last ``latency_samples`` sets (None keeps them all).
+    """
+
+    def __init__(self, sources, tolerance=TOLERANCE, layout=LAYOUT_SIDE_BY_SIDE, offsets=None,
+                 realtime=False, queue_frames=QUEUE_FRAMES, read_timeout=READ_TIMEOUT,
+                 latency_samples=LATENCY_SAMPLES, clock=time.monotonic):
+        self.sources = list(sources)
+        self.tolerance = tolerance
+        self.layout = layout
+        self.read_timeout = read_timeout
+        self.clock = clock
+        offsets = offsets or [0.0] * len(self.sources)
+        self.streams = [CameraStream(source, queue_frames, offset, realtime, clock)
+                        for source, offset in zip(self.sources, offsets)]
+        self.last_set = None
+        self.paired = 0
+        self.unpaired = [0] * len(self.streams)
+        self.latencies = collections.deque(maxlen=latency_samples)
+        self._heads = [None] * len(self.streams)
+        self._ended = False
+        if self.isOpened():
+            for stream in self.streams:
+                stream.start()
+
+    def isOpened(self):
+        return bool(self.streams) and all(stream.isOpened() for stream in self.streams)
+
+    def _fill_heads(self, deadline):
+        """Make sure every stream has a waiting frame; False if one has ended or timed out."""
+        for i, stream in enumerate(self.streams):
+            if self._heads[i] is not None:
+                continue
+            try:
+                item = stream.frames.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return False
+            if item is _END:
+                self._ended = True
+                return False
+            self._heads[i] = item
+        return True
+
+    def read_set(self, timeout=READ_TIMEOUT):
+        """Next ``FrameSet``, or None when a stream has ended or nothing came in time."""
+        deadline = time.monotonic() + timeout
+        while not self._ended and self._fill_heads(deadline):
+            timestamps = [head[0] for head in self._heads]
+            oldest = int(np.argmin(timestamps))
+            if max(timestamps) - timestamps[oldest] <= self.tolerance:
+                arrivals = [head[2] for head in self._heads]
+                frame_set = FrameSet(tuple(head[1] for head in self._heads), tuple(timestamps),
+                                     max(arrivals) - min(arrivals))
+                self._heads = [None] * len(self.streams)
+                self.paired += 1
+                self.latencies.append(frame_set.latency)
+                self.last_set = frame_set
+                return frame_set
+            # The other streams are past it: it will never be paired
+            self._heads[oldest] = None
+            self.unpaired[oldest] += 1
+        return None
+
+    def read(self):
+        """``cv2.VideoCapture``-style read of the newest frame set, composed.
+
+        Sets already waiting behind it are skipped, so a slow reader shows
+        the present rather than a backlog.
+        """
+        frame_set = self.read_set(self.read_timeout)
+        if frame_set is None:
+            return False, None
+        while True:
+            newer = self.read_set(0)
+            if newer is None:
+                break
+            frame_set = newer
+        return True, compose(frame_set.frames, self.layout)
+
+    def get(self, prop):
+        return self.streams[0].cap.get(prop) if self.streams else 0.0
+
+    def set(self, prop, value):
+        return all(stream.cap.set(prop, value) for stream in self.streams)
+
+    def release(self):
+        for stream in self.streams:
+            stream.stop()
+
+    def stats(self):
+        """Pairing counts, unpaired share of each stream and recent pairing latency."""
+        rates = []
+        for i, stream in enumerate(self.streams):
+            lost = self.unpaired[i] + stream.overflowed
+            frames = self.paired + lost
+            rates.append(lost / frames if frames else 0.0)
+        latencies = np.array(self.latencies) * 1000.0
+        return {
+            "paired": self.paired,
+            "unpaired": [u + s.overflowed for u, s in zip(self.unpaired, self.streams)],
+            "unpaired_rate": rates,
+            "latency_ms": float(np.median(latencies)) if len(latencies) else 0.0,
+            "latency_p95_ms": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m linux_hello_gui.multicam",
+        description="Stream several cameras or recordings together and report how their frames pair.")
+    parser.add_argument("sources", nargs="+", help="camera indexes or clip/recording paths")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE * 1000, help="pairing tolerance in ms")
+    parser.add_argument("--offsets", type=float, nargs="+", help="ms added to the timestamps of each file")
+    parser.add_argument("--realtime", action="store_true", help="play files at their recorded pace")
+    parser.add_argument("--seconds", type=float, default=5.0, help="how long to stream cameras")
+    args = parser.parse_args()
+
+    sources = [int(s) if s.isdigit() else s for s in args.sources]
+    offsets = [ms / 1000.0 for ms in args.offsets] if args.offsets else None
+    group = CaptureGroup(sources, tolerance=args.tolerance / 1000.0, offsets=offsets, realtime=args.realtime,
+                         latency_samples=None)
+    if not group.isOpened():
+        print("Cannot open all sources")
+        return 1
+    started = time.monotonic()
+    try:
+        while time.monotonic() - started < args.seconds or all(is_file_source(s) for s in sources):
+            if group.read_set() is None:
+                break
+    finally:
+        group.release()
+
+    stats = group.stats()
+    print(f"{stats['paired']} frame sets, pairing latency median {stats['latency_ms']:.1f} ms, "
+          f"p95 {stats['latency_p95_ms']:.1f} ms")
+    for source, lost, rate in zip(sources, stats["unpaired"], stats["unpaired_rate"]):
+        print(f"  {source}: {lost} unpaired frames ({rate:.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,17 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QTextEdit, QMessageBox, QCheckBox, QGroupBox
+    QTextEdit, QMessageBox, QCheckBox, QGroupBox, QTableWidget,
+    QTableWidgetItem, QSpinBox, QComboBox, QHeaderView
 )
 from PySide6.QtCore import Qt
 import subprocess
 import os
+import tempfile
 from .i18n import _
+from .retranslate import bind, tr, unbind
+from . import pam_profiles
+from .config_watcher import ConfigWatcher, ConflictBanner, parse_text
 
 
 class PamManagerWidget(QWidget):
@@ -16,35 +21,53 @@ class PamManagerWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.pam_config_path = "/etc/pam.d/linux-hello"
+        self.pam_dir = pam_profiles.PAM_DIR
+        self.profiles = {}
+        self._loaded_content = None
+        self._loaded_profiles = {}
         self.init_ui()
         self.load_pam_config()
+        self.load_profiles()
+        
+        # Pick up edits made outside the application
+        self.watcher = ConfigWatcher(parser=parse_text, parent=self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watcher.watch(self.pam_config_path)
+        for service in pam_profiles.SERVICES:
+            self.watcher.watch(os.path.join(self.pam_dir, pam_profiles.PROFILE_PREFIX + service))
         
     def init_ui(self):
         layout = QVBoxLayout()
         
         # Title
-        title = QLabel(_("PAM Configuration (Authentication)"))
+        title = tr(QLabel(), "setText", "PAM Configuration (Authentication)")
         title.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(title)
         
         # Status info
-        info_label = QLabel(
-            _("PAM (Pluggable Authentication Modules) allows using "
-              "facial recognition for system authentication.")
+        info_label = tr(
+            QLabel(), "setText",
+            "PAM (Pluggable Authentication Modules) allows using "
+            "facial recognition for system authentication."
         )
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
+        self.banner = ConflictBanner()
+        self.banner.reloadRequested.connect(self.load_pam_config)
+        self.banner.reloadRequested.connect(self.load_profiles)
+        layout.addWidget(self.banner)
+        
         # Authentication Method
-        auth_group = QGroupBox(_("Authentication method"))
+        auth_group = tr(QGroupBox(), "setTitle", "Authentication method")
         auth_layout = QVBoxLayout()
         
-        self.auth_face_only = QCheckBox(_("Facial recognition only"))
-        self.auth_face_only.setToolTip(_("Face must be recognized to authenticate (highest security)"))
+        self.auth_face_only = tr(QCheckBox(), "setText", "Facial recognition only")
+        tr(self.auth_face_only, "setToolTip", "Face must be recognized to authenticate (highest security)")
         auth_layout.addWidget(self.auth_face_only)
         
-        self.auth_face_with_password = QCheckBox(_("Facial recognition + password fallback"))
-        self.auth_face_with_password.setToolTip(_("Use face first, or password if face not recognized"))
+        self.auth_face_with_password = tr(QCheckBox(), "setText", "Facial recognition + password fallback")
+        tr(self.auth_face_with_password, "setToolTip", "Use face first, or password if face not recognized")
         auth_layout.addWidget(self.auth_face_with_password)
         
         # Connect to make them mutually exclusive
@@ -55,12 +78,12 @@ class PamManagerWidget(QWidget):
         layout.addWidget(auth_group)
         
         # Options
-        options_group = QGroupBox(_("Options"))
+        options_group = tr(QGroupBox(), "setTitle", "Options")
         options_layout = QVBoxLayout()
         
-        self.option_cache = QCheckBox(_("Cache recognition results"))
+        self.option_cache = tr(QCheckBox(), "setText", "Cache recognition results")
         self.option_cache.setChecked(True)
-        self.option_cache.setToolTip(_("Faster authentication within 5 minutes"))
+        tr(self.option_cache, "setToolTip", "Faster authentication within 5 minutes")
         options_layout.addWidget(self.option_cache)
         
         self.option_cache.stateChanged.connect(self.regenerate_config)
@@ -69,7 +92,7 @@ class PamManagerWidget(QWidget):
         layout.addWidget(options_group)
         
         # Configuration file display
-        config_group = QGroupBox(_("Configuration file (/etc/pam.d/linux-hello)"))
+        config_group = tr(QGroupBox(), "setTitle", "Configuration file (/etc/pam.d/linux-hello)")
         config_layout = QVBoxLayout()
         
         self.config_text = QTextEdit()
@@ -81,21 +104,74 @@ class PamManagerWidget(QWidget):
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
         
+        # Per-service profiles (matrix view)
+        profiles_group = tr(QGroupBox(), "setTitle", "Per-service profiles")
+        profiles_layout = QVBoxLayout()
+        
+        self.profiles_table = QTableWidget(len(pam_profiles.SERVICES), 5)
+        bind(self.profiles_table, "setHorizontalHeaderLabels", lambda: [
+            _("Service"), _("Timeout"), _("Max frames"), _("Fallback"), _("Status")
+        ])
+        self.profiles_table.verticalHeader().setVisible(False)
+        self.profiles_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+        self.profiles_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        
+        for row, (service, (label, *_defaults)) in enumerate(pam_profiles.SERVICES.items()):
+            item = QTableWidgetItem(f"{_(label)} ({service})")
+            item.setData(Qt.UserRole, service)
+            self.profiles_table.setItem(row, 0, item)
+            
+            timeout = QSpinBox()
+            timeout.setRange(*pam_profiles.TIMEOUT_RANGE)
+            tr(timeout, "setSuffix", " seconds")
+            timeout.valueChanged.connect(self._on_profile_changed)
+            self.profiles_table.setCellWidget(row, 1, timeout)
+            
+            max_frames = QSpinBox()
+            max_frames.setRange(*pam_profiles.MAX_FRAMES_RANGE)
+            max_frames.valueChanged.connect(self._on_profile_changed)
+            self.profiles_table.setCellWidget(row, 2, max_frames)
+            
+            fallback = QComboBox()
+            for index, policy in enumerate(pam_profiles.FALLBACK_POLICIES):
+                fallback.addItem("", policy)
+                bind(fallback, "setItemText",
+                     lambda policy=policy: pam_profiles.get_fallback_label(policy), index)
+            fallback.currentIndexChanged.connect(self._on_profile_changed)
+            self.profiles_table.setCellWidget(row, 3, fallback)
+            
+            self.profiles_table.setItem(row, 4, QTableWidgetItem())
+        
+        self.profiles_table.resizeColumnsToContents()
+        profiles_layout.addWidget(self.profiles_table)
+        
+        profiles_buttons = QHBoxLayout()
+        profiles_buttons.addStretch()
+        
+        save_profiles_btn = tr(QPushButton(), "setText", "Save profiles")
+        save_profiles_btn.clicked.connect(self.save_profiles)
+        profiles_buttons.addWidget(save_profiles_btn)
+        
+        profiles_layout.addLayout(profiles_buttons)
+        profiles_group.setLayout(profiles_layout)
+        layout.addWidget(profiles_group)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
-        reload_btn = QPushButton(_("Reload"))
+        reload_btn = tr(QPushButton(), "setText", "Reload")
         reload_btn.clicked.connect(self.load_pam_config)
+        reload_btn.clicked.connect(self.load_profiles)
         button_layout.addWidget(reload_btn)
         
         button_layout.addStretch()
         
-        save_btn = QPushButton(_("Save changes"))
+        save_btn = tr(QPushButton(), "setText", "Save changes")
         save_btn.setStyleSheet("background-color: #1976d2; color: white;")
         save_btn.clicked.connect(self.on_save_clicked)
         button_layout.addWidget(save_btn)
         
-        help_btn = QPushButton(_("Help"))
+        help_btn = tr(QPushButton(), "setText", "Help")
         help_btn.clicked.connect(self.show_help)
         button_layout.addWidget(help_btn)
         
@@ -129,14 +205,20 @@ class PamManagerWidget(QWidget):
             else:
                 content = _("# PAM configuration not found. Use presets to create it.")
             
-            self.config_text.setText(content)
+            self.show_config(content)
+            self._loaded_content = self.config_text.toPlainText()
             
             # Parse config to update checkboxes
             self.parse_config(content)
         except PermissionError:
-            self.config_text.setText(_("Error: Permission denied to read PAM configuration"))
+            tr(self.config_text, "setText", "Error: Permission denied to read PAM configuration")
         except Exception as e:
-            self.config_text.setText(_("Error: {error}").format(error=str(e)))
+            tr(self.config_text, "setText", "Error: {error}", error=str(e))
+    
+    def show_config(self, text):
+        """Show PAM configuration text in place of any translated message."""
+        unbind(self.config_text, "setText")
+        self.config_text.setText(text)
     
     def parse_config(self, content):
         """Parse PAM config to update UI checkboxes."""
@@ -174,10 +256,157 @@ class PamManagerWidget(QWidget):
             self.auth_face_with_password.blockSignals(False)
             self.option_cache.blockSignals(False)
     
+    def load_profiles(self):
+        """Load per-service profiles and show them in the matrix."""
+        errors = []
+        self.profiles = pam_profiles.load_profiles(self.pam_dir, errors)
+        if errors:
+            # Defaults are shown for these services: say so
+            self.banner.show_error("\n".join(
+                _("Cannot read {path}: {error}").format(path=path, error=error) for path, error in errors))
+        self._loaded_profiles = {service: profile.to_dict() for service, profile in self.profiles.items()}
+        
+        for row in range(self.profiles_table.rowCount()):
+            self._show_profile(row)
+        
+        self.validate_profiles()
+    
+    def _show_profile(self, row):
+        """Show a profile in its matrix row without triggering edits."""
+        service = self.profiles_table.item(row, 0).data(Qt.UserRole)
+        profile = self.profiles[service]
+        
+        widgets = [self.profiles_table.cellWidget(row, col) for col in (1, 2, 3)]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            widgets[0].setValue(profile.timeout)
+            widgets[1].setValue(profile.max_frames)
+            widgets[2].setCurrentIndex(widgets[2].findData(profile.fallback))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+    
+    def on_file_changed(self, path, content):
+        """Apply an external change to the PAM file or a service profile."""
+        if path == os.path.abspath(self.pam_config_path):
+            if self.config_text.toPlainText() == self._loaded_content:
+                self.show_config(content)
+                self._loaded_content = self.config_text.toPlainText()
+                self.parse_config(content)
+            elif content != self._loaded_content:
+                self.banner.show_conflict([self.pam_config_path])
+            return
+        
+        service = os.path.basename(path)[len(pam_profiles.PROFILE_PREFIX):]
+        if service not in self.profiles:
+            return
+        
+        profile = pam_profiles.parse_profile(service, content)
+        if profile is None or profile.to_dict() == self._loaded_profiles[service]:
+            return
+        
+        if self.profiles[service].to_dict() != self._loaded_profiles[service]:
+            # Unsaved edits in this row
+            self.banner.show_conflict([path])
+            return
+        
+        self.profiles[service] = profile
+        self._loaded_profiles[service] = profile.to_dict()
+        for row in range(self.profiles_table.rowCount()):
+            if self.profiles_table.item(row, 0).data(Qt.UserRole) == service:
+                self._show_profile(row)
+        self.validate_profiles()
+    
+    def _on_profile_changed(self):
+        """Copy matrix edits into the profiles and revalidate."""
+        for row in range(self.profiles_table.rowCount()):
+            service = self.profiles_table.item(row, 0).data(Qt.UserRole)
+            profile = self.profiles[service]
+            profile.timeout = self.profiles_table.cellWidget(row, 1).value()
+            profile.max_frames = self.profiles_table.cellWidget(row, 2).value()
+            profile.fallback = self.profiles_table.cellWidget(row, 3).currentData()
+        
+        self.validate_profiles()
+    
+    def validate_profiles(self):
+        """Validate every profile and show the result in the status column."""
+        results = pam_profiles.validate_all(self.profiles, self.pam_dir)
+        
+        for row in range(self.profiles_table.rowCount()):
+            service = self.profiles_table.item(row, 0).data(Qt.UserRole)
+            issues = results.get(service, [])
+            item = self.profiles_table.item(row, 4)
+            if issues:
+                item.setText("⚠ " + issues[0])
+                item.setToolTip("\n".join(issues))
+            else:
+                item.setText("✓")
+                item.setToolTip("")
+        
+        return results
+    
+    def save_profiles(self):
+        """Write every profile to its own PAM include file."""
+        rendered = pam_profiles.render_all(self.profiles)
+        
+        reply = QMessageBox.question(
+            self,
+            _("Confirmation"),
+            _("This will modify system PAM configuration.\n"
+              "Enter your administrator password when prompted."),
+            QMessageBox.Ok | QMessageBox.Cancel
+        )
+        
+        if reply != QMessageBox.Ok:
+            return
+        
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                paths = []
+                for file_name, content in rendered.items():
+                    path = os.path.join(tmp_dir, file_name)
+                    with open(path, 'w') as f:
+                        f.write(content)
+                    paths.append(path)
+                
+                # Install all files at once so the password is asked only once;
+                # install sets the mode, cp would keep the private temp file's
+                command = ['install', '-m', '644'] + paths + [self.pam_dir]
+                result = subprocess.run(
+                    ['pkexec'] + command,
+                    capture_output=True,
+                    timeout=30
+                )
+                
+                if result.returncode != 0:
+                    result = subprocess.run(
+                        ['sudo'] + command,
+                        capture_output=True,
+                        timeout=30
+                    )
+            
+            if result.returncode != 0:
+                error_msg = result.stderr.decode('utf-8', errors='ignore') if result.stderr else "Unknown error"
+                QMessageBox.critical(
+                    self,
+                    _("Error"),
+                    _("Failed to save PAM configuration:\n{error}").format(error=error_msg)
+                )
+                return
+            
+            self.load_profiles()
+            QMessageBox.information(self, _("Success"), _("PAM profiles saved successfully"))
+        
+        except subprocess.TimeoutExpired:
+            QMessageBox.critical(self, _("Error"), _("Operation timed out. No administrator password provided?"))
+        except Exception as e:
+            QMessageBox.critical(self, _("Error"), _("Error: {error}").format(error=str(e)))
+    
     def regenerate_config(self):
         """Regenerate PAM config based on current checkbox state."""
         config = self.generate_pam_config()
-        self.config_text.setText(config)
+        self.show_config(config)
     
     def generate_pam_config(self):
         """Generate PAM configuration based on selected options."""
@@ -195,7 +424,7 @@ class PamManagerWidget(QWidget):
             lines.append("account required pam_unix.so")
             lines.append("password required pam_unix.so sha512 shadow nullok try_first_pass use_authtok")
             lines.append("session required pam_unix.so")
-            self.config_text.setText("\n".join(lines))
+            self.show_config("\n".join(lines))
             return "\n".join(lines)
         
         # Generate header comment
@@ -270,7 +499,6 @@ class PamManagerWidget(QWidget):
                 return
             
             # Create temp file
-            import tempfile
             with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.pam') as tmp:
                 tmp.write(content)
                 tmp_path = tmp.name
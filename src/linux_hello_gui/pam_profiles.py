@@ -0,0 +1,256 @@
+"""Per-service PAM profiles for Linux Hello.
+
+Each target service (sudo, the SDDM greeter, the screen locker, ...) gets its
+own include file ``/etc/pam.d/linux-hello-<service>`` whose ``pam_exec`` line
+passes the service name, timeout and frame budget to the recognizer. The
+service's own PAM file pulls it in with ``@include linux-hello-<service>``.
+
+Everything here is plain Python so rendering and validation can run without
+Qt and against any directory laid out like ``/etc/pam.d``.
+"""
+
+import os
+import re
+
+from .config import FIELD_LIMITS
+from .i18n import _, N_
+
+PAM_DIR = "/etc/pam.d"
+PAM_HELPER = "/usr/lib/linux-hello/pam_linux_hello.py"
+PROFILE_PREFIX = "linux-hello-"
+
+# Limits shared with the "Performance Settings" group of ConfigEditorWidget
+TIMEOUT_RANGE = FIELD_LIMITS["timeout"]
+MAX_FRAMES_RANGE = FIELD_LIMITS["max_frames"]
+
+# Highest frame rate a budget can realistically be spent at
+MAX_CAMERA_FPS = 60
+
+# Fallback policies
+FALLBACK_PASSWORD = "password"
+FALLBACK_FACE_ONLY = "face-only"
+FALLBACK_DISABLED = "disabled"
+
+FALLBACK_POLICIES = (FALLBACK_PASSWORD, FALLBACK_FACE_ONLY, FALLBACK_DISABLED)
+
+# Target services: PAM service name -> (display name, timeout, max frames, fallback);
+# display names are translated where shown
+SERVICES = {
+    "sudo": ("sudo", 3, 30, FALLBACK_PASSWORD),
+    "polkit-1": ("PolicyKit", 3, 30, FALLBACK_PASSWORD),
+    "sddm": ("SDDM", 8, 240, FALLBACK_PASSWORD),
+    "kde": (N_("Screen locker"), 5, 150, FALLBACK_PASSWORD),
+    "login": (N_("Console login"), 5, 100, FALLBACK_DISABLED),
+}
+
+_ARG_RE = re.compile(r"\b(service|timeout|max_frames)=(\S+)")
+
+
+def get_fallback_label(policy):
+    """Get display name for a fallback policy."""
+    labels = {
+        FALLBACK_PASSWORD: _("Face + password fallback"),
+        FALLBACK_FACE_ONLY: _("Face only"),
+        FALLBACK_DISABLED: _("Disabled"),
+    }
+    return labels.get(policy, policy)
+
+
+class ServiceProfile:
+    """Face authentication settings for one PAM service."""
+
+    __slots__ = ("service", "timeout", "max_frames", "fallback")
+
+    def __init__(self, service, timeout, max_frames, fallback=FALLBACK_PASSWORD):
+        self.service = service
+        self.timeout = timeout
+        self.max_frames = max_frames
+        self.fallback = fallback
+
+    def __repr__(self):
+        return (f"ServiceProfile({self.service!r}, timeout={self.timeout}, "
+                f"max_frames={self.max_frames}, fallback={self.fallback!r})")
+
+    def __eq__(self, other):
+        if not isinstance(other, ServiceProfile):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    @property
+    def enabled(self):
+        return self.fallback != FALLBACK_DISABLED
+
+    @property
+    def file_name(self):
+        return PROFILE_PREFIX + self.service
+
+    def to_dict(self):
+        return {
+            "service": self.service,
+            "timeout": self.timeout,
+            "max_frames": self.max_frames,
+            "fallback": self.fallback,
+        }
+
+    @classmethod
+    def default(cls, service):
+        """Get the built-in profile for a known service."""
+        _label, timeout, max_frames, fallback = SERVICES[service]
+        return cls(service, timeout, max_frames, fallback)
+
+
+def get_default_profiles():
+    """Get default profiles for every known service."""
+    return {service: ServiceProfile.default(service) for service in SERVICES}
+
+
+def render_profile(profile):
+    """Render the PAM include file for a profile."""
+    lines = [f"# Linux Hello PAM profile for '{profile.service}'"]
+
+    if not profile.enabled:
+        lines.append(f"# fallback={FALLBACK_DISABLED}: facial recognition is not used")
+        lines.append("")
+        return "\n".join(lines)
+
+    lines.append(f"# fallback={profile.fallback}")
+    lines.append("")
+
+    exec_line = (f"pam_exec.so quiet expose_authtok {PAM_HELPER} "
+                 f"service={profile.service} timeout={profile.timeout} "
+                 f"max_frames={profile.max_frames}")
+
+    if profile.fallback == FALLBACK_FACE_ONLY:
+        # Face decides the whole stack: success ends it, failure denies it
+        lines.append(f"auth [success=done default=die] {exec_line}")
+    else:
+        # Face is sufficient, the including service's password modules follow
+        lines.append(f"auth sufficient {exec_line}")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_all(profiles):
+    """Render every profile, keyed by PAM file name."""
+    return {profile.file_name: render_profile(profile) for profile in profiles.values()}
+
+
+def parse_profile(service, content):
+    """Parse a rendered profile back, falling back to defaults for missing values.
+
+    Returns None if the content does not look like a Linux Hello profile.
+    """
+    if service in SERVICES:
+        profile = ServiceProfile.default(service)
+    else:
+        profile = ServiceProfile(service, 5, 100)
+
+    found = False
+    for line in content.splitlines():
+        line = line.strip()
+        if line.startswith("#"):
+            if line.startswith("# fallback="):
+                policy = line.split("=", 1)[1].split(":")[0].strip()
+                if policy in FALLBACK_POLICIES:
+                    profile.fallback = policy
+                    found = True
+            continue
+
+        if "pam_exec.so" not in line:
+            continue
+
+        found = True
+        for key, value in _ARG_RE.findall(line):
+            if key == "timeout" and value.isdigit():
+                profile.timeout = int(value)
+            elif key == "max_frames" and value.isdigit():
+                profile.max_frames = int(value)
+
+    return profile if found else None
+
+
+def load_profiles(pam_dir=PAM_DIR, errors=None):
+    """Load profiles from ``pam_dir``, using defaults for missing files.
+
+    Files that exist but cannot be read also fall back to the defaults;
+    ``errors``, when given, collects their ``(path, message)``.
+    """
+    profiles = get_default_profiles()
+
+    for service in SERVICES:
+        path = os.path.join(pam_dir, PROFILE_PREFIX + service)
+        try:
+            with open(path, "r") as f:
+                content = f.read()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            if errors is not None:
+                errors.append((path, e.strerror or str(e)))
+            continue
+
+        profile = parse_profile(service, content)
+        if profile is not None:
+            profiles[service] = profile
+
+    return profiles
+
+
+def _includes(content, file_name):
+    """Check whether a PAM file pulls in ``file_name``."""
+    for line in content.splitlines():
+        tokens = line.split("#", 1)[0].split()
+        if not tokens:
+            continue
+        if tokens[0] == "@include" and tokens[1:2] == [file_name]:
+            return True
+        if (len(tokens) >= 3 and tokens[0].lstrip("-") == "auth"
+                and tokens[1] in ("include", "substack") and tokens[2] == file_name):
+            return True
+    return False
+
+
+def validate_profile(profile, pam_dir=PAM_DIR):
+    """Validate one profile against a ``/etc/pam.d``-like directory.
+
+    Returns a list of human-readable issues (empty when valid).
+    """
+    issues = []
+
+    if profile.fallback not in FALLBACK_POLICIES:
+        issues.append(_("Unknown fallback policy: {policy}").format(policy=profile.fallback))
+
+    low, high = TIMEOUT_RANGE
+    if not low <= profile.timeout <= high:
+        issues.append(_("Timeout must be between {min} and {max} seconds").format(min=low, max=high))
+
+    low, high = MAX_FRAMES_RANGE
+    if not low <= profile.max_frames <= high:
+        issues.append(_("Max frames must be between {min} and {max}").format(min=low, max=high))
+
+    if profile.max_frames > profile.timeout * MAX_CAMERA_FPS:
+        issues.append(_("Frame budget cannot be reached before the timeout"))
+
+    service_path = os.path.join(pam_dir, profile.service)
+    try:
+        with open(service_path, "r") as f:
+            service_content = f.read()
+    except FileNotFoundError:
+        if profile.enabled:
+            issues.append(_("Service file {path} not found").format(path=service_path))
+        return issues
+    except OSError as e:
+        issues.append(_("Error: {error}").format(error=str(e)))
+        return issues
+
+    if profile.enabled and not _includes(service_content, profile.file_name):
+        issues.append(_("{path} does not include {name}").format(
+            path=service_path, name=profile.file_name))
+
+    return issues
+
+
+def validate_all(profiles, pam_dir=PAM_DIR):
+    """Validate every profile, keyed by service name."""
+    return {service: validate_profile(profile, pam_dir) for service, profile in profiles.items()}
@@ -0,0 +1,97 @@
+"""Runtime retranslation of widgets.
+
+Widgets register their translatable strings with ``tr`` (a message id) or
+``bind`` (a callable building the text). The setter runs immediately and
+again whenever the language changes: ``i18n.set_language`` sends a
+``QEvent.LanguageChange`` to every registered widget, and a shared event
+filter re-applies its strings in place. Nothing is rebuilt.
+"""
+
+import weakref
+
+import shiboken6
+from PySide6.QtCore import QObject, QEvent, QCoreApplication, Qt
+from PySide6.QtGui import QGuiApplication
+
+from . import i18n
+from .i18n import _
+
+# Languages written right to left
+RTL_LANGUAGES = {'ar'}
+
+_widgets = weakref.WeakSet()
+
+
+class _Retranslator(QObject):
+    """Event filter re-applying registered strings on LanguageChange."""
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.LanguageChange:
+            apply_texts(obj)
+        return False
+
+
+_retranslator = None
+
+
+def _get_retranslator():
+    global _retranslator
+    if _retranslator is None:
+        _retranslator = _Retranslator()
+    return _retranslator
+
+
+def bind(widget, method, text, *args):
+    """Call ``widget.method(*args, text())`` now and on every language change.
+
+    Registering the same method and arguments again replaces the previous
+    binding. Returns the widget so calls can be nested in layout code.
+    """
+    texts = getattr(widget, '_i18n_texts', None)
+    if texts is None:
+        texts = widget._i18n_texts = {}
+        widget.installEventFilter(_get_retranslator())
+        _widgets.add(widget)
+
+    texts[(method, args)] = text
+    getattr(widget, method)(*args, text())
+    return widget
+
+
+def tr(widget, method, message, *args, **format_args):
+    """Like ``bind`` for a message id, formatted with ``format_args`` if given."""
+    if format_args:
+        return bind(widget, method, lambda: _(message).format(**format_args), *args)
+    return bind(widget, method, lambda: _(message), *args)
+
+
+def unbind(widget, method, *args):
+    """Stop re-applying ``widget.method(*args, ...)``, once it shows other text."""
+    getattr(widget, '_i18n_texts', {}).pop((method, args), None)
+
+
+def apply_texts(widget):
+    """Re-apply every string registered on ``widget``."""
+    for (method, args), text in getattr(widget, '_i18n_texts', {}).items():
+        getattr(widget, method)(*args, text())
+
+
+def retranslate_all(language=None):
+    """Send LanguageChange to every registered widget that is still alive."""
+    language = language or i18n.get_language()
+    if QCoreApplication.instance() is not None:
+        QGuiApplication.setLayoutDirection(
+            Qt.RightToLeft if language in RTL_LANGUAGES else Qt.LeftToRight
+        )
+
+    for widget in list(_widgets):
+        if shiboken6.isValid(widget):
+            QCoreApplication.sendEvent(widget, QEvent(QEvent.LanguageChange))
+
+
+def registered_count():
+    """Number of live widgets with registered strings."""
+    return sum(1 for widget in list(_widgets) if shiboken6.isValid(widget))
+
+
+i18n.add_language_listener(retranslate_all)
@@ -0,0 +1,397 @@
+"""Session recordings: the raw camera stream of an enrollment or test.
+
+A ``.lhrec`` file holds a JSON metadata header (camera settings, user, start
+time) followed by independently decodable chunks. Each chunk starts with a
+key frame; the next frames are stored as byte-wise differences from the
+previous one, so a still scene compresses to almost nothing, and the whole
+chunk is zlib-compressed. A JSON index of chunk offsets closes the file; a
+recording cut short by a crash is still readable by scanning its chunks.
+
+``SessionRecorder`` compresses and writes on a background thread, so capture
+never waits on the disk; if the writer falls behind, frames are dropped and
+counted instead. ``SessionPlayer`` reads a recording back through the
+``cv2.VideoCapture`` interface, at the recorded pace or as fast as possible.
+
+    python -m linux_hello_gui.session_recorder recording.lhrec
+"""
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import cv2
+import numpy as np
+
+RECORDING_EXTENSION = ".lhrec"
+RECORDINGS_DIR = os.path.join(os.path.expanduser("~"), ".linux-hello", "recordings")
+
+FORMAT_VERSION = 1
+FILE_MAGIC = b"LHREC"
+CHUNK_MAGIC = b"LHCK"
+INDEX_MAGIC = b"LHIX"
+
+# magic, version, metadata length
+FILE_HEADER = struct.Struct("<5sBI")
+# magic, frames, payload length, first and last timestamp
+CHUNK_HEADER = struct.Struct("<4sIIdd")
+# timestamp, height, width, channels, delta-coded
+FRAME_HEADER = struct.Struct("<dHHB?")
+# index offset, magic
+FILE_FOOTER = struct.Struct("<Q4s")
+
+# Frames per chunk (one key frame each), zlib level, frames waiting for the writer
+CHUNK_FRAMES = 30
+COMPRESSION_LEVEL = 1
+QUEUE_FRAMES = 60
+
+
+def camera_metadata(cap):
+    """Settings of an open capture worth keeping with a recording."""
+    fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    try:
+        backend = cap.getBackendName()
+    except (AttributeError, cv2.error):
+        backend = None
+    return {
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fps": cap.get(cv2.CAP_PROP_FPS),
+        "fourcc": "".join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)) if fourcc else None,
+        "backend": backend,
+    }
+
+
+def recording_path(kind, directory=RECORDINGS_DIR):
+    """New file name for a ``kind`` ("enroll", "test", ...) session."""
+    return os.path.join(directory, f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}{RECORDING_EXTENSION}")
+
+
+def is_recording(source):
+    return isinstance(source, str) and source.endswith(RECORDING_EXTENSION)
+
+
+def open_capture(source, realtime=False):
+    """``cv2.VideoCapture`` for cameras and clips, ``SessionPlayer`` for recordings."""
+    if is_recording(source):
+        return SessionPlayer(source, realtime=realtime)
+    return cv2.VideoCapture(source)
+
+
+def _encode_chunk(frames):
+    """Compress ``[(timestamp, frame), ...]`` into one chunk payload."""
+    parts = []
+    previous = None
+    for timestamp, frame in frames:
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        delta = previous is not None and previous.shape == frame.shape
+        parts.append(FRAME_HEADER.pack(timestamp, height, width, channels, delta))
+        # uint8 arithmetic wraps, so the difference restores exactly
+        parts.append((frame - previous if delta else frame).tobytes())
+        previous = frame
+    return zlib.compress(b"".join(parts), COMPRESSION_LEVEL)
+
+
+def _decode_chunk(payload, count):
+    """Inverse of ``_encode_chunk``: ``[(timestamp, frame), ...]``."""
+    data = zlib.decompress(payload)
+    frames = []
+    previous = None
+    offset = 0
+    for _i in range(count):
+        timestamp, height, width, channels, delta = FRAME_HEADER.unpack_from(data, offset)
+        offset += FRAME_HEADER.size
+        size = height * width * channels
+        frame = np.frombuffer(data, np.uint8, size, offset)
+        frame = frame.reshape((height, width, channels) if channels > 1 else (height, width))
+        offset += size
+        if delta:
+            frame = previous + frame
+        frames.append((timestamp, frame))
+        previous = frame
+    return frames
+
+
+class SessionRecorder:
+    """Record frames to a ``.lhrec`` file from a background writer thread."""
+
+    def __init__(self, path, metadata=None, chunk_frames=CHUNK_FRAMES, queue_frames=QUEUE_FRAMES):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.frames = 0
+        self.dropped = 0
+        self.bytes_written = 0
+        self.raw_bytes = 0
+        self.writer_cpu = 0.0
+
+        metadata = dict(metadata or {})
+        metadata.setdefault("started", time.time())
+        header = json.dumps(metadata).encode("utf-8")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, len(header)) + header)
+        self.bytes_written = self._file.tell()
+
+        self._index = []
+        self._start = None
+        self._queue = queue.Queue(maxsize=queue_frames)
+        self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+        self._thread.start()
+
+    def write(self, frame, timestamp=None):
+        """Queue a frame; never blocks. Returns False if it had to be dropped."""
+        if frame is None or frame.dtype != np.uint8:
+            raise ValueError("Recordings hold 8-bit frames")
+        now = time.monotonic() if timestamp is None else timestamp
+        if self._start is None:
+            self._start = now
+        try:
+            # Callers may draw on the frame once this returns
+            self._queue.put_nowait((now - self._start, frame.copy()))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _run(self):
+        started = time.thread_time()
+        pending = []
+        while True:
+            item = self._queue.get()
+            if item is not None:
+                pending.append(item)
+            if pending and (item is None or len(pending) >= self.chunk_frames):
+                self._write_chunk(pending)
+                pending = []
+            self.writer_cpu = time.thread_time() - started
+            if item is None:
+                break
+
+    def _write_chunk(self, frames):
+        payload = _encode_chunk(frames)
+        offset = self._file.tell()
+        self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, len(frames), len(payload),
+                                           frames[0][0], frames[-1][0]))
+        self._file.write(payload)
+        self._index.append([offset, len(frames), frames[0][0], frames[-1][0]])
+        self.frames += len(frames)
+        self.raw_bytes += sum(frame.nbytes for _timestamp, frame in frames)
+        self.bytes_written = self._file.tell()
+
+    def close(self):
+        """Flush the remaining frames and write the index."""
+        if self._file is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+        index = json.dumps({
+            "chunks": self._index,
+            "frames": self.frames,
+            "dropped": self.dropped,
+        }).encode("utf-8")
+        offset = self._file.tell()
+        self._file.write(index)
+        self._file.write(FILE_FOOTER.pack(offset, INDEX_MAGIC))
+        self.bytes_written = self._file.tell()
+        self._file.close()
+        self._file = None
+
+    def stats(self):
+        """Frames, drops, sizes and writer CPU time so far."""
+        duration = self._index[-1][3] if self._index else 0.0
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "bytes": self.bytes_written,
+            "raw_bytes": self.raw_bytes,
+            "duration": duration,
+            "bytes_per_second": self.bytes_written / duration if duration > 0 else 0.0,
+            "writer_cpu": self.writer_cpu,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordingCapture:
+    """Wrap a capture so every frame read is also recorded."""
+
+    def __init__(self, cap, recorder):
+        self.cap = cap
+        self.recorder = recorder
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if ret:
+            self.recorder.write(frame)
+        return ret, frame
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def release(self):
+        self.cap.release()
+        self.recorder.close()
+
+
+class SessionPlayer:
+    """Play a ``.lhrec`` file back through the ``cv2.VideoCapture`` interface.
+
+    With ``realtime`` the frames are returned at their recorded pace;
+    otherwise as fast as they decode.
+    """
+
+    def __init__(self, path, realtime=False):
+        self.path = path
+        self.realtime = realtime
+        self.metadata = {}
+        self.dropped = 0
+        self._chunks = []
+        self._file = None
+        self._frames = []
+        self._chunk = 0
+        self._position = 0
+        self._timestamp = 0.0
+        self._clock = None
+        self.frame_count = 0
+        self.duration = 0.0
+
+        try:
+            self._file = open(path, "rb")
+            self._read_header()
+        except (OSError, ValueError):
+            self.release()
+            return
+
+        self.frame_count = sum(count for _offset, count, _first, _last in self._chunks)
+        self.duration = self._chunks[-1][3] if self._chunks else 0.0
+
+    def _read_header(self):
+        f = self._file
+        magic, version, length = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != FILE_MAGIC or version > FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a session recording")
+        self.metadata = json.loads(f.read(length))
+        data_start = f.tell()
+
+        # Index at the end; scan the chunks if the recording was cut short
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if end - data_start >= FILE_FOOTER.size:
+            f.seek(end - FILE_FOOTER.size)
+            offset, magic = FILE_FOOTER.unpack(f.read(FILE_FOOTER.size))
+            if magic == INDEX_MAGIC and data_start <= offset < end:
+                f.seek(offset)
+                index = json.loads(f.read(end - FILE_FOOTER.size - offset))
+                self._chunks = index["chunks"]
+                self.dropped = index.get("dropped", 0)
+                return
+
+        offset = data_start
+        while offset + CHUNK_HEADER.size <= end:
+            f.seek(offset)
+            magic, count, length, first, last = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+            if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + length > end:
+                break
+            self._chunks.append([offset, count, first, last])
+            offset += CHUNK_HEADER.size + length
+
+    def _load_chunk(self, index):
+        offset, count, _first, _last = self._chunks[index]
+        self._file.seek(offset)
+        _magic, count, length, _first, _last = CHUNK_HEADER.unpack(self._file.read(CHUNK_HEADER.size))
+        self._frames = _decode_chunk(self._file.read(length), count)
+
+    def isOpened(self):
+        return self._file is not None
+
+    def read(self):
+        if self._file is None:
+            return False, None
+        while not self._frames:
+            if self._chunk >= len(self._chunks):
+                return False, None
+            self._load_chunk(self._chunk)
+            self._chunk += 1
+            # Frames are consumed from the front
+            self._frames.reverse()
+
+        timestamp, frame = self._frames.pop()
+        if self.realtime:
+            if self._clock is None:
+                self._clock = time.monotonic() - timestamp
+            delay = self._clock + timestamp - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self._position += 1
+        self._timestamp = timestamp
+        # Key frames are views of the read-only chunk buffer
+        return True, frame if frame.flags.writeable else frame.copy()
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.metadata.get("width") or 0)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.metadata.get("height") or 0)
+        if prop == cv2.CAP_PROP_FPS:
+            if self.frame_count > 1 and self.duration > 0:
+                return (self.frame_count - 1) / self.duration
+            return float(self.metadata.get("fps") or 0)
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.frame_count)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return 1000.0 * self._timestamp
+        return 0.0
+
+    def set(self, prop, value):
+        # Only rewinding is supported
+        if prop == cv2.CAP_PROP_POS_FRAMES and value == 0 and self._file is not None:
+            self._frames = []
+            self._chunk = 0
+            self._position = 0
+            self._clock = None
+            return True
+        return False
+
+    def release(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(f"Usage: python -m linux_hello_gui.session_recorder recording{RECORDING_EXTENSION}")
+        return 1
+    player = SessionPlayer(sys.argv[1])
+    if not player.isOpened():
+        print(f"✗ Cannot read {sys.argv[1]}")
+        return 1
+    size = os.path.getsize(sys.argv[1])
+    print(json.dumps(player.metadata, indent=1, sort_keys=True))
+    print(f"{player.frame_count} frames ({player.dropped} dropped), {player.duration:.1f} s, "
+          f"{player.get(cv2.CAP_PROP_FPS):.1f} fps, {size // 1024} KB")
+    player.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
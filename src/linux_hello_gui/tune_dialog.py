@@ -0,0 +1,207 @@
+"""Benchmark & Tune dialog."""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSpinBox,
+    QDoubleSpinBox, QFormLayout, QProgressBar, QTableWidget, QTableWidgetItem,
+    QFileDialog, QHeaderView, QRadioButton, QLineEdit
+)
+from PySide6.QtCore import Qt, QThread, Signal
+from . import tuner
+from .config import FIELD_LIMITS
+from .i18n import _
+from .retranslate import bind, tr
+
+
+class TuneWorker(QThread):
+    """Run the hardware benchmark off the GUI thread."""
+
+    # Signals carry the run's generation, so results of older runs can be dropped
+    progress = Signal(int, int, int)
+    measured = Signal(int, object)
+
+    def __init__(self, source, generation=0, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.generation = generation
+
+    def run(self):
+        measurements = tuner.run_benchmark(
+            self.source,
+            progress=lambda done, total: self.progress.emit(self.generation, done, total),
+            cancelled=self.isInterruptionRequested,
+        )
+        self.measured.emit(self.generation, measurements)
+
+
+class TuneDialog(QDialog):
+    """Measure the camera and CPU, then recommend performance settings."""
+
+    def __init__(self, camera_index=0, parent=None):
+        super().__init__(parent)
+        tr(self, "setWindowTitle", "Benchmark & Tune")
+        self.resize(640, 480)
+        self.worker = None
+        # Bumped by every start and by closing: results of older runs are ignored
+        self.generation = 0
+        self.measuring = False
+        self.recommendation = None
+        self.init_ui(camera_index)
+
+    def init_ui(self, camera_index):
+        layout = QVBoxLayout(self)
+
+        form = QFormLayout()
+
+        source_layout = QHBoxLayout()
+        self.use_camera = tr(QRadioButton(), "setText", "Camera")
+        self.use_camera.setChecked(True)
+        source_layout.addWidget(self.use_camera)
+        self.camera_index = QSpinBox()
+        self.camera_index.setRange(*FIELD_LIMITS["camera_index"])
+        self.camera_index.setValue(camera_index)
+        source_layout.addWidget(self.camera_index)
+
+        self.use_clip = tr(QRadioButton(), "setText", "Recorded clip")
+        source_layout.addWidget(self.use_clip)
+        self.clip_path = QLineEdit()
+        source_layout.addWidget(self.clip_path)
+        browse_btn = tr(QPushButton(), "setText", "Browse...")
+        browse_btn.clicked.connect(self.browse_clip)
+        source_layout.addWidget(browse_btn)
+        form.addRow(tr(QLabel(), "setText", "Source:"), source_layout)
+
+        self.target_latency = QDoubleSpinBox()
+        self.target_latency.setRange(0.2, 10.0)
+        self.target_latency.setSingleStep(0.1)
+        self.target_latency.setValue(tuner.TARGET_LATENCY)
+        tr(self.target_latency, "setSuffix", " seconds")
+        self.target_latency.valueChanged.connect(self.update_recommendation)
+        form.addRow(tr(QLabel(), "setText", "Target unlock latency:"), self.target_latency)
+
+        layout.addLayout(form)
+
+        self.progress_bar = QProgressBar()
+        layout.addWidget(self.progress_bar)
+
+        # Measured evidence
+        self.table = QTableWidget(0, 7)
+        bind(self.table, "setHorizontalHeaderLabels", lambda: [
+            _("Resolution"), _("Format"), _("Capture FPS"), _("Detection (ms)"),
+            _("Matching (ms)"), _("First face (s)"), _("Expected latency (s)")
+        ])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+
+        self.result_label = tr(QLabel(), "setText", "Press 'Run benchmark' to measure this hardware.")
+        self.result_label.setWordWrap(True)
+        layout.addWidget(self.result_label)
+
+        button_layout = QHBoxLayout()
+        self.run_btn = tr(QPushButton(), "setText", "Run benchmark")
+        self.run_btn.clicked.connect(self.start_benchmark)
+        button_layout.addWidget(self.run_btn)
+        button_layout.addStretch()
+
+        self.apply_btn = tr(QPushButton(), "setText", "Apply")
+        self.apply_btn.setEnabled(False)
+        self.apply_btn.clicked.connect(self.accept)
+        button_layout.addWidget(self.apply_btn)
+
+        close_btn = tr(QPushButton(), "setText", "Close")
+        close_btn.clicked.connect(self.reject)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.measurements = []
+
+    def browse_clip(self):
+        """Choose a recorded clip to benchmark instead of a camera."""
+        path, _filter = QFileDialog.getOpenFileName(
+            self, _("Recorded clip"), "",
+            _("Videos (*.mp4 *.avi *.mkv *.webm)") + ";;" + _("Session recordings (*.lhrec)")
+        )
+        if path:
+            self.clip_path.setText(path)
+            self.use_clip.setChecked(True)
+
+    def start_benchmark(self):
+        """Start measuring in the background."""
+        if self.use_clip.isChecked() and self.clip_path.text():
+            source = self.clip_path.text()
+        else:
+            source = self.camera_index.value()
+
+        self.run_btn.setEnabled(False)
+        self.apply_btn.setEnabled(False)
+        self.table.setRowCount(0)
+        self.progress_bar.setValue(0)
+        tr(self.result_label, "setText", "Measuring...")
+
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.requestInterruption()
+        self.generation += 1
+        self.measuring = True
+        self.measurements = []
+        self.worker = TuneWorker(source, self.generation, self)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.measured.connect(self.on_measured)
+        self.worker.start()
+
+    def on_progress(self, generation, done, total):
+        if generation != self.generation:
+            return
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def on_measured(self, generation, measurements):
+        """Show the evidence and the resulting recommendation."""
+        if generation != self.generation:
+            return
+        self.measuring = False
+        self.run_btn.setEnabled(True)
+        self.measurements = measurements
+
+        self.table.setRowCount(len(measurements))
+        for row, m in enumerate(measurements):
+            first_face = f"{m.first_face_s:.2f}" if m.first_face_s is not None else "—"
+            values = [
+                f"{m.width}×{m.height}", m.fmt, f"{m.capture_fps:.1f}", f"{m.detect_ms:.1f}",
+                f"{m.match_ms:.2f}", first_face, f"{m.expected_latency():.2f}"
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+
+        self.update_recommendation()
+
+    def update_recommendation(self):
+        """Recompute the recommendation for the current target latency."""
+        if not self.measurements:
+            if self.worker is not None and not self.measuring:
+                tr(self.result_label, "setText", "No frames could be captured from this source.")
+            return
+
+        settings, best = tuner.recommend(self.measurements, self.target_latency.value())
+        self.recommendation = settings
+        self.apply_btn.setEnabled(settings is not None)
+        if settings is None:
+            return
+
+        bind(self.result_label, "setText", lambda: (
+            _("Recommended: {width}×{height}, timeout {timeout} s, max frames {max_frames} "
+              "(expected unlock latency {latency:.2f} s)").format(
+                width=settings["camera_width"], height=settings["camera_height"],
+                timeout=settings["timeout"], max_frames=settings["max_frames"],
+                latency=best.expected_latency())
+        ))
+
+    def done(self, result):
+        self.generation += 1
+        self.measuring = False
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.requestInterruption()
+            self.worker.wait()
+        super().done(result)
@@ -0,0 +1,254 @@
+"""Hardware benchmark and settings recommendation.
+
+Measures, for each candidate resolution and pixel format, the capture rate
+the camera really delivers, the per-frame cost of face detection and template
+matching on this CPU, and the time from opening the source to the first frame
+with a detected face. ``recommend`` turns those numbers into values for
+``camera_width``, ``camera_height``, ``max_frames`` and ``timeout``.
+
+A recorded clip or session recording can stand in for the camera: its
+frames are resized to each candidate resolution and paced at the clip's own
+frame rate.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from .config import FIELD_LIMITS
+from .face_features import FEATURE_DIM, detect_faces, face_vector, match_scores
+from .session_recorder import open_capture
+
+CANDIDATE_RESOLUTIONS = [(640, 480), (960, 540), (1280, 720), (1920, 1080)]
+CANDIDATE_FORMATS = ["MJPG", "YUYV"]
+
+# Unlock latency the recommendation aims for, in seconds
+TARGET_LATENCY = 1.5
+
+# Frames a decision usually needs once a face is visible
+DECISION_FRAMES = 3
+
+# Frames sampled per candidate, and the time limit per candidate
+SAMPLE_FRAMES = 30
+SAMPLE_SECONDS = 3.0
+
+# Template bank used to time matching (size of a default enrollment)
+TEMPLATE_COUNT = 30
+
+
+@dataclass
+class Measurement:
+    """Benchmark evidence for one resolution and format."""
+
+    width: int
+    height: int
+    fmt: str
+    capture_fps: float
+    detect_ms: float
+    match_ms: float
+    first_face_s: float = None
+    frames: int = 0
+
+    @property
+    def process_ms(self):
+        return self.detect_ms + self.match_ms
+
+    @property
+    def effective_fps(self):
+        """Frames per second the pipeline can actually evaluate."""
+        if self.process_ms <= 0:
+            return self.capture_fps
+        return min(self.capture_fps, 1000.0 / self.process_ms)
+
+    def expected_latency(self, decision_frames=DECISION_FRAMES):
+        """Expected seconds from opening the camera to a decision."""
+        if self.effective_fps <= 0:
+            return math.inf
+        if self.first_face_s is not None:
+            first_face = self.first_face_s
+        else:
+            # No face during the whole sample: at least that long
+            first_face = self.frames / self.capture_fps if self.capture_fps > 0 else math.inf
+        return first_face + decision_frames / self.effective_fps
+
+
+def is_clip(source):
+    return isinstance(source, str)
+
+
+def _open_capture(source, width, height, fmt):
+    """Open a camera (or clip) configured for one candidate."""
+    cap = open_capture(source)
+    if not cap.isOpened() or is_clip(source):
+        return cap
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fmt))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    return cap
+
+
+def measure_candidate(source, width, height, fmt, templates, cancelled=None):
+    """Benchmark one resolution/format.
+
+    Returns a ``Measurement``, or None if the source cannot be opened or the
+    camera refuses the format.
+    """
+    started = time.perf_counter()
+    cap = _open_capture(source, width, height, fmt)
+    if not cap.isOpened():
+        return None
+
+    try:
+        clip = is_clip(source)
+        if clip:
+            clip_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        else:
+            # Keep what the driver actually gave us
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or width
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height
+
+        detect_times = []
+        match_times = []
+        first_face = None
+        frames = 0
+        capture_started = time.perf_counter()
+
+        while frames < SAMPLE_FRAMES and time.perf_counter() - capture_started < SAMPLE_SECONDS:
+            if cancelled is not None and cancelled():
+                return None
+
+            ret, frame = cap.read()
+            if not ret:
+                if clip and frames == 0:
+                    return None
+                if clip:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                break
+
+            if clip and frame.shape[1] != width:
+                frame = cv2.resize(frame, (width, height))
+            frames += 1
+
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            t0 = time.perf_counter()
+            faces = detect_faces(gray)
+            t1 = time.perf_counter()
+
+            if len(faces):
+                x, y, w, h = faces[0]
+                face = gray[y:y + h, x:x + w]
+                if first_face is None:
+                    # Simulated time for clips, wall time for cameras
+                    first_face = frames / clip_fps if clip else t1 - started
+            else:
+                # Time matching on the centre even without a face
+                face = gray[height // 4:3 * height // 4, width // 4:3 * width // 4]
+
+            t2 = time.perf_counter()
+            match_scores(face_vector(face), templates)
+            t3 = time.perf_counter()
+
+            detect_times.append(t1 - t0)
+            match_times.append(t3 - t2)
+
+        if not frames:
+            return None
+
+        if clip:
+            # A file decodes as fast as possible; the clip rate is the ceiling
+            decode_fps = frames / (time.perf_counter() - capture_started)
+            capture_fps = min(clip_fps, decode_fps)
+        else:
+            capture_fps = frames / (time.perf_counter() - capture_started)
+
+        return Measurement(
+            width=width,
+            height=height,
+            fmt="clip" if clip else fmt,
+            capture_fps=capture_fps,
+            detect_ms=1000.0 * float(np.median(detect_times)),
+            match_ms=1000.0 * float(np.median(match_times)),
+            first_face_s=first_face,
+            frames=frames,
+        )
+    finally:
+        cap.release()
+
+
+def make_templates(count=TEMPLATE_COUNT, seed=0):
+    """Build a normalized template bank for timing matches."""
+    rng = np.random.default_rng(seed)
+    templates = rng.standard_normal((count, FEATURE_DIM)).astype(np.float32)
+    templates /= np.linalg.norm(templates, axis=1, keepdims=True)
+    return templates
+
+
+def run_benchmark(source, resolutions=None, formats=None, progress=None, cancelled=None):
+    """Benchmark every candidate and return the list of measurements.
+
+    ``source`` is a camera index or the path of a recorded clip.
+    ``progress`` is called with ``(done, total)`` after each candidate.
+    """
+    resolutions = resolutions or CANDIDATE_RESOLUTIONS
+    formats = ["clip"] if is_clip(source) else (formats or CANDIDATE_FORMATS)
+    templates = make_templates()
+
+    candidates = [(w, h, fmt) for w, h in resolutions for fmt in formats]
+    measurements = []
+    seen = set()
+
+    for done, (width, height, fmt) in enumerate(candidates, 1):
+        if cancelled is not None and cancelled():
+            break
+        measurement = measure_candidate(source, width, height, fmt, templates, cancelled)
+        if measurement is not None:
+            # Drivers fall back to a supported mode; keep each real mode once
+            key = (measurement.width, measurement.height, measurement.fmt)
+            if key not in seen:
+                seen.add(key)
+                measurements.append(measurement)
+        if progress is not None:
+            progress(done, len(candidates))
+
+    return measurements
+
+
+def _clamp(name, value):
+    low, high = FIELD_LIMITS[name]
+    return max(low, min(high, value))
+
+
+def recommend(measurements, target_latency=TARGET_LATENCY):
+    """Recommend settings from benchmark measurements.
+
+    Picks the highest resolution whose expected latency meets the target
+    (or the fastest one if none does). The timeout leaves room for twice the
+    expected latency, and ``max_frames`` is what the pipeline can evaluate
+    within it.
+
+    Returns ``(settings, measurement)`` or ``(None, None)`` without data.
+    """
+    usable = [m for m in measurements if m.effective_fps > 0 and m.width >= 320 and m.height >= 240]
+    if not usable:
+        return None, None
+
+    meeting = [m for m in usable if m.expected_latency() <= target_latency]
+    if meeting:
+        best = max(meeting, key=lambda m: (m.width * m.height, m.effective_fps))
+    else:
+        best = min(usable, key=lambda m: m.expected_latency())
+
+    timeout = _clamp("timeout", math.ceil(max(target_latency, best.expected_latency()) * 2))
+    max_frames = _clamp("max_frames", math.ceil(best.effective_fps * timeout))
+
+    settings = {
+        "camera_width": _clamp("camera_width", best.width),
+        "camera_height": _clamp("camera_height", best.height),
+        "max_frames": max_frames,
+        "timeout": timeout,
+    }
+    return settings, best
@@ -0,0 +1,186 @@
+"""Video preview widget that paints camera frames directly.
+
+``QLabel.setPixmap`` makes every frame go through a ``QPixmap`` (an upload
+to the X server on X11) and may recompute size hints and layouts.
+``VideoView`` keeps the latest frame as a ``QImage`` wrapping the numpy
+array, scales it once per paint to the device pixels it will cover (so
+frames that are replaced before being painted cost nothing) and repaints
+only its own rectangle.
+
+Overlay layers are drawn over the video in frame coordinates: boxes with an
+optional label, and captions in a corner. A message (``setText``) is shown
+centred, like the placeholder text of a label.
+"""
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+
+@dataclass
+class Box:
+    """Rectangle ``(x, y, width, height)`` in frame pixels."""
+
+    rect: tuple
+    label: str = ""
+    color: str = "#4caf50"
+
+
+@dataclass
+class Caption:
+    """Text in a corner of the video: ``top-left``, ``top-right``, ``bottom-left`` or ``bottom-right``."""
+
+    text: str
+    corner: str = "top-left"
+    color: str = "white"
+
+
+class VideoView(QWidget):
+    """Paint-based replacement for a ``QLabel`` showing video frames."""
+
+    def __init__(self, minimum_size=(400, 300), border=0, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(*minimum_size)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Every pixel is painted: no background erase before each frame
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.border = border
+        self.frames = 0
+        self.paints = 0
+        self._frame = None
+        self._scaled = None
+        self._scaled_key = None
+        self._message = ""
+        self._layers = {}
+
+    def sizeHint(self):
+        # Fixed, so new frames never trigger a layout pass
+        return self.minimumSize()
+
+    def minimumSizeHint(self):
+        return self.minimumSize()
+
+    def set_frame(self, frame):
+        """Show a BGR or grayscale uint8 frame; the array must not be changed afterwards."""
+        self._frame = np.ascontiguousarray(frame)
+        self._scaled_key = None
+        self._message = ""
+        self.frames += 1
+        self.update()
+
+    def frame(self):
+        return self._frame
+
+    def clear(self):
+        """Drop the frame and the overlays."""
+        self._frame = None
+        self._scaled = None
+        self._scaled_key = None
+        self._layers.clear()
+        self.update()
+
+    def setText(self, text):
+        """Show ``text`` in the middle, over the last frame if there is one."""
+        self._message = text
+        self.update()
+
+    def text(self):
+        return self._message
+
+    def set_layer(self, name, items):
+        """Replace overlay layer ``name`` with ``items`` (``Box``/``Caption``); empty removes it."""
+        if items:
+            self._layers[name] = list(items)
+        else:
+            self._layers.pop(name, None)
+        self.update()
+
+    def video_rect(self):
+        """Where the frame is drawn, in widget coordinates (aspect kept, centred)."""
+        inner = QRectF(self.rect()).adjusted(self.border, self.border, -self.border, -self.border)
+        if self._frame is None:
+            return inner
+        height, width = self._frame.shape[:2]
+        scale = min(inner.width() / width, inner.height() / height)
+        w, h = width * scale, height * scale
+        # Whole pixels, so the scaled frame is blitted without resampling
+        return QRectF(round(inner.x() + (inner.width() - w) / 2), round(inner.y() + (inner.height() - h) / 2), w, h)
+
+    def _scaled_image(self, target):
+        """The frame resized to the device pixels of ``target``, cached until the next frame."""
+        ratio = self.devicePixelRatioF()
+        size = (max(1, round(target.width() * ratio)), max(1, round(target.height() * ratio)))
+        if self._scaled_key != size:
+            height, width = self._frame.shape[:2]
+            if size == (width, height):
+                pixels = self._frame
+            else:
+                # Bilinear, like Qt's smooth scaling; INTER_AREA costs 6x more
+                pixels = cv2.resize(self._frame, size, interpolation=cv2.INTER_LINEAR)
+            if pixels.ndim == 3:
+                image = QImage(pixels.data, size[0], size[1], pixels.strides[0], QImage.Format_BGR888)
+            else:
+                image = QImage(pixels.data, size[0], size[1], pixels.strides[0], QImage.Format_Grayscale8)
+            image.setDevicePixelRatio(ratio)
+            # The QImage does not own the pixels: keep them alive with it
+            self._scaled = (image, pixels)
+            self._scaled_key = size
+        return self._scaled[0]
+
+    def paintEvent(self, event):
+        self.paints += 1
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self.border:
+            painter.setPen(QPen(QColor("#666"), self.border))
+            half = self.border / 2
+            painter.drawRect(QRectF(self.rect()).adjusted(half, half, -half, -half))
+
+        target = self.video_rect()
+        if self._frame is not None:
+            painter.drawImage(target.topLeft(), self._scaled_image(target))
+            self._paint_layers(painter, target)
+        if self._message:
+            self._paint_message(painter, target)
+        painter.end()
+
+    def _paint_layers(self, painter, target):
+        scale = target.width() / self._frame.shape[1]
+        painter.setRenderHint(QPainter.Antialiasing)
+        for items in self._layers.values():
+            for item in items:
+                if isinstance(item, Box):
+                    x, y, w, h = item.rect
+                    rect = QRectF(target.x() + x * scale, target.y() + y * scale, w * scale, h * scale)
+                    painter.setPen(QPen(QColor(item.color), 2))
+                    painter.setBrush(Qt.NoBrush)
+                    painter.drawRect(rect)
+                    if item.label:
+                        painter.drawText(rect.bottomLeft() + QPointF(0, painter.fontMetrics().ascent() + 2),
+                                         item.label)
+                elif isinstance(item, Caption):
+                    self._paint_caption(painter, target, item)
+
+    def _paint_caption(self, painter, target, caption):
+        metrics = painter.fontMetrics()
+        margin = 6
+        box = QRectF(metrics.boundingRect(caption.text)).adjusted(-4, -2, 4, 2)
+        x = target.left() + margin if caption.corner.endswith("left") else target.right() - margin - box.width()
+        y = target.top() + margin if caption.corner.startswith("top") else target.bottom() - margin - box.height()
+        box.moveTo(x, y)
+        painter.fillRect(box, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(caption.color))
+        painter.drawText(box, Qt.AlignCenter, caption.text)
+
+    def _paint_message(self, painter, target):
+        font = QFont(painter.font())
+        font.setBold(True)
+        painter.setFont(font)
+        if self._frame is not None:
+            painter.fillRect(target, QColor(0, 0, 0, 128))
+        painter.setPen(Qt.white)
+        painter.drawText(target, Qt.AlignCenter | Qt.TextWordWrap, self._message)
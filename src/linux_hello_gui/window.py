@@ -4,14 +4,33 @@ from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QVBoxLayout, QHBoxLayout, QWidget,
     QPushButton, QLabel, QMessageBox
 )
-from PySide6.QtGui import QIcon, QFont, QPixmap, QImage
+from PySide6.QtGui import QIcon, QFont, QActionGroup
 from PySide6.QtCore import Qt, QProcess, QTimer
 import cv2
 import getpass
-import os
-from pathlib import Path
+import time
 from .pam_manager import PamManagerWidget
-from .i18n import _
+from .kde_integration import IconManager
+from .app_icon import load_app_icon
+from .enrollment import EnrollmentWatcher
+from .enrollment_admin import EnrollmentAdminWidget
+from .frame_ring import FrameRing
+from .camera_widget import CameraManager
+from . import multicam
+from . import exposure
+from .enhance import Enhancer
+from . import alignment
+from . import config as config_module
+from . import decision
+from . import diagnostics
+from .face_features import detect_faces
+from . import liveness as liveness_module
+from .video_view import VideoView
+from .diagnostics_dialog import DiagnosticsDialog
+from .frame_timing_view import FrameTimingDialog, PaintProbe
+from . import i18n
+from .i18n import _, ngettext
+from .retranslate import bind, tr, unbind
 
 
 class MainWindow(QMainWindow):
@@ -19,19 +38,34 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(_("Linux Hello"))
+        tr(self, "setWindowTitle", "Linux Hello")
         
         # Load application icon
-        icon = self._load_app_icon()
+        icon = load_app_icon()
         if icon:
             self.setWindowIcon(icon)
         else:
             # Fallback to system theme icon
-            self.setWindowIcon(QIcon.fromTheme("face-recognition"))
+            self.setWindowIcon(IconManager.get_icon("face-recognition"))
         
         self.resize(700, 600)
         
         self.cap = None
+        # Recent preview frames for failure reports; off unless enabled
+        self.frame_ring = None
+        # Frame timestamps while the frame timing panel measures
+        self.frame_timing = None
+        self.paint_probe = None
+        # Auto-exposure of the preview camera; reset on every open
+        self.exposure = None
+        # Low-light enhancement of the preview; off unless enabled
+        self.enhancer = None
+        # Preview every camera (RGB + IR) instead of the first one only
+        self.multi_camera = False
+        self.camera_layout = multicam.LAYOUT_SIDE_BY_SIDE
+        # Liveness of the preview while the Test action checks it
+        self.liveness = None
+        self.liveness_started = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
         
@@ -43,21 +77,156 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         
         # Tab 1: Face (main interface)
-        self.tabs.addTab(self.create_face_tab(), _("Face"))
+        self.tabs.addTab(self.create_face_tab(), "")
+        tr(self.tabs, "setTabText", "Face", 0)
         
         # Tab 2: Settings (PAM config)
         self.pam_widget = PamManagerWidget()
-        self.tabs.addTab(self.pam_widget, _("Settings"))
+        self.tabs.addTab(self.pam_widget, "")
+        tr(self.tabs, "setTabText", "Settings", 1)
+        
+        # Tab 3: Users (every enrolled profile, indexed when first opened)
+        self.admin_widget = EnrollmentAdminWidget()
+        self.tabs.addTab(self.admin_widget, "")
+        tr(self.tabs, "setTabText", "Users", 2)
         
         layout.addWidget(self.tabs)
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
         
+        self.create_menus()
+        
         # Status bar
         self.statusBar().showMessage(_("Ready"))
         
         # Start camera on init
         self.start_camera()
+        
+        IconManager.watch_theme(self)
+    
+    def create_menus(self):
+        """Create the menu bar with the language selector."""
+        language_menu = self.menuBar().addMenu("")
+        tr(language_menu, "setTitle", "&Language")
+        
+        group = QActionGroup(self)
+        group.setExclusive(True)
+        for code, name in i18n.get_available_languages().items():
+            action = language_menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(code == i18n.get_language())
+            action.setData(code)
+            group.addAction(action)
+        group.triggered.connect(self.change_language)
+        
+        tools_menu = self.menuBar().addMenu("")
+        tr(tools_menu, "setTitle", "&Tools")
+        
+        keep_frames = tools_menu.addAction("")
+        tr(keep_frames, "setText", "Save recent video when an action fails")
+        keep_frames.setCheckable(True)
+        keep_frames.toggled.connect(self.set_frame_ring_enabled)
+        
+        enhance = tools_menu.addAction("")
+        tr(enhance, "setText", "Enhance low-light video")
+        enhance.setCheckable(True)
+        enhance.toggled.connect(self.set_enhancement_enabled)
+        
+        tools_menu.addSeparator()
+        
+        all_cameras = tools_menu.addAction("")
+        tr(all_cameras, "setText", "Show all cameras (RGB + IR)")
+        all_cameras.setCheckable(True)
+        all_cameras.toggled.connect(self.set_multi_camera_enabled)
+        
+        inset = tools_menu.addAction("")
+        tr(inset, "setText", "Picture-in-picture")
+        inset.setCheckable(True)
+        inset.toggled.connect(self.set_picture_in_picture)
+        
+        tools_menu.addSeparator()
+        
+        frame_timing = tools_menu.addAction("")
+        tr(frame_timing, "setText", "Measure Frame Timing...")
+        frame_timing.triggered.connect(self.show_frame_timing)
+    
+    def change_language(self, action):
+        """Switch language in place; widgets retranslate themselves."""
+        i18n.set_language(action.data())
+    
+    def set_frame_ring_enabled(self, enabled):
+        """Start or stop keeping the last seconds of preview in memory."""
+        if not enabled:
+            self.frame_ring = None
+            self.statusBar().showMessage(_("Recent video is no longer kept"))
+            return
+        self.frame_ring = FrameRing()
+        self.statusBar().showMessage(
+            _("Keeping the last {seconds} s of video ({size:.1f} MB)").format(
+                seconds=self.frame_ring.seconds,
+                size=self.frame_ring.nbytes / 1e6,
+            )
+        )
+    
+    def show_frame_timing(self):
+        """Open the frame timing panel for the live preview."""
+        dialog = FrameTimingDialog(parent=self)
+        dialog.measuring.connect(self.set_frame_timing)
+        dialog.finished.connect(dialog.deleteLater)
+        dialog.show()
+    
+    def set_frame_timing(self, log):
+        """Record preview timestamps into ``log``, or stop with ``None``."""
+        if self.paint_probe is not None:
+            self.paint_probe.remove()
+            self.paint_probe = None
+        self.frame_timing = log
+        if log is not None:
+            self.paint_probe = PaintProbe(log, self.video_view)
+    
+    def set_multi_camera_enabled(self, enabled):
+        """Preview all cameras together, paired frame by frame, or only the first."""
+        self.multi_camera = enabled
+        if self.cap is not None:
+            self.stop_camera()
+            self.start_camera()
+    
+    def set_picture_in_picture(self, enabled):
+        """Show the other cameras as insets instead of side by side."""
+        self.camera_layout = multicam.LAYOUT_PICTURE_IN_PICTURE if enabled else multicam.LAYOUT_SIDE_BY_SIDE
+        if isinstance(self.cap, multicam.CaptureGroup):
+            self.cap.layout = self.camera_layout
+    
+    def open_cameras(self):
+        """Capture for the preview: a ``CaptureGroup`` of all cameras, or camera 0."""
+        if self.multi_camera:
+            indexes = CameraManager.get_available_cameras()
+            if len(indexes) >= 2:
+                # The preview never waits for a frame set
+                return multicam.CaptureGroup(indexes, layout=self.camera_layout, read_timeout=0)
+            self.statusBar().showMessage(_("Only one camera found"))
+        return cv2.VideoCapture(0)
+    
+    def set_enhancement_enabled(self, enabled):
+        """Brighten the preview in dim light (adjusted to each frame)."""
+        self.enhancer = Enhancer() if enabled else None
+    
+    def report_failure(self, kind, output):
+        """Save the recent frames with ``output`` (a finished QProcess or a dict).
+        
+        Returns a suffix for the status bar message.
+        """
+        if self.frame_ring is None or not self.frame_ring.count:
+            return ""
+        if isinstance(output, QProcess):
+            output = {
+                "command": " ".join([output.program()] + output.arguments()),
+                "exit_code": output.exitCode(),
+                "stdout": bytes(output.readAllStandardOutput()).decode("utf-8", "replace"),
+                "stderr": bytes(output.readAllStandardError()).decode("utf-8", "replace"),
+            }
+        path = self.frame_ring.dump(kind, output)
+        return " — " + _("report saved to {path}").format(path=path)
     
     def create_face_tab(self):
         """Create user-friendly face tab with live preview."""
@@ -67,24 +236,21 @@ class MainWindow(QMainWindow):
         # Top: Current user info and profile status
         header_layout = QHBoxLayout()
         current_user = getpass.getuser()
-        user_label = QLabel(f"<b>{_('User')}:</b> {current_user}")
+        user_label = bind(QLabel(), "setText", lambda: f"<b>{_('User')}:</b> {current_user}")
         header_layout.addWidget(user_label)
         header_layout.addStretch()
         
-        refresh_status_btn = QPushButton(_("Refresh"))
-        refresh_status_btn.setMaximumWidth(80)
-        refresh_status_btn.clicked.connect(self.refresh_profile_status)
-        header_layout.addWidget(refresh_status_btn)
+        # Updated by the watcher whenever the face stores change
+        self.profile_label = QLabel()
+        self.profile_label.setStyleSheet("color: #666;")
+        header_layout.addWidget(self.profile_label)
         
         layout.addLayout(header_layout)
         
         # Middle: Live camera preview (always visible)
-        self.video_label = QLabel()
-        self.video_label.setMinimumSize(600, 400)
-        self.video_label.setStyleSheet("background-color: black; border: 2px solid #666;")
-        self.video_label.setAlignment(Qt.AlignCenter)
-        self.video_label.setText(_("Initializing camera..."))
-        layout.addWidget(self.video_label)
+        self.video_view = VideoView(minimum_size=(600, 400), border=2)
+        tr(self.video_view, "setText", "Initializing camera...")
+        layout.addWidget(self.video_view)
         
         # Bottom: Action buttons (simple workflow)
         button_layout = QVBoxLayout()
@@ -103,44 +269,73 @@ class MainWindow(QMainWindow):
         # Secondary actions
         secondary_layout = QHBoxLayout()
         
-        test_btn = QPushButton(_("Test"))
+        test_btn = tr(QPushButton(), "setText", "Test")
         test_btn.clicked.connect(self.run_test)
         secondary_layout.addWidget(test_btn)
         
-        remove_btn = QPushButton(_("Remove"))
+        remove_btn = tr(QPushButton(), "setText", "Remove")
         remove_btn.setStyleSheet("color: #d32f2f;")
         remove_btn.clicked.connect(self.run_remove)
         secondary_layout.addWidget(remove_btn)
         
-        doctor_btn = QPushButton(_("Diagnostics"))
+        doctor_btn = tr(QPushButton(), "setText", "Diagnostics")
         doctor_btn.clicked.connect(self.run_doctor)
         secondary_layout.addWidget(doctor_btn)
         
         button_layout.addLayout(secondary_layout)
         layout.addLayout(button_layout)
         
-        # Check profile status on load
-        self.refresh_profile_status()
+        # Show the profile status now, then follow changes to the face stores
+        self.enrollment_watcher = EnrollmentWatcher(current_user, parent=self)
+        self.enrollment_watcher.statusChanged.connect(self.show_profile_status)
+        self.show_profile_status(self.enrollment_watcher.read_now())
         
         return widget
     
     def start_camera(self):
         """Start the camera and begin live preview."""
         if not self.cap:
-            self.cap = cv2.VideoCapture(0)
+            self.exposure = exposure.monitor_for(exposure.device_key(0))
+            self.cap = self.open_cameras()
             if not self.cap.isOpened():
-                self.video_label.setText(_("Camera not available"))
+                self.cap.release()
+                self.cap = None
+                tr(self.video_view, "setText", "Camera not available")
                 self.statusBar().showMessage(_("Camera error"))
                 return
             
+            # Frames replace the message; it must not come back on a language change
+            unbind(self.video_view, "setText")
             # Start timer for frame updates
             self.timer.start(33)  # ~30 fps
-            self.statusBar().showMessage(_("Camera ready"))
+            self.statusBar().showMessage(_("Camera starting..."))
+    
+    def start_camera_when_released(self):
+        """Start the camera once no diagnostics check holds it any more."""
+        if self.cap:
+            return
+        if not diagnostics.release_camera(timeout=0):
+            tr(self.video_view, "setText", "Waiting for the diagnostics to release the camera...")
+            QTimer.singleShot(500, self.start_camera_when_released)
+            return
+        self.start_camera()
+    
+    def check_exposure(self, frame):
+        """Follow auto-exposure after opening; report when it has settled."""
+        if not self.exposure.update(frame):
+            return
+        if self.exposure.converged:
+            exposure.record(exposure.device_key(0), self.exposure.time_to_stable)
+            self.statusBar().showMessage(_("Camera ready (exposure settled in {seconds:.1f} s)").format(
+                seconds=self.exposure.time_to_stable))
+        else:
+            self.statusBar().showMessage(_("Camera ready (exposure did not settle)"))
     
     def stop_camera(self):
         """Stop camera and live preview."""
         if self.timer.isActive():
             self.timer.stop()
+        self.liveness = None
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -150,33 +345,44 @@ class MainWindow(QMainWindow):
         if not self.cap or not self.cap.isOpened():
             return
         
+        read_started = time.monotonic()
         ret, frame = self.cap.read()
         if not ret:
             return
-        
-        # Resize and convert
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        pixmap = QPixmap.fromImage(qt_image)
-        
-        # Display
-        self.video_label.setPixmap(pixmap.scaledToWidth(600, Qt.SmoothTransformation))
+        if self.frame_timing is not None:
+            self.frame_timing.record_capture(self.cap, read_started, time.monotonic())
+        if self.exposure is not None and not self.exposure.stable:
+            self.check_exposure(frame)
+        
+        if self.frame_ring is not None:
+            self.frame_ring.push(frame)
+        if self.enhancer is not None:
+            self.enhancer.apply(frame)
+        # Warm-up frames would skew the blink and texture signals
+        if self.liveness is not None and (self.exposure is None or self.exposure.stable):
+            self.check_liveness(frame)
+        
+        # Scaled to the widget when painted
+        self.video_view.set_frame(frame)
     
     def refresh_profile_status(self):
-        """Check and display profile status for current user."""
-        current_user = getpass.getuser()
-        home_dir = os.path.expanduser("~")
-        faces_dir = os.path.join(home_dir, ".linux-hello", "faces")
-        face_file = os.path.join(faces_dir, f"{current_user}.npy")
-        
-        if os.path.exists(face_file):
-            self.enroll_btn.setText("✓ " + _("Register Face"))
+        """Re-read the profile status (also done automatically on changes)."""
+        self.enrollment_watcher.refresh()
+    
+    def show_profile_status(self, status):
+        """Display a ``ProfileStatus`` on the register button and header."""
+        if status.enrolled:
+            bind(self.enroll_btn, "setText", lambda: "✓ " + _("Register Face"))
             self.enroll_btn.setStyleSheet("background-color: #388e3c; color: white; border-radius: 5px;")
+            bind(self.profile_label, "setText", lambda: "{samples} · {date} · {size} KB".format(
+                samples=ngettext("{count} sample", "{count} samples", status.samples).format(count=status.samples),
+                date=time.strftime("%Y-%m-%d %H:%M", time.localtime(status.last_enrolled)),
+                size=max(1, status.size // 1024),
+            ))
         else:
-            self.enroll_btn.setText("✗ " + _("Register Face"))
+            bind(self.enroll_btn, "setText", lambda: "✗ " + _("Register Face"))
             self.enroll_btn.setStyleSheet("background-color: #d32f2f; color: white; border-radius: 5px;")
+            tr(self.profile_label, "setText", "Not registered")
     
     def start_enrollment_workflow(self):
         """Start the face enrollment workflow with camera preview."""
@@ -214,14 +420,43 @@ class MainWindow(QMainWindow):
                 self.refresh_profile_status()
                 self.statusBar().showMessage(_("✓ Face registered successfully!"))
             else:
-                self.statusBar().showMessage(_("✗ Enrollment failed"))
+                self.statusBar().showMessage(_("✗ Enrollment failed") + self.report_failure("enroll", process))
             
         except Exception as e:
             self.statusBar().showMessage(_("Error: {error}").format(error=str(e)))
             self.start_camera()
     
     def run_test(self):
-        """Run face recognition test."""
+        """Run face recognition test, after a liveness check on the preview."""
+        if self.liveness is not None:
+            return
+        if self.cap is not None and self.cap.isOpened():
+            # Started by the first frame after auto-exposure has settled
+            self.liveness = liveness_module.LivenessMonitor()
+            self.liveness_started = None
+            if self.exposure is not None and not self.exposure.stable:
+                self.statusBar().showMessage(_("Waiting for the camera exposure to settle..."))
+            return
+        self.run_recognition_test(None)
+    
+    def check_liveness(self, frame):
+        """Feed the aligned face of a preview frame to the liveness check."""
+        if self.liveness_started is None:
+            self.liveness_started = time.monotonic()
+            self.statusBar().showMessage(_("Checking liveness, look at the camera..."))
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = detect_faces(gray)
+        if faces:
+            self.liveness.update(alignment.align_face(gray, faces[0], gray).image)
+        elapsed = time.monotonic() - self.liveness_started
+        if self.liveness.frames >= liveness_module.WINDOW or elapsed >= liveness_module.CHECK_SECONDS:
+            result = self.liveness.result()
+            self.liveness = None
+            # Not from inside the frame callback: the test stops the camera
+            QTimer.singleShot(0, lambda: self.run_recognition_test(result))
+    
+    def run_recognition_test(self, liveness):
+        """Run ``hello test``; ``liveness`` is the preview's ``LivenessResult`` or None."""
         self.statusBar().showMessage(_("Testing recognition..."))
         
         try:
@@ -236,15 +471,30 @@ class MainWindow(QMainWindow):
             # Restart camera
             self.start_camera()
             
-            if process.exitCode() == 0:
-                self.statusBar().showMessage(_("✓ Face recognized!"))
+            live = ""
+            if liveness is not None:
+                live = "  " + _("Liveness {score:.2f} ({ms:.1f} ms per frame)").format(
+                    score=liveness.score, ms=liveness.ms_per_frame)
+            
+            if process.exitCode() != 0:
+                self.statusBar().showMessage(_("✗ Face not recognized") + live + self.report_failure("test", process))
+            elif self.decision_engine().confirm(liveness.score if liveness is not None else None) != decision.ACCEPT:
+                self.statusBar().showMessage(_("✗ Face recognized, but not live") + live)
             else:
-                self.statusBar().showMessage(_("✗ Face not recognized"))
+                self.statusBar().showMessage(_("✓ Face recognized!") + live)
             
         except Exception as e:
             self.statusBar().showMessage(_("Error: {error}").format(error=str(e)))
             self.start_camera()
     
+    def decision_engine(self):
+        """Decision engine of the current configuration (defaults if unreadable)."""
+        try:
+            config = config_module.get()
+        except (config_module.ConfigError, OSError):
+            config = config_module.Config()
+        return decision.from_config(config)
+    
     def run_remove(self):
         """Remove face registration."""
         current_user = getpass.getuser()
@@ -280,50 +530,29 @@ class MainWindow(QMainWindow):
         """Run system diagnostics."""
         self.statusBar().showMessage(_("Running diagnostics..."))
         
-        try:
-            # Close camera to avoid conflicts
-            self.stop_camera()
-            
-            process = QProcess(self)
-            process.start("hello", ["doctor"])
-            process.waitForFinished(30000)
-            
-            # Restart camera
-            self.start_camera()
-            
-            if process.exitCode() == 0:
-                self.statusBar().showMessage(_("✓ All systems operational"))
-            else:
-                self.statusBar().showMessage(_("✗ Some issues detected"))
-            
-        except Exception as e:
-            self.statusBar().showMessage(_("Error: {error}").format(error=str(e)))
-            self.start_camera()
-    
-    def _load_app_icon(self):
-        """Load application icon from various possible locations."""
-        icon_paths = [
-            # Development location
-            Path(__file__).parent.parent.parent / "icon.png",
-            # Installed location
-            Path("/usr/share/linux-hello-gui/icon.png"),
-            # Alternative installed location
-            Path("/usr/share/pixmaps/linux-hello-gui.png"),
-            # Current directory
-            Path("icon.png"),
-        ]
-        
-        for icon_path in icon_paths:
-            if icon_path.exists():
-                try:
-                    return QIcon(str(icon_path))
-                except Exception:
-                    continue
-        
-        # No icon found
-        return None
+        # The camera checks need the device
+        self.stop_camera()
+        dialog = DiagnosticsDialog(parent=self)
+        dialog.start()
+        dialog.exec()
+        # A camera check that timed out may still hold the device
+        diagnostics.release_camera()
+        self.start_camera_when_released()
+        
+        failed = [result for result in dialog.results if not result.ok]
+        if not failed:
+            self.statusBar().showMessage(_("✓ All systems operational"))
+        else:
+            report = self.report_failure("doctor", {
+                "results": [
+                    {"check": r.check, "status": r.status, "summary": r.summary, "details": r.details}
+                    for r in dialog.results
+                ],
+            })
+            self.statusBar().showMessage(_("✗ Some issues detected") + report)
     
     def closeEvent(self, event):
         """Clean up when closing."""
         self.stop_camera()
+        self.admin_widget.stop()
         event.accept()